@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-call sqlite3.connect vs the shared connection pool"""
+
+import sys
+sys.path.append('.')
+
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from renaissance_weekly.database import PodcastDatabase
+from renaissance_weekly.db_connection import close_connection_pool
+from renaissance_weekly.models import Episode
+
+EPISODES = 500
+LOOKUPS = 2000
+
+
+def lookup_query(conn, episode):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT id, transcription_mode FROM episodes
+        WHERE podcast = ? AND title = ? AND date(published) = date(?)
+    """, (episode.podcast, episode.title, episode.published.isoformat()))
+    return cursor.fetchone()
+
+
+def time_it(label, fn, episodes):
+    start = time.perf_counter()
+    for i in range(LOOKUPS):
+        fn(episodes[i % len(episodes)])
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed * 1000:8.1f} ms total  {elapsed / LOOKUPS * 1e6:8.1f} µs/lookup")
+    return elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "benchmark.db"
+        db = PodcastDatabase(db_path)
+
+        base = datetime(2025, 1, 1)
+        episodes = [
+            Episode(podcast=f"Podcast {i % 20}", title=f"Episode {i}", published=base + timedelta(hours=i))
+            for i in range(EPISODES)
+        ]
+        for episode in episodes:
+            db.save_episode(episode, transcript="x" * 1000)
+
+        print("=" * 80)
+        print(f"SQLITE CONNECTION BENCHMARK ({EPISODES} episodes, {LOOKUPS} lookups)")
+        print("=" * 80)
+
+        def per_call(episode):
+            with sqlite3.connect(db_path) as conn:
+                result = lookup_query(conn, episode)
+            conn.close()
+            return result
+
+        def pooled(episode):
+            with db.connection() as conn:
+                return lookup_query(conn, episode)
+
+        connect_time = time_it("per-call sqlite3.connect", per_call, episodes)
+        pooled_time = time_it("pooled connection", pooled, episodes)
+        print(f"\n  Speedup: {connect_time / pooled_time:.1f}x")
+
+        close_connection_pool(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,7 @@ def print_help():
     print("  python main.py check \"Podcast Name\" [days] # Check single podcast")
     print("  python main.py reload-prompts            # Reload prompts from disk")
     print("  python main.py regenerate-summaries [days] # Force regenerate summaries")
+    print("  python main.py resume                    # Finish episodes an interrupted run left queued")
     print("  python main.py pre-flight [days]         # Pre-flight check for available episodes")
     print("  python main.py test                      # Run system diagnostics")
     print("  python main.py -h                        # Show this help\n")
@@ -267,6 +268,8 @@ def parse_arguments():
             mode = "pre-flight"
             if len(sys.argv) > 2 and sys.argv[2].isdigit():
                 days_back = int(sys.argv[2])
+        elif sys.argv[1] == "resume":
+            mode = "resume"
         elif sys.argv[1] == "test":
             mode = "test"
         elif sys.argv[1] == "health":
@@ -405,6 +408,8 @@ async def main():
             await app_instance.load_test_dataset(extra_args['dataset_name'])
         elif mode == "health":
             show_health_report()
+        elif mode == "resume":
+            await app_instance.run(resume=True)
         else:
             force_fresh = extra_args.get('force_fresh', False)
             await app_instance.run(days_back, force_fresh=force_fresh)
@@ -2,7 +2,6 @@
 
 import asyncio
 import json
-import sqlite3
 import threading
 import uuid
 import traceback
@@ -12,14 +11,20 @@ from pathlib import Path
 from typing import List, Optional, Dict, Callable, Any
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
+from urllib.parse import urlparse
 
 from .config import (
     TESTING_MODE, MAX_TRANSCRIPTION_MINUTES, EMAIL_TO, EMAIL_FROM,
     PODCAST_CONFIGS, VERIFY_APPLE_PODCASTS, FETCH_MISSING_EPISODES,
-    TEMP_DIR
+    TEMP_DIR, FEED_FETCH_CONCURRENCY, FEED_FETCH_PER_HOST,
+    PIPELINE_FETCH_WORKERS, PIPELINE_AUDIO_WORKERS, PIPELINE_TRANSCRIBE_WORKERS,
+    PIPELINE_POSTPROCESS_WORKERS, PIPELINE_SUMMARIZE_WORKERS, PIPELINE_PERSIST_WORKERS,
+    PIPELINE_QUEUE_SIZE, PIPELINE_MEMORY_FRACTION, ADAPTIVE_CONCURRENCY, ADAPTIVE_MAX_SCALE,
+    AUDIO_DIR, PREFETCH_EPISODES, PREFETCH_MAX_MB, PREFETCH_MIN_FREE_DISK_MB,
+    JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS
 )
-from .database import PodcastDatabase
-from .models import Episode, TranscriptSource
+from .database import PodcastDatabase, JOB_STAGES
+from .models import Episode, EpisodeJob, TranscriptSource
 from .fetchers.episode_fetcher import ReliableEpisodeFetcher
 from .transcripts.finder import TranscriptFinder
 from .transcripts.transcriber import AudioTranscriber
@@ -32,37 +37,24 @@ from .email.digest import EmailDigest
 from .utils.logging import get_logger
 from .monitoring import monitor
 from .utils.helpers import (
-    validate_env_vars, get_available_memory, get_cpu_count,
-    ProgressTracker, exponential_backoff_with_jitter, slugify
+    validate_env_vars, get_available_memory,
+    ProgressTracker, slugify, duration_to_minutes
 )
 from .download_manager import DownloadManager
-from .utils.clients import openai_rate_limiter
+from .pipeline import MemoryBudget, PrefetchWindow, Stage, StageFailed, StagePipeline
+from .utils.clients import openai_rate_limiter, openai_call_limit
+from .utils.adaptive import AdaptiveConcurrencyController
 
 logger = get_logger(__name__)
 
 
 class ResourceAwareConcurrencyManager:
-    """Manage concurrency based on available system resources"""
+    """Memory estimates for audio work; runtime limits come from AdaptiveConcurrencyController"""
     
     def __init__(self, correlation_id: str):
         self.correlation_id = correlation_id
-        # Check for environment variable override
-        import os
-        env_concurrency = os.getenv('EPISODE_CONCURRENCY')
-        if env_concurrency:
-            try:
-                self.base_concurrency = int(env_concurrency)
-                self.max_concurrency = int(env_concurrency)
-                logger.info(f"[{correlation_id}] Using EPISODE_CONCURRENCY={self.base_concurrency} from environment")
-            except ValueError:
-                logger.warning(f"[{correlation_id}] Invalid EPISODE_CONCURRENCY value: {env_concurrency}, using defaults")
-                self.base_concurrency = 4  # Increased from 2 for better performance
-                self.max_concurrency = 4   # Increased from 3 to match base
-        else:
-            self.base_concurrency = 4  # Increased from 2 for better performance
-            self.max_concurrency = 4   # Increased from 3 to match base
-        
         # Check for memory override
+        import os
         env_memory = os.getenv('MEMORY_PER_TASK')
         if env_memory:
             try:
@@ -75,43 +67,22 @@ class ResourceAwareConcurrencyManager:
             self.min_memory_per_task_full = 1200  # MB for full mode (reduced from 1500MB)
             
         self.min_memory_per_task = 600  # MB for test mode (increased from 400MB)
-        self.cpu_multiplier = 1.0  # Reduced from 1.5 to match cores exactly
         self.is_full_mode = False
-        
-    def get_optimal_concurrency(self, openai_limit: int = 3) -> int:
-        """Calculate optimal concurrency based on system resources with OpenAI limit"""
-        try:
-            # Get available resources
-            available_memory = get_available_memory()
-            cpu_count = get_cpu_count()
-            
-            # Calculate memory-based limit based on mode
-            memory_per_task = self.min_memory_per_task_full if self.is_full_mode else self.min_memory_per_task
-            memory_limit = int(available_memory / memory_per_task)
-            
-            # Calculate CPU-based limit
-            cpu_limit = int(cpu_count * self.cpu_multiplier)
-            
-            # Take the minimum of all limits including OpenAI
-            optimal = min(
-                max(self.base_concurrency, memory_limit),
-                cpu_limit,
-                self.max_concurrency,
-                openai_limit  # Hard limit for OpenAI operations
-            )
-            
-            logger.info(
-                f"[{self.correlation_id}] Resource-aware concurrency: {optimal} "
-                f"(Memory: {available_memory:.0f}MB allows {memory_limit}, "
-                f"CPU: {cpu_count} cores allows {cpu_limit}, "
-                f"OpenAI limit: {openai_limit})"
-            )
-            
-            return optimal
-            
-        except Exception as e:
-            logger.warning(f"[{self.correlation_id}] Could not determine optimal concurrency: {e}")
-            return min(self.base_concurrency, openai_limit)
+        self.audio_mb_per_minute = 1.0  # 128 kbps MP3, the common podcast encoding
+        self.default_episode_minutes = 60  # When the feed gives no duration
+    
+    def memory_per_task(self, full_mode: Optional[bool] = None) -> int:
+        """Memory (MB) one transcription reserves from the pipeline's memory budget"""
+        full_mode = self.is_full_mode if full_mode is None else full_mode
+        return self.min_memory_per_task_full if full_mode else self.min_memory_per_task
+    
+    def audio_download_mb(self, episode: Episode, full_mode: Optional[bool] = None) -> float:
+        """Disk (MB) an episode's audio is expected to take, for the prefetch window"""
+        full_mode = self.is_full_mode if full_mode is None else full_mode
+        minutes = duration_to_minutes(episode.duration) or self.default_episode_minutes
+        if not full_mode:
+            minutes = min(minutes, MAX_TRANSCRIPTION_MINUTES)  # Test mode fetches a clip
+        return minutes * self.audio_mb_per_minute
 
 
 class ExceptionAggregator:
@@ -176,6 +147,7 @@ class RenaissanceWeekly:
         try:
             validate_env_vars()
             self.db = PodcastDatabase()
+            self.db.start_content_compression()  # One-time background pass over pre-compression rows
             self.episode_fetcher = ReliableEpisodeFetcher(self.db)
             self.transcript_finder = TranscriptFinder(self.db)
             self.transcriber = AudioTranscriber()
@@ -195,9 +167,12 @@ class RenaissanceWeekly:
             self._processing_status = None
             self._status_lock = threading.Lock()  # Thread-safe status updates
             self._active_tasks = []  # Track active tasks for cancellation
+            self._pipeline = None  # Stage pipeline of the current run, for metrics
+            self._prefetch_window = None  # Audio downloaded ahead of transcription in that run
             
             # Initialize global rate limiter info
-            logger.info(f"[{self.correlation_id}] 🔧 OpenAI rate limiter configured: 45 requests/minute (with 10% buffer)")
+            logger.info(f"[{self.correlation_id}] 🔧 OpenAI rate limiter configured: "
+                        f"{openai_rate_limiter.max_rpm} requests/minute, {openai_rate_limiter.max_tpm} tokens/minute (with 10% buffer)")
             
             # Log current API usage
             usage = openai_rate_limiter.get_current_usage()
@@ -225,6 +200,9 @@ class RenaissanceWeekly:
             'warnings': []
         }
         
+        # Last episode date for every podcast in one query
+        last_episode_dates = self.db.get_last_episode_dates(podcast_names)
+        
         # Quick RSS check for each podcast
         for podcast_name in podcast_names:
             try:
@@ -234,7 +212,6 @@ class RenaissanceWeekly:
                     continue
                 
                 # Check last episode date from database
-                last_episode_dates = self.db.get_last_episode_dates([podcast_name])
                 last_date = last_episode_dates.get(podcast_name)
                 
                 if last_date:
@@ -274,8 +251,12 @@ class RenaissanceWeekly:
         
         return results
     
-    async def run(self, days_back: int = 7, force_fresh: bool = False):
-        """Main execution function with simplified flow and progress tracking"""
+    async def run(self, days_back: int = 7, force_fresh: bool = False, resume: bool = False):
+        """Main execution function with simplified flow and progress tracking
+        
+        With resume=True, skip selection and finish the episodes that
+        interrupted runs left in the job queue instead.
+        """
         # Store force_fresh flag for use in processing
         self.force_fresh_summaries = force_fresh
         if force_fresh:
@@ -290,6 +271,15 @@ class RenaissanceWeekly:
         pipeline_progress = ProgressTracker(3, self.correlation_id)  # 3 stages
         
         try:
+            if resume:
+                await self.resume_queued_jobs()
+                return
+            
+            queued = self.db.get_job_counts().get('pending', 0)
+            if queued:
+                logger.info(f"[{self.correlation_id}] ⏯️  {queued} episodes from an interrupted run are queued - "
+                            f"'python main.py resume' finishes them, and selecting them again resumes them")
+            
             # Create fetch callback for the UI
             def fetch_episodes_callback(podcast_names: List[str], days: int, progress_callback: Callable):
                 """Callback to fetch episodes in a separate thread"""
@@ -476,9 +466,28 @@ class RenaissanceWeekly:
             -s['episode'].published.timestamp()  # Secondary: date descending
         ))
     
+    @staticmethod
+    def _feed_host(podcast_config: Dict) -> str:
+        """Host used to bound concurrent fetches against the same feed server"""
+        rss_feeds = podcast_config.get("rss_feeds") or []
+        if rss_feeds:
+            # The feed the fetcher tries first
+            host = urlparse(rss_feeds[0]).netloc.lower()
+            if host:
+                return host
+        if podcast_config.get("apple_id"):
+            return "itunes.apple.com"
+        return podcast_config["name"]
+    
     async def _fetch_selected_episodes(self, podcast_names: List[str], days_back: int, 
                                       progress_callback: Callable) -> List[Episode]:
-        """Fetch episodes for selected podcasts with progress updates"""
+        """Fetch episodes for selected podcasts concurrently with progress updates
+        
+        Podcasts are fetched as bounded-concurrency tasks (FEED_FETCH_CONCURRENCY
+        overall, FEED_FETCH_PER_HOST per feed host), so one slow feed no longer
+        stalls the rest. Progress is reported in completion order; the returned
+        episodes keep the alphabetical podcast order.
+        """
         all_episodes = []
         podcasts_with_no_recent_episodes = []
         
@@ -490,9 +499,20 @@ class RenaissanceWeekly:
         
         # Sort podcast names alphabetically for consistent order
         sorted_podcast_names = sorted(podcast_names, key=lambda x: x.lower())
+        total = len(sorted_podcast_names)
+        
+        fetch_semaphore = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        completed_count = 0
+        
+        logger.info(
+            f"[{self.correlation_id}] ⚙️  Fetch concurrency: {FEED_FETCH_CONCURRENCY} podcasts, "
+            f"{FEED_FETCH_PER_HOST} per feed host"
+        )
         
-        for i, podcast_name in enumerate(sorted_podcast_names):
-            progress_callback(podcast_name, i, len(sorted_podcast_names))
+        async def fetch_one(podcast_name: str) -> Optional[List[Episode]]:
+            """Fetch a single podcast; returns None on failure or missing config"""
+            nonlocal completed_count
             
             # Find the podcast config
             podcast_config = next(
@@ -500,38 +520,63 @@ class RenaissanceWeekly:
                 None
             )
             
+            started_at = time.time()
+            episodes = None
+            success = False
+            
             if not podcast_config:
                 logger.warning(f"[{self.correlation_id}] ⚠️ No configuration found for {podcast_name}")
-                await fetch_progress.complete_item(False)
-                continue
-            
-            try:
-                await fetch_progress.start_item(podcast_name)
-                logger.info(f"[{self.correlation_id}] 📻 Fetching episodes for {podcast_name}...")
-                
-                episodes = await self.episode_fetcher.fetch_episodes(podcast_config, days_back)
+            else:
+                host = self._feed_host(podcast_config)
+                host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(FEED_FETCH_PER_HOST))
                 
-                if episodes:
-                    all_episodes.extend(episodes)
-                    logger.info(f"[{self.correlation_id}]   ✅ {podcast_name}: Found {len(episodes)} episodes")
-                    
-                    # Save to database
-                    for episode in episodes:
-                        try:
-                            self.db.save_episode(episode, transcription_mode=self.current_transcription_mode)
-                        except Exception as e:
-                            logger.debug(f"[{self.correlation_id}]   Failed to cache episode: {e}")
+                try:
+                    # Host first, so podcasts queued on a busy host don't hold global slots
+                    async with host_semaphore, fetch_semaphore:
+                        started_at = time.time()
+                        logger.info(f"[{self.correlation_id}] 📻 Fetching episodes for {podcast_name}...")
+                        episodes = await self.episode_fetcher.fetch_episodes(podcast_config, days_back)
                     
-                    await fetch_progress.complete_item(True)
-                else:
-                    logger.info(f"[{self.correlation_id}]   📅 {podcast_name}: No episodes in the last {days_back} days")
-                    podcasts_with_no_recent_episodes.append(podcast_name)
-                    await fetch_progress.complete_item(True)
+                    if episodes:
+                        logger.info(f"[{self.correlation_id}]   ✅ {podcast_name}: Found {len(episodes)} episodes")
+                        
+                        # Save to database
+                        for episode in episodes:
+                            try:
+                                self.db.save_episode(episode, transcription_mode=self.current_transcription_mode)
+                            except Exception as e:
+                                logger.debug(f"[{self.correlation_id}]   Failed to cache episode: {e}")
+                    else:
+                        logger.info(f"[{self.correlation_id}]   📅 {podcast_name}: No episodes in the last {days_back} days")
+                        episodes = []
+                    success = True
                     
-            except Exception as e:
-                logger.error(f"[{self.correlation_id}]   ❌ {podcast_name}: Failed to fetch episodes - {e}")
-                await self.exception_aggregator.add_exception(f"fetch_{podcast_name}", e)
-                await fetch_progress.complete_item(False)
+                except Exception as e:
+                    logger.error(f"[{self.correlation_id}]   ❌ {podcast_name}: Failed to fetch episodes - {e}")
+                    await self.exception_aggregator.add_exception(f"fetch_{podcast_name}", e)
+            
+            # Report progress in completion order
+            await fetch_progress.complete_item(success, item_name=podcast_name, started_at=started_at)
+            completed_count += 1
+            if progress_callback(podcast_name, completed_count, total) is False:
+                logger.info(f"[{self.correlation_id}] ⏹️ Fetch cancelled by progress callback")
+                for task in tasks:
+                    if not task.done() and task is not asyncio.current_task():
+                        task.cancel()
+            
+            return episodes
+        
+        tasks = [asyncio.create_task(fetch_one(name)) for name in sorted_podcast_names]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Assemble results in the original (alphabetical) order
+        for podcast_name, result in zip(sorted_podcast_names, results):
+            if isinstance(result, BaseException):
+                continue
+            if result:
+                all_episodes.extend(result)
+            elif result is not None:
+                podcasts_with_no_recent_episodes.append(podcast_name)
         
         # Log fetch summary
         fetch_summary = fetch_progress.get_summary()
@@ -577,30 +622,21 @@ class RenaissanceWeekly:
         needs_transcript = 0  
         needs_summary = 0
         
-        for episode in episodes:
-            # Check what exists in database
-            existing = self.db.get_episode(
-                episode.podcast, 
-                episode.title,
-                episode.published
-            )
-            
-            if not existing:
+        # Check what exists in database for the current mode (one query for all episodes)
+        statuses = self.db.get_cache_status_bulk(episodes, self.current_transcription_mode)
+        
+        for status in statuses:
+            if not status:
                 # New episode - needs everything
                 needs_download += 1
                 needs_transcript += 1
                 needs_summary += 1
             else:
-                # Check what's missing based on current mode
-                audio_key = 'audio_file_path_test' if self.current_transcription_mode == 'test' else 'audio_file_path'
-                transcript_key = 'transcript_test' if self.current_transcription_mode == 'test' else 'transcript'
-                summary_key = 'summary_test' if self.current_transcription_mode == 'test' else 'summary'
-                
-                if not existing.get(audio_key):
+                # Audio is only downloaded to produce a missing transcript
+                if not status['has_transcript']:
                     needs_download += 1
-                if not existing.get(transcript_key):
                     needs_transcript += 1
-                if not existing.get(summary_key):
+                if not status['has_summary']:
                     needs_summary += 1
         
         # Time estimates (minutes) - adjusted for 2-core system and actual performance
@@ -644,9 +680,8 @@ class RenaissanceWeekly:
         
         # Check OpenAI API
         try:
-            # Use asyncio.to_thread to avoid blocking
-            from .utils.clients import openai_client
-            await asyncio.to_thread(lambda: openai_client.models.list())
+            from .utils.clients import get_async_openai_client
+            await get_async_openai_client().models.list()
             checks['openai_api'] = True
             logger.debug(f"[{self.correlation_id}] ✅ OpenAI API check passed")
         except Exception as e:
@@ -700,28 +735,29 @@ class RenaissanceWeekly:
     def filter_episodes_needing_processing(self, episodes: List[Episode]) -> List[Episode]:
         """Filter out episodes that already have valid summaries"""
         episodes_to_process = []
-        
-        for episode in episodes:
-            # Get full episode data to check both transcript and summaries
-            episode_data = self.db.get_episode(
-                episode.podcast,
-                episode.title, 
-                episode.published
-            )
-            
-            if episode_data:
-                # Get the appropriate columns based on mode
-                if self.current_transcription_mode == 'test':
-                    transcript = episode_data.get('transcript_test', '')
-                    summary = episode_data.get('summary_test', '')
-                    paragraph = episode_data.get('paragraph_summary_test', '')
-                else:
-                    transcript = episode_data.get('transcript', '')
-                    summary = episode_data.get('summary', '')
-                    paragraph = episode_data.get('paragraph_summary', '')
+        mode = self.current_transcription_mode
+        
+        # Cache status for the whole selection in one query, then summaries (one
+        # more query) for the cached episodes. Transcripts are only loaded, one at a
+        # time, for summaries that mention an error the transcript may have fixed
+        statuses = self.db.get_cache_status_bulk(episodes, mode)
+        cached_ids = [
+            status['id'] for status in statuses
+            if status and status['has_summary'] and status['has_paragraph_summary']
+        ]
+        cached_content = self.db.get_content_bulk(cached_ids, ('summary', 'paragraph_summary'), mode)
+        
+        for episode, status in zip(episodes, statuses):
+            if status:
+                content = cached_content.pop(status['id'], {})
+                summary = content.get('summary', '')
+                paragraph = content.get('paragraph_summary', '')
                 
                 # Check if we have summaries
                 if summary and paragraph:
+                    transcript = None
+                    if status['has_transcript'] and cache_validator.needs_transcript_check(summary, paragraph):
+                        transcript = self.db.get_content(status['id'], 'transcript', mode)
                     # Validate cache quality
                     if transcript and cache_validator.should_regenerate_summaries(transcript, summary, paragraph)[0]:
                         logger.info(f"[{self.correlation_id}] 🔄 STALE CACHE: {episode.podcast} - {episode.title[:50]}... (needs regeneration)")
@@ -741,23 +777,19 @@ class RenaissanceWeekly:
     async def _prepare_summaries_for_email(self, episodes: List[Episode]) -> List[Dict]:
         """Prepare summaries for episodes that already have them"""
         summaries = []
+        mode = self.current_transcription_mode
         
-        for episode in episodes:
-            # Get the full episode data from database which includes both summaries
-            episode_data = self.db.get_episode(
-                episode.podcast,
-                episode.title,
-                episode.published
-            )
-            
-            if episode_data:
-                # Extract the appropriate summaries based on transcription mode
-                if self.current_transcription_mode == 'test':
-                    full_summary = episode_data.get('summary_test')
-                    paragraph_summary = episode_data.get('paragraph_summary_test')
-                else:
-                    full_summary = episode_data.get('summary')
-                    paragraph_summary = episode_data.get('paragraph_summary')
+        # Summaries for the current mode in two queries, whatever the selection size
+        statuses = self.db.get_cache_status_bulk(episodes, mode)
+        content = self.db.get_content_bulk(
+            [status['id'] for status in statuses if status and status['has_summary']],
+            ('summary', 'paragraph_summary'), mode
+        )
+        
+        for episode, status in zip(episodes, statuses):
+            if status:
+                full_summary = content.get(status['id'], {}).get('summary')
+                paragraph_summary = content.get(status['id'], {}).get('paragraph_summary')
                 
                 if full_summary:
                     summaries.append({
@@ -768,10 +800,17 @@ class RenaissanceWeekly:
         
         return summaries
     
-    async def _process_episodes_with_resource_management(self, selected_episodes: List[Episode]) -> List[Dict]:
-        """Process episodes with dynamic concurrency based on system resources and OpenAI limits"""
+    async def _process_episodes_with_resource_management(self, selected_episodes: List[Episode],
+                                                         jobs: Optional[List[EpisodeJob]] = None) -> List[Dict]:
+        """Process episodes with dynamic concurrency based on system resources and OpenAI limits
+        
+        jobs, if given, are already-claimed queue jobs to process as they are.
+        """
         # Filter episodes that need processing BEFORE creating any async tasks
-        episodes_to_process = self.filter_episodes_needing_processing(selected_episodes)
+        if jobs is None:
+            episodes_to_process = self.filter_episodes_needing_processing(selected_episodes)
+        else:
+            episodes_to_process = [job.episode for job in jobs]
         
         # Log cache status
         cached_count = len(selected_episodes) - len(episodes_to_process)
@@ -803,6 +842,11 @@ class RenaissanceWeekly:
         # If some episodes need processing, process only those
         logger.info(f"[{self.correlation_id}] 🔄 Processing {len(episodes_to_process)} episodes that need summaries...")
         
+        # Lease them in the durable job queue; episodes an earlier run got partway through resume there
+        if jobs is None:
+            jobs = self._queue_episode_jobs(episodes_to_process)
+            episodes_to_process = [job.episode for job in jobs]
+        
         # Log processing time estimate
         time_estimate = self.estimate_processing_time(episodes_to_process)
         logger.info(f"[{self.correlation_id}] ⏱️  Estimated processing time: {time_estimate['estimated_minutes']:.1f} minutes")
@@ -832,125 +876,81 @@ class RenaissanceWeekly:
             for episode in cached_episodes:
                 self._progress_callback(episode, 'completed')
         
-        # Get optimal concurrency with separate limits for different services
-        whisper_concurrency_limit = 3  # Whisper API: 3 requests per minute
-        gpt4_concurrency_limit = 20  # GPT-4 API: Much higher limit (check your tier)
-        
-        # For I/O-bound operations like AssemblyAI, we don't need to limit by CPU cores
-        # AssemblyAI handles its own concurrency (32 concurrent) internally
-        # But we need to be careful with memory usage when processing audio files
-        # Memory requirements vary significantly between test and full mode
+        # Each stage runs its own worker pool; only the audio stages draw on the memory budget
         available_memory = get_available_memory()
+        memory_per_task = self.concurrency_manager.memory_per_task(self.current_transcription_mode == 'full')
+        memory_budget = MemoryBudget(available_memory * PIPELINE_MEMORY_FRACTION)
         
-        if self.current_transcription_mode == 'test':
-            # Test mode: With ffmpeg prioritized, we can be less conservative
-            # ffmpeg streams files without loading them into memory
-            # Only need to account for: trimmed file (15min = ~20MB) + API overhead
-            memory_per_task = 600   # MB - adjusted to match concurrency manager
-            max_concurrent = 3      # Reduced from 4 to prevent OOM on 2-core system
-        else:
-            # Full mode: Complete episodes can be 100-300MB
-            # Need extra buffer for 300MB files + transcription overhead
-            memory_per_task = 1500  # MB - very conservative for large files
-            max_concurrent = 2      # Very conservative for full episodes on 2-core system
-            
-        # Calculate safe concurrency with reasonable safety factor
-        available_for_tasks = available_memory * 0.70  # Keep 30% memory free (more conservative)
-        memory_safe_concurrency = min(int(available_for_tasks / memory_per_task), max_concurrent)
-        io_concurrency = max(2, memory_safe_concurrency)  # Minimum 2 for reasonable speed
-        cpu_bound_concurrency = self.concurrency_manager.get_optimal_concurrency(10)  # Limited by CPU/memory
-        
-        logger.info(f"[{self.correlation_id}] 🔄 Starting concurrent processing of {len(episodes_to_process)} episodes...")
+        logger.info(f"[{self.correlation_id}] 🔄 Starting pipelined processing of {len(episodes_to_process)} episodes...")
         logger.info(f"[{self.correlation_id}] 💾 Available memory: {available_memory:.0f}MB")
-        logger.info(f"[{self.correlation_id}] 📊 Memory calculations: {memory_per_task}MB per task, {available_for_tasks:.0f}MB available for tasks")
-        logger.info(f"[{self.correlation_id}] ⚙️  Episode concurrency limit: {io_concurrency} (memory-aware)")
-        logger.info(f"[{self.correlation_id}] 🎙️  Whisper API limit: {whisper_concurrency_limit} concurrent")
-        logger.info(f"[{self.correlation_id}] 🤖  GPT-4 API limit: {gpt4_concurrency_limit} concurrent")
+        logger.info(f"[{self.correlation_id}] 📊 Audio memory budget: {memory_budget.total_mb:.0f}MB, {memory_per_task}MB per transcription")
         logger.info(f"[{self.correlation_id}] 🚀  AssemblyAI: 32 concurrent (managed internally)")
-        logger.info(f"[{self.correlation_id}] 📊  Effective concurrency: Episodes({io_concurrency}), AssemblyAI(32), GPT-4(20)")
         
         # Progress tracker for processing
         process_progress = ProgressTracker(len(episodes_to_process), self.correlation_id)
         
-        # Create semaphores for different types of operations
-        # CRITICAL: Use the calculated io_concurrency to prevent OOM
-        # This limits total concurrent episode processing based on available memory
-        general_semaphore = asyncio.Semaphore(io_concurrency)  # Use memory-aware limit (2-5)
-        # Store API-specific semaphores for future use if needed
-        self._whisper_semaphore = asyncio.Semaphore(whisper_concurrency_limit)
-        self._gpt4_semaphore = asyncio.Semaphore(gpt4_concurrency_limit)
-        
-        # Create tasks with enhanced error handling
-        tasks = []
-        for i, episode in enumerate(episodes_to_process):
-            task = asyncio.create_task(
-                self._process_episode_with_monitoring(
-                    episode, general_semaphore, process_progress, i
-                )
-            )
-            tasks.append(task)
+        # Stage and API limits start at their configured sizes and adapt to memory, latency and 429s
+        controller = None
+        if ADAPTIVE_CONCURRENCY:
+            controller = AdaptiveConcurrencyController(correlation_id=self.correlation_id)
+            controller.register('openai_calls', openai_call_limit, uses_api=True)
         
-        # Store active tasks for cancellation support
-        self._active_tasks = tasks
+        pipeline = self._build_episode_pipeline(memory_budget, process_progress, controller)
+        for name, stage in pipeline.stages.items():
+            logger.info(f"[{self.correlation_id}] ⚙️  Stage {name}: {stage.workers} workers (max {stage.max_workers})"
+                        + (f", {stage.memory_mb:.0f}MB each" if stage.memory_mb else ""))
+        self._pipeline = pipeline
         
-        # DIAGNOSTIC: Log task creation
-        logger.info(f"[{self.correlation_id}] 📋 Created {len(tasks)} tasks for processing")
+        run_task = asyncio.create_task(pipeline.run(jobs))
+        
+        # Store the active task for cancellation support
+        self._active_tasks = [run_task]
         
         # Monitor resource usage periodically
-        monitor_task = asyncio.create_task(self._monitor_resources(io_concurrency))
+        monitor_task = asyncio.create_task(self._monitor_resources())
+        lease_task = asyncio.create_task(self._renew_job_leases())
+        if controller:
+            controller.start()
         
+        results = []
         try:
-            # Execute all tasks
-            logger.info(f"[{self.correlation_id}] 🚀 Starting asyncio.gather for {len(tasks)} tasks...")
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            logger.info(f"[{self.correlation_id}] ✅ asyncio.gather completed with {len(results)} results")
-            
-            # Process results maintaining order
-            for i, result in enumerate(results):
-                episode = episodes_to_process[i]
-                
-                if isinstance(result, asyncio.CancelledError):
-                    # Don't mark cancelled tasks as failed
-                    logger.info(f"[{self.correlation_id}] Episode {i+1} ({episode.title[:50]}...) was cancelled (not failed)")
-                    continue
-                elif isinstance(result, Exception):
-                    logger.error(
-                        f"[{self.correlation_id}] Episode {i+1} ({episode.title[:50]}...) "
-                        f"failed with exception: {result}"
-                    )
-                    await self.exception_aggregator.add_exception(
-                        f"process_episode_{i}_{episode.title[:30]}", 
-                        result
-                    )
-                    # Ensure failed episodes are marked as failed in UI
-                    if hasattr(self, '_progress_callback') and self._progress_callback:
-                        if not any(error.get('episode', '').endswith(episode.title) for error in self._processing_status.get('errors', [])):
-                            self._progress_callback(episode, 'failed', result)
-                elif isinstance(result, dict) and result:
-                    summaries.append(result)
-                    logger.info(f"[{self.correlation_id}] ✅ Episode {i+1} ({episode.title[:50]}...) successfully processed")
-                elif result is None:
-                    logger.warning(f"[{self.correlation_id}] ⚠️ Episode {i+1} ({episode.title[:50]}...) returned None")
-                    # Ensure episodes that returned None are marked as failed
-                    if hasattr(self, '_progress_callback') and self._progress_callback:
-                        # Check if this episode wasn't already marked as completed or failed
-                        episode_key = f"{episode.podcast}:{episode.title}"
-                        if episode_key in self._processing_status.get('currently_processing', set()):
-                            self._progress_callback(episode, 'failed', Exception("Episode processing returned None"))
-                else:
-                    logger.warning(f"[{self.correlation_id}] ⚠️ Episode {i+1} ({episode.title[:50]}...) returned unexpected result type: {type(result)}")
+            try:
+                results = await run_task
+            except asyncio.CancelledError:
+                if not self._processing_cancelled:
+                    raise
+                logger.info(f"[{self.correlation_id}] Pipeline cancelled - keeping finished episodes")
+            
+            for i, job in enumerate(jobs):
+                if job.full_summary:
+                    summaries.append({
+                        "episode": job.episode,
+                        "summary": job.full_summary,
+                        "paragraph_summary": job.paragraph_summary or ''
+                    })
+                    logger.info(f"[{self.correlation_id}] ✅ Episode {i+1} ({job.episode.title[:50]}...) successfully processed")
             
         finally:
             # Cancel monitoring
-            monitor_task.cancel()
-            try:
-                await monitor_task
-            except asyncio.CancelledError:
-                pass
+            for task in (monitor_task, lease_task):
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+            if controller:
+                await controller.stop()
+            
+            # Anything still leased didn't finish - leave it queued at its last checkpoint
+            await asyncio.to_thread(self.db.release_job_leases, self.correlation_id)
             
             # Clear active tasks list
             self._active_tasks = []
         
+        self._log_stage_metrics(pipeline)
+        if controller and controller.decisions:
+            logger.info(f"[{self.correlation_id}] 🎚️  {len(controller.decisions)} concurrency adjustments during the run")
+        
         # Log processing summary
         process_summary = process_progress.get_summary()
         
@@ -962,9 +962,9 @@ class RenaissanceWeekly:
                 f"Expected: {process_summary['total_items']}, Processed: {total_processed}"
             )
             # Log which episodes might be missing
-            if len(results) < len(selected_episodes):
+            if len(results) < len(episodes_to_process):
                 logger.error(
-                    f"[{self.correlation_id}] 🚨 Results mismatch: {len(results)} results for {len(selected_episodes)} episodes"
+                    f"[{self.correlation_id}] 🚨 Results mismatch: {len(results)} results for {len(episodes_to_process)} episodes"
                 )
             
             # Fix UI status by marking unprocessed episodes as failed
@@ -1022,155 +1022,296 @@ class RenaissanceWeekly:
             
         return summaries
     
-    async def _process_episode_with_monitoring(self, episode: Episode, semaphore: asyncio.Semaphore, 
-                                             progress: ProgressTracker, index: int) -> Optional[Dict]:
-        """Process single episode with monitoring and error handling"""
-        # CRITICAL: Acquire semaphore to limit concurrent processing
-        async with semaphore:
-            # Check for cancellation before starting
-            if self._processing_cancelled:
-                logger.info(f"[{self.correlation_id}] Processing cancelled, skipping episode {index+1}")
-                return None
-                
-            episode_id = f"{episode.podcast}:{episode.title[:30]}"
-            episode_key = f"{episode.podcast}:{episode.title}"
-            episode_timeout = 1800  # 30 minutes per episode (for very long podcasts)
+    def _build_episode_pipeline(self, memory_budget: MemoryBudget,
+                                progress: Optional[ProgressTracker] = None,
+                                controller: Optional[AdaptiveConcurrencyController] = None) -> StagePipeline:
+        """Stage graph: fetch transcript → prefetch → acquire audio → transcribe → post-process → summarize → persist"""
+        memory_per_task = self.concurrency_manager.memory_per_task(self.current_transcription_mode == 'full')
+        self._prefetch_window = PrefetchWindow(PREFETCH_EPISODES, PREFETCH_MAX_MB, PREFETCH_MIN_FREE_DISK_MB, AUDIO_DIR)
+        # The controller may grow a stage up to ADAPTIVE_MAX_SCALE times its configured workers
+        scale = ADAPTIVE_MAX_SCALE if controller else 1
+        
+        def stage(name: str, handler: Callable, workers: int, **kwargs) -> Stage:
+            return Stage(name, handler, workers, max_workers=max(int(workers * scale), workers), **kwargs)
+        
+        async def on_finish(job: EpisodeJob, error: Optional[BaseException]):
+            await self._finish_episode_job(job, error, progress)
+        
+        return StagePipeline(
+            [
+                stage('fetch_transcript', self._stage_fetch_transcript, PIPELINE_FETCH_WORKERS,
+                      timeout=600, retries=2),
+                # Waits for room in the prefetch window; no timeout, since it waits on transcription
+                Stage('prefetch', self._stage_prefetch, workers=1),
+                # Downloads stream to disk; the reservation covers buffers and test-mode trimming
+                stage('acquire_audio', self._stage_acquire_audio, PIPELINE_AUDIO_WORKERS,
+                      memory_mb=200, timeout=900, retries=2),
+                stage('transcribe', self._stage_transcribe, PIPELINE_TRANSCRIBE_WORKERS,
+                      memory_mb=memory_per_task, timeout=1800, retries=2, uses_api=True),
+                stage('post_process', self._stage_post_process, PIPELINE_POSTPROCESS_WORKERS,
+                      timeout=600, retries=2, uses_api=True),
+                stage('summarize', self._stage_summarize, PIPELINE_SUMMARIZE_WORKERS,
+                      timeout=900, uses_api=True),
+                stage('persist', self._stage_persist, PIPELINE_PERSIST_WORKERS, timeout=120, retries=2),
+            ],
+            queue_size=PIPELINE_QUEUE_SIZE,
+            memory_budget=memory_budget,
+            on_finish=on_finish,
+            on_stage=EpisodeJob.record_stage,
+            on_advance=self._checkpoint_job,
+            controller=controller,
+            correlation_id=self.correlation_id
+        )
+    
+    async def _finish_episode_job(self, job: EpisodeJob, error: Optional[BaseException],
+                                  progress: Optional[ProgressTracker] = None):
+        """Record an episode's outcome once it leaves the pipeline"""
+        episode, episode_key = job.episode, job.key
+        await self._release_job_audio(job)
+        
+        job.error = error
+        if job.started_at is None:
+            # Never started - processing was cancelled before this episode came up
+            job.outcome = 'cancelled'
+            await self._finish_queued_job(job)
+            return
         
+        job.finished_at = time.time()
+        success = error is None and bool(job.full_summary)
+        if success:
+            job.outcome = job.outcome or 'completed'
+        elif self._processing_cancelled:
+            job.outcome = 'cancelled'
+        else:
+            job.outcome = 'failed'
+        
+        timings = " | ".join(f"{stage} {seconds:.1f}s" for stage, seconds in job.timings.items())
+        logger.info(f"[{job.id}] ⏱️  {job.label} {job.outcome} after {job.elapsed:.1f}s ({timings})")
+        await self._finish_queued_job(job)
+        
+        if job.outcome == 'cancelled':
+            # Don't mark cancelled episodes as failed
+            logger.info(f"[{self.correlation_id}] Episode {job.label} was cancelled")
+            if self._processing_status:
+                with self._status_lock:
+                    self._processing_status['currently_processing'].discard(episode_key)
+            return
+        
+        if progress:
+            await progress.complete_item(success, item_name=job.label, started_at=job.started_at)
+        
+        if error is not None:
+            logger.error(f"[{self.correlation_id}] Failed to process {job.label}: {error}")
+            await self.exception_aggregator.add_exception(job.label, error)
+        
+        # Update processing status (thread-safe)
+        if self._processing_status:
+            with self._status_lock:
+                self._processing_status['currently_processing'].discard(episode_key)
+                if success:
+                    self._processing_status['completed'] += 1
+                    self._processing_status['completed_episodes'].add(episode_key)
+                else:
+                    self._processing_status['failed'] += 1
+                    if error is not None:
+                        # Limit error list to prevent unbounded memory growth
+                        MAX_ERRORS = 100
+                        if len(self._processing_status['errors']) < MAX_ERRORS:
+                            self._processing_status['errors'].append({
+                                'episode': f"{episode.podcast}: {episode.title}",
+                                'message': str(error)[:200]  # Limit error message length
+                            })
+                        elif len(self._processing_status['errors']) == MAX_ERRORS:
+                            # Add a final message indicating truncation
+                            self._processing_status['errors'].append({
+                                'episode': "...",
+                                'message': f"Error list truncated after {MAX_ERRORS} errors"
+                            })
+        
+        # Call progress callback if available
+        if hasattr(self, '_progress_callback') and self._progress_callback:
+            if success:
+                self._progress_callback(episode, 'completed')
+            elif error is not None:
+                self._progress_callback(episode, 'failed', error)
+            else:
+                self._progress_callback(episode, 'failed')
+        
+        # Force garbage collection after processing large files
+        gc.collect()
+    
+    def _queue_episode_jobs(self, episodes: List[Episode]) -> List[EpisodeJob]:
+        """Jobs for episodes, leased to this run in the durable queue
+        
+        Episodes another live run holds are left to it. Without the queue,
+        processing goes ahead but can't be resumed.
+        """
+        mode = self.current_transcription_mode
+        rows = self.db.claim_jobs(episodes, mode, self.correlation_id, JOB_LEASE_SECONDS)
+        if rows is None:
+            logger.warning(f"[{self.correlation_id}] ⚠️  Job queue unavailable - this run can't be resumed if interrupted")
+            return [EpisodeJob(episode, mode) for episode in episodes]
+        
+        claimed = []
+        for episode, row in zip(episodes, rows):
+            if row is None:
+                logger.warning(f"[{self.correlation_id}] ⏭️  {episode.podcast}: {episode.title[:50]} "
+                               f"is being processed by another run - skipping")
+                continue
+            row['episode'] = episode
+            claimed.append(row)
+        
+        jobs = self._jobs_from_rows(claimed)
+        resumed = sum(1 for job in jobs if job.checkpoint)
+        if resumed:
+            logger.info(f"[{self.correlation_id}] ⏯️  {resumed} episodes continue from where an earlier run stopped")
+        return jobs
+    
+    def _jobs_from_rows(self, rows: List[Dict]) -> List[EpisodeJob]:
+        jobs = []
+        for row in rows:
+            job = EpisodeJob(row['episode'], row['mode'])
+            job.queue_id = row['id']
+            if row['stage'] != JOB_STAGES[0]:
+                job.checkpoint = row
+            jobs.append(job)
+        return jobs
+    
+    async def resume_queued_jobs(self) -> List[Dict]:
+        """Drain the durable job queue: finish the episodes interrupted runs left behind"""
+        rows = self.db.claim_resumable_jobs(self.correlation_id, JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS)
+        if not rows:
+            logger.info(f"[{self.correlation_id}] ✅ Nothing to resume - the job queue is empty")
+            return []
+        
+        jobs = self._jobs_from_rows(rows)
+        # Memory is reserved for the heaviest mode in the queue
+        self.current_transcription_mode = 'full' if any(job.mode == 'full' for job in jobs) else 'test'
+        self.concurrency_manager.is_full_mode = (self.current_transcription_mode == 'full')
+        
+        logger.info(f"[{self.correlation_id}] ⏯️  Resuming {len(jobs)} episodes:")
+        for job in jobs:
+            stage = job.checkpoint['stage'] if job.checkpoint else JOB_STAGES[0]
+            logger.info(f"[{self.correlation_id}]    {job.label} ({job.mode} mode) at {stage}")
+        
+        summaries = await self._process_episodes_with_resource_management([job.episode for job in jobs], jobs=jobs)
+        logger.info(f"[{self.correlation_id}] ✅ Resume complete - {len(summaries)} summaries saved for the next digest")
+        return summaries
+    
+    async def _resume_from_checkpoint(self, job: EpisodeJob) -> Optional[str]:
+        """Restore what an interrupted run produced; returns the stage to continue at
+        
+        None means there's nothing usable to resume from and the episode
+        starts over.
+        """
+        checkpoint, job.checkpoint = job.checkpoint, None
+        episode, episode_id, stage = job.episode, job.id, checkpoint['stage']
+        
+        if stage in ('post_process', 'summarize', 'persist') and checkpoint['transcript_id']:
+            transcript = await asyncio.to_thread(
+                self.db.get_content, checkpoint['transcript_id'], 'transcript', job.mode
+            )
+            if transcript:
+                job.db_id = checkpoint['transcript_id']
+                job.transcript = transcript
+                job.source = TranscriptSource(checkpoint['transcript_source'] or TranscriptSource.CACHED.value)
+                # Summaries are only saved by persist, so an interrupted persist summarizes again
+                stage = 'summarize' if stage == 'persist' else stage
+                logger.info(f"[{episode_id}] ⏯️  Resuming at {stage} with the saved transcript ({len(transcript)} characters)")
+                return stage
+            logger.warning(f"[{episode_id}] ⚠️  Saved transcript is gone - starting over")
+            return None
+        
+        if stage == 'transcribe':
+            job.audio_file = self.transcriber.restore_audio(episode, checkpoint['audio_blob'], job.mode, episode_id)
+            if job.audio_file:
+                logger.info(f"[{episode_id}] ⏯️  Resuming at transcribe without downloading again")
+                return 'transcribe'
+            logger.warning(f"[{episode_id}] ⚠️  Downloaded audio is gone - downloading again")
+        
+        if stage in ('prefetch', 'acquire_audio', 'transcribe') and episode.audio_url:
+            # An earlier run already found no usable transcript
+            logger.info(f"[{episode_id}] ⏯️  Resuming at audio download")
+            return 'prefetch'
+        return None
+    
+    async def _checkpoint_job(self, job: EpisodeJob, stage: str, next_stage: Optional[str]):
+        """Record a completed stage in the durable job queue, with whatever it produced"""
+        if job.queue_id is None or self._processing_cancelled:
+            return
+        
+        artifacts = {}
+        if stage == 'acquire_audio' and job.audio_file:
+            artifacts['audio_blob'] = self.transcriber.audio_pointer(job.audio_file)
+        elif next_stage in ('post_process', 'summarize') and job.transcript:
+            if stage == 'fetch_transcript' and job.source is TranscriptSource.CACHED and job.db_id:
+                transcript_id = job.db_id  # Already in the database
+            else:
+                # Save it now, so a restart doesn't fetch, transcribe or correct it again
+                transcript_id = await asyncio.to_thread(
+                    self.db.save_episode, job.episode, job.transcript, job.source,
+                    transcription_mode=job.mode
+                )
+                job.db_id = transcript_id if transcript_id > 0 else job.db_id
+            artifacts.update(transcript_id=job.db_id, transcript_source=job.source.value if job.source else None)
+        elif stage == 'persist' and job.full_summary and job.db_id:
+            artifacts['summary_id'] = job.db_id
+        
+        await asyncio.to_thread(
+            self.db.checkpoint_job, job.queue_id, stage, next_stage, job.timings.get(stage), **artifacts
+        )
+    
+    async def _finish_queued_job(self, job: EpisodeJob):
+        """Close the episode's job: done, failed at its last stage, or back in the queue if cancelled"""
+        if job.queue_id is None:
+            return
+        if job.outcome in ('completed', 'cached'):
+            status, error = 'completed', None
+        elif job.outcome == 'cancelled':
+            status, error = 'pending', None
+        else:
+            status, error = 'failed', str(job.error or 'No summary generated')[:500]
+        await asyncio.to_thread(self.db.finish_job, job.queue_id, status, job.stage, error)
+    
+    async def _renew_job_leases(self):
+        """Keep this run's job leases alive while it processes them"""
+        while True:
+            await asyncio.sleep(JOB_LEASE_SECONDS / 3)
             try:
-                await progress.start_item(episode_id)
-            
-                # Update processing status if available (thread-safe)
-                if self._processing_status:
-                    with self._status_lock:
-                        self._processing_status['currently_processing'].add(episode_key)
-            
-                # Call progress callback if available
-                if hasattr(self, '_progress_callback') and self._progress_callback:
-                    self._progress_callback(episode, 'processing')
-            
-                # Add retry logic with exponential backoff
-                max_retries = 3
-                last_exception = None
-            
-                for attempt in range(max_retries):
-                    try:
-                        # Check for cancellation in retry loop
-                        if self._processing_cancelled:
-                            logger.info(f"[{self.correlation_id}] Processing cancelled during episode {index+1}")
-                            return None
-                        
-                        # Add timeout to prevent stuck episodes
-                        logger.debug(f"[{self.correlation_id}] Processing episode {index+1}: {episode_id}")
-                        result = await asyncio.wait_for(
-                            self.process_episode(episode),
-                            timeout=episode_timeout
-                        )
-                    
-                        if result and result.get('full_summary'):
-                            await progress.complete_item(True)
-                            # Update processing status (thread-safe)
-                            if self._processing_status:
-                                with self._status_lock:
-                                    self._processing_status['completed'] += 1
-                                    self._processing_status['currently_processing'].discard(episode_key)
-                                    self._processing_status['completed_episodes'].add(episode_key)
-                        
-                            # Call progress callback if available
-                            if hasattr(self, '_progress_callback') and self._progress_callback:
-                                self._progress_callback(episode, 'completed')
-                            logger.debug(f"[{self.correlation_id}] Episode {index+1} completed successfully")
-                            # Force garbage collection after processing large files
-                            gc.collect()
-                            return {
-                                "episode": episode, 
-                                "summary": result['full_summary'],
-                                "paragraph_summary": result.get('paragraph_summary', '')
-                            }
-                        else:
-                            await progress.complete_item(False)
-                            # Update processing status (thread-safe)
-                            if self._processing_status:
-                                with self._status_lock:
-                                    self._processing_status['failed'] += 1
-                                    self._processing_status['currently_processing'].discard(episode_key)
-                        
-                            # Call progress callback if available
-                            if hasattr(self, '_progress_callback') and self._progress_callback:
-                                self._progress_callback(episode, 'failed')
-                            logger.debug(f"[{self.correlation_id}] Episode {index+1} completed with no summary")
-                            return None
-                        
-                    except asyncio.TimeoutError:
-                            logger.error(
-                                f"[{self.correlation_id}] Episode {index+1} ({episode_id}) timed out after {episode_timeout}s"
-                            )
-                            last_exception = asyncio.TimeoutError(f"Episode processing timed out after {episode_timeout}s")
-                            # Update processing status on timeout (thread-safe)
-                            if self._processing_status:
-                                with self._status_lock:
-                                    self._processing_status['currently_processing'].discard(episode_key)
-                            if attempt < max_retries - 1:
-                                logger.warning(f"[{self.correlation_id}] Retrying episode {index+1}...")
-                                continue
-                            else:
-                                raise last_exception
-                    except Exception as e:
-                        last_exception = e
-                        if attempt < max_retries - 1:
-                            delay = exponential_backoff_with_jitter(attempt)
-                            logger.warning(
-                                f"[{self.correlation_id}] Episode processing attempt {attempt + 1} failed: {e}. "
-                                f"Retrying in {delay:.1f}s..."
-                            )
-                            await asyncio.sleep(delay)
-                        else:
-                            raise
-                
-            except asyncio.CancelledError:
-                # Don't mark cancelled episodes as failed
-                logger.info(f"[{self.correlation_id}] Episode {episode_id} was cancelled")
-                raise  # Re-raise to propagate cancellation
+                await asyncio.to_thread(self.db.renew_job_leases, self.correlation_id, JOB_LEASE_SECONDS)
             except Exception as e:
-                logger.error(
-                    f"[{self.correlation_id}] Failed to process {episode_id} after {max_retries} attempts: {e}"
-                )
-                await self.exception_aggregator.add_exception(episode_id, e)
-                await progress.complete_item(False)
-            
-                # Update processing status with error (thread-safe)
-                if self._processing_status:
-                    with self._status_lock:
-                        self._processing_status['failed'] += 1
-                        self._processing_status['currently_processing'].discard(episode_key)
-            
-                # Call progress callback if available
-                if hasattr(self, '_progress_callback') and self._progress_callback:
-                    self._progress_callback(episode, 'failed', e)
-                    if self._processing_status:
-                        with self._status_lock:
-                            # Limit error list to prevent unbounded memory growth
-                            MAX_ERRORS = 100
-                            if len(self._processing_status['errors']) < MAX_ERRORS:
-                                self._processing_status['errors'].append({
-                                    'episode': f"{episode.podcast}: {episode.title}",
-                                    'message': str(e)[:200]  # Limit error message length
-                                })
-                            elif len(self._processing_status['errors']) == MAX_ERRORS:
-                                # Add a final message indicating truncation
-                                self._processing_status['errors'].append({
-                                    'episode': "...",
-                                    'message': f"Error list truncated after {MAX_ERRORS} errors"
-                                })
-            
-                return None
-            finally:
-                # CRITICAL FIX: Always remove from currently_processing, regardless of outcome
-                if self._processing_status:
-                    with self._status_lock:
-                        self._processing_status['currently_processing'].discard(episode_key)
-                        logger.debug(f"[{self.correlation_id}] Removed {episode_key} from currently_processing")
+                logger.debug(f"[{self.correlation_id}] Job lease renewal failed: {e}")
+    
+    async def _release_job_audio(self, job: EpisodeJob):
+        """Delete the job's audio and give its room in the prefetch window back"""
+        if job.audio_file:
+            self.transcriber.release_audio(job.audio_file, job.id)
+            job.audio_file = None
+        if self._prefetch_window:
+            await self._prefetch_window.release(job.id)
+    
+    def get_stage_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage throughput of the current (or last) processing run"""
+        pipeline = getattr(self, '_pipeline', None)
+        return pipeline.snapshot() if pipeline else {}
+    
+    def _log_stage_metrics(self, pipeline: StagePipeline):
+        logger.info(f"[{self.correlation_id}] 📈 Stage throughput:")
+        for name, stats in pipeline.snapshot().items():
+            logger.info(
+                f"[{self.correlation_id}]    {name}: {stats['processed']} done, {stats['failed']} failed, "
+                f"{stats['throughput_per_min']:.1f}/min, avg {stats['avg_seconds']:.1f}s "
+                f"(queued {stats['avg_wait_seconds']:.1f}s), peak {stats['peak_in_flight']} in flight, "
+                f"{stats['utilization'] * 100:.0f}% busy"
+            )
+        if self._prefetch_window:
+            window = self._prefetch_window.snapshot()
+            logger.info(
+                f"[{self.correlation_id}] 📥 Prefetch: up to {window['peak_ahead']} episodes downloaded ahead "
+                f"of transcription, {window['wait_seconds']:.1f}s waiting for room"
+            )
     
-    async def _monitor_resources(self, initial_concurrency: int):
+    async def _monitor_resources(self):
         """Monitor system resources and log warnings if needed"""
         check_interval = 30  # seconds
         low_memory_threshold = 500 if self.concurrency_manager.is_full_mode else 200  # MB
@@ -1192,8 +1333,7 @@ class RenaissanceWeekly:
                 if available_memory < low_memory_threshold:
                     logger.warning(
                         f"[{self.correlation_id}] ⚠️  Low memory warning: {available_memory:.0f}MB available "
-                        f"(threshold: {low_memory_threshold}MB). "
-                        f"Consider reducing concurrency from {initial_concurrency}."
+                        f"(threshold: {low_memory_threshold}MB)"
                     )
                 
                 # Log API rate limiter status
@@ -1204,14 +1344,49 @@ class RenaissanceWeekly:
                         f"({api_usage['current_requests']}/{api_usage['max_requests']} requests)"
                     )
                 
+                # Log where episodes are in the pipeline
+                stage_metrics = self.get_stage_metrics()
+                if stage_metrics:
+                    logger.info(f"[{self.correlation_id}] 🔀 Stages: " + " | ".join(
+                        f"{name} {stats['in_flight']}/{stats['limit']} active, {stats['processed']} done"
+                        for name, stats in stage_metrics.items()
+                    ))
+                if self._prefetch_window:
+                    window = self._prefetch_window.snapshot()
+                    logger.info(
+                        f"[{self.correlation_id}] 📥 Prefetch: {window['ahead']}/{PREFETCH_EPISODES} episodes ahead, "
+                        f"{window['held_mb']:.0f}/{PREFETCH_MAX_MB:.0f}MB of audio held"
+                    )
+                
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.debug(f"[{self.correlation_id}] Resource monitoring error: {e}")
     
-    async def process_episode(self, episode: Episode) -> Optional[str]:
-        """Process a single episode with comprehensive logging"""
-        episode_id = str(uuid.uuid4())[:8]
+    async def process_episode(self, episode: Episode) -> Optional[Dict]:
+        """Process a single episode through the stage pipeline"""
+        memory_budget = MemoryBudget(get_available_memory() * PIPELINE_MEMORY_FRACTION)
+        pipeline = self._build_episode_pipeline(memory_budget)
+        job = EpisodeJob(episode, getattr(self, 'current_transcription_mode', 'test'))
+        errors = await pipeline.run([job])
+        if errors[0] is not None:
+            raise errors[0]
+        return job.summaries()
+    
+    async def _stage_fetch_transcript(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 1: cached summaries, cached transcript, or a published transcript"""
+        if self._processing_cancelled:
+            return None
+        
+        episode, episode_id = job.episode, job.id
+        if job.started_at is None:
+            job.started_at = time.time()
+            if self._processing_status:
+                with self._status_lock:
+                    self._processing_status['currently_processing'].add(job.key)
+            if hasattr(self, '_progress_callback') and self._progress_callback:
+                self._progress_callback(episode, 'processing')
+        
         logger.info(f"\n[{episode_id}] {'='*60}")
         logger.info(f"[{episode_id}] 🎧 PROCESSING EPISODE:")
         logger.info(f"[{episode_id}]    Title: {episode.title}")
@@ -1222,22 +1397,28 @@ class RenaissanceWeekly:
         logger.info(f"[{episode_id}]    Transcript URL: {'Yes' if episode.transcript_url else 'No'}")
         logger.info(f"[{episode_id}] {'='*60}")
         
+        if job.checkpoint:
+            resume_stage = await self._resume_from_checkpoint(job)
+            if resume_stage:
+                return resume_stage
+        
+        current_mode = job.mode
+        
         # Check if episode already has a summary in the database
-        existing_summary = self.db.get_episode_summary(
-            episode.podcast, episode.title, episode.published,
-            transcription_mode=self.current_transcription_mode
+        existing_summary = await asyncio.to_thread(
+            self.db.get_episode_summary, episode.podcast, episode.title, episode.published,
+            transcription_mode=current_mode
         )
         if existing_summary:
             logger.info(f"[{episode_id}] ✅ Episode already processed - using cached summary")
             logger.info(f"[{episode_id}] 📏 Summary length: {len(existing_summary)} characters")
-            logger.info(f"[{episode_id}] {'='*60}\n")
-            return existing_summary
+            job.full_summary = existing_summary
+            job.outcome = 'cached'
+            return None
         
         # ADDITIONAL CACHE CHECK - Direct database lookup for transcript and summaries
         # This catches cases where the Episode object matching might fail
         logger.info(f"[{episode_id}] 🔍 DIRECT CACHE CHECK: Looking for existing data...")
-        logger.info(f"[{episode_id}]    Podcast: {episode.podcast}")
-        logger.info(f"[{episode_id}]    Title: {episode.title[:80]}...")
         
         # Skip cache if force-fresh is enabled
         force_fresh = getattr(self, 'force_fresh_summaries', False)
@@ -1245,276 +1426,222 @@ class RenaissanceWeekly:
             logger.info(f"[{episode_id}] ⚠️  Force-fresh enabled - skipping cache")
         else:
             try:
-                # Use simplified lookup that's resilient to date/GUID variations
-                with sqlite3.connect(self.db.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # Determine which columns to check based on mode
-                    if self.current_transcription_mode == 'test':
-                        transcript_col = 'transcript_test'
-                        summary_col = 'summary_test'
-                        paragraph_col = 'paragraph_summary_test'
+                # Title lookup resilient to date/GUID variations: exact, fingerprint, GUID, then fuzzy
+                result = await asyncio.to_thread(
+                    self.db.find_episode_by_title, episode.podcast, episode.title, episode.published, episode.guid
+                )
+                if result:
+                    job.db_id = result['id']
+                    job.cached_transcript = await asyncio.to_thread(
+                        self.db.get_content, job.db_id, 'transcript', current_mode
+                    )
+                    if result['fuzzy']:
+                        # Probably the same episode - good for its transcript, not for reusing summaries as is
+                        logger.info(f"[{episode_id}] 🔎 Fuzzy title match '{result['title'][:60]}' - summaries will be regenerated")
                     else:
-                        transcript_col = 'transcript'
-                        summary_col = 'summary'
-                        paragraph_col = 'paragraph_summary'
-                    
-                    # Look for episodes with matching podcast and similar title
-                    cursor.execute(f"""
-                        SELECT {transcript_col}, {summary_col}, {paragraph_col}, guid, id
-                        FROM episodes 
-                        WHERE podcast = ? 
-                        AND (
-                            title = ? OR 
-                            title LIKE ? OR
-                            title LIKE ?
+                        job.cached_summary = await asyncio.to_thread(
+                            self.db.get_content, job.db_id, 'summary', current_mode
                         )
-                        ORDER BY published DESC
-                        LIMIT 1
-                    """, (
-                        episode.podcast, 
-                        episode.title,
-                        f"{episode.title[:50]}%",  # Match by first 50 chars
-                        f"%{episode.title[-50:]}"   # Match by last 50 chars
-                    ))
-                    
-                    result = cursor.fetchone()
-                    if result:
-                        cached_transcript, cached_summary, cached_paragraph, db_guid, db_id = result
-                        
-                        logger.info(f"[{episode_id}] 📊 CACHE RESULT:")
-                        logger.info(f"[{episode_id}]    DB ID: {db_id}")
-                        logger.info(f"[{episode_id}]    DB GUID: {db_guid}")
-                        logger.info(f"[{episode_id}]    Transcript: {len(cached_transcript) if cached_transcript else 0} chars")
-                        logger.info(f"[{episode_id}]    Full Summary: {len(cached_summary) if cached_summary else 0} chars")
-                        logger.info(f"[{episode_id}]    Paragraph: {len(cached_paragraph) if cached_paragraph else 0} chars")
-                        
-                        # If we have both summaries, check if they need regeneration
-                        if cached_summary and cached_paragraph:
-                            # Validate cache quality
-                            if cached_transcript:
-                                needs_regen = cache_validator.should_regenerate_summaries(
-                                    cached_transcript, cached_summary, cached_paragraph
-                                )
-                                
-                                if needs_regen[0]:  # needs_regen is (bool, reason)
-                                    logger.info(f"[{episode_id}] ⚠️  STALE CACHE! {needs_regen[1]}")
-                                    logger.info(f"[{episode_id}] 🔄 Will regenerate summaries with corrected transcript")
-                                    # Store transcript for later use and continue processing
-                                    self._cached_transcript = cached_transcript
-                                    self._cached_transcript_source = TranscriptSource.CACHED
-                                else:
-                                    logger.info(f"[{episode_id}] 🎉 CACHE HIT! Episode fully processed - skipping all processing")
-                                    logger.info(f"[{episode_id}] {'='*60}\n")
-                                    return {
-                                        'full_summary': cached_summary,
-                                        'paragraph_summary': cached_paragraph
-                                    }
-                            else:
-                                # No transcript to validate against, use cache as-is
-                                logger.info(f"[{episode_id}] 🎉 CACHE HIT! Episode fully processed - skipping all processing")
-                                logger.info(f"[{episode_id}] {'='*60}\n")
-                                return {
-                                    'full_summary': cached_summary,
-                                    'paragraph_summary': cached_paragraph
-                                }
-                        
-                        # If we have transcript but missing summaries, we can regenerate just the summaries
-                        elif cached_transcript and (not cached_summary or not cached_paragraph):
-                            logger.info(f"[{episode_id}] 📝 PARTIAL CACHE HIT! Have transcript, need to generate summaries")
-                            # Store the cached transcript for later use
-                            self._cached_transcript = cached_transcript
-                            self._cached_transcript_source = TranscriptSource.CACHED
-                    else:
-                        logger.info(f"[{episode_id}] ❌ CACHE MISS - No matching episode found in database")
-                        
-            except Exception as e:
-                logger.error(f"[{episode_id}] ⚠️  Cache check failed: {e}")
-                # Continue with normal processing if cache check fails
-        
-        try:
-            # Get current transcription mode
-            current_mode = getattr(self, 'current_transcription_mode', 'test')
-            
-            # Step 1: Try to find existing transcript
-            logger.info(f"\n[{episode_id}] 📄 Step 1: Checking for existing transcript...")
-            logger.info(f"[{episode_id}]    GUID: {episode.guid or 'None'}")
-            
-            # Check if we already found a cached transcript in the direct cache check above
-            if hasattr(self, '_cached_transcript') and self._cached_transcript:
-                transcript_text = self._cached_transcript
-                transcript_source = self._cached_transcript_source
-                logger.info(f"[{episode_id}] ✅ Using cached transcript from direct lookup")
-                
-                # Post-process cached transcript if it contains known errors
-                # Quick check for common errors before running expensive AI processing
-                needs_processing = transcript_postprocessor.needs_processing(transcript_text)
-                
-                if needs_processing:
-                    logger.info(f"[{episode_id}] 🤖 Cached transcript may contain errors, running AI post-processing...")
-                    processed_transcript, corrections = await transcript_postprocessor.process_transcript(
-                        transcript_text, episode.podcast, episode.title
-                    )
-                    
-                    if corrections > 0:
-                        transcript_text = processed_transcript
-                        logger.info(f"[{episode_id}] ✅ Fixed {corrections} errors in cached transcript")
-                        # Update the database with the cleaned transcript
-                        self.db.save_episode(episode, transcript_text, transcript_source, transcription_mode=self.current_transcription_mode)
-                logger.info(f"[{episode_id}] 📏 Transcript length: {len(transcript_text)} characters")
-                # Clear the cached values
-                self._cached_transcript = None
-                self._cached_transcript_source = None
-            else:
-                transcript_text, transcript_source = await self.transcript_finder.find_transcript(episode, current_mode)
-            
-            # If transcript found, validate it immediately
-            if transcript_text:
-                # Validate the transcript content
-                if self.summarizer._validate_transcript_content(transcript_text, transcript_source):
-                    logger.info(f"[{episode_id}] ✅ Found valid transcript (source: {transcript_source.value})")
-                    logger.info(f"[{episode_id}] 📏 Transcript length: {len(transcript_text)} characters")
-                    
-                    # Post-process found transcripts (not cached ones)
-                    if transcript_source != TranscriptSource.CACHED:
-                        logger.info(f"[{episode_id}] 🤖 Running AI post-processing on found transcript...")
-                        processed_transcript, corrections = await transcript_postprocessor.process_transcript(
-                            transcript_text, episode.podcast, episode.title
+                        job.cached_paragraph = await asyncio.to_thread(
+                            self.db.get_content, job.db_id, 'paragraph_summary', current_mode
                         )
-                        
-                        if corrections > 0:
-                            transcript_text = processed_transcript
-                            logger.info(f"[{episode_id}] ✅ Fixed {corrections} transcription errors")
                     
-                    monitor.record_success('transcript_fetch', episode.podcast, mode=current_mode)
-                else:
-                    logger.warning(f"[{episode_id}] ⚠️ Found transcript but validation failed - falling back to audio")
-                    monitor.record_failure('transcript_fetch', episode.podcast, episode.title, 
-                                         'ValidationFailed', 'Transcript found but contains only metadata', mode=current_mode)
-                    # Reset transcript to trigger audio fallback
-                    transcript_text = None
-                    transcript_source = None
-            
-            # Step 2: If no valid transcript found, transcribe from audio
-            if not transcript_text:
-                # Only record as NotFound if we didn't already record as ValidationFailed
-                if transcript_source is None:
-                    monitor.record_failure('transcript_fetch', episode.podcast, episode.title, 
-                                         'NotFound', 'No transcript found from any source', mode=current_mode)
-                logger.info(f"\n[{episode_id}] 🎵 Step 2: No valid transcript found - transcribing from audio...")
-                
-                # Check if we have audio URL
-                if not episode.audio_url:
-                    logger.error(f"[{episode_id}] ❌ No audio URL available for this episode")
-                    return None
-                
-                logger.info(f"[{episode_id}] 🔗 Audio URL: {episode.audio_url[:80]}...")
-                transcript_text = await self.transcriber.transcribe_episode(episode, self.current_transcription_mode)
-                
-                if transcript_text:
-                    transcript_source = TranscriptSource.GENERATED
-                    logger.info(f"[{episode_id}] ✅ Audio transcribed successfully")
-                    logger.info(f"[{episode_id}] 📏 Transcript length: {len(transcript_text)} characters")
-                    
-                    # Post-process transcript to fix errors automatically
-                    logger.info(f"[{episode_id}] 🤖 Running AI post-processing to fix transcription errors...")
-                    processed_transcript, corrections = await transcript_postprocessor.process_transcript(
-                        transcript_text, episode.podcast, episode.title
-                    )
+                    logger.info(f"[{episode_id}] 📊 CACHE RESULT: DB ID {job.db_id}, "
+                                f"transcript {len(job.cached_transcript or '')} chars, "
+                                f"full summary {len(job.cached_summary or '')} chars, "
+                                f"paragraph {len(job.cached_paragraph or '')} chars")
                     
-                    if corrections > 0:
-                        transcript_text = processed_transcript
-                        logger.info(f"[{episode_id}] ✅ Fixed {corrections} transcription errors automatically")
-                    else:
-                        logger.info(f"[{episode_id}] ✓ No transcription errors detected")
+                    if job.cached_summary and job.cached_paragraph:
+                        # Validate cache quality against the transcript, if there is one
+                        needs_regen = (False, '')
+                        if job.cached_transcript:
+                            needs_regen = cache_validator.should_regenerate_summaries(
+                                job.cached_transcript, job.cached_summary, job.cached_paragraph
+                            )
+                        if not needs_regen[0]:  # needs_regen is (bool, reason)
+                            logger.info(f"[{episode_id}] 🎉 CACHE HIT! Episode fully processed - skipping all processing")
+                            job.full_summary = job.cached_summary
+                            job.paragraph_summary = job.cached_paragraph
+                            job.outcome = 'cached'
+                            return None
+                        logger.info(f"[{episode_id}] ⚠️  STALE CACHE! {needs_regen[1]}")
+                        logger.info(f"[{episode_id}] 🔄 Will regenerate summaries with corrected transcript")
                     
-                    monitor.record_success('audio_transcription', episode.podcast, mode=current_mode)
+                    if job.cached_transcript:
+                        logger.info(f"[{episode_id}] 📝 Using cached transcript ({len(job.cached_transcript)} characters)")
+                        job.transcript = job.cached_transcript
+                        job.source = TranscriptSource.CACHED
+                        # Quick check for common errors before running expensive AI processing
+                        if transcript_postprocessor.needs_processing(job.transcript):
+                            logger.info(f"[{episode_id}] 🤖 Cached transcript may contain errors")
+                            return 'post_process'
+                        return 'summarize'
                 else:
-                    logger.error(f"[{episode_id}] ❌ Failed to transcribe audio")
-                    monitor.record_failure('audio_transcription', episode.podcast, episode.title,
-                                         'TranscriptionFailed', 'Failed to transcribe audio', mode=current_mode)
-                    return None
-            
-            # Note: Transcript cleaning now happens via AI post-processing earlier in the pipeline
+                    logger.info(f"[{episode_id}] ❌ CACHE MISS - No matching episode found in database")
             
-            # Save transcript to database with current mode
-            try:
-                logger.info(f"[{episode_id}] 💾 Attempting to save transcript to database...")
-                logger.info(f"[{episode_id}]    Mode: {current_mode}")
-                logger.info(f"[{episode_id}]    Source: {transcript_source}")
-                logger.info(f"[{episode_id}]    Length: {len(transcript_text) if transcript_text else 0} chars")
-                
-                save_result = self.db.save_episode(episode, transcript_text, transcript_source, transcription_mode=current_mode)
-                
-                if save_result > 0:
-                    logger.info(f"[{episode_id}] ✅ Transcript saved successfully (ID: {save_result})")
-                else:
-                    logger.error(f"[{episode_id}] ❌ Failed to save transcript! Result: {save_result}")
             except Exception as e:
-                logger.error(f"[{episode_id}] ❌ Exception saving transcript: {e}", exc_info=True)
-            
-            # Step 3: Generate summaries (paragraph and full)
-            logger.info(f"\n[{episode_id}] 📝 Step 3: Generating summaries...")
-            # Pass force_fresh flag if set
-            force_fresh = getattr(self, 'force_fresh_summaries', False)
-            
-            # Generate paragraph summary first
-            logger.info(f"[{episode_id}] 📄 Generating paragraph summary...")
-            paragraph_summary = await self.summarizer.generate_paragraph_summary(
-                episode, transcript_text, transcript_source, mode=current_mode, force_fresh=force_fresh
-            )
-            
-            # Add 0.5s delay between API calls to manage rate limits
-            await asyncio.sleep(0.5)
-            
-            # Generate full summary
-            logger.info(f"[{episode_id}] 📚 Generating full summary...")
-            full_summary = await self.summarizer.generate_full_summary(
-                episode, transcript_text, transcript_source, mode=current_mode, force_fresh=force_fresh
+                logger.error(f"[{episode_id}] ⚠️  Cache check failed: {e}")
+                # Continue with normal processing if cache check fails
+        
+        logger.info(f"\n[{episode_id}] 📄 Step 1: Checking for existing transcript...")
+        logger.info(f"[{episode_id}]    GUID: {episode.guid or 'None'}")
+        transcript_text, transcript_source = await self.transcript_finder.find_transcript(episode, current_mode)
+        
+        if transcript_text:
+            # Validate the transcript content
+            if self.summarizer._validate_transcript_content(transcript_text, transcript_source):
+                logger.info(f"[{episode_id}] ✅ Found valid transcript (source: {transcript_source.value})")
+                logger.info(f"[{episode_id}] 📏 Transcript length: {len(transcript_text)} characters")
+                monitor.record_success('transcript_fetch', episode.podcast, mode=current_mode)
+                job.transcript = transcript_text
+                job.source = transcript_source
+                return 'post_process'
+            
+            logger.warning(f"[{episode_id}] ⚠️ Found transcript but validation failed - falling back to audio")
+            monitor.record_failure('transcript_fetch', episode.podcast, episode.title,
+                                 'ValidationFailed', 'Transcript found but contains only metadata', mode=current_mode)
+        else:
+            monitor.record_failure('transcript_fetch', episode.podcast, episode.title,
+                                 'NotFound', 'No transcript found from any source', mode=current_mode)
+        
+        logger.info(f"\n[{episode_id}] 🎵 Step 2: No valid transcript found - transcribing from audio...")
+        if not episode.audio_url:
+            logger.error(f"[{episode_id}] ❌ No audio URL available for this episode")
+            return None
+        return 'prefetch'
+    
+    async def _stage_prefetch(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 2a: wait for room to download this episode ahead of transcription"""
+        if self._processing_cancelled:
+            return None
+        
+        if self._prefetch_window:
+            estimate_mb = self.concurrency_manager.audio_download_mb(job.episode, job.mode == 'full')
+            await self._prefetch_window.admit(job.id, estimate_mb)
+        return 'acquire_audio'
+    
+    async def _stage_acquire_audio(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 2b: download and validate the audio"""
+        if self._processing_cancelled:
+            return None
+        
+        episode, episode_id = job.episode, job.id
+        logger.info(f"[{episode_id}] 🔗 Audio URL: {episode.audio_url[:80]}...")
+        job.audio_file = await self.transcriber.acquire_audio(episode, job.mode, episode_id)
+        if not job.audio_file:
+            logger.error(f"[{episode_id}] ❌ Failed to download audio")
+            monitor.record_failure('audio_transcription', episode.podcast, episode.title,
+                                 'DownloadFailed', 'Failed to download audio', mode=job.mode)
+            raise StageFailed("Failed to download audio")
+        if self._prefetch_window:
+            await self._prefetch_window.settle(episode_id, job.audio_file.stat().st_size / 1024 / 1024)
+        return 'transcribe'
+    
+    async def _stage_transcribe(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 3: transcribe the downloaded audio"""
+        if self._processing_cancelled:
+            return None
+        
+        episode, episode_id = job.episode, job.id
+        if self._prefetch_window:
+            await self._prefetch_window.started(episode_id)  # Lets the next download start
+        transcript_text = await self.transcriber.transcribe_audio(
+            episode, job.audio_file, job.mode, episode_id
+        )
+        if not transcript_text:
+            logger.error(f"[{episode_id}] ❌ Failed to transcribe audio")
+            monitor.record_failure('audio_transcription', episode.podcast, episode.title,
+                                 'TranscriptionFailed', 'Failed to transcribe audio', mode=job.mode)
+            raise StageFailed("Failed to transcribe audio")
+        
+        # Stream processing: free the audio as soon as the transcript exists
+        await self._release_job_audio(job)
+        
+        logger.info(f"[{episode_id}] ✅ Audio transcribed successfully")
+        logger.info(f"[{episode_id}] 📏 Transcript length: {len(transcript_text)} characters")
+        monitor.record_success('audio_transcription', episode.podcast, mode=job.mode)
+        job.transcript = transcript_text
+        job.source = TranscriptSource.GENERATED
+        return 'post_process'
+    
+    async def _stage_post_process(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 4: AI post-processing to fix transcription errors"""
+        if self._processing_cancelled:
+            return None
+        
+        episode, episode_id = job.episode, job.id
+        logger.info(f"[{episode_id}] 🤖 Running AI post-processing to fix transcription errors...")
+        processed_transcript, corrections = await transcript_postprocessor.process_transcript(
+            job.transcript, episode.podcast, episode.title
+        )
+        
+        if corrections > 0:
+            job.transcript = processed_transcript
+            logger.info(f"[{episode_id}] ✅ Fixed {corrections} transcription errors automatically")
+        else:
+            logger.info(f"[{episode_id}] ✓ No transcription errors detected")
+        return 'summarize'
+    
+    async def _stage_summarize(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 5: paragraph and full summaries
+        
+        Always moves on to persist, so a transcript survives a failed summary.
+        """
+        if self._processing_cancelled:
+            return 'persist'
+        
+        episode, episode_id = job.episode, job.id
+        current_mode = job.mode
+        logger.info(f"\n[{episode_id}] 📝 Step 3: Generating summaries...")
+        # Pass force_fresh flag if set
+        force_fresh = getattr(self, 'force_fresh_summaries', False)
+        
+        try:
+            # Paragraph and full summaries run concurrently, paced by the shared rate limiter
+            paragraph_summary, full_summary = await self.summarizer.generate_summaries(
+                episode, job.transcript, job.source, mode=current_mode, force_fresh=force_fresh
             )
-            
-            # Fallback: extract paragraph from full summary if paragraph generation failed
-            if not paragraph_summary and full_summary:
-                logger.warning(f"[{episode_id}] ⚠️ Paragraph generation failed, extracting from full summary")
-                # Extract first 150 words from full summary
-                words = full_summary.split()[:150]
-                paragraph_summary = ' '.join(words)
-                if len(words) == 150:
-                    paragraph_summary += '...'
-            
-            if paragraph_summary and full_summary:
-                logger.info(f"[{episode_id}] ✅ Both summaries generated successfully!")
-                logger.info(f"[{episode_id}] 📏 Paragraph: {len(paragraph_summary)} chars | Full: {len(full_summary)} chars")
-                monitor.record_success('summarization', episode.podcast, mode=current_mode)
-                
-                # Save both summaries to database
-                try:
-                    self.db.save_episode(
-                        episode, transcript_text, transcript_source, 
-                        full_summary, paragraph_summary, 
-                        transcription_mode=current_mode
-                    )
-                    logger.info(f"[{episode_id}] 💾 Summaries saved to database ({current_mode} mode)")
-                except Exception as e:
-                    logger.warning(f"[{episode_id}] Failed to save summaries to database: {e}")
-            else:
-                logger.error(f"[{episode_id}] ❌ Failed to generate summaries")
-                monitor.record_failure('summarization', episode.podcast, episode.title,
-                                     'SummarizationFailed', 'Failed to generate summaries', mode=current_mode)
-            
-            # Return dict with both summaries
-            return {
-                'full_summary': full_summary,
-                'paragraph_summary': paragraph_summary
-            }
-            
         except Exception as e:
-            logger.error(f"[{episode_id}] ❌ Error processing episode: {e}", exc_info=True)
-            monitor.record_failure('episode_processing', episode.podcast, episode.title,
-                                 type(e).__name__, str(e), mode=current_mode)
-            raise
-        finally:
-            logger.info(f"[{episode_id}] {'='*60}\n")
+            logger.error(f"[{episode_id}] ❌ Summarization error: {e}", exc_info=True)
+            paragraph_summary, full_summary = None, None
+        
+        # Fallback: extract paragraph from full summary if paragraph generation failed
+        if not paragraph_summary and full_summary:
+            logger.warning(f"[{episode_id}] ⚠️ Paragraph generation failed, extracting from full summary")
+            # Extract first 150 words from full summary
+            words = full_summary.split()[:150]
+            paragraph_summary = ' '.join(words)
+            if len(words) == 150:
+                paragraph_summary += '...'
+        
+        if paragraph_summary and full_summary:
+            logger.info(f"[{episode_id}] ✅ Both summaries generated successfully!")
+            logger.info(f"[{episode_id}] 📏 Paragraph: {len(paragraph_summary)} chars | Full: {len(full_summary)} chars")
+            monitor.record_success('summarization', episode.podcast, mode=current_mode)
+            job.full_summary = full_summary
+            job.paragraph_summary = paragraph_summary
+        else:
+            logger.error(f"[{episode_id}] ❌ Failed to generate summaries")
+            monitor.record_failure('summarization', episode.podcast, episode.title,
+                                 'SummarizationFailed', 'Failed to generate summaries', mode=current_mode)
+        return 'persist'
+    
+    async def _stage_persist(self, job: EpisodeJob) -> Optional[str]:
+        """Stage 6: save the transcript and any summaries"""
+        episode, episode_id = job.episode, job.id
+        logger.info(f"[{episode_id}] 💾 Saving to database ({job.mode} mode, source: {job.source})")
+        save_result = await asyncio.to_thread(
+            self.db.save_episode,
+            episode, job.transcript, job.source,
+            job.full_summary, job.paragraph_summary,
+            transcription_mode=job.mode
+        )
+        if save_result > 0:
+            job.db_id = save_result
+            logger.info(f"[{episode_id}] ✅ Saved (ID: {save_result})")
+        else:
+            logger.error(f"[{episode_id}] ❌ Failed to save episode! Result: {save_result}")
+        return None
     
     def _estimate_processing_cost(self, episodes: List[Episode]) -> dict:
         """Estimate the cost of processing episodes"""
@@ -1795,9 +1922,9 @@ class RenaissanceWeekly:
         )
         
         # Generate both summaries
-        paragraph_summary = await self.summarizer.generate_paragraph_summary(episode, transcript, TranscriptSource.CACHED, mode='test', force_fresh=False)
-        await asyncio.sleep(0.5)  # Rate limit delay
-        full_summary = await self.summarizer.generate_full_summary(episode, transcript, TranscriptSource.CACHED, mode='test', force_fresh=False)
+        paragraph_summary, full_summary = await self.summarizer.generate_summaries(
+            episode, transcript, TranscriptSource.CACHED, mode='test', force_fresh=False
+        )
         
         if paragraph_summary:
             logger.info(f"[{self.correlation_id}] ✅ Paragraph summary generated ({len(paragraph_summary)} chars)")
@@ -1856,7 +1983,7 @@ class RenaissanceWeekly:
                 podcast, title = episode_name.split(': ', 1)
                 
                 # Try to find the episode in the database
-                episode_data = self.db.get_episode(podcast, title, datetime.now())
+                episode_data = self.db.get_episode(podcast, title, datetime.now(), include_transcripts=False)
                 if episode_data:
                     # Reconstruct Episode object
                     episode = Episode(
@@ -2033,11 +2160,11 @@ class RenaissanceWeekly:
         episodes = self.db.get_recent_episodes(days_back)
         episodes_with_transcripts = []
         
-        # Determine which transcript field to check based on mode
+        # Determine which transcript flag to check based on mode
         transcript_field = 'transcript_test' if self.current_transcription_mode == 'test' else 'transcript'
         
         for ep_dict in episodes:
-            if ep_dict.get(transcript_field):
+            if ep_dict.get(f'has_{transcript_field}'):
                 episode = Episode(
                     guid=ep_dict['guid'],
                     title=ep_dict['title'],
@@ -2049,7 +2176,7 @@ class RenaissanceWeekly:
                 )
                 episodes_with_transcripts.append({
                     'episode': episode,
-                    'transcript': ep_dict[transcript_field],
+                    'episode_id': ep_dict['id'],
                     'source': TranscriptSource(ep_dict.get('transcript_source', 'UNKNOWN'))
                 })
         
@@ -2087,19 +2214,13 @@ class RenaissanceWeekly:
             episode = ep_data['episode']
             logger.info(f"[{self.correlation_id}] [{i}/{len(episodes_with_transcripts)}] Regenerating: {episode.podcast} - {episode.title}")
             
-            # Generate both paragraph and full summaries
-            paragraph_summary = await self.summarizer.generate_paragraph_summary(
-                episode,
-                ep_data['transcript'],
-                ep_data['source'],
-                mode=self.current_transcription_mode,
-                force_fresh=True  # Always fresh for regenerate command
+            # Load the transcript only now that we're about to summarize it
+            ep_data['transcript'] = self.db.get_content(
+                ep_data['episode_id'], 'transcript', self.current_transcription_mode
             )
             
-            # Add delay between API calls
-            await asyncio.sleep(0.5)
-            
-            full_summary = await self.summarizer.generate_full_summary(
+            # Generate both paragraph and full summaries
+            paragraph_summary, full_summary = await self.summarizer.generate_summaries(
                 episode,
                 ep_data['transcript'],
                 ep_data['source'],
@@ -2294,6 +2415,15 @@ This email will include executive summaries of all processed episodes...
                 await self.transcriber.cleanup()
                 logger.debug(f"[{self.correlation_id}] ✓ Transcriber cleaned up")
             
+            # Leave unfinished episodes queued at their last checkpoint for `main.py resume`
+            released = self.db.release_job_leases(self.correlation_id)
+            if released:
+                logger.info(f"[{self.correlation_id}] ⏸️  {released} unfinished episodes kept for 'python main.py resume'")
+            
+            # Close pooled OpenAI connections
+            from .utils.clients import close_async_openai_client
+            await close_async_openai_client()
+            
             # Clean up any temporary files
             from .config import TEMP_DIR
             if TEMP_DIR.exists():
@@ -0,0 +1,201 @@
+"""Content-addressed store for downloaded episode audio
+
+Full downloads are kept once under audio/blobs/<sha256><ext> and indexed by
+the audio URL (as given and as resolved) together with the ETag and
+Content-Length the server reports for it. A re-titled episode, or a full
+run after a test run, finds the existing blob instead of downloading the
+audio again. The per-episode files in audio/ are hard links into the store,
+so deleting them after transcription never touches the blob.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+import aiohttp
+
+from .config import AUDIO_BLOB_DIR, AUDIO_BLOB_CACHE_MAX_GB, AUDIO_BLOB_HEAD_TIMEOUT
+from .utils.download_sink import verified_sha256
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+HASH_CHUNK = 1024 * 1024
+
+
+class AudioFingerprint(NamedTuple):
+    """What the server says about an audio URL, used as the index key"""
+    url: str
+    resolved_url: Optional[str] = None
+    etag: Optional[str] = None
+    content_length: Optional[int] = None
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file, read in 1MB chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AudioBlobStore:
+    """Deduplicated audio files with a (URL, ETag, Content-Length) index"""
+
+    def __init__(self, root: Path = AUDIO_BLOB_DIR, max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes if max_bytes is not None else int(AUDIO_BLOB_CACHE_MAX_GB * 1024 ** 3)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Index connection, opened on first use so constructing the store touches no files"""
+        if self._connection is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS sources (
+                    url TEXT NOT NULL,
+                    etag TEXT NOT NULL DEFAULT '',
+                    content_length INTEGER NOT NULL DEFAULT -1,
+                    sha256 TEXT NOT NULL,
+                    PRIMARY KEY (url, etag, content_length)
+                );
+                CREATE INDEX IF NOT EXISTS idx_sources_sha256 ON sources(sha256);
+            """)
+            self._connection = conn
+        return self._connection
+
+    async def fingerprint(self, url: str, timeout: float = AUDIO_BLOB_HEAD_TIMEOUT) -> AudioFingerprint:
+        """HEAD the URL for its final location, ETag and length (URL alone if that fails)
+        
+        Runs before every download, so the timeout is kept short: a host that
+        is slow to answer HEAD costs one missed blob lookup, not seconds per
+        episode.
+        """
+        try:
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+            async with aiohttp.ClientSession(timeout=client_timeout) as session:
+                async with session.head(url, allow_redirects=True) as response:
+                    if response.status >= 400:
+                        return AudioFingerprint(url)
+                    length = response.headers.get('Content-Length')
+                    return AudioFingerprint(
+                        url=url,
+                        resolved_url=str(response.url),
+                        etag=response.headers.get('ETag'),
+                        content_length=int(length) if length and length.isdigit() else None
+                    )
+        except Exception as e:
+            logger.debug(f"HEAD failed for {url[:80]}: {e}")
+            return AudioFingerprint(url)
+
+    def find(self, fingerprint: AudioFingerprint) -> Optional[Path]:
+        """Blob previously stored for this fingerprint, if it's still on disk"""
+        etag, length = fingerprint.etag or '', fingerprint.content_length or -1
+        urls = [u for u in (fingerprint.resolved_url, fingerprint.url) if u]
+        with self._lock, self._conn:
+            row = self._conn.execute(f"""
+                SELECT b.sha256, b.filename FROM sources s JOIN blobs b ON b.sha256 = s.sha256
+                WHERE s.url IN ({','.join('?' * len(urls))}) AND s.etag = ? AND s.content_length = ?
+                LIMIT 1
+            """, (*urls, etag, length)).fetchone()
+            if not row:
+                return None
+            blob = self.root / row[1]
+            if not blob.exists():
+                self._forget(row[0])
+                return None
+            self._conn.execute("UPDATE blobs SET last_used = ? WHERE sha256 = ?", (time.time(), row[0]))
+        return blob
+
+    def ingest(self, path: Path, fingerprint: AudioFingerprint, sha256: Optional[str] = None) -> Path:
+        """Move a completed full download into the store and leave a link in its place"""
+        existing = self.find(fingerprint)
+        if existing:
+            self.link(existing, path)
+            return existing
+
+        sha256 = sha256 or verified_sha256(path) or hash_file(path)
+        blob = self.root / f"{sha256}{path.suffix or '.mp3'}"
+        if blob.exists():
+            path.unlink()  # Same audio under another URL - keep one copy
+        else:
+            os.replace(path, blob)
+            os.chmod(blob, 0o444)  # Blobs are shared through hard links - never write in place
+        self.link(blob, path)
+
+        now = time.time()
+        etag, length = fingerprint.etag or '', fingerprint.content_length or -1
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO blobs (sha256, filename, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(sha256) DO UPDATE SET last_used = excluded.last_used
+            """, (sha256, blob.name, blob.stat().st_size, now, now))
+            for url in {fingerprint.url, fingerprint.resolved_url} - {None}:
+                self._conn.execute("""
+                    INSERT OR REPLACE INTO sources (url, etag, content_length, sha256) VALUES (?, ?, ?, ?)
+                """, (url, etag, length, sha256))
+
+        logger.info(f"📦 Stored audio blob {sha256[:12]} ({blob.stat().st_size / 1024 / 1024:.1f} MB)")
+        self.prune()
+        return blob
+
+    def blob_for(self, path: Path) -> Optional[Path]:
+        """The stored blob path is a link to, if any"""
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return None
+        with self._lock, self._conn:
+            rows = self._conn.execute("SELECT filename FROM blobs WHERE size = ?", (size,)).fetchall()
+        for (filename,) in rows:
+            blob = self.root / filename
+            try:
+                if os.path.samefile(blob, path):
+                    return blob
+            except OSError:
+                continue
+        return None
+
+    def link(self, blob: Path, dest: Path):
+        """Point dest at the blob: hard link where possible, copy otherwise"""
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+        try:
+            os.link(blob, dest)
+        except OSError:
+            shutil.copyfile(blob, dest)
+
+    def prune(self):
+        """Drop least recently used blobs until the store fits in max_bytes"""
+        with self._lock, self._conn:
+            rows = self._conn.execute("SELECT sha256, filename, size FROM blobs ORDER BY last_used").fetchall()
+            total = sum(size for _, _, size in rows)
+            for sha256, filename, size in rows:
+                if total <= self.max_bytes:
+                    break
+                (self.root / filename).unlink(missing_ok=True)
+                self._forget(sha256)
+                total -= size
+                logger.info(f"🧹 Evicted audio blob {sha256[:12]} ({size / 1024 / 1024:.1f} MB)")
+
+    def _forget(self, sha256: str):
+        # Caller holds the lock and transaction
+        self._conn.execute("DELETE FROM sources WHERE sha256 = ?", (sha256,))
+        self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
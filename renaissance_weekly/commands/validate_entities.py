@@ -5,6 +5,7 @@ import asyncio
 import click
 from datetime import datetime, timedelta
 
+from renaissance_weekly.content_codec import decode_content
 from renaissance_weekly.database import PodcastDatabase
 from renaissance_weekly.processing.entity_validator import entity_validator
 from renaissance_weekly.processing.transcript_cleaner import transcript_cleaner
@@ -18,7 +19,7 @@ async def validate_episode_entities(episode_data: dict):
     
     podcast = episode_data['podcast']
     title = episode_data['title']
-    transcript = episode_data['transcript']
+    transcript = decode_content(episode_data['transcript'])
     
     if not transcript:
         return
@@ -78,19 +79,20 @@ async def validate_entities(days: int, podcast: str, dry_run: bool):
     since_date = datetime.now() - timedelta(days=days)
     
     query = """
-        SELECT podcast, title, transcript, published
-        FROM episodes
-        WHERE transcript IS NOT NULL
-        AND published >= ?
+        SELECT e.podcast, e.title, c.body AS transcript, e.published
+        FROM episodes e
+        JOIN episode_content c
+          ON c.episode_id = e.id AND c.kind = 'transcript' AND c.mode = 'full'
+        WHERE e.published >= ?
     """
     
     params = [since_date.isoformat()]
     
     if podcast:
-        query += " AND podcast = ?"
+        query += " AND e.podcast = ?"
         params.append(podcast)
     
-    query += " ORDER BY published DESC"
+    query += " ORDER BY e.published DESC"
     
     episodes = db.execute_query(query, params)
     
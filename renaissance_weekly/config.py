@@ -41,6 +41,87 @@ MAX_TRANSCRIPTION_MINUTES = int(os.getenv("MAX_TRANSCRIPTION_MINUTES", "15")) if
 VERIFY_APPLE_PODCASTS = os.getenv("VERIFY_APPLE_PODCASTS", "true").lower() == "true"
 FETCH_MISSING_EPISODES = os.getenv("FETCH_MISSING_EPISODES", "true").lower() == "true"
 
+# Episode fetching concurrency (podcasts fetched at once, and per feed host)
+FEED_FETCH_CONCURRENCY = int(os.getenv("FEED_FETCH_CONCURRENCY", "6"))
+FEED_FETCH_PER_HOST = int(os.getenv("FEED_FETCH_PER_HOST", "2"))
+
+# Chunked Whisper transcription (chunks transcribed at once, extra attempts per chunk)
+TRANSCRIPTION_CHUNK_CONCURRENCY = int(os.getenv("TRANSCRIPTION_CHUNK_CONCURRENCY", "3"))
+TRANSCRIPTION_CHUNK_RETRIES = int(os.getenv("TRANSCRIPTION_CHUNK_RETRIES", "2"))
+# Chunks are cut at a silence within this many seconds of the size limit, else overlapped
+TRANSCRIPTION_SILENCE_SEARCH_SECONDS = float(os.getenv("TRANSCRIPTION_SILENCE_SEARCH_SECONDS", "60"))
+TRANSCRIPTION_CHUNK_OVERLAP_SECONDS = float(os.getenv("TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", "2"))
+
+# Test mode fetches only the byte range covering MAX_TRANSCRIPTION_MINUTES (plus this fraction)
+PARTIAL_DOWNLOAD_ENABLED = os.getenv("PARTIAL_DOWNLOAD_ENABLED", "true").lower() == "true"
+PARTIAL_DOWNLOAD_MARGIN = float(os.getenv("PARTIAL_DOWNLOAD_MARGIN", "0.15"))
+
+# Content-addressed store for full audio downloads (audio/blobs), evicted oldest-first past this size
+AUDIO_BLOB_DIR = AUDIO_DIR / "blobs"
+AUDIO_BLOB_CACHE_MAX_GB = float(os.getenv("AUDIO_BLOB_CACHE_MAX_GB", "20"))
+# Budget for the HEAD request that looks up a stored blob before each download
+AUDIO_BLOB_HEAD_TIMEOUT = float(os.getenv("AUDIO_BLOB_HEAD_TIMEOUT", "3"))
+
+# Transcripts longer than this are summarized map-reduce: sections are condensed with a cheaper
+# model (cached by content hash under summaries/sections), then the notes feed the final prompts
+SUMMARY_MAP_REDUCE_CHARS = int(os.getenv("SUMMARY_MAP_REDUCE_CHARS", "100000"))
+SUMMARY_SECTION_CHARS = int(os.getenv("SUMMARY_SECTION_CHARS", "24000"))
+SUMMARY_SECTION_MODEL = os.getenv("SUMMARY_SECTION_MODEL", "gpt-4o-mini")
+SUMMARY_SECTION_MAX_TOKENS = int(os.getenv("SUMMARY_SECTION_MAX_TOKENS", "800"))
+SUMMARY_SECTION_CONCURRENCY = int(os.getenv("SUMMARY_SECTION_CONCURRENCY", "4"))
+
+# Episode pipeline: workers per stage, items queued between stages, and the share of free
+# memory the audio stages may hold (each transcription reserves its mode's estimate from it)
+PIPELINE_FETCH_WORKERS = int(os.getenv("PIPELINE_FETCH_WORKERS", "8"))
+PIPELINE_AUDIO_WORKERS = int(os.getenv("PIPELINE_AUDIO_WORKERS", "3"))
+PIPELINE_TRANSCRIBE_WORKERS = int(os.getenv("PIPELINE_TRANSCRIBE_WORKERS", "3"))
+PIPELINE_POSTPROCESS_WORKERS = int(os.getenv("PIPELINE_POSTPROCESS_WORKERS", "6"))
+PIPELINE_SUMMARIZE_WORKERS = int(os.getenv("PIPELINE_SUMMARIZE_WORKERS", "20"))
+PIPELINE_PERSIST_WORKERS = int(os.getenv("PIPELINE_PERSIST_WORKERS", "2"))
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+PIPELINE_MEMORY_FRACTION = float(os.getenv("PIPELINE_MEMORY_FRACTION", "0.7"))
+# Audio prefetch: downloads run up to PREFETCH_EPISODES ahead of transcription, while the audio held
+# stays under PREFETCH_MAX_MB and at least PREFETCH_MIN_FREE_DISK_MB stays free on the audio disk
+PREFETCH_EPISODES = int(os.getenv("PREFETCH_EPISODES", "4"))
+PREFETCH_MAX_MB = float(os.getenv("PREFETCH_MAX_MB", "2048"))
+PREFETCH_MIN_FREE_DISK_MB = float(os.getenv("PREFETCH_MIN_FREE_DISK_MB", "2048"))
+# Durable job queue: a run renews the lease on its episodes' jobs every third of JOB_LEASE_SECONDS, so
+# a crashed run's jobs can be resumed once it lapses; a job is tried at most JOB_MAX_ATTEMPTS times on resume
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+# Adaptive (AIMD) concurrency: every ADAPTIVE_INTERVAL_SECONDS a stage or API limit grows by one while
+# saturated and healthy (up to ADAPTIVE_MAX_SCALE x its configured start) and halves on free memory below
+# ADAPTIVE_MIN_FREE_MB, p95 latency over ADAPTIVE_LATENCY_FACTOR x the best seen, or 429 responses
+ADAPTIVE_CONCURRENCY = os.getenv("ADAPTIVE_CONCURRENCY", "true").lower() == "true"
+ADAPTIVE_INTERVAL_SECONDS = float(os.getenv("ADAPTIVE_INTERVAL_SECONDS", "10"))
+ADAPTIVE_MIN_FREE_MB = float(os.getenv("ADAPTIVE_MIN_FREE_MB", "500"))
+ADAPTIVE_LATENCY_FACTOR = float(os.getenv("ADAPTIVE_LATENCY_FACTOR", "3.0"))
+ADAPTIVE_MAX_SCALE = float(os.getenv("ADAPTIVE_MAX_SCALE", "2.0"))
+# Chat completions in flight at once (adjusted at runtime when ADAPTIVE_CONCURRENCY is on)
+OPENAI_MAX_IN_FLIGHT = int(os.getenv("OPENAI_MAX_IN_FLIGHT", "20"))
+
+# OpenAI rate limits - starting points, corrected from the x-ratelimit-* response headers
+OPENAI_CHAT_RPM = int(os.getenv("OPENAI_CHAT_RPM", "50"))
+OPENAI_CHAT_TPM = int(os.getenv("OPENAI_CHAT_TPM", "30000"))
+OPENAI_WHISPER_RPM = int(os.getenv("OPENAI_WHISPER_RPM", "3"))
+
+# Async OpenAI client (HTTP/2 when the h2 package is installed) and per-call timeouts in seconds
+OPENAI_HTTP2 = os.getenv("OPENAI_HTTP2", "true").lower() == "true"
+OPENAI_CHAT_TIMEOUT = float(os.getenv("OPENAI_CHAT_TIMEOUT", "180"))
+OPENAI_TRANSCRIPTION_TIMEOUT = float(os.getenv("OPENAI_TRANSCRIPTION_TIMEOUT", "300"))
+
+# SQLite connection pool tuning
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "10000"))
+DB_CACHE_SIZE_KB = int(os.getenv("DB_CACHE_SIZE_KB", "16384"))
+DB_MMAP_SIZE_MB = int(os.getenv("DB_MMAP_SIZE_MB", "256"))
+
+# Transcript/summary compression in the database (auto = zstd if installed, else zlib; none disables)
+CONTENT_COMPRESSION = os.getenv("CONTENT_COMPRESSION", "auto")
+CONTENT_COMPRESSION_MIN_BYTES = int(os.getenv("CONTENT_COMPRESSION_MIN_BYTES", "1024"))
+CONTENT_COMPRESSION_BATCH_SIZE = int(os.getenv("CONTENT_COMPRESSION_BATCH_SIZE", "200"))
+
 # Load podcast configurations from YAML file
 def load_podcast_configs():
     """Load podcast configurations from podcasts.yaml"""
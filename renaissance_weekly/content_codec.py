@@ -0,0 +1,88 @@
+"""Compression codec for transcript and summary text stored in SQLite
+
+Compressed bodies are stored as BLOBs whose first byte names the codec;
+short bodies and rows written before compression existed stay plain TEXT.
+Decoding therefore works on any mix of old and new rows.
+"""
+
+import zlib
+from typing import Optional, Union
+
+from .config import CONTENT_COMPRESSION, CONTENT_COMPRESSION_MIN_BYTES
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Header bytes - never renumber, they are persisted in the database
+CODEC_RAW = 0x00
+CODEC_ZLIB = 0x01
+CODEC_ZSTD = 0x02
+
+CODEC_NAMES = {'none': CODEC_RAW, 'zlib': CODEC_ZLIB, 'zstd': CODEC_ZSTD}
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+
+def _resolve_codec(name: str) -> int:
+    """Pick the configured codec, falling back to zlib when zstandard is missing"""
+    name = (name or 'auto').lower()
+    if name == 'auto':
+        return CODEC_ZSTD if zstandard else CODEC_ZLIB
+    if name not in CODEC_NAMES:
+        logger.warning(f"Unknown CONTENT_COMPRESSION '{name}', using zlib")
+        return CODEC_ZLIB
+    if name == 'zstd' and not zstandard:
+        logger.warning("CONTENT_COMPRESSION=zstd but zstandard is not installed, using zlib")
+        return CODEC_ZLIB
+    return CODEC_NAMES[name]
+
+
+DEFAULT_CODEC = _resolve_codec(CONTENT_COMPRESSION)
+
+
+def encode_content(text: Optional[str], codec: int = DEFAULT_CODEC,
+                   min_bytes: int = CONTENT_COMPRESSION_MIN_BYTES) -> Optional[Union[str, bytes]]:
+    """Encode text for storage; returns the text unchanged when not worth compressing"""
+    if text is None or codec == CODEC_RAW:
+        return text
+
+    raw = text.encode('utf-8')
+    if len(raw) < min_bytes:
+        return text
+
+    if codec == CODEC_ZSTD:
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    else:
+        codec, payload = CODEC_ZLIB, zlib.compress(raw, ZLIB_LEVEL)
+
+    # Incompressible text isn't worth the decode cost
+    if len(payload) + 1 >= len(raw):
+        return text
+    return bytes([codec]) + payload
+
+
+def decode_content(value: Optional[Union[str, bytes]]) -> Optional[str]:
+    """Decode a stored body back to text (plain TEXT values pass straight through)"""
+    if value is None or isinstance(value, str):
+        return value
+
+    value = bytes(value)
+    if not value:
+        return ''
+
+    codec, payload = value[0], value[1:]
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(payload).decode('utf-8')
+    if codec == CODEC_ZSTD:
+        if not zstandard:
+            raise RuntimeError("Stored content is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(payload).decode('utf-8')
+    if codec == CODEC_RAW:
+        return payload.decode('utf-8')
+    raise ValueError(f"Unknown content codec header: {codec:#04x}")
@@ -2,28 +2,97 @@
 
 import sqlite3
 import json
-from datetime import datetime, timezone
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, Tuple, Any, Union
 
 from .models import Episode, TranscriptSource
-from .config import DB_PATH
+from .config import DB_PATH, CONTENT_COMPRESSION_BATCH_SIZE, CONTENT_COMPRESSION_MIN_BYTES
+from .db_connection import get_connection_pool, close_connection_pool
+from .content_codec import encode_content, decode_content, DEFAULT_CODEC, CODEC_RAW
+from .utils.filename_utils import title_fingerprint
 from .utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Transcripts and summaries live in episode_content, one row per
+# (episode, mode, kind), so listing episodes never drags their text along
+CONTENT_KINDS = ('transcript', 'summary', 'paragraph_summary')
+TRANSCRIPTION_MODES = ('test', 'full')
+
+
+def content_column(kind: str, mode: str) -> str:
+    """Legacy episodes column name for a content kind/mode (e.g. summary_test)"""
+    return kind if mode == 'full' else f"{kind}_test"
+
+
+# Legacy column name -> (kind, mode); still used as keys in episode dicts
+CONTENT_COLUMNS = {
+    content_column(kind, mode): (kind, mode)
+    for kind in CONTENT_KINDS for mode in TRANSCRIPTION_MODES
+}
+
+# has_<column> flags computed in SQL so listings can tell what exists without loading it
+CONTENT_FLAGS_SQL = ', '.join(
+    f"EXISTS(SELECT 1 FROM episode_content c WHERE c.episode_id = e.id "
+    f"AND c.kind = '{kind}' AND c.mode = '{mode}') AS has_{column}"
+    for column, (kind, mode) in CONTENT_COLUMNS.items()
+)
+
+# Index-friendly "same episode" match: published_date holds date(published), so
+# this is a seek on idx_episodes_podcast_title_date instead of a per-row date() call
+EPISODE_DATE_MATCH_SQL = "e.podcast = ? AND e.title = ? AND e.published_date = date(?)"
+
+# Episodes per bulk query (4 bound parameters each, well under SQLite's variable limit)
+BULK_LOOKUP_CHUNK = 200
+
+# Last-resort fuzzy title match: minimum trigram similarity, how far apart the
+# published dates may be, and how many same-podcast rows in that window are compared
+TITLE_SIMILARITY_THRESHOLD = 0.7
+TITLE_MATCH_DATE_WINDOW_DAYS = 1
+TITLE_MATCH_MAX_CANDIDATES = 50
+
+# Episode processing stages that are durably checkpointed in the jobs table, in order
+JOB_STAGES = ('fetch_transcript', 'prefetch', 'acquire_audio', 'transcribe', 'post_process', 'summarize', 'persist')
+
+# Episode processing statuses that mark work as in progress
+IN_PROGRESS_STATUSES = ('downloading', 'transcribing', 'summarizing')
+
+# One background compression pass per database file per process
+_compression_threads: Dict[Path, threading.Thread] = {}
+_compression_lock = threading.Lock()
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(a: set, b: set) -> float:
+    """Jaccard similarity of two trigram sets"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
 
 class PodcastDatabase:
     """Handle all database operations for podcast episodes and transcripts"""
     
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self._pool = get_connection_pool(db_path)
         self._init_database()
     
+    def connection(self):
+        """Pooled connection context manager (commits on success, rolls back on error)"""
+        return self._pool.connection()
+    
     def _init_database(self):
         """Initialize database tables with migration support"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if episodes table exists
@@ -41,9 +110,7 @@ class PodcastDatabase:
                     required_columns = {
                         'podcast', 'title', 'published', 'audio_url', 
                         'transcript_url', 'description', 'link', 'duration', 
-                        'guid', 'transcript', 'transcript_source', 'summary',
-                        'transcription_mode', 'transcript_test', 'summary_test',
-                        'paragraph_summary', 'paragraph_summary_test'
+                        'guid', 'transcript_source', 'transcription_mode'
                     }
                     
                     if not required_columns.issubset(columns):
@@ -53,8 +120,14 @@ class PodcastDatabase:
                     # Create new table
                     self._create_episodes_table(conn)
                 
-                # Create or update indexes
-                self._create_indexes(conn)
+                self._create_content_table(conn)
+                
+                # Move inline transcript/summary columns into episode_content
+                if table_exists:
+                    cursor.execute("PRAGMA table_info(episodes)")
+                    self._migrate_content_columns(conn, {row[1] for row in cursor.fetchall()})
+                
+                self._create_schema(conn)
                 
                 conn.commit()
                 
@@ -63,6 +136,21 @@ class PodcastDatabase:
             # If all else fails, backup and recreate
             self._backup_and_recreate()
     
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Bring columns, indexes and side tables up to date once the core tables exist
+        
+        Shared by _init_database and _backup_and_recreate so a recreated
+        database gets every table the normal path creates.
+        """
+        self._migrate_published_date(conn)
+        self._migrate_title_fingerprint(conn)
+        
+        # Create or update indexes
+        self._create_indexes(conn)
+        
+        self._create_feed_cache_table(conn)
+        self._create_jobs_tables(conn)
+    
     def _create_episodes_table(self, conn: sqlite3.Connection):
         """Create the episodes table"""
         cursor = conn.cursor()
@@ -72,19 +160,15 @@ class PodcastDatabase:
                 podcast TEXT NOT NULL,
                 title TEXT NOT NULL,
                 published DATETIME NOT NULL,
+                published_date TEXT,
+                title_fingerprint TEXT,
                 audio_url TEXT,
                 transcript_url TEXT,
                 description TEXT,
                 link TEXT,
                 duration TEXT,
                 guid TEXT,
-                transcript TEXT,
                 transcript_source TEXT,
-                summary TEXT,
-                transcript_test TEXT,
-                summary_test TEXT,
-                paragraph_summary TEXT,
-                paragraph_summary_test TEXT,
                 transcription_mode TEXT DEFAULT 'test',
                 processing_status TEXT DEFAULT 'pending',
                 failure_reason TEXT,
@@ -124,6 +208,227 @@ class PodcastDatabase:
             ON episodes(processing_status)
         """)
     
+    def _create_content_table(self, conn: sqlite3.Connection):
+        """Create the table holding transcript and summary text"""
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS episode_content (
+                episode_id INTEGER NOT NULL,
+                mode TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                body TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (episode_id, mode, kind)
+            )
+        """)
+    
+    def _migrate_content_columns(self, conn: sqlite3.Connection, existing_columns: set):
+        """Move legacy inline transcript/summary columns into episode_content"""
+        legacy_columns = [column for column in CONTENT_COLUMNS if column in existing_columns]
+        if not legacy_columns:
+            return
+        
+        cursor = conn.cursor()
+        logger.info(f"Moving {', '.join(legacy_columns)} into episode_content...")
+        
+        for column in legacy_columns:
+            kind, mode = CONTENT_COLUMNS[column]
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO episode_content (episode_id, mode, kind, body)
+                SELECT id, ?, ?, {column} FROM episodes
+                WHERE {column} IS NOT NULL AND {column} != ''
+            """, (mode, kind))
+            logger.info(f"   {column}: {cursor.rowcount} rows")
+        
+        for column in legacy_columns:
+            cursor.execute(f"ALTER TABLE episodes DROP COLUMN {column}")
+        
+        logger.info("✅ Content migration completed")
+    
+    def _migrate_published_date(self, conn: sqlite3.Connection):
+        """Add and backfill the normalized published_date column and its lookup index"""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(episodes)")
+        if 'published_date' not in {row[1] for row in cursor.fetchall()}:
+            logger.info("Adding published_date column...")
+            cursor.execute("ALTER TABLE episodes ADD COLUMN published_date TEXT")
+        
+        # Also catches rows written by tools that don't set the column
+        cursor.execute("""
+            UPDATE episodes SET published_date = date(published)
+            WHERE published_date IS NULL AND date(published) IS NOT NULL
+        """)
+        if cursor.rowcount:
+            logger.info(f"   Backfilled published_date for {cursor.rowcount} episodes")
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_episodes_podcast_title_date
+            ON episodes(podcast, title, published_date)
+        """)
+    
+    def _migrate_title_fingerprint(self, conn: sqlite3.Connection):
+        """Add and backfill the title_fingerprint column and its lookup index"""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(episodes)")
+        if 'title_fingerprint' not in {row[1] for row in cursor.fetchall()}:
+            logger.info("Adding title_fingerprint column...")
+            cursor.execute("ALTER TABLE episodes ADD COLUMN title_fingerprint TEXT")
+        
+        # Computed in Python, so rows from tools that don't set it are filled in here
+        cursor.execute("SELECT id, title FROM episodes WHERE title_fingerprint IS NULL")
+        missing = [(title_fingerprint(title), row_id) for row_id, title in cursor.fetchall()]
+        if missing:
+            cursor.executemany("UPDATE episodes SET title_fingerprint = ? WHERE id = ?", missing)
+            logger.info(f"   Backfilled title_fingerprint for {len(missing)} episodes")
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_episodes_podcast_fingerprint
+            ON episodes(podcast, title_fingerprint)
+        """)
+    
+    def _set_content(self, cursor: sqlite3.Cursor, episode_id: int, mode: str,
+                     kind: str, body: Optional[str]):
+        """Store (or clear, when body is None) one piece of episode text, compressed"""
+        if body is None:
+            cursor.execute("""
+                DELETE FROM episode_content
+                WHERE episode_id = ? AND mode = ? AND kind = ?
+            """, (episode_id, mode, kind))
+        else:
+            cursor.execute("""
+                INSERT OR REPLACE INTO episode_content (episode_id, mode, kind, body, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (episode_id, mode, kind, encode_content(body), datetime.now().isoformat()))
+
+    def compress_existing_content(self, batch_size: int = CONTENT_COMPRESSION_BATCH_SIZE) -> int:
+        """Compress plain-text content rows in place, one short transaction per batch
+
+        Safe to run while the pipeline is writing: a row is only replaced if its
+        body is unchanged, and rows that don't shrink stay as text. Returns the
+        number of rows compressed.
+        """
+        if DEFAULT_CODEC == CODEC_RAW:
+            return 0
+
+        compressed = 0
+        last_rowid = 0
+        while True:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT rowid, body FROM episode_content
+                    WHERE rowid > ? AND typeof(body) = 'text'
+                    AND length(CAST(body AS BLOB)) >= ?
+                    ORDER BY rowid
+                    LIMIT ?
+                """, (last_rowid, CONTENT_COMPRESSION_MIN_BYTES, batch_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                for rowid, body in rows:
+                    encoded = encode_content(body)
+                    if isinstance(encoded, bytes):
+                        cursor.execute("""
+                            UPDATE episode_content SET body = ?
+                            WHERE rowid = ? AND body = ?
+                        """, (encoded, rowid, body))
+                        compressed += cursor.rowcount
+                last_rowid = rows[-1][0]
+
+        if compressed:
+            logger.info(f"🗜️ Compressed {compressed} stored transcripts/summaries "
+                        f"(run VACUUM to return the freed pages to the filesystem)")
+        return compressed
+
+    def start_content_compression(self) -> Optional[threading.Thread]:
+        """Compress legacy plain-text content on a background thread (once per process)"""
+        if DEFAULT_CODEC == CODEC_RAW:
+            return None
+
+        with _compression_lock:
+            key = Path(self.db_path).resolve()
+            thread = _compression_threads.get(key)
+            if thread is None:
+                def run():
+                    try:
+                        self.compress_existing_content()
+                    except sqlite3.Error as e:
+                        logger.warning(f"Background content compression stopped: {e}")
+
+                thread = threading.Thread(target=run, name="content-compression", daemon=True)
+                _compression_threads[key] = thread
+                thread.start()
+            return thread
+
+    def _create_feed_cache_table(self, conn: sqlite3.Connection):
+        """Create the feed cache table used for conditional GETs"""
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                feed_url TEXT PRIMARY KEY,
+                podcast TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                days_back INTEGER,
+                episodes TEXT,
+                fetched_at DATETIME
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_feed_cache_podcast
+            ON feed_cache(podcast)
+        """)
+    
+    def _create_jobs_tables(self, conn: sqlite3.Connection):
+        """Create the durable episode job queue and its per-stage checkpoints
+        
+        One job per (episode, mode). ``stage`` is the next stage to run;
+        audio_blob, transcript_id and summary_id point at what earlier
+        stages produced, so a resumed job skips the work already done. A
+        running job is leased to one run until lease_expires.
+        """
+        cursor = conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                podcast TEXT NOT NULL,
+                title TEXT NOT NULL,
+                published DATETIME NOT NULL,
+                mode TEXT NOT NULL,
+                episode TEXT NOT NULL,
+                stage TEXT NOT NULL DEFAULT 'fetch_transcript',
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL,
+                audio_blob TEXT,
+                transcript_id INTEGER,
+                transcript_source TEXT,
+                summary_id INTEGER,
+                error TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                UNIQUE(podcast, title, published, mode)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_status
+            ON jobs(status, lease_expires)
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_stages (
+                job_id INTEGER NOT NULL,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                seconds REAL,
+                error TEXT,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (job_id, stage)
+            )
+        """)
+    
     def _migrate_database(self, conn: sqlite3.Connection, existing_columns: set):
         """Migrate database to new schema with proper transaction handling"""
         cursor = conn.cursor()
@@ -139,19 +444,15 @@ class PodcastDatabase:
                     podcast TEXT NOT NULL,
                     title TEXT NOT NULL,
                     published DATETIME NOT NULL,
+                    published_date TEXT,
+                    title_fingerprint TEXT,
                     audio_url TEXT,
                     transcript_url TEXT,
                     description TEXT,
                     link TEXT,
                     duration TEXT,
                     guid TEXT,
-                    transcript TEXT,
                     transcript_source TEXT,
-                    summary TEXT,
-                    transcript_test TEXT,
-                    summary_test TEXT,
-                    paragraph_summary TEXT,
-                    paragraph_summary_test TEXT,
                     transcription_mode TEXT DEFAULT 'test',
                     processing_status TEXT DEFAULT 'pending',
                     failure_reason TEXT,
@@ -214,6 +515,10 @@ class PodcastDatabase:
     def _backup_and_recreate(self):
         """Backup existing database and create a new one"""
         if self.db_path.exists():
+            # Close pooled connections first so the WAL is checkpointed into the file
+            close_connection_pool(self.db_path)
+            self._pool = get_connection_pool(self.db_path)
+            
             # Create backup
             backup_path = self.db_path.with_suffix('.backup')
             logger.warning(f"Backing up existing database to {backup_path}")
@@ -222,9 +527,10 @@ class PodcastDatabase:
             shutil.move(str(self.db_path), str(backup_path))
         
         # Create fresh database
-        with sqlite3.connect(self.db_path) as conn:
+        with self.connection() as conn:
             self._create_episodes_table(conn)
-            self._create_indexes(conn)
+            self._create_content_table(conn)
+            self._create_schema(conn)
             conn.commit()
         
         logger.info("✅ Created fresh database")
@@ -240,7 +546,7 @@ class PodcastDatabase:
         logger.info(f"   Transcript: {len(transcript) if transcript else 0} chars")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Convert episode to dict for storage
@@ -269,23 +575,7 @@ class PodcastDatabase:
                 
                 # CRITICAL FIX: Only update transcript/summary fields when explicitly provided
                 # This prevents overwriting existing data during episode fetching
-                if transcript is not None or summary is not None or paragraph_summary is not None:
-                    # We have actual content to save
-                    if transcription_mode == 'test':
-                        episode_data['transcript_test'] = transcript
-                        episode_data['summary_test'] = summary
-                        episode_data['paragraph_summary_test'] = paragraph_summary
-                        # Don't touch full mode columns - preserve existing data
-                    else:  # full mode
-                        episode_data['transcript'] = transcript
-                        episode_data['summary'] = summary
-                        episode_data['paragraph_summary'] = paragraph_summary
-                        # Don't touch test mode columns - preserve existing data
-                else:
-                    # No transcript/summary provided - this is just an episode metadata update
-                    # Preserve ALL existing transcript/summary data by not setting these fields
-                    # They will be excluded from the UPDATE/INSERT queries below
-                    pass
+                has_content = transcript is not None or summary is not None or paragraph_summary is not None
                 
                 # Use INSERT OR REPLACE for atomic operation
                 # First check if record exists to preserve the ID
@@ -297,47 +587,26 @@ class PodcastDatabase:
                 existing_id = cursor.fetchone()
                 
                 if existing_id:
-                    # Build dynamic UPDATE query based on what fields we have
-                    update_fields = ['podcast = ?', 'title = ?', 'published = ?', 
+                    update_fields = ['podcast = ?', 'title = ?', 'published = ?',
+                                   'published_date = date(?)', 'title_fingerprint = ?',
                                    'audio_url = ?', 'transcript_url = ?', 'description = ?',
-                                   'link = ?', 'duration = ?', 'guid = ?', 
+                                   'link = ?', 'duration = ?', 'guid = ?',
                                    'transcription_mode = ?', 'updated_at = ?']
                     
                     update_values = [
                         episode_data['podcast'], episode_data['title'], episode_data['published'],
+                        episode_data['published'], title_fingerprint(episode.title),
                         episode_data['audio_url'], episode_data['transcript_url'],
                         episode_data['description'], episode_data['link'],
                         episode_data['duration'], episode_data['guid'],
                         episode_data['transcription_mode'], episode_data['updated_at']
                     ]
                     
-                    # Only update transcript/summary fields if they're present in episode_data
-                    if 'transcript' in episode_data:
-                        update_fields.append('transcript = ?')
-                        update_values.append(episode_data['transcript'])
+                    # Only touch the source when we're saving content
+                    if has_content:
                         update_fields.append('transcript_source = ?')
                         update_values.append(episode_data['transcript_source'])
                     
-                    if 'summary' in episode_data:
-                        update_fields.append('summary = ?')
-                        update_values.append(episode_data['summary'])
-                    
-                    if 'paragraph_summary' in episode_data:
-                        update_fields.append('paragraph_summary = ?')
-                        update_values.append(episode_data['paragraph_summary'])
-                    
-                    if 'transcript_test' in episode_data:
-                        update_fields.append('transcript_test = ?')
-                        update_values.append(episode_data['transcript_test'])
-                    
-                    if 'summary_test' in episode_data:
-                        update_fields.append('summary_test = ?')
-                        update_values.append(episode_data['summary_test'])
-                    
-                    if 'paragraph_summary_test' in episode_data:
-                        update_fields.append('paragraph_summary_test = ?')
-                        update_values.append(episode_data['paragraph_summary_test'])
-                    
                     # Add the WHERE clause value
                     update_values.append(existing_id[0])
                     
@@ -349,26 +618,30 @@ class PodcastDatabase:
                     # Insert new record
                     cursor.execute("""
                         INSERT INTO episodes (
-                            podcast, title, published, audio_url, transcript_url,
-                            description, link, duration, guid, transcript,
-                            transcript_source, summary, transcript_test, summary_test,
-                            transcription_mode, paragraph_summary, paragraph_summary_test
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            podcast, title, published, published_date, title_fingerprint,
+                            audio_url, transcript_url, description, link, duration, guid,
+                            transcript_source, transcription_mode
+                        ) VALUES (?, ?, ?, date(?), ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """, (
                         episode_data['podcast'], episode_data['title'], episode_data['published'],
+                        episode_data['published'], title_fingerprint(episode.title),
                         episode_data['audio_url'], episode_data['transcript_url'],
                         episode_data['description'], episode_data['link'],
                         episode_data['duration'], episode_data['guid'],
-                        episode_data.get('transcript'), episode_data['transcript_source'],
-                        episode_data.get('summary'), episode_data.get('transcript_test'),
-                        episode_data.get('summary_test'), episode_data['transcription_mode'],
-                        episode_data.get('paragraph_summary'), episode_data.get('paragraph_summary_test')
+                        episode_data['transcript_source'], episode_data['transcription_mode']
                     ))
                 
-                conn.commit()
                 # For UPDATE operations, lastrowid is 0, so use existing_id
                 row_id = existing_id[0] if existing_id else cursor.lastrowid
                 
+                if has_content:
+                    # Content for this mode is written as a set; the other mode's rows are untouched
+                    mode = 'test' if transcription_mode == 'test' else 'full'
+                    for kind, body in zip(CONTENT_KINDS, (transcript, summary, paragraph_summary)):
+                        self._set_content(cursor, row_id, mode, kind, body)
+                
+                conn.commit()
+                
                 # Verify the save was successful
                 if row_id > 0:
                     # Immediately verify we can retrieve what we just saved
@@ -401,40 +674,35 @@ class PodcastDatabase:
             logger.info(f"   GUID: {episode.guid}")
             logger.info(f"   Published: {episode.published} (type: {type(episode.published)})")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
-                # Determine which column to use based on mode
-                if transcription_mode == 'test':
-                    transcript_column = 'transcript_test'
-                elif transcription_mode == 'full':
-                    transcript_column = 'transcript'
+                # Restrict to the requested mode; with no mode prefer full over test
+                if transcription_mode in TRANSCRIPTION_MODES:
+                    mode_clause, mode_params = "AND c.mode = ?", [transcription_mode]
                 else:
-                    # Backwards compatibility - try both columns
-                    transcript_column = None
+                    mode_clause, mode_params = "", []
+                
+                def find_transcript(where: str, params: list, order: str = ""):
+                    cursor.execute(f"""
+                        SELECT c.body, e.transcript_source, e.published
+                        FROM episodes e
+                        JOIN episode_content c
+                          ON c.episode_id = e.id AND c.kind = 'transcript' {mode_clause}
+                        WHERE {where}
+                        ORDER BY {order} c.mode = 'full' DESC
+                        LIMIT 1
+                    """, mode_params + params)
+                    return cursor.fetchone()
                 
                 # Try to find by guid first (most reliable)
                 if episode.guid:
-                    if transcript_column:
-                        query = f"""
-                            SELECT {transcript_column}, transcript_source 
-                            FROM episodes
-                            WHERE guid = ? AND {transcript_column} IS NOT NULL
-                        """
-                        logger.info(f"🔍 Executing GUID query for column: {transcript_column}")
-                        logger.debug(f"🔍 GUID query: {query} with param: {episode.guid}")
-                        cursor.execute(query, (episode.guid,))
-                    else:
-                        # Backwards compatibility - check both columns
-                        cursor.execute("""
-                            SELECT COALESCE(transcript, transcript_test), transcript_source 
-                            FROM episodes 
-                            WHERE guid = ? AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                        """, (episode.guid,))
-                    result = cursor.fetchone()
+                    logger.info(f"🔍 Executing GUID query for mode: {transcription_mode}")
+                    result = find_transcript("e.guid = ?", [episode.guid])
                     logger.info(f"🔍 GUID query result: {result is not None}")
                     if result:
-                        transcript, source_str = result
+                        transcript, source_str, _ = result
+                        transcript = decode_content(transcript)
                         source = TranscriptSource(source_str) if source_str else None
                         logger.info(f"✅ Found transcript by GUID: {len(transcript) if transcript else 0} chars")
                         return transcript, source
@@ -449,55 +717,28 @@ class PodcastDatabase:
                     published_str = episode.published.isoformat()
                 else:
                     published_str = str(episode.published)
-                    
-                if transcript_column:
-                    cursor.execute(f"""
-                        SELECT {transcript_column}, transcript_source 
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ? AND date(published) = date(?)
-                        AND {transcript_column} IS NOT NULL
-                    """, (episode.podcast, episode.title, published_str))
-                else:
-                    # Backwards compatibility
-                    cursor.execute("""
-                        SELECT COALESCE(transcript, transcript_test), transcript_source 
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ? AND date(published) = date(?)
-                        AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                    """, (episode.podcast, episode.title, published_str))
                 
-                result = cursor.fetchone()
+                result = find_transcript(
+                    EPISODE_DATE_MATCH_SQL,
+                    [episode.podcast, episode.title, published_str]
+                )
                 logger.info(f"🔍 Title/date query result: {result is not None}")
                 if result:
-                    transcript, source_str = result
+                    transcript, source_str, _ = result
+                    transcript = decode_content(transcript)
                     source = TranscriptSource(source_str) if source_str else None
                     logger.info(f"✅ Found transcript by title/date: {len(transcript) if transcript else 0} chars")
                     return transcript, source
                 
                 # Final fallback: Try matching by just podcast and title (most flexible)
                 logger.info("🔍 Title/date lookup failed, trying title-only match...")
-                if transcript_column:
-                    cursor.execute(f"""
-                        SELECT {transcript_column}, transcript_source, published
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ?
-                        AND {transcript_column} IS NOT NULL
-                        ORDER BY published DESC
-                        LIMIT 1
-                    """, (episode.podcast, episode.title))
-                else:
-                    cursor.execute("""
-                        SELECT COALESCE(transcript, transcript_test), transcript_source, published
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ?
-                        AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                        ORDER BY published DESC
-                        LIMIT 1
-                    """, (episode.podcast, episode.title))
-                
-                result = cursor.fetchone()
+                result = find_transcript(
+                    "e.podcast = ? AND e.title = ?", [episode.podcast, episode.title],
+                    order="e.published DESC,"
+                )
                 if result:
                     transcript, source_str, db_published = result
+                    transcript = decode_content(transcript)
                     source = TranscriptSource(source_str) if source_str else None
                     logger.info(f"✅ Found transcript by title-only: {len(transcript) if transcript else 0} chars")
                     logger.info(f"   DB published: {db_published}, Episode published: {episode.published}")
@@ -510,36 +751,219 @@ class PodcastDatabase:
             logger.error(f"Database error getting transcript: {e}")
             return None, None
     
-    def get_episode(self, podcast: str, title: str, published: datetime) -> Optional[Dict]:
-        """Get a specific episode from the database"""
+    def get_episode(self, podcast: str, title: str, published: datetime,
+                    include_transcripts: bool = True) -> Optional[Dict]:
+        """Get a specific episode with its content under the legacy column names
+        
+        Transcripts are the bulk of the data; pass include_transcripts=False
+        when only summaries and the has_* flags are needed.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM episodes 
-                    WHERE podcast = ? AND title = ? AND date(published) = date(?)
+                cursor.execute(f"""
+                    SELECT e.*, {CONTENT_FLAGS_SQL} FROM episodes e
+                    WHERE {EPISODE_DATE_MATCH_SQL}
                 """, (podcast, title, published.isoformat()))
                 
                 result = cursor.fetchone()
-                if result:
-                    columns = [desc[0] for desc in cursor.description]
-                    return dict(zip(columns, result))
+                if not result:
+                    return None
+                
+                columns = [desc[0] for desc in cursor.description]
+                episode_data = dict(zip(columns, result))
                 
-                return None
+                kinds = CONTENT_KINDS if include_transcripts else ('summary', 'paragraph_summary')
+                placeholders = ','.join('?' for _ in kinds)
+                cursor.execute(f"""
+                    SELECT mode, kind, body FROM episode_content
+                    WHERE episode_id = ? AND kind IN ({placeholders})
+                """, (episode_data['id'], *kinds))
+                for mode, kind, body in cursor.fetchall():
+                    episode_data[content_column(kind, mode)] = decode_content(body)
+                
+                return episode_data
                 
         except sqlite3.Error as e:
             logger.error(f"Database error getting episode: {e}")
             return None
     
-    def get_recent_episodes(self, days_back: int = 7) -> List[Dict]:
-        """Get recent episodes from the database"""
+    def find_episode_by_title(self, podcast: str, title: str, published: Optional[datetime] = None,
+                              guid: Optional[str] = None) -> Optional[Dict]:
+        """Find a podcast's episode by title when the date/GUID may not line up
+        
+        Tries an exact title match, the indexed title fingerprint and the GUID.
+        Only then, and only with a published date to confirm against, does it
+        compare titles of that podcast's episodes published within a day or so.
+        A fuzzy candidate needs the same episode number, no words the other
+        title lacks besides additions like "(Rebroadcast)", and a close
+        trigram score. Returns {'id', 'guid', 'title', 'fuzzy'} or None;
+        fuzzy matches are likely, not certain, to be the same episode.
+        """
+        fingerprint = title_fingerprint(title)
+        lookups = [("title = ?", title), ("title_fingerprint = ?", fingerprint)]
+        if guid:
+            lookups.append(("guid = ?", guid))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                for where, value in lookups:
+                    cursor.execute(f"""
+                        SELECT id, guid, title FROM episodes
+                        WHERE podcast = ? AND {where}
+                        ORDER BY published DESC
+                        LIMIT 1
+                    """, (podcast, value))
+                    row = cursor.fetchone()
+                    if row:
+                        return {'id': row[0], 'guid': row[1], 'title': row[2], 'fuzzy': False}
+                
+                number, _, words = fingerprint.partition('|')
+                if not words or not hasattr(published, 'date'):
+                    return None
+                
+                # Stored dates are ISO strings, so a date-prefix range is an index seek
+                day = published.date()
+                window = timedelta(days=TITLE_MATCH_DATE_WINDOW_DAYS)
                 cursor.execute("""
-                    SELECT * FROM episodes 
-                    WHERE published >= datetime('now', '-' || ? || ' days')
+                    SELECT id, guid, title, title_fingerprint FROM episodes
+                    WHERE podcast = ? AND published >= ? AND published < ?
                     ORDER BY published DESC
+                    LIMIT ?
+                """, (podcast, (day - window).isoformat(), (day + window + timedelta(days=1)).isoformat(),
+                      TITLE_MATCH_MAX_CANDIDATES))
+                
+                target, target_words = _trigrams(words), set(words.split())
+                best, best_score = None, 0.0
+                for row_id, row_guid, row_title, row_fingerprint in cursor.fetchall():
+                    row_number, _, row_words = (row_fingerprint or '').partition('|')
+                    if number and row_number and number != row_number:
+                        continue
+                    # One title may add words ("Rebroadcast", a guest's surname), never swap them
+                    row_word_set = set(row_words.split())
+                    if not (row_word_set <= target_words or target_words <= row_word_set):
+                        continue
+                    score = _similarity(target, _trigrams(row_words))
+                    # Rows are newest first, so ties keep the most recent episode
+                    if score >= TITLE_SIMILARITY_THRESHOLD and score > best_score:
+                        best = {'id': row_id, 'guid': row_guid, 'title': row_title, 'fuzzy': True}
+                        best_score = score
+                
+                if best:
+                    logger.info(f"Fuzzy title match ({best_score:.2f}): '{title[:60]}' -> '{best['title'][:60]}'")
+                return best
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error finding episode by title: {e}")
+            return None
+    
+    def get_content(self, episode_id: int, kind: str, transcription_mode: str) -> Optional[str]:
+        """Load one transcript or summary body on demand"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT body FROM episode_content
+                    WHERE episode_id = ? AND mode = ? AND kind = ?
+                """, (episode_id, 'test' if transcription_mode == 'test' else 'full', kind))
+                
+                row = cursor.fetchone()
+                return decode_content(row[0]) if row else None
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting episode content: {e}")
+            return None
+    
+    def get_cache_status_bulk(self, episodes: List[Episode], transcription_mode: str) -> List[Optional[Dict]]:
+        """What's cached for many episodes at once, without loading any text
+        
+        Returns one entry per episode, in order (None when it isn't in the
+        database), with the row 'id', has_transcript / has_summary /
+        has_paragraph_summary for the mode, and 'content_hash' - a digest of the
+        stored pieces' sizes and write times that changes whenever one of them
+        is rewritten.
+        """
+        mode = 'test' if transcription_mode == 'test' else 'full'
+        statuses: List[Optional[Dict]] = [None] * len(episodes)
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(episodes), BULK_LOOKUP_CHUNK):
+                    chunk = episodes[start:start + BULK_LOOKUP_CHUNK]
+                    params = []
+                    for offset, episode in enumerate(chunk):
+                        published = episode.published
+                        published_str = published.isoformat() if hasattr(published, 'isoformat') else str(published)
+                        params.extend([start + offset, episode.podcast, episode.title, published_str])
+                    values = ', '.join('(?, ?, ?, ?)' for _ in chunk)
+                    
+                    cursor.execute(f"""
+                        WITH wanted(idx, podcast, title, published) AS (VALUES {values})
+                        SELECT w.idx, e.id, c.kind, length(c.body), c.updated_at
+                        FROM wanted w
+                        JOIN episodes e
+                          ON e.podcast = w.podcast AND e.title = w.title
+                          AND e.published_date = date(w.published)
+                        LEFT JOIN episode_content c
+                          ON c.episode_id = e.id AND c.mode = ? AND c.body != ''
+                        ORDER BY w.idx, e.id, c.kind
+                    """, params + [mode])
+                    
+                    hashes = {}
+                    for idx, episode_id, kind, size, updated_at in cursor.fetchall():
+                        status = statuses[idx]
+                        if status is None:
+                            status = statuses[idx] = {'id': episode_id, **{f'has_{k}': False for k in CONTENT_KINDS}}
+                            hashes[idx] = hashlib.md5()
+                        elif status['id'] != episode_id:
+                            continue  # Same title and day twice; keep the first row like get_episode
+                        if kind:
+                            status[f'has_{kind}'] = True
+                            hashes[idx].update(f"{kind}:{size}:{updated_at};".encode())
+                    
+                    for idx, digest in hashes.items():
+                        statuses[idx]['content_hash'] = digest.hexdigest()
+                
+                return statuses
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting bulk cache status: {e}")
+            return [None] * len(episodes)
+    
+    def get_content_bulk(self, episode_ids: List[int], kinds: Tuple[str, ...],
+                         transcription_mode: str) -> Dict[int, Dict[str, str]]:
+        """Load the given kinds of text for many episodes: {episode_id: {kind: text}}"""
+        mode = 'test' if transcription_mode == 'test' else 'full'
+        content: Dict[int, Dict[str, str]] = {}
+        ids = list(dict.fromkeys(episode_ids))
+        kind_placeholders = ','.join('?' for _ in kinds)
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(ids), BULK_LOOKUP_CHUNK):
+                    chunk = ids[start:start + BULK_LOOKUP_CHUNK]
+                    cursor.execute(f"""
+                        SELECT episode_id, kind, body FROM episode_content
+                        WHERE mode = ? AND kind IN ({kind_placeholders})
+                        AND episode_id IN ({','.join('?' for _ in chunk)})
+                    """, [mode, *kinds, *chunk])
+                    for episode_id, kind, body in cursor.fetchall():
+                        content.setdefault(episode_id, {})[kind] = decode_content(body)
+                return content
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting bulk content: {e}")
+            return {}
+    
+    def get_recent_episodes(self, days_back: int = 7) -> List[Dict]:
+        """Get recent episode metadata (no transcript/summary text, just has_* flags)"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    SELECT e.*, {CONTENT_FLAGS_SQL} FROM episodes e
+                    WHERE e.published >= datetime('now', '-' || ? || ' days')
+                    ORDER BY e.published DESC
                 """, (days_back,))
                 
                 results = cursor.fetchall()
@@ -552,39 +976,41 @@ class PodcastDatabase:
             return []
     
     def get_episodes_with_summaries(self, days_back: int = 7, transcription_mode: str = None) -> List[Dict]:
-        """Get episodes that have summaries (both paragraph and full)"""
+        """Get episodes that have summaries, with 'summary' and 'paragraph_summary' but no transcript"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
-                if transcription_mode == 'test':
-                    cursor.execute("""
-                        SELECT * FROM episodes 
-                        WHERE published >= datetime('now', '-' || ? || ' days')
-                        AND summary_test IS NOT NULL AND summary_test != ''
-                        ORDER BY published DESC
-                    """, (days_back,))
-                elif transcription_mode == 'full':
-                    cursor.execute("""
-                        SELECT * FROM episodes 
-                        WHERE published >= datetime('now', '-' || ? || ' days')
-                        AND summary IS NOT NULL AND summary != ''
-                        ORDER BY published DESC
-                    """, (days_back,))
+                # Without a mode, return each episode once, preferring full summaries
+                if transcription_mode in TRANSCRIPTION_MODES:
+                    mode_clause, mode_params = "AND s.mode = ?", [transcription_mode]
                 else:
-                    # Backwards compatibility - get episodes with any summaries
-                    cursor.execute("""
-                        SELECT * FROM episodes 
-                        WHERE published >= datetime('now', '-' || ? || ' days')
-                        AND ((summary IS NOT NULL AND summary != '') OR 
-                             (summary_test IS NOT NULL AND summary_test != ''))
-                        ORDER BY published DESC
-                    """, (days_back,))
+                    mode_clause, mode_params = "", []
+                
+                cursor.execute(f"""
+                    SELECT e.*, s.mode AS summary_mode, s.body AS summary, p.body AS paragraph_summary
+                    FROM episodes e
+                    JOIN episode_content s
+                      ON s.episode_id = e.id AND s.kind = 'summary' AND s.body != '' {mode_clause}
+                    LEFT JOIN episode_content p
+                      ON p.episode_id = e.id AND p.kind = 'paragraph_summary' AND p.mode = s.mode
+                    WHERE e.published >= datetime('now', '-' || ? || ' days')
+                    ORDER BY e.published DESC, s.mode = 'full' DESC
+                """, mode_params + [days_back])
                 
                 results = cursor.fetchall()
                 columns = [desc[0] for desc in cursor.description]
                 
-                return [dict(zip(columns, row)) for row in results]
+                episodes = []
+                seen_ids = set()
+                for row in results:
+                    episode_data = dict(zip(columns, row))
+                    if episode_data['id'] not in seen_ids:
+                        seen_ids.add(episode_data['id'])
+                        episode_data['summary'] = decode_content(episode_data['summary'])
+                        episode_data['paragraph_summary'] = decode_content(episode_data['paragraph_summary'])
+                        episodes.append(episode_data)
+                return episodes
                 
         except sqlite3.Error as e:
             logger.error(f"Database error getting episodes with summaries: {e}")
@@ -593,7 +1019,7 @@ class PodcastDatabase:
     def get_episode_summary(self, podcast: str, title: str, published: datetime, transcription_mode: str = None) -> Optional[str]:
         """Get summary for a specific episode if it exists, optionally filtered by mode"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Handle both datetime and string published dates
@@ -602,49 +1028,44 @@ class PodcastDatabase:
                 else:
                     published_str = published
                 
-                # Determine which column to use based on mode
-                if transcription_mode == 'test':
-                    summary_column = 'summary_test'
-                elif transcription_mode == 'full':
-                    summary_column = 'summary'
+                # Restrict to the requested mode; with no mode prefer full over test
+                if transcription_mode in TRANSCRIPTION_MODES:
+                    mode_clause, mode_params = "AND c.mode = ?", [transcription_mode]
                 else:
-                    # Backwards compatibility - try both columns
-                    summary_column = None
+                    mode_clause, mode_params = "", []
                 
-                if summary_column:
-                    cursor.execute(f"""
-                        SELECT {summary_column}
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ? AND published = ?
-                        AND {summary_column} IS NOT NULL
-                    """, (podcast, title, published_str))
-                else:
-                    # Backwards compatibility - check both columns
-                    cursor.execute("""
-                        SELECT COALESCE(summary, summary_test)
-                        FROM episodes 
-                        WHERE podcast = ? AND title = ? AND published = ?
-                        AND (summary IS NOT NULL OR summary_test IS NOT NULL)
-                    """, (podcast, title, published_str))
+                cursor.execute(f"""
+                    SELECT c.body
+                    FROM episodes e
+                    JOIN episode_content c
+                      ON c.episode_id = e.id AND c.kind = 'summary' {mode_clause}
+                    WHERE e.podcast = ? AND e.title = ? AND e.published = ?
+                    ORDER BY c.mode = 'full' DESC
+                    LIMIT 1
+                """, mode_params + [podcast, title, published_str])
                 
                 row = cursor.fetchone()
-                return row[0] if row else None
+                return decode_content(row[0]) if row else None
                 
         except Exception as e:
             logger.error(f"Error fetching episode summary: {e}")
             return None
     
-    def get_episodes_without_transcripts(self, days_back: int = 7) -> List[Dict]:
-        """Get episodes that don't have transcripts yet"""
+    def get_episodes_without_transcripts(self, days_back: int = 7, transcription_mode: str = 'full') -> List[Dict]:
+        """Get metadata for episodes that don't have transcripts yet"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT * FROM episodes 
-                    WHERE published >= datetime('now', '-' || ? || ' days')
-                    AND (transcript IS NULL OR transcript = '')
-                    ORDER BY published DESC
-                """, (days_back,))
+                    SELECT e.* FROM episodes e
+                    WHERE e.published >= datetime('now', '-' || ? || ' days')
+                    AND NOT EXISTS (
+                        SELECT 1 FROM episode_content c
+                        WHERE c.episode_id = e.id AND c.kind = 'transcript'
+                        AND c.mode = ? AND c.body != ''
+                    )
+                    ORDER BY e.published DESC
+                """, (days_back, 'test' if transcription_mode == 'test' else 'full'))
                 
                 results = cursor.fetchall()
                 columns = [desc[0] for desc in cursor.description]
@@ -658,7 +1079,7 @@ class PodcastDatabase:
     def get_last_episode_dates(self, podcast_names: List[str]) -> Dict[str, Optional[datetime]]:
         """Get the most recent episode date for each podcast"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create placeholders for IN clause
@@ -700,7 +1121,7 @@ class PodcastDatabase:
     def get_last_episode_info(self, podcast_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
         """Get the most recent episode info (date and title) for each podcast"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create placeholders for IN clause
@@ -747,10 +1168,86 @@ class PodcastDatabase:
             logger.error(f"Database error getting last episode info: {e}")
             return {name: None for name in podcast_names}
     
+    def get_feed_cache(self, feed_url: str) -> Optional[Dict]:
+        """Get the cached validators and episodes for a feed URL"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT etag, last_modified, days_back, episodes, fetched_at
+                    FROM feed_cache WHERE feed_url = ?
+                """, (feed_url,))
+                
+                result = cursor.fetchone()
+                if not result:
+                    return None
+                
+                etag, last_modified, days_back, episodes_json, fetched_at = result
+                return {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'days_back': days_back or 0,
+                    'episodes': [Episode.from_dict(ep) for ep in json.loads(episodes_json or '[]')],
+                    'fetched_at': datetime.fromisoformat(fetched_at) if fetched_at else None
+                }
+                
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.error(f"Database error getting feed cache: {e}")
+            return None
+    
+    def save_feed_cache(self, feed_url: str, podcast: str, episodes: List[Episode],
+                        days_back: int, etag: Optional[str] = None,
+                        last_modified: Optional[str] = None):
+        """Store a feed's validators and parsed episodes"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT OR REPLACE INTO feed_cache
+                    (feed_url, podcast, etag, last_modified, days_back, episodes, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (feed_url, podcast, etag, last_modified, days_back,
+                      json.dumps([ep.to_dict() for ep in episodes]),
+                      datetime.now().isoformat()))
+                conn.commit()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error saving feed cache: {e}")
+    
+    def touch_feed_cache(self, feed_url: str):
+        """Mark a cached feed as revalidated (304 Not Modified)"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE feed_cache SET fetched_at = ? WHERE feed_url = ?
+                """, (datetime.now().isoformat(), feed_url))
+                conn.commit()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error updating feed cache: {e}")
+    
+    def get_cached_feed_urls(self, podcast: str) -> List[str]:
+        """Get feed URLs that have previously returned episodes for a podcast"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT feed_url FROM feed_cache
+                    WHERE podcast = ? AND episodes != '[]'
+                    ORDER BY fetched_at DESC
+                """, (podcast,))
+                
+                return [row[0] for row in cursor.fetchall()]
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error getting cached feed URLs: {e}")
+            return []
+    
     def clear_old_episodes(self, days_to_keep: int = 30):
         """Clear episodes older than specified days"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     DELETE FROM episodes 
@@ -758,6 +1255,11 @@ class PodcastDatabase:
                 """, (days_to_keep,))
                 
                 deleted_count = cursor.rowcount
+                
+                cursor.execute("""
+                    DELETE FROM episode_content
+                    WHERE episode_id NOT IN (SELECT id FROM episodes)
+                """)
                 conn.commit()
                 
                 if deleted_count > 0:
@@ -766,49 +1268,52 @@ class PodcastDatabase:
         except sqlite3.Error as e:
             logger.error(f"Database error clearing old episodes: {e}")
     
-    def update_episode_status(self, episode_id: int, status: str, 
-                            failure_reason: Optional[str] = None,
-                            retry_strategy: Optional[str] = None):
-        """Update the processing status of an episode"""
+    def update_episode_status(self, episode: Union[int, str], status: str,
+                              failure_reason: Optional[str] = None,
+                              retry_strategy: Optional[str] = None) -> bool:
+        """Update an episode's processing status and retry information
+        
+        episode is the database id (int) or the episode GUID (str). A
+        failure reason, or a failed status, counts as one more retry.
+        """
+        column = 'id' if isinstance(episode, int) else 'guid'
+        now = datetime.now().isoformat()
+        fields, values = ['processing_status = ?', 'updated_at = ?'], [status, now]
+        
+        if status in IN_PROGRESS_STATUSES:
+            fields.append('processing_started_at = ?')
+            values.append(now)
+        elif status == 'completed':
+            fields.append('processing_completed_at = ?')
+            values.append(now)
+        
+        if failure_reason or 'failed' in status:
+            fields.append('retry_count = retry_count + 1')
+        if failure_reason:
+            fields.append('failure_reason = ?')
+            values.append(failure_reason)
+        if retry_strategy:
+            fields.append('retry_strategy = ?')
+            values.append(retry_strategy)
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
-                
-                if status in ['downloading', 'transcribing', 'summarizing']:
-                    cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, processing_started_at = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (status, datetime.now().isoformat(), datetime.now().isoformat(), episode_id))
-                elif status == 'completed':
-                    cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, processing_completed_at = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (status, datetime.now().isoformat(), datetime.now().isoformat(), episode_id))
-                elif 'failed' in status:
-                    cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, failure_reason = ?, retry_count = retry_count + 1, 
-                            retry_strategy = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (status, failure_reason, retry_strategy, datetime.now().isoformat(), episode_id))
-                else:
-                    cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, updated_at = ?
-                        WHERE id = ?
-                    """, (status, datetime.now().isoformat(), episode_id))
-                
+                cursor.execute(f"""
+                    UPDATE episodes SET {', '.join(fields)}
+                    WHERE {column} = ?
+                """, (*values, episode))
                 conn.commit()
+                return cursor.rowcount > 0
                 
         except sqlite3.Error as e:
             logger.error(f"Database error updating episode status: {e}")
+            return False
     
     def get_failed_episodes(self, days_back: int = 7) -> List[Dict]:
         """Get episodes that failed processing"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT * FROM episodes 
@@ -829,7 +1334,7 @@ class PodcastDatabase:
     def get_episodes_by_status(self, status: str, days_back: int = 7) -> List[Dict]:
         """Get episodes with a specific processing status"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT * FROM episodes 
@@ -850,7 +1355,7 @@ class PodcastDatabase:
     def get_retry_eligible_episodes(self, max_retries: int = 3) -> List[Dict]:
         """Get failed episodes that haven't exceeded retry limit"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT * FROM episodes 
@@ -871,7 +1376,7 @@ class PodcastDatabase:
     def get_episode_failure_info(self, guid: str) -> Dict:
         """Get failure information for a specific episode"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT processing_status, failure_reason, retry_count, retry_strategy
@@ -893,40 +1398,193 @@ class PodcastDatabase:
             logger.error(f"Database error getting episode failure info: {e}")
             return {}
     
-    def update_episode_status(self, guid: str, status: str, 
-                            failure_reason: Optional[str] = None,
-                            retry_strategy: Optional[str] = None) -> bool:
-        """Update episode processing status and retry information"""
+    def _job_rows(self, cursor: sqlite3.Cursor, where: str, params: tuple) -> List[Dict]:
+        cursor.execute(f"SELECT * FROM jobs WHERE {where} ORDER BY id", params)
+        columns = [desc[0] for desc in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        for row in rows:
+            row['episode'] = Episode.from_dict(json.loads(row['episode']))
+        return rows
+    
+    def claim_jobs(self, episodes: List[Episode], mode: str, owner: str,
+                   lease_seconds: float) -> Optional[List[Optional[Dict]]]:
+        """Queue episodes for processing and lease their jobs to owner
+        
+        An episode with an unfinished job keeps its stage and artifacts, so
+        processing it again continues from the last checkpoint; a completed
+        job starts over. Returns each episode's job row, or None where the
+        job is leased to another run that is still alive (None overall if
+        the queue can't be reached).
+        """
+        now = datetime.now().timestamp()
+        claimed = []
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
+                for episode in episodes:
+                    published = episode.published.isoformat() if hasattr(episode.published, 'isoformat') else str(episode.published)
+                    cursor.execute("""
+                        INSERT INTO jobs (podcast, title, published, mode, episode)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(podcast, title, published, mode) DO UPDATE SET episode = excluded.episode
+                    """, (episode.podcast, episode.title, published, mode, json.dumps(episode.to_dict())))
+                    cursor.execute("""
+                        SELECT id, status FROM jobs
+                        WHERE podcast = ? AND title = ? AND published = ? AND mode = ?
+                    """, (episode.podcast, episode.title, published, mode))
+                    job_id, status = cursor.fetchone()
+                    
+                    if status == 'completed':
+                        cursor.execute("""
+                            UPDATE jobs SET stage = ?, attempts = 0, audio_blob = NULL, transcript_id = NULL,
+                                transcript_source = NULL, summary_id = NULL, error = NULL
+                            WHERE id = ?
+                        """, (JOB_STAGES[0], job_id))
+                        cursor.execute("DELETE FROM job_stages WHERE job_id = ?", (job_id,))
+                    
+                    cursor.execute("""
+                        UPDATE jobs SET status = 'running', lease_owner = ?, lease_expires = ?,
+                            attempts = attempts + 1, updated_at = ?
+                        WHERE id = ? AND (status != 'running' OR lease_owner = ? OR lease_expires < ?)
+                    """, (owner, now + lease_seconds, datetime.now().isoformat(), job_id, owner, now))
+                    if cursor.rowcount == 0:
+                        claimed.append(None)
+                        continue
+                    claimed.append(self._job_rows(cursor, "id = ?", (job_id,))[0])
+                conn.commit()
+                return claimed
                 
-                # First get current retry count
-                cursor.execute("SELECT retry_count FROM episodes WHERE guid = ?", (guid,))
-                result = cursor.fetchone()
-                current_retry_count = result[0] if result else 0
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.error(f"Database error claiming jobs: {e}")
+            return None
+    
+    def claim_resumable_jobs(self, owner: str, lease_seconds: float, max_attempts: int,
+                             days_back: int = 7) -> List[Dict]:
+        """Lease every job left unfinished in the last days_back days
+        
+        That is queued or interrupted jobs, jobs whose run died without
+        renewing its lease, and failed jobs that haven't used up
+        max_attempts.
+        """
+        now = datetime.now().timestamp()
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE jobs SET status = 'running', lease_owner = ?, lease_expires = ?,
+                        attempts = attempts + 1, updated_at = ?
+                    WHERE created_at >= datetime('now', '-' || ? || ' days')
+                    AND attempts < ?
+                    AND (status IN ('pending', 'failed') OR (status = 'running' AND lease_expires < ?))
+                """, (owner, now + lease_seconds, datetime.now().isoformat(), days_back, max_attempts, now))
+                rows = self._job_rows(cursor, "status = 'running' AND lease_owner = ?", (owner,))
+                conn.commit()
+                return rows
                 
-                # Update status
-                if failure_reason:
-                    cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, failure_reason = ?, 
-                            retry_count = ?, retry_strategy = ?,
-                            updated_at = ?
-                        WHERE guid = ?
-                    """, (status, failure_reason, current_retry_count + 1, 
-                          retry_strategy, datetime.now().isoformat(), guid))
-                else:
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.error(f"Database error claiming resumable jobs: {e}")
+            return []
+    
+    def checkpoint_job(self, job_id: int, stage: str, next_stage: Optional[str],
+                       seconds: Optional[float] = None, **artifacts):
+        """Record a finished stage, the stage to run next, and any artifacts it produced
+        
+        artifacts may set audio_blob, transcript_id, transcript_source and
+        summary_id.
+        """
+        fields = ['updated_at = ?']
+        values: List[Any] = [datetime.now().isoformat()]
+        if next_stage:
+            fields.append('stage = ?')
+            values.append(next_stage)
+        for column in ('audio_blob', 'transcript_id', 'transcript_source', 'summary_id'):
+            if column in artifacts:
+                fields.append(f'{column} = ?')
+                values.append(artifacts[column])
+        
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO job_stages (job_id, stage, status, attempts, seconds, updated_at)
+                    VALUES (?, ?, 'done', 1, ?, ?)
+                    ON CONFLICT(job_id, stage) DO UPDATE SET
+                        status = 'done', attempts = attempts + 1, seconds = excluded.seconds,
+                        error = NULL, updated_at = excluded.updated_at
+                """, (job_id, stage, seconds, datetime.now().isoformat()))
+                cursor.execute(f"UPDATE jobs SET {', '.join(fields)} WHERE id = ?", (*values, job_id))
+                conn.commit()
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error checkpointing job {job_id}: {e}")
+    
+    def finish_job(self, job_id: int, status: str, stage: Optional[str] = None,
+                   error: Optional[str] = None):
+        """Release a job's lease as 'completed', 'failed' (at stage, with error) or 'pending'"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                    WHERE id = ?
+                """, (status, error, datetime.now().isoformat(), job_id))
+                if status == 'failed' and stage:
                     cursor.execute("""
-                        UPDATE episodes 
-                        SET processing_status = ?, retry_strategy = ?,
-                            updated_at = ?
-                        WHERE guid = ?
-                    """, (status, retry_strategy, datetime.now().isoformat(), guid))
+                        INSERT INTO job_stages (job_id, stage, status, attempts, error, updated_at)
+                        VALUES (?, ?, 'failed', 1, ?, ?)
+                        ON CONFLICT(job_id, stage) DO UPDATE SET
+                            status = 'failed', attempts = attempts + 1, error = excluded.error,
+                            updated_at = excluded.updated_at
+                    """, (job_id, stage, error, datetime.now().isoformat()))
+                conn.commit()
                 
+        except sqlite3.Error as e:
+            logger.error(f"Database error finishing job {job_id}: {e}")
+    
+    def renew_job_leases(self, owner: str, lease_seconds: float) -> int:
+        """Extend the leases on owner's running jobs; returns how many"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE jobs SET lease_expires = ?
+                    WHERE lease_owner = ? AND status = 'running'
+                """, (datetime.now().timestamp() + lease_seconds, owner))
                 conn.commit()
-                return cursor.rowcount > 0
+                return cursor.rowcount
                 
         except sqlite3.Error as e:
-            logger.error(f"Database error updating episode status: {e}")
-            return False
\ No newline at end of file
+            logger.error(f"Database error renewing job leases: {e}")
+            return 0
+    
+    def release_job_leases(self, owner: str) -> int:
+        """Put owner's unfinished jobs back in the queue at their last checkpoint"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE jobs SET status = 'pending', lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                    WHERE lease_owner = ? AND status = 'running'
+                """, (datetime.now().isoformat(), owner))
+                conn.commit()
+                return cursor.rowcount
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error releasing job leases: {e}")
+            return 0
+    
+    def get_job_counts(self, days_back: int = 7) -> Dict[str, int]:
+        """Number of jobs per status created in the last days_back days"""
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT status, COUNT(*) FROM jobs
+                    WHERE created_at >= datetime('now', '-' || ? || ' days')
+                    GROUP BY status
+                """, (days_back,))
+                return dict(cursor.fetchall())
+                
+        except sqlite3.Error as e:
+            logger.error(f"Database error counting jobs: {e}")
+            return {}
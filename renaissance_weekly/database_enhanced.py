@@ -8,6 +8,12 @@ import json
 
 from .models import Episode, TranscriptSource
 from .config import DB_PATH
+from .database import (
+    PodcastDatabase, CONTENT_COLUMNS, TRANSCRIPTION_MODES, EPISODE_DATE_MATCH_SQL, content_column
+)
+from .content_codec import decode_content
+from .utils.filename_utils import title_fingerprint
+from .db_connection import get_connection_pool
 from .utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +24,7 @@ class EnhancedPodcastDatabase:
     
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
+        self._pool = get_connection_pool(db_path)
         logger.info(f"🗄️ Initializing Enhanced Database at: {self.db_path}")
         logger.info(f"   File exists: {self.db_path.exists()}")
         if self.db_path.exists():
@@ -25,10 +32,31 @@ class EnhancedPodcastDatabase:
             logger.info(f"   Last modified: {datetime.fromtimestamp(self.db_path.stat().st_mtime)}")
         self._init_database()
     
+    def connection(self):
+        """Pooled connection context manager (commits on success, rolls back on error)"""
+        return self._pool.connection()
+    
+    # Content storage is shared with PodcastDatabase
+    _create_content_table = PodcastDatabase._create_content_table
+    _migrate_content_columns = PodcastDatabase._migrate_content_columns
+    _migrate_published_date = PodcastDatabase._migrate_published_date
+    _migrate_title_fingerprint = PodcastDatabase._migrate_title_fingerprint
+    _set_content = PodcastDatabase._set_content
+    
+    def _content_lengths(self, cursor: sqlite3.Cursor, episode_id: int) -> Dict[str, int]:
+        """Stored body sizes keyed by legacy column name (bytes once compressed; for diagnostics)"""
+        cursor.execute("""
+            SELECT mode, kind, LENGTH(body) FROM episode_content WHERE episode_id = ?
+        """, (episode_id,))
+        lengths = {column: None for column in CONTENT_COLUMNS}
+        for mode, kind, length in cursor.fetchall():
+            lengths[content_column(kind, mode)] = length
+        return lengths
+    
     def _init_database(self):
         """Initialize database with proper error handling"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 # Check if episodes table exists
                 cursor = conn.cursor()
                 cursor.execute("""
@@ -51,6 +79,12 @@ class EnhancedPodcastDatabase:
                     cursor.execute("SELECT COUNT(*) FROM episodes")
                     count = cursor.fetchone()[0]
                     logger.info(f"📊 Database contains {count} episodes")
+                
+                self._create_content_table(conn)
+                if table_exists:
+                    self._migrate_content_columns(conn, columns)
+                    self._migrate_published_date(conn)
+                    self._migrate_title_fingerprint(conn)
                     
                 conn.commit()
                 
@@ -88,27 +122,26 @@ class EnhancedPodcastDatabase:
             
             logger.info(f"   Normalized date: {published_str}")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
                 # Check if episode already exists
                 cursor.execute("""
-                    SELECT id, transcription_mode, 
-                           LENGTH(transcript), LENGTH(transcript_test),
-                           LENGTH(summary), LENGTH(summary_test)
+                    SELECT id, transcription_mode
                     FROM episodes
-                    WHERE podcast = ? AND title = ? AND date(published) = date(?)
+                    WHERE podcast = ? AND title = ? AND published_date = date(?)
                 """, (episode.podcast, episode.title, published_str))
                 
                 existing = cursor.fetchone()
                 
                 if existing:
+                    lengths = self._content_lengths(cursor, existing[0])
                     logger.info(f"📝 Episode exists with ID: {existing[0]}")
                     logger.info(f"   Existing mode: {existing[1]}")
-                    logger.info(f"   Existing transcript: {existing[2]} chars")
-                    logger.info(f"   Existing transcript_test: {existing[3]} chars")
-                    logger.info(f"   Existing summary: {existing[4]} chars")
-                    logger.info(f"   Existing summary_test: {existing[5]} chars")
+                    logger.info(f"   Existing transcript: {lengths['transcript']} chars")
+                    logger.info(f"   Existing transcript_test: {lengths['transcript_test']} chars")
+                    logger.info(f"   Existing summary: {lengths['summary']} chars")
+                    logger.info(f"   Existing summary_test: {lengths['summary_test']} chars")
                 
                 # Prepare episode data
                 episode_data = {
@@ -126,16 +159,6 @@ class EnhancedPodcastDatabase:
                     'updated_at': datetime.now().isoformat()
                 }
                 
-                # Set mode-specific columns
-                if transcription_mode == 'test':
-                    episode_data['transcript_test'] = transcript
-                    episode_data['summary_test'] = summary
-                    episode_data['paragraph_summary_test'] = paragraph_summary
-                else:  # full mode
-                    episode_data['transcript'] = transcript
-                    episode_data['summary'] = summary
-                    episode_data['paragraph_summary'] = paragraph_summary
-                
                 if existing:
                     # Update existing record
                     update_fields = []
@@ -148,35 +171,13 @@ class EnhancedPodcastDatabase:
                             update_fields.append(f"{field} = ?")
                             update_values.append(episode_data[field])
                     
-                    # Update mode-specific fields
-                    if transcription_mode == 'test':
-                        if transcript:
-                            update_fields.append("transcript_test = ?")
-                            update_values.append(transcript)
-                        if summary:
-                            update_fields.append("summary_test = ?")
-                            update_values.append(summary)
-                        if paragraph_summary:
-                            update_fields.append("paragraph_summary_test = ?")
-                            update_values.append(paragraph_summary)
-                    else:
-                        if transcript:
-                            update_fields.append("transcript = ?")
-                            update_values.append(transcript)
-                        if summary:
-                            update_fields.append("summary = ?")
-                            update_values.append(summary)
-                        if paragraph_summary:
-                            update_fields.append("paragraph_summary = ?")
-                            update_values.append(paragraph_summary)
-                    
                     # Add WHERE clause values
                     update_values.extend([episode.podcast, episode.title, published_str])
                     
                     update_sql = f"""
                         UPDATE episodes 
                         SET {', '.join(update_fields)}
-                        WHERE podcast = ? AND title = ? AND date(published) = date(?)
+                        WHERE podcast = ? AND title = ? AND published_date = date(?)
                     """
                     
                     logger.info(f"🔄 Updating existing episode...")
@@ -190,22 +191,19 @@ class EnhancedPodcastDatabase:
                     # Insert new record
                     insert_sql = """
                         INSERT INTO episodes (
-                            podcast, title, published, audio_url, transcript_url,
-                            description, link, duration, guid, transcript,
-                            transcript_source, summary, transcript_test, summary_test,
-                            transcription_mode, paragraph_summary, paragraph_summary_test
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            podcast, title, published, published_date, title_fingerprint,
+                            audio_url, transcript_url, description, link, duration, guid,
+                            transcript_source, transcription_mode
+                        ) VALUES (?, ?, ?, date(?), ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """
                     
                     insert_values = (
                         episode_data['podcast'], episode_data['title'], episode_data['published'],
+                        episode_data['published'], title_fingerprint(episode.title),
                         episode_data['audio_url'], episode_data['transcript_url'],
                         episode_data['description'], episode_data['link'],
                         episode_data['duration'], episode_data['guid'],
-                        episode_data.get('transcript'), episode_data['transcript_source'],
-                        episode_data.get('summary'), episode_data.get('transcript_test'),
-                        episode_data.get('summary_test'), episode_data['transcription_mode'],
-                        episode_data.get('paragraph_summary'), episode_data.get('paragraph_summary_test')
+                        episode_data['transcript_source'], episode_data['transcription_mode']
                     )
                     
                     logger.info(f"➕ Inserting new episode...")
@@ -214,25 +212,31 @@ class EnhancedPodcastDatabase:
                     cursor.execute(insert_sql, insert_values)
                     row_id = cursor.lastrowid
                 
+                # Only provided text is written; existing content is never blanked here
+                mode = 'test' if transcription_mode == 'test' else 'full'
+                for kind, body in (('transcript', transcript), ('summary', summary),
+                                   ('paragraph_summary', paragraph_summary)):
+                    if body:
+                        self._set_content(cursor, row_id, mode, kind, body)
+                
                 # Commit the transaction
                 conn.commit()
                 logger.info(f"✅ Database commit successful! Row ID: {row_id}")
                 
                 # Verify the save was successful
                 cursor.execute("""
-                    SELECT id, LENGTH(transcript), LENGTH(transcript_test),
-                           LENGTH(summary), LENGTH(summary_test)
-                    FROM episodes
-                    WHERE podcast = ? AND title = ? AND date(published) = date(?)
+                    SELECT id FROM episodes
+                    WHERE podcast = ? AND title = ? AND published_date = date(?)
                 """, (episode.podcast, episode.title, published_str))
                 
                 verification = cursor.fetchone()
                 if verification:
+                    lengths = self._content_lengths(cursor, verification[0])
                     logger.info(f"✅ VERIFIED: Episode saved with ID {verification[0]}")
-                    logger.info(f"   Transcript: {verification[1]} chars")
-                    logger.info(f"   Transcript_test: {verification[2]} chars")
-                    logger.info(f"   Summary: {verification[3]} chars")
-                    logger.info(f"   Summary_test: {verification[4]} chars")
+                    logger.info(f"   Transcript: {lengths['transcript']} chars")
+                    logger.info(f"   Transcript_test: {lengths['transcript_test']} chars")
+                    logger.info(f"   Summary: {lengths['summary']} chars")
+                    logger.info(f"   Summary_test: {lengths['summary_test']} chars")
                 else:
                     logger.error(f"❌ VERIFICATION FAILED: Could not find saved episode!")
                 
@@ -270,93 +274,59 @@ class EnhancedPodcastDatabase:
             
             logger.info(f"   Normalized date: {published_str}")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
-                # Determine which column to check based on mode
-                if transcription_mode == 'test':
-                    transcript_column = 'transcript_test'
-                elif transcription_mode == 'full':
-                    transcript_column = 'transcript'
+                # Restrict to the requested mode; with no mode prefer full over test
+                if transcription_mode in TRANSCRIPTION_MODES:
+                    mode_clause, mode_params = "AND c.mode = ?", [transcription_mode]
                 else:
-                    transcript_column = None
+                    mode_clause, mode_params = "", []
                 
-                logger.info(f"   Using column: {transcript_column or 'BOTH (backwards compat)'}")
+                logger.info(f"   Using mode: {transcription_mode if mode_clause else 'BOTH (backwards compat)'}")
+                
+                def find_transcript(where: str, params: list, order: str = ""):
+                    cursor.execute(f"""
+                        SELECT c.body, e.transcript_source, e.id, e.transcription_mode, e.published
+                        FROM episodes e
+                        JOIN episode_content c
+                          ON c.episode_id = e.id AND c.kind = 'transcript' {mode_clause}
+                        WHERE {where}
+                        ORDER BY {order} c.mode = 'full' DESC
+                        LIMIT 1
+                    """, mode_params + params)
+                    return cursor.fetchone()
                 
                 # Try multiple lookup strategies
                 result = None
                 
                 # Strategy 1: GUID lookup (most reliable)
                 if episode.guid:
-                    if transcript_column:
-                        query = f"""
-                            SELECT {transcript_column}, transcript_source, id, transcription_mode
-                            FROM episodes
-                            WHERE guid = ? AND {transcript_column} IS NOT NULL
-                        """
-                        cursor.execute(query, (episode.guid,))
-                    else:
-                        cursor.execute("""
-                            SELECT COALESCE(transcript, transcript_test), transcript_source, id, transcription_mode
-                            FROM episodes 
-                            WHERE guid = ? AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                        """, (episode.guid,))
-                    
-                    result = cursor.fetchone()
+                    result = find_transcript("e.guid = ?", [episode.guid])
                     if result:
                         logger.info(f"✅ Found by GUID! ID: {result[2]}, Mode: {result[3]}")
                 
                 # Strategy 2: Title + Date lookup
                 if not result:
-                    if transcript_column:
-                        query = f"""
-                            SELECT {transcript_column}, transcript_source, id, transcription_mode
-                            FROM episodes 
-                            WHERE podcast = ? AND title = ? AND date(published) = date(?)
-                            AND {transcript_column} IS NOT NULL
-                        """
-                        cursor.execute(query, (episode.podcast, episode.title, published_str))
-                    else:
-                        cursor.execute("""
-                            SELECT COALESCE(transcript, transcript_test), transcript_source, id, transcription_mode
-                            FROM episodes 
-                            WHERE podcast = ? AND title = ? AND date(published) = date(?)
-                            AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                        """, (episode.podcast, episode.title, published_str))
-                    
-                    result = cursor.fetchone()
+                    result = find_transcript(
+                        EPISODE_DATE_MATCH_SQL,
+                        [episode.podcast, episode.title, published_str]
+                    )
                     if result:
                         logger.info(f"✅ Found by Title+Date! ID: {result[2]}, Mode: {result[3]}")
                 
                 # Strategy 3: Title only (handles date mismatches)
                 if not result:
-                    if transcript_column:
-                        query = f"""
-                            SELECT {transcript_column}, transcript_source, id, transcription_mode, published
-                            FROM episodes 
-                            WHERE podcast = ? AND title = ?
-                            AND {transcript_column} IS NOT NULL
-                            ORDER BY published DESC
-                            LIMIT 1
-                        """
-                        cursor.execute(query, (episode.podcast, episode.title))
-                    else:
-                        cursor.execute("""
-                            SELECT COALESCE(transcript, transcript_test), transcript_source, id, transcription_mode, published
-                            FROM episodes 
-                            WHERE podcast = ? AND title = ?
-                            AND (transcript IS NOT NULL OR transcript_test IS NOT NULL)
-                            ORDER BY published DESC
-                            LIMIT 1
-                        """, (episode.podcast, episode.title))
-                    
-                    result = cursor.fetchone()
+                    result = find_transcript(
+                        "e.podcast = ? AND e.title = ?", [episode.podcast, episode.title],
+                        order="e.published DESC,"
+                    )
                     if result:
                         logger.warning(f"⚠️ Found by Title only! ID: {result[2]}, Mode: {result[3]}")
                         logger.warning(f"   Date mismatch: DB has {result[4]}, looking for {published_str}")
                 
                 if result:
-                    transcript, source_str = result[0], result[1]
+                    transcript, source_str = decode_content(result[0]), result[1]
                     source = TranscriptSource(source_str) if source_str else TranscriptSource.GENERATED
                     logger.info(f"✅ TRANSCRIPT FOUND!")
                     logger.info(f"   Length: {len(transcript)} chars")
@@ -367,9 +337,7 @@ class EnhancedPodcastDatabase:
                     logger.info(f"❌ NO TRANSCRIPT FOUND")
                     # Log what's in the database for this episode
                     cursor.execute("""
-                        SELECT id, transcription_mode, 
-                               LENGTH(transcript), LENGTH(transcript_test),
-                               published
+                        SELECT id, transcription_mode, published
                         FROM episodes
                         WHERE podcast = ? AND title = ?
                     """, (episode.podcast, episode.title))
@@ -378,7 +346,9 @@ class EnhancedPodcastDatabase:
                     if existing:
                         logger.info(f"   Found {len(existing)} matching episodes in DB:")
                         for row in existing:
-                            logger.info(f"     ID: {row[0]}, Mode: {row[1]}, Full: {row[2]}, Test: {row[3]}, Date: {row[4]}")
+                            lengths = self._content_lengths(cursor, row[0])
+                            logger.info(f"     ID: {row[0]}, Mode: {row[1]}, Full: {lengths['transcript']}, "
+                                        f"Test: {lengths['transcript_test']}, Date: {row[2]}")
                     else:
                         logger.info(f"   No episodes found with this podcast/title combination")
                     
@@ -405,28 +375,22 @@ class EnhancedPodcastDatabase:
             else:
                 published_str = str(published)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connection() as conn:
                 cursor = conn.cursor()
                 
-                # Determine which columns to check
-                if transcription_mode == 'test':
-                    summary_col = 'summary_test'
-                    paragraph_col = 'paragraph_summary_test'
-                else:
-                    summary_col = 'summary'
-                    paragraph_col = 'paragraph_summary'
-                
-                # Get both summary types
                 cursor.execute(f"""
-                    SELECT {summary_col}, {paragraph_col}
-                    FROM episodes
-                    WHERE podcast = ? AND title = ? AND date(published) = date(?)
-                """, (podcast, title, published_str))
+                    SELECT c.body
+                    FROM episodes e
+                    JOIN episode_content c
+                      ON c.episode_id = e.id AND c.kind = 'summary' AND c.mode = ?
+                    WHERE {EPISODE_DATE_MATCH_SQL}
+                """, ('test' if transcription_mode == 'test' else 'full', podcast, title, published_str))
                 
                 result = cursor.fetchone()
                 if result and result[0]:  # If we have a full summary
-                    logger.info(f"✅ Found cached summary ({len(result[0])} chars)")
-                    return result[0]
+                    summary = decode_content(result[0])
+                    logger.info(f"✅ Found cached summary ({len(summary)} chars)")
+                    return summary
                 else:
                     logger.info(f"❌ No cached summary found")
                     return None
@@ -0,0 +1,117 @@
+"""Shared SQLite connection pool for Renaissance Weekly"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Iterator
+
+from .config import DB_POOL_SIZE, DB_BUSY_TIMEOUT_MS, DB_CACHE_SIZE_KB, DB_MMAP_SIZE_MB
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SQLiteConnectionPool:
+    """Small pool of tuned SQLite connections, one checked out per thread.
+
+    Connections are opened in WAL mode with synchronous=NORMAL, a larger
+    page cache, mmap and a busy timeout, so concurrent readers never block
+    the writer and short write contention waits instead of failing with
+    'database is locked'.
+
+    ``connection()`` behaves like ``with sqlite3.connect(...) as conn``:
+    it commits on success and rolls back on error. Nested use on the same
+    thread reuses the connection already checked out, so a method that
+    calls another method never holds two write transactions at once.
+    """
+
+    def __init__(self, db_path: Path, max_idle: int = DB_POOL_SIZE):
+        self.db_path = Path(db_path)
+        self.max_idle = max_idle
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DB_BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False  # Handed between threads via the idle list
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE_MB * 1024 * 1024}")
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._create_connection()
+
+    def _release(self, conn: sqlite3.Connection):
+        # Don't leak per-call settings to the next user
+        conn.row_factory = None
+        with self._lock:
+            if not self._closed and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Check out this thread's connection for the duration of the block"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            # Re-entrant use - the outermost block owns the transaction
+            yield conn
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def close(self):
+        """Close all idle connections and stop pooling new ones"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+_pools: Dict[Path, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: Path) -> SQLiteConnectionPool:
+    """Get the shared pool for a database file"""
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLiteConnectionPool(key)
+            _pools[key] = pool
+        return pool
+
+
+def close_connection_pool(db_path: Path):
+    """Close and forget the pool for a database file (e.g. before moving it)"""
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.pop(key, None)
+    if pool:
+        pool.close()
@@ -14,10 +14,12 @@ from .fetchers.audio_sources import AudioSourceFinder
 from .fetchers.american_optimist_handler import AmericanOptimistHandler
 from .fetchers.universal_youtube_handler import UniversalYouTubeHandler
 from .download_strategies.smart_router import SmartDownloadRouter
+from .download_strategies.range_strategy import RangeDownloadStrategy
 from .utils.logging import get_logger
 from .utils.helpers import exponential_backoff_with_jitter
 from .utils.filename_utils import generate_audio_filename, generate_temp_filename
-from .config import TEMP_DIR, MAX_TRANSCRIPTION_MINUTES
+from .utils.audio_probe import probe_audio
+from .config import TEMP_DIR, MAX_TRANSCRIPTION_MINUTES, PARTIAL_DOWNLOAD_ENABLED
 
 logger = get_logger(__name__)
 
@@ -87,29 +89,12 @@ class EpisodeDownloadStatus:
             # Get audio format from file extension
             self.audio_format = self.audio_path.suffix.lower().lstrip('.')
             
-            # Extract duration using mutagen (memory efficient - doesn't load entire file)
-            try:
-                from mutagen import File
-                audio_file = File(str(self.audio_path))
-                if audio_file and audio_file.info:
-                    self.downloaded_duration = audio_file.info.length / 60  # Convert seconds to minutes
-                else:
-                    # Fallback: Try ffprobe if mutagen fails
-                    import subprocess
-                    import json
-                    cmd = [
-                        'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                        '-show_streams', str(self.audio_path)
-                    ]
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if result.returncode == 0:
-                        data = json.loads(result.stdout)
-                        for stream in data.get('streams', []):
-                            if stream.get('codec_type') == 'audio' and 'duration' in stream:
-                                self.downloaded_duration = float(stream['duration']) / 60
-                                break
-            except Exception as e:
-                logger.debug(f"Could not extract duration from {self.audio_path}: {e}")
+            # Extract duration from the file headers (memory efficient - doesn't decode the audio)
+            audio_info = probe_audio(self.audio_path)
+            if audio_info:
+                self.downloaded_duration = audio_info.duration / 60  # Convert seconds to minutes
+            else:
+                logger.debug(f"Could not extract duration from {self.audio_path}")
                 
             # Set download source from last successful attempt
             if self.attempts:
@@ -219,13 +204,12 @@ class DownloadManager:
         self._browser_download_queue: List[str] = []
         self._cancelled = False
         self.transcription_mode = transcription_mode  # Set mode from constructor
-        
-        # Set transcriber mode to match
-        self.transcriber._current_mode = self.transcription_mode
         logger.info(f"DownloadManager initialized with mode: {self.transcription_mode}")
         
         # Initialize smart router for bulletproof downloads
         self.smart_router = SmartDownloadRouter()
+        self.range_strategy = RangeDownloadStrategy()
+        self.blob_store = self.transcriber.blob_store
         
         # Download statistics
         self.stats = {
@@ -237,9 +221,8 @@ class DownloadManager:
         }
     
     def set_transcription_mode(self, mode: str):
-        """Set transcription mode and sync with transcriber"""
+        """Set transcription mode for later downloads"""
         self.transcription_mode = mode
-        self.transcriber._current_mode = mode
         logger.info(f"Set transcription mode to: {mode}")
         
     def add_manual_url(self, episode_id: str, url: str):
@@ -432,7 +415,7 @@ class DownloadManager:
                 
             # First check if file already exists
             from .config import AUDIO_DIR
-            from .utils.helpers import calculate_file_hash, validate_audio_file_smart
+            from .utils.helpers import validate_audio_file_smart
             
             # Ensure audio directory exists
             AUDIO_DIR.mkdir(exist_ok=True)
@@ -448,18 +431,16 @@ class DownloadManager:
             if audio_file.exists():
                 correlation_id = f"download_{ep_id[:8]}"
                 if validate_audio_file_smart(audio_file, correlation_id, episode.audio_url):
-                    file_hash = calculate_file_hash(audio_file)
                     logger.info(f"✅ Using existing audio file for {episode.title}")
                     logger.info(f"   Path: {audio_file}")
                     logger.info(f"   Size: {audio_file.stat().st_size / 1024 / 1024:.1f} MB")
-                    logger.info(f"   Hash: {file_hash[:8]}...")
                     
                     # Mark as successful immediately
                     status.status = 'success'
                     status.audio_path = audio_file
                     
                     # Extract audio file information
-                    status.extract_audio_info()
+                    await asyncio.to_thread(status.extract_audio_info)
                     
                     # Add a successful attempt record to show it was cached
                     cached_attempt = DownloadAttempt(str(audio_file), 'cached_file')
@@ -509,7 +490,7 @@ class DownloadManager:
                             status.audio_path = audio_file
                             
                             # Extract audio file information
-                            status.extract_audio_info()
+                            await asyncio.to_thread(status.extract_audio_info)
                             
                             self.stats['downloaded'] += 1
                             self._report_progress()
@@ -552,12 +533,30 @@ class DownloadManager:
                     status.audio_path = audio_file
                     
                     # Extract audio file information
-                    status.extract_audio_info()
+                    await asyncio.to_thread(status.extract_audio_info)
                     
                     self.stats['downloaded'] += 1
                     self._report_progress()
                     return audio_file
                     
+            # Reuse a full download of the same audio if we've fetched it before (any title, any mode)
+            fingerprint = None
+            if episode.audio_url and episode.audio_url.startswith(('http://', 'https://')):
+                fingerprint = await self.blob_store.fingerprint(episode.audio_url)
+                blob = self.blob_store.find(fingerprint)
+                if blob:
+                    logger.info(f"[{ep_id}] 📦 Reusing stored audio blob {blob.stem[:12]}")
+                    self.blob_store.link(blob, audio_file)
+                    return await self._complete_download(episode, audio_file, status, ep_id, 'audio_blob',
+                                                         trim=current_mode == 'test')
+            
+            # Test mode only transcribes the opening minutes - try fetching just that byte range
+            if (current_mode == 'test' and PARTIAL_DOWNLOAD_ENABLED and
+                    self.range_strategy.can_handle(episode.audio_url or '', episode.podcast)):
+                partial_file = await self._try_partial_download(episode, audio_file, status, ep_id)
+                if partial_file:
+                    return partial_file
+            
             # Use smart router for all downloads (replaces all complex logic above)
             episode_info = {
                 'podcast': episode.podcast,
@@ -594,6 +593,13 @@ class DownloadManager:
                     )
                 
                 if success:
+                    # Keep the full download in the blob store before any test-mode trim
+                    if fingerprint:
+                        try:
+                            await asyncio.to_thread(self.blob_store.ingest, audio_file, fingerprint)
+                        except Exception as e:
+                            logger.warning(f"[{ep_id}] Could not store audio blob: {e}")
+                    
                     # If we're in test mode, trim the audio file immediately after download
                     if current_mode == 'test':
                         logger.info(f"[{ep_id}] 🧪 TEST MODE: Trimming downloaded audio to {MAX_TRANSCRIPTION_MINUTES} minutes")
@@ -612,7 +618,7 @@ class DownloadManager:
                     status.audio_path = audio_file
                     
                     # Extract audio file information
-                    status.extract_audio_info()
+                    await asyncio.to_thread(status.extract_audio_info)
                     
                     self.stats['downloaded'] += 1
                     self._report_progress()
@@ -640,6 +646,51 @@ class DownloadManager:
             self._report_progress()
             return None
             
+    async def _try_partial_download(self, episode: Episode, audio_file: Path,
+                                    status: EpisodeDownloadStatus, ep_id: str) -> Optional[Path]:
+        """Download only the test-mode window of the episode via HTTP Range requests"""
+        attempt = DownloadAttempt(episode.audio_url, 'range')
+        status.add_attempt(attempt)
+        
+        success, error = await self.range_strategy.download(
+            episode.audio_url, audio_file,
+            {'podcast': episode.podcast, 'title': episode.title, 'max_seconds': MAX_TRANSCRIPTION_MINUTES * 60}
+        )
+        if not success:
+            attempt.complete(False, error)
+            logger.info(f"[{ep_id}] Partial download unavailable ({error}), downloading full episode")
+            return None
+        
+        attempt.complete(True)
+        # Trim cuts the safety margin off so the file matches a trimmed full download
+        return await self._complete_download(episode, audio_file, status, ep_id, 'range', trim=True)
+    
+    async def _complete_download(self, episode: Episode, audio_file: Path, status: EpisodeDownloadStatus,
+                                 ep_id: str, source: str, trim: bool) -> Path:
+        """Mark an episode downloaded, trimming it to the test-mode window first if asked"""
+        if trim:
+            trimmed_file = await self._trim_downloaded_audio(audio_file, ep_id)
+            if trimmed_file:
+                audio_file.unlink()  # Only drops this link if the file came from the blob store
+                import shutil
+                shutil.move(str(trimmed_file), str(audio_file))
+        
+        if not any(attempt.strategy == source for attempt in status.attempts):
+            attempt = DownloadAttempt(str(audio_file), source)
+            attempt.complete(True)
+            status.add_attempt(attempt)
+        
+        status.status = 'success'
+        status.audio_path = audio_file
+        
+        # Extract audio file information
+        await asyncio.to_thread(status.extract_audio_info)
+        
+        self.stats['downloaded'] += 1
+        self._report_progress()
+        logger.info(f"✅ {source} download succeeded for {episode.title}")
+        return audio_file
+    
     async def _try_download(self, episode: Episode, url: str, strategy: str, 
                           status: EpisodeDownloadStatus) -> Optional[Path]:
         """Try downloading from a specific URL"""
@@ -663,14 +714,12 @@ class DownloadManager:
                 apple_podcast_id=episode.apple_podcast_id if hasattr(episode, 'apple_podcast_id') else None
             )
             
-            # Set the transcriber's mode before downloading
-            self.transcriber._current_mode = current_mode
-            
             # Use the transcriber's simple download method
             audio_path = await self.transcriber.download_audio_simple(
                 episode_copy, 
                 url,
-                f"download-{strategy}-{episode.title[:20]}"
+                f"download-{strategy}-{episode.title[:20]}",
+                transcription_mode=self.transcription_mode
             )
             
             if audio_path and audio_path.exists():
@@ -679,7 +728,7 @@ class DownloadManager:
                 status.audio_path = audio_path
                 
                 # Extract audio file information
-                status.extract_audio_info()
+                await asyncio.to_thread(status.extract_audio_info)
                 
                 self._report_progress()
                 logger.info(f"Successfully downloaded {episode.title} using {strategy}")
@@ -743,7 +792,7 @@ class DownloadManager:
                     status.audio_path = temp_file
                     
                     # Extract audio file information
-                    status.extract_audio_info()
+                    await asyncio.to_thread(status.extract_audio_info)
                     
                     logger.info(f"✅ Browser download successful for {episode.title}")
                     return temp_file
@@ -796,7 +845,7 @@ class DownloadManager:
                 status.audio_path = temp_file
                 
                 # Extract audio file information
-                status.extract_audio_info()
+                await asyncio.to_thread(status.extract_audio_info)
                 
                 logger.info(f"✅ yt-dlp YouTube download successful for {episode.title}")
                 return temp_file
@@ -987,7 +1036,7 @@ class DownloadManager:
             status.audio_path = audio_path
             
             # Extract audio file information
-            status.extract_audio_info()
+            await asyncio.to_thread(status.extract_audio_info)
             
             self.stats['downloaded'] = self.stats.get('downloaded', 0) + 1
             self.stats['retrying'] = max(0, self.stats.get('retrying', 0) - 1)
@@ -1047,6 +1096,12 @@ class DownloadManager:
             
             # Fallback: use pydub
             try:
+                # Skip the decode entirely if the headers already say it's short enough
+                audio_info = await asyncio.to_thread(probe_audio, audio_file)
+                if audio_info and audio_info.duration <= max_seconds:
+                    logger.info(f"[{correlation_id}] Audio already short enough ({audio_info.duration:.1f}s), no trimming needed")
+                    return None
+                
                 from pydub import AudioSegment
                 
                 # Check file size first to avoid OOM
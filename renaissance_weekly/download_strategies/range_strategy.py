@@ -0,0 +1,114 @@
+"""Range download strategy - fetch only the opening minutes of an episode"""
+
+import re
+import aiohttp
+import aiofiles
+from pathlib import Path
+from typing import Optional, Tuple, Dict
+from . import DownloadStrategy
+from ..config import MAX_TRANSCRIPTION_MINUTES, PARTIAL_DOWNLOAD_MARGIN
+from ..utils.audio_probe import id3v2_size, mp3_bitrate
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROBE_BYTES = 64 * 1024
+STREAM_CHUNK = 64 * 1024
+MIN_MARGIN_BYTES = 512 * 1024  # Covers VBR swings and the trailing partial frame
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'audio/mpeg,audio/*;q=0.9,*/*;q=0.8',
+    'Accept-Encoding': 'identity',  # Byte offsets must refer to the file itself
+}
+
+
+def _range_total(content_range: str) -> Optional[int]:
+    """Total size from a 'bytes 0-65535/123456' Content-Range header"""
+    match = re.search(r'/(\d+)\s*$', content_range or '')
+    return int(match.group(1)) if match else None
+
+
+class RangeDownloadStrategy(DownloadStrategy):
+    """Download just the byte range covering the test-mode transcription window
+    
+    A small Range probe reads the MP3 headers for the bitrate, then only
+    bitrate * max_seconds (plus a margin) is requested. Fails - so the caller
+    falls back to a full download - if the server ignores Range, the stream
+    isn't MP3, or the episode is shorter than the window anyway.
+    """
+    
+    @property
+    def name(self) -> str:
+        return "range"
+    
+    def can_handle(self, url: str, podcast_name: str) -> bool:
+        """Plain HTTP audio URLs only"""
+        if not url.startswith(('http://', 'https://')):
+            return False
+        if 'youtube.com' in url or 'youtu.be' in url or 'substack.com' in url:
+            return False
+        return podcast_name not in ["American Optimist", "Dwarkesh Podcast"]
+    
+    async def download(self, url: str, output_path: Path, episode_info: Dict) -> Tuple[bool, Optional[str]]:
+        """Fetch the opening max_seconds (default MAX_TRANSCRIPTION_MINUTES) of the episode"""
+        max_seconds = episode_info.get('max_seconds') or MAX_TRANSCRIPTION_MINUTES * 60
+        part_file = output_path.with_name(output_path.name + '.part')
+        timeout = aiohttp.ClientTimeout(total=600, sock_read=60)
+        
+        try:
+            async with aiohttp.ClientSession(timeout=timeout, headers=HEADERS) as session:
+                probe = await self._get_range(session, url, 0, PROBE_BYTES - 1)
+                if not probe:
+                    return False, "Server ignored Range request"
+                head, total = probe
+                
+                audio_start = id3v2_size(head)
+                if audio_start + 4096 > len(head):
+                    # Large ID3 tag (usually cover art) - probe the frames after it
+                    probe = await self._get_range(session, url, audio_start, audio_start + PROBE_BYTES - 1)
+                    frames = probe[0] if probe else b''
+                else:
+                    frames = head[audio_start:]
+                
+                bitrate = mp3_bitrate(frames)
+                if not bitrate:
+                    return False, "Could not read MP3 bitrate from stream headers"
+                
+                needed = audio_start + int(bitrate / 8 * max_seconds * (1 + PARTIAL_DOWNLOAD_MARGIN)) + MIN_MARGIN_BYTES
+                if total and needed >= total:
+                    return False, "Episode is shorter than the requested window"
+                
+                logger.info(f"📐 Range download: {needed / 1024 / 1024:.1f} MB"
+                            f"{f' of {total / 1024 / 1024:.1f} MB' if total else ''}"
+                            f" ({bitrate / 1000:.0f} kbps, {max_seconds / 60:.0f} min)")
+                
+                async with aiofiles.open(part_file, 'wb') as f:
+                    await f.write(head[:needed])
+                    if needed > len(head):
+                        headers = {'Range': f'bytes={len(head)}-{needed - 1}'}
+                        async with session.get(url, headers=headers) as response:
+                            if response.status != 206:
+                                return False, f"Server ignored Range request (HTTP {response.status})"
+                            async for chunk in response.content.iter_chunked(STREAM_CHUNK):
+                                await f.write(chunk)
+            
+            part_file.replace(output_path)
+            logger.info(f"✅ Range download successful ({output_path.stat().st_size / 1024 / 1024:.1f} MB)")
+            return True, None
+        
+        except Exception as e:
+            error_msg = f"Range download error: {str(e)}"
+            logger.debug(error_msg)
+            return False, error_msg
+        finally:
+            if part_file.exists():
+                part_file.unlink()
+    
+    async def _get_range(self, session: aiohttp.ClientSession, url: str,
+                         first: int, last: int) -> Optional[Tuple[bytes, Optional[int]]]:
+        """GET one byte range; None unless the server answers 206 Partial Content"""
+        async with session.get(url, headers={'Range': f'bytes={first}-{last}'}) as response:
+            if response.status != 206:
+                return None
+            return await response.read(), _range_total(response.headers.get('Content-Range'))
@@ -15,8 +15,9 @@ import time
 import hashlib
 import uuid
 from functools import lru_cache
-import concurrent.futures
 import threading
+from contextvars import ContextVar
+from xml.etree import ElementTree
 
 from ..models import Episode
 from ..database import PodcastDatabase
@@ -24,40 +25,13 @@ from ..config import PODCAST_CONFIGS
 from ..utils.logging import get_logger
 from ..utils.helpers import seconds_to_duration, CircuitBreaker, ProgressTracker
 from .podcast_index import PodcastIndexClient
+from .rss_stream import StreamingFeedParser
 
 logger = get_logger(__name__)
 
-
-class FeedCache:
-    """Cache for feed URLs with TTL"""
-    
-    def __init__(self, ttl_seconds: int = 3600):
-        self.cache = {}
-        self.ttl = ttl_seconds
-    
-    def get(self, key: str) -> Optional[List[str]]:
-        """Get cached feed URLs if not expired"""
-        if key in self.cache:
-            urls, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                return urls
-            else:
-                del self.cache[key]
-        return None
-    
-    def set(self, key: str, urls: List[str]):
-        """Cache feed URLs with timestamp"""
-        self.cache[key] = (urls, time.time())
-    
-    def clear_expired(self):
-        """Remove expired entries"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, (_, timestamp) in self.cache.items()
-            if current_time - timestamp >= self.ttl
-        ]
-        for key in expired_keys:
-            del self.cache[key]
+# Apple ID of the podcast being fetched. Kept per task so concurrent
+# fetch_episodes calls don't stamp episodes with another podcast's ID.
+_current_apple_id_var: ContextVar[Optional[str]] = ContextVar('current_apple_id', default=None)
 
 
 class ReliableEpisodeFetcher:
@@ -74,9 +48,6 @@ class ReliableEpisodeFetcher:
         # Cache for feed URLs discovered through various methods
         self.discovered_feeds_cache = {}
         
-        # Feed URL cache with TTL
-        self.feed_cache = FeedCache(ttl_seconds=3600)  # 1 hour TTL
-        
         # Circuit breakers for failing feeds
         self.circuit_breakers = {}  # URL -> CircuitBreaker
         
@@ -113,6 +84,14 @@ class ReliableEpisodeFetcher:
             
         return self._http_session
     
+    @property
+    def _current_apple_id(self) -> Optional[str]:
+        return _current_apple_id_var.get()
+    
+    @_current_apple_id.setter
+    def _current_apple_id(self, apple_id: Optional[str]):
+        _current_apple_id_var.set(apple_id)
+    
     async def _get_aiohttp_session(self) -> aiohttp.ClientSession:
         """Get or create shared aiohttp session"""
         if self._aiohttp_session is None or self._aiohttp_session.closed:
@@ -151,7 +130,6 @@ class ReliableEpisodeFetcher:
         # Clear caches
         self.circuit_breakers.clear()
         self.failed_urls.clear()
-        self.feed_cache.cache.clear()
         
         logger.info(f"[{self._correlation_id}] Episode fetcher cleaned up")
     
@@ -205,12 +183,8 @@ class ReliableEpisodeFetcher:
         # Store apple_id for episode creation
         self._current_apple_id = podcast_config.get("apple_id")
         
-        # Clean up expired cache entries
-        self.feed_cache.clear_expired()
-        
-        # Check feed cache first
-        cache_key = f"{podcast_name}:{days_back}"
-        cached_feed_urls = self.feed_cache.get(cache_key)
+        # Feeds that returned episodes on earlier runs (persisted in the feed cache)
+        cached_feed_urls = await asyncio.to_thread(self.db.get_cached_feed_urls, podcast_name)
         
         # Collect all episodes from all sources
         all_episodes = {}  # Use dict to deduplicate by guid/title
@@ -244,8 +218,8 @@ class ReliableEpisodeFetcher:
         if "rss_feeds" in podcast_config and podcast_config["rss_feeds"] and not skip_rss and primary_strategy != "youtube_search":
             methods_tried.append("RSS feeds")
             
-            # Use cached feeds if available
-            feed_urls = cached_feed_urls if cached_feed_urls else podcast_config["rss_feeds"]
+            # Configured feeds plus any that worked before
+            feed_urls = podcast_config["rss_feeds"] + cached_feed_urls
             
             episodes = await self._try_all_rss_sources(
                 podcast_name, podcast_config, days_back, correlation_id, feed_urls
@@ -311,10 +285,6 @@ class ReliableEpisodeFetcher:
         # Convert back to list
         final_episodes = list(all_episodes.values())
         
-        # Cache successful feed URLs
-        if final_episodes and podcast_name in self.discovered_feeds_cache:
-            self.feed_cache.set(cache_key, self.discovered_feeds_cache[podcast_name])
-        
         if final_episodes:
             logger.info(f"[{correlation_id}] ✅ Found {len(final_episodes)} unique episodes via: {', '.join(methods_tried)}")
         else:
@@ -453,84 +423,69 @@ class ReliableEpisodeFetcher:
             user_agents = user_agents[:2]  # Only try first 2 user agents
             logger.info(f"[{correlation_id}]   Using limited retries for Tim Ferriss feed")
         
-        session = self._get_http_session()
+        # Conditional GET - only usable if the cached fetch looked back at least as far
+        cached = await asyncio.to_thread(self.db.get_feed_cache, feed_url)
+        if cached and cached['days_back'] < days_back:
+            cached = None
+        
+        session = await self._get_aiohttp_session()
         
         for ua in user_agents:
             try:
                 headers = {'User-Agent': ua}
+                if cached:
+                    if cached['etag']:
+                        headers['If-None-Match'] = cached['etag']
+                    if cached['last_modified']:
+                        headers['If-Modified-Since'] = cached['last_modified']
                 
                 # Universal streaming approach with size limit
                 # Special handling for Tim Ferriss - known to be very slow
                 timeout = 60 if 'tim-ferriss' in feed_url.lower() else 20
-                response = session.get(feed_url, timeout=timeout, headers=headers, allow_redirects=True, stream=True)
                 
-                if response.status_code == 200:
-                    # Smart RSS parsing - only download what we need
-                    content = b''
-                    # Most RSS feeds have recent episodes first, so we only need a small portion
-                    # 500KB is enough to get 10-15 recent episodes from most feeds
-                    initial_size = 500 * 1024  # 500KB initial chunk
-                    max_size = 2 * 1024 * 1024  # 2MB absolute max (even for huge feeds)
-                    
-                    # Track if we have enough complete episodes
-                    item_count = 0
-                    complete_items = 0
-                    
-                    for chunk in response.iter_content(chunk_size=8192):
-                        content += chunk
-                        
-                        # Count opening and closing item tags
-                        chunk_str = chunk.decode('utf-8', errors='ignore')
-                        item_count += chunk_str.count('<item>')
-                        complete_items += chunk_str.count('</item>')
-                        
-                        # Stop if we have at least 5 complete episodes
-                        if complete_items >= 5 and len(content) >= initial_size:
-                            logger.info(f"[{correlation_id}]     Got {complete_items} complete episodes in {len(content)/1024:.0f}KB")
-                            break
-                            
-                        # Absolute limit to prevent downloading huge feeds
-                        if len(content) >= max_size:
-                            logger.info(f"[{correlation_id}]     Reached max size limit ({max_size/(1024*1024):.1f}MB) with {complete_items} complete episodes")
-                            break
-                    
-                    response.close()
-                    
-                    # Ensure XML is properly closed if we stopped mid-stream
-                    if content and complete_items < item_count:
-                        # Find the last complete </item> tag
-                        last_item_end = content.rfind(b'</item>')
-                        if last_item_end > 0:
-                            # Truncate to last complete item and close the XML
-                            content = content[:last_item_end + 7]  # +7 for '</item>'
-                            # Add closing tags if needed
-                            if b'</channel>' not in content:
-                                content += b'\n</channel>'
-                            if b'</rss>' not in content:
-                                content += b'\n</rss>'
-                    
-                    # Parse whatever we got
-                    if content:
-                        episodes = self._parse_rss_feed(content, podcast_name, days_back, correlation_id)
-                        if episodes:
-                            # Cache this feed URL as successful
-                            if podcast_name not in self.discovered_feeds_cache:
-                                self.discovered_feeds_cache[podcast_name] = []
-                            if feed_url not in self.discovered_feeds_cache[podcast_name]:
-                                self.discovered_feeds_cache[podcast_name].append(feed_url)
-                            return episodes
-                        # Tim Ferriss optimization: if first UA returns no episodes, skip remaining
-                        elif 'tim ferriss' in podcast_lower and ua == user_agents[0]:
-                            logger.info(f"[{correlation_id}]     No recent episodes found for Tim Ferriss, skipping remaining attempts")
-                            return []
-                    elif response.status_code == 403:
+                async with session.get(
+                    feed_url, headers=headers, allow_redirects=True,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    if response.status == 304 and cached:
+                        cutoff = datetime.now() - timedelta(days=days_back)
+                        episodes = [ep for ep in cached['episodes'] if ep.published >= cutoff]
+                        logger.info(f"[{correlation_id}]     Feed not modified, using {len(episodes)} cached episodes")
+                        await asyncio.to_thread(self.db.touch_feed_cache, feed_url)
+                        return episodes
+                    elif response.status == 403:
                         logger.debug(f"[{correlation_id}]     403 with UA: {ua[:30]}...")
                         continue
-                    else:
-                        logger.warning(f"[{correlation_id}]     HTTP {response.status_code}")
+                    elif response.status != 200:
+                        logger.warning(f"[{correlation_id}]     HTTP {response.status}")
                         break
                     
-            except requests.Timeout:
+                    episodes = [
+                        episode async for episode in
+                        self._stream_rss_episodes(response, podcast_name, days_back, correlation_id)
+                    ]
+                    etag = response.headers.get('ETag')
+                    last_modified = response.headers.get('Last-Modified')
+                
+                # Cache quiet feeds too, so the next run can revalidate instead of downloading them again
+                await asyncio.to_thread(
+                    self.db.save_feed_cache, feed_url, podcast_name, episodes, days_back, etag, last_modified
+                )
+                if episodes:
+                    # Cache this feed URL as successful
+                    if podcast_name not in self.discovered_feeds_cache:
+                        self.discovered_feeds_cache[podcast_name] = []
+                    if feed_url not in self.discovered_feeds_cache[podcast_name]:
+                        self.discovered_feeds_cache[podcast_name].append(feed_url)
+                    return episodes
+                # Tim Ferriss optimization: if first UA returns no episodes, skip remaining
+                elif 'tim ferriss' in podcast_lower and ua == user_agents[0]:
+                    logger.info(f"[{correlation_id}]     No recent episodes found for Tim Ferriss, skipping remaining attempts")
+                    return []
+                # Remaining user agents revalidate against what was just stored
+                cached = {'etag': etag, 'last_modified': last_modified, 'days_back': days_back, 'episodes': []}
+                    
+            except asyncio.TimeoutError:
                 logger.warning(f"[{correlation_id}]     Timeout with UA: {ua[:30]}...")
                 continue
             except Exception as e:
@@ -539,32 +494,114 @@ class ReliableEpisodeFetcher:
         
         return []
     
-    def _parse_feed_with_timeout(self, content: bytes, correlation_id: str, timeout: int = 20):
-        """Parse feedparser content with timeout protection"""
-        import feedparser
+    async def _stream_rss_episodes(self, response: aiohttp.ClientResponse, podcast_name: str,
+                                   days_back: int, correlation_id: str):
+        """Parse an RSS response incrementally, yielding episodes as items complete
+        
+        Stops reading once the feed runs past the days_back cutoff, so for
+        most feeds only the first few KB are downloaded. Falls back to
+        feedparser on whatever was read if the XML is too broken for the
+        strict parser.
+        """
+        max_size = 2 * 1024 * 1024  # 2MB absolute max (even for huge feeds)
+        max_items = 100
+        # Some feeds aren't strictly chronological, so allow a few old items
+        # in a row before deciding we've passed the cutoff
+        max_consecutive_old = 3
+        
+        cutoff = datetime.now() - timedelta(days=days_back)
+        parser = StreamingFeedParser()
+        raw = bytearray()  # Only used if we have to fall back to feedparser
+        received = 0
+        items_seen = 0
+        consecutive_old = 0
+        yielded = set()
+        done = False
         
-        # Use ThreadPoolExecutor to enforce timeout on feedparser.parse()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(feedparser.parse, content)
-            try:
-                # Wait for parsing to complete with timeout
-                feed = future.result(timeout=timeout)
-                return feed
-            except concurrent.futures.TimeoutError:
-                logger.error(f"[{correlation_id}]     Feedparser timed out after {timeout}s - skipping this feed")
-                # Cancel the future if possible
-                future.cancel()
-                # Return empty feed structure
-                return type('obj', (object,), {'entries': []})()
-            except Exception as e:
-                logger.error(f"[{correlation_id}]     Feedparser error: {e}")
-                return type('obj', (object,), {'entries': []})()
+        try:
+            async for chunk in response.content.iter_chunked(8192):
+                received += len(chunk)
+                raw += chunk
+                
+                for entry in parser.feed(chunk):
+                    items_seen += 1
+                    pub_date = self._parse_date(entry)
+                    if pub_date and pub_date < cutoff:
+                        consecutive_old += 1
+                    elif pub_date:
+                        consecutive_old = 0
+                        episode = self._safe_entry_to_episode(entry, podcast_name, pub_date, correlation_id)
+                        if episode:
+                            yielded.add((episode.title, episode.audio_url))
+                            yield episode
+                    
+                    if consecutive_old >= max_consecutive_old or items_seen >= max_items:
+                        logger.info(f"[{correlation_id}]     Reached cutoff after {items_seen} items in {received/1024:.0f}KB")
+                        done = True
+                        break
+                
+                if done:
+                    break
+                if received >= max_size:
+                    logger.info(f"[{correlation_id}]     Reached max size limit ({max_size/(1024*1024):.1f}MB) with {items_seen} items")
+                    break
+            else:
+                for entry in parser.close():
+                    pub_date = self._parse_date(entry)
+                    if pub_date and pub_date >= cutoff:
+                        episode = self._safe_entry_to_episode(entry, podcast_name, pub_date, correlation_id)
+                        if episode:
+                            yield episode
+        except ElementTree.ParseError as e:
+            logger.debug(f"[{correlation_id}]     Strict XML parse failed ({e}), falling back to feedparser")
+            # Read up to the size cap and let feedparser's lenient parser have a go
+            async for chunk in response.content.iter_chunked(8192):
+                raw += chunk
+                if len(raw) >= max_size:
+                    break
+            episodes = await asyncio.to_thread(
+                self._parse_rss_feed, bytes(raw), podcast_name, days_back, correlation_id
+            )
+            for episode in episodes:
+                if (episode.title, episode.audio_url) not in yielded:
+                    yield episode
+    
+    def _entry_to_episode(self, entry, podcast_name: str, pub_date: datetime,
+                          correlation_id: str) -> Optional[Episode]:
+        """Build an Episode from a feed entry, or None if it has no audio"""
+        audio_url = self._extract_audio_url(entry)
+        if not audio_url:
+            logger.debug(f"[{correlation_id}]       No audio URL for: {entry.get('title', 'Unknown')[:50]}")
+            return None
+        
+        episode = Episode(
+            podcast=podcast_name,
+            title=entry.get('title', 'Unknown'),
+            published=pub_date,
+            audio_url=audio_url,
+            transcript_url=self._extract_transcript_url(entry),
+            description=self._extract_full_description(entry),
+            link=entry.get('link', ''),
+            duration=self._extract_duration(entry),
+            guid=entry.get('guid', entry.get('id', '')),
+            apple_podcast_id=getattr(self, '_current_apple_id', None)
+        )
+        logger.debug(f"[{correlation_id}]     ✓ Added episode: {episode.title[:50]} ({episode.published.strftime('%Y-%m-%d')})")
+        return episode
+    
+    def _safe_entry_to_episode(self, entry, podcast_name: str, pub_date: datetime,
+                               correlation_id: str) -> Optional[Episode]:
+        """_entry_to_episode that logs and skips entries it can't handle"""
+        try:
+            return self._entry_to_episode(entry, podcast_name, pub_date, correlation_id)
+        except Exception as e:
+            logger.debug(f"[{correlation_id}]     Error parsing entry {entry.get('title', 'Unknown')[:50]}: {e}")
+            return None
     
     def _parse_rss_feed(self, content: bytes, podcast_name: str, days_back: int, correlation_id: str) -> List[Episode]:
-        """Parse RSS feed content into episodes with more robust parsing"""
+        """Parse a complete RSS document with feedparser (lenient fallback path)"""
         try:
-            # Parse RSS feed with timeout protection
-            feed = self._parse_feed_with_timeout(content, correlation_id)
+            feed = feedparser.parse(content)
             
             if not feed or not hasattr(feed, 'entries') or not feed.entries:
                 logger.warning(f"[{correlation_id}]     No entries in feed")
@@ -576,48 +613,15 @@ class ReliableEpisodeFetcher:
             logger.debug(f"[{correlation_id}]     Feed has {len(feed.entries)} entries, checking last {days_back} days")
             
             # Check more entries in case dates are out of order
-            for i, entry in enumerate(feed.entries[:100]):  # Increased from 50
-                try:
-                    # Log first few entries for debugging
-                    if i < 3:
-                        logger.debug(f"[{correlation_id}]     Entry {i}: {entry.get('title', 'No title')[:50]}")
-                    
-                    pub_date = self._parse_date(entry)
-                    if not pub_date:
-                        if i < 3:
-                            logger.debug(f"[{correlation_id}]       No valid date found")
-                        continue
-                    
-                    if i < 3:
-                        logger.debug(f"[{correlation_id}]       Published: {pub_date.strftime('%Y-%m-%d')}")
-                    
-                    # Don't stop on old episodes - some feeds aren't chronological
-                    if pub_date < cutoff:
-                        continue
-                    
-                    audio_url = self._extract_audio_url(entry)
-                    if not audio_url:
-                        logger.debug(f"[{correlation_id}]       No audio URL for: {entry.get('title', 'Unknown')[:50]}")
-                        continue
-                    
-                    episode = Episode(
-                        podcast=podcast_name,
-                        title=entry.get('title', 'Unknown'),
-                        published=pub_date,
-                        audio_url=audio_url,
-                        transcript_url=self._extract_transcript_url(entry),
-                        description=self._extract_full_description(entry),
-                        link=entry.get('link', ''),
-                        duration=self._extract_duration(entry),
-                        guid=entry.get('guid', entry.get('id', '')),
-                        apple_podcast_id=getattr(self, '_current_apple_id', None)
-                    )
-                    episodes.append(episode)
-                    logger.debug(f"[{correlation_id}]     ✓ Added episode: {episode.title[:50]} ({episode.published.strftime('%Y-%m-%d')})")
-                    
-                except Exception as e:
-                    logger.debug(f"[{correlation_id}]     Error parsing entry {i}: {e}")
+            for entry in feed.entries[:100]:  # Increased from 50
+                pub_date = self._parse_date(entry)
+                # Don't stop on old episodes - some feeds aren't chronological
+                if not pub_date or pub_date < cutoff:
                     continue
+                
+                episode = self._safe_entry_to_episode(entry, podcast_name, pub_date, correlation_id)
+                if episode:
+                    episodes.append(episode)
             
             logger.info(f"[{correlation_id}]     Found {len(episodes)} episodes from this feed")
             return episodes
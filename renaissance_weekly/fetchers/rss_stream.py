@@ -0,0 +1,152 @@
+"""Incremental RSS/Atom parser for streamed feed downloads"""
+
+from typing import List, Optional
+from xml.etree import ElementTree
+
+from dateutil import parser as date_parser
+from dateutil import tz
+from feedparser import FeedParserDict
+
+# Namespace URIs mapped to the prefixes feedparser uses for entry keys
+NAMESPACES = {
+    'http://www.itunes.com/dtds/podcast-1.0.dtd': 'itunes',
+    'http://purl.org/rss/1.0/modules/content/': 'content',
+    'http://search.yahoo.com/mrss/': 'media',
+    'https://podcastindex.org/namespace/1.0': 'podcast',
+    'http://www.w3.org/2005/Atom': 'atom',
+    'http://purl.org/dc/elements/1.1/': 'dc',
+}
+
+ITEM_TAGS = ('item', 'entry')
+
+
+def _split_tag(tag: str):
+    """Split '{uri}local' into (prefix, local)"""
+    if tag.startswith('{'):
+        uri, local = tag[1:].split('}', 1)
+        return NAMESPACES.get(uri, uri), local
+    return '', tag
+
+
+def _parse_struct_time(date_str: Optional[str]):
+    """Parse a feed date into a UTC struct_time like feedparser's *_parsed fields"""
+    if not date_str:
+        return None
+    try:
+        parsed = date_parser.parse(date_str.strip(), fuzzy=True)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(tz.UTC)
+    return parsed.utctimetuple()
+
+
+class StreamingFeedParser:
+    """Pull parser that turns feed bytes into entries as each <item> closes.
+
+    Chunks can be fed at any boundary - expat buffers partial tags, so an
+    <item> split across two network reads is only emitted once it is
+    complete. Entries are FeedParserDicts with the same keys feedparser
+    produces, so the fetcher's existing _parse_date / _extract_* helpers
+    work on them unchanged. Finished items are detached from the tree to
+    keep memory flat on large feeds.
+    """
+
+    def __init__(self):
+        self._parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        self._stack: List[ElementTree.Element] = []
+
+    def feed(self, data: bytes) -> List[FeedParserDict]:
+        """Feed a chunk and return the entries it completed.
+
+        Raises xml.etree.ElementTree.ParseError on malformed XML.
+        """
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> List[FeedParserDict]:
+        """Signal end of input and return any remaining entries"""
+        try:
+            self._parser.close()
+        except ElementTree.ParseError:
+            # Truncated streams are expected - we stop reading early on purpose
+            pass
+        return self._drain()
+
+    def _drain(self) -> List[FeedParserDict]:
+        entries = []
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                self._stack.append(elem)
+                continue
+
+            self._stack.pop()
+            prefix, local = _split_tag(elem.tag)
+            if local in ITEM_TAGS and prefix in ('', 'atom'):
+                entries.append(self._build_entry(elem))
+                if self._stack:
+                    self._stack[-1].remove(elem)
+                elem.clear()
+        return entries
+
+    def _build_entry(self, item: ElementTree.Element) -> FeedParserDict:
+        """Map an <item>/<entry> element onto feedparser's entry keys"""
+        entry = FeedParserDict()
+        links = []
+        media_content = []
+
+        for child in item:
+            prefix, local = _split_tag(child.tag)
+            text = (child.text or '').strip()
+            attrs = dict(child.attrib)
+
+            if prefix in ('', 'atom'):
+                if local == 'title':
+                    entry['title'] = text
+                elif local == 'link':
+                    if attrs.get('href'):
+                        link = FeedParserDict(attrs)
+                        link.setdefault('rel', 'alternate')
+                        links.append(link)
+                        if link['rel'] == 'alternate' and 'link' not in entry:
+                            entry['link'] = link['href']
+                    elif text:
+                        entry['link'] = text
+                elif local in ('guid', 'id'):
+                    entry['id'] = text
+                elif local in ('pubDate', 'published'):
+                    entry['published'] = text
+                    entry['published_parsed'] = _parse_struct_time(text)
+                elif local == 'updated':
+                    entry['updated'] = text
+                    entry['updated_parsed'] = _parse_struct_time(text)
+                elif local == 'enclosure':
+                    # feedparser exposes entry.enclosures as the rel=enclosure links
+                    links.append(FeedParserDict(rel='enclosure', href=attrs.get('url', ''),
+                                                type=attrs.get('type', ''),
+                                                length=attrs.get('length', '')))
+                elif local in ('description', 'summary'):
+                    entry['summary'] = text
+                elif local == 'content':
+                    entry['content'] = [FeedParserDict(value=text, type=attrs.get('type', 'text/html'))]
+            elif prefix == 'content' and local == 'encoded':
+                entry['content'] = [FeedParserDict(value=text, type='text/html')]
+            elif prefix == 'itunes':
+                if local == 'duration':
+                    entry['itunes_duration'] = text
+                elif local == 'summary':
+                    entry['itunes_summary'] = text
+            elif prefix == 'media' and local == 'content':
+                media_content.append(FeedParserDict(attrs))
+            elif prefix == 'podcast' and local == 'transcript':
+                if 'podcast_transcript' not in entry:
+                    entry['podcast_transcript'] = FeedParserDict(attrs)
+            elif prefix == 'dc' and local == 'date' and 'published' not in entry:
+                entry['published'] = text
+                entry['published_parsed'] = _parse_struct_time(text)
+
+        if links:
+            entry['links'] = links
+        if media_content:
+            entry['media_content'] = media_content
+        return entry
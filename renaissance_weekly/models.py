@@ -1,9 +1,12 @@
 """Data models for Renaissance Weekly"""
 
+import time
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from pathlib import Path
+from typing import Dict, Optional
 
 
 class TranscriptSource(Enum):
@@ -58,4 +61,83 @@ class Episode:
         """Create from dictionary"""
         if isinstance(data.get('published'), str):
             data['published'] = datetime.fromisoformat(data['published'])
-        return cls(**data)
\ No newline at end of file
+        return cls(**data)
+
+
+class EpisodeJob:
+    """Per-episode state carried through the processing pipeline
+    
+    Every episode in flight gets its own job: cache lookup results, the
+    transcript and its source, the audio file, summaries, time spent in
+    each stage and the final outcome. Nothing is stashed on the app, so
+    concurrent episodes can't pick up each other's transcripts.
+    
+    queue_id is the episode's row in the durable jobs table; checkpoint is
+    that row when an earlier run got partway, so this one can resume it.
+    """
+    
+    __slots__ = (
+        'episode', 'id', 'mode', 'db_id', 'cached_transcript', 'cached_summary', 'cached_paragraph',
+        'transcript', 'source', 'audio_file', 'full_summary', 'paragraph_summary',
+        'stage', 'outcome', 'error', 'started_at', 'finished_at', 'timings', 'queue_id', 'checkpoint'
+    )
+    
+    def __init__(self, episode: Episode, mode: str = 'test', job_id: Optional[str] = None):
+        self.episode = episode
+        self.id = job_id or str(uuid.uuid4())[:8]
+        self.mode = mode
+        # Direct cache lookup
+        self.db_id: Optional[int] = None
+        self.cached_transcript: Optional[str] = None
+        self.cached_summary: Optional[str] = None
+        self.cached_paragraph: Optional[str] = None
+        # Work in progress
+        self.transcript: Optional[str] = None
+        self.source: Optional[TranscriptSource] = None
+        self.audio_file: Optional[Path] = None
+        self.full_summary: Optional[str] = None
+        self.paragraph_summary: Optional[str] = None
+        # Progress and outcome: 'completed', 'cached', 'failed' or 'cancelled'
+        self.stage: Optional[str] = None
+        self.outcome: Optional[str] = None
+        self.error: Optional[BaseException] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.timings: Dict[str, float] = {}
+        # Durable queue
+        self.queue_id: Optional[int] = None
+        self.checkpoint: Optional[Dict] = None
+    
+    @property
+    def key(self) -> str:
+        """Identifies the episode in the UI processing status"""
+        return f"{self.episode.podcast}:{self.episode.title}"
+    
+    @property
+    def label(self) -> str:
+        """Short name for logs"""
+        return f"{self.episode.podcast}:{self.episode.title[:30]}"
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the first stage to the finish (or now)"""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+    
+    def record_stage(self, stage: str, seconds: float):
+        """Add time spent in a stage (retries accumulate)"""
+        self.stage = stage
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+    
+    def summaries(self) -> Optional[Dict[str, str]]:
+        """Summaries in the shape process_episode returns, if there are any"""
+        if not self.full_summary:
+            return None
+        return {
+            'full_summary': self.full_summary,
+            'paragraph_summary': self.paragraph_summary
+        }
+    
+    def __repr__(self) -> str:
+        return f"EpisodeJob({self.id}, {self.label!r}, stage={self.stage}, outcome={self.outcome})"
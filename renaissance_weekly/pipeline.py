@@ -0,0 +1,354 @@
+"""Stage-graph executor for episode processing
+
+Episodes used to run end to end inside one semaphore sized for the
+memory-heavy audio work, so summarization - which needs almost no memory -
+was throttled to two or three episodes at a time. StagePipeline gives each
+stage (fetch transcript, acquire audio, transcribe, post-process,
+summarize, persist) its own worker pool fed by a bounded queue. Stages
+that hold audio reserve megabytes from a shared MemoryBudget instead of
+sharing a global episode limit, so twenty summaries can be in flight
+while two files are being transcribed.
+
+A stage handler returns the name of the stage the item moves to next, or
+None when the item is finished. That lets an episode with a published
+transcript skip the audio stages entirely.
+
+Audio is prefetched: a PrefetchWindow lets downloads run up to K episodes
+ahead of transcription, within a byte budget and above a free-disk floor,
+so the network and the transcription APIs stay busy at the same time.
+
+Each stage's concurrency is an AdaptiveLimit starting at its configured
+workers. Given an AdaptiveConcurrencyController, the pipeline registers
+those limits and feeds it per-stage latency, and the controller moves
+them between one and max_workers while the run is going.
+"""
+
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .utils.adaptive import AdaptiveLimit, AdaptiveConcurrencyController
+from .utils.helpers import exponential_backoff_with_jitter, get_free_disk_space
+from .utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class StageFailed(Exception):
+    """Raised by a handler whose work failed, so the stage's retries apply"""
+
+
+class MemoryBudget:
+    """Megabytes shared between the stages that hold audio in memory"""
+
+    def __init__(self, total_mb: float):
+        self.total_mb = total_mb
+        self.used_mb = 0.0
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def reserve(self, mb: float):
+        """Wait until mb is free and hold it for the block
+
+        A request larger than the whole budget still runs, but only alone.
+        """
+        mb = min(mb, self.total_mb)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.used_mb + mb <= self.total_mb)
+            self.used_mb += mb
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.used_mb -= mb
+                self._condition.notify_all()
+
+
+class PrefetchWindow:
+    """Audio downloaded ahead of transcription, bounded by count, size and free disk
+
+    admit() waits until one more episode may start downloading: fewer than
+    max_items are downloaded or downloading but not yet being transcribed,
+    the audio held stays within max_mb, and the download would leave at
+    least min_free_mb on disk. settle() swaps the estimate for the real
+    size, started() frees the count slot when transcription begins, and
+    release() frees the bytes once the file is gone. An empty window
+    always admits, so one oversized episode still runs alone.
+    """
+
+    def __init__(self, max_items: int, max_mb: float, min_free_mb: float = 0, path: Optional[Path] = None):
+        self.max_items = max(max_items, 1)
+        self.max_mb = max_mb
+        self.min_free_mb = min_free_mb
+        self.path = path
+        self.peak_ahead = 0
+        self.wait_seconds = 0.0
+        self._held: Dict[Any, List] = {}  # key -> [mb, settled, ahead]
+        self._condition = asyncio.Condition()
+
+    @property
+    def ahead(self) -> int:
+        return sum(1 for _, _, ahead in self._held.values() if ahead)
+
+    @property
+    def held_mb(self) -> float:
+        return sum(mb for mb, _, _ in self._held.values())
+
+    def _fits(self, mb: float) -> bool:
+        if not self._held:
+            return True
+        if self.ahead >= self.max_items or self.held_mb + mb > self.max_mb:
+            return False
+        if self.path is None:
+            return True
+        # Downloads still in progress will take up to their estimate on top of what's on disk now
+        pending = sum(held_mb for held_mb, settled, _ in self._held.values() if not settled)
+        return get_free_disk_space(self.path) - pending - mb >= self.min_free_mb
+
+    async def admit(self, key: Any, mb: float):
+        """Wait for room in the window and hold an estimated mb for key"""
+        start = time.monotonic()
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._fits(mb))
+            self._held[key] = [mb, False, True]
+            self.peak_ahead = max(self.peak_ahead, self.ahead)
+        self.wait_seconds += time.monotonic() - start
+
+    async def settle(self, key: Any, mb: float):
+        """Replace key's estimate with the size actually downloaded"""
+        async with self._condition:
+            if key in self._held:
+                self._held[key][:2] = [mb, True]
+                self._condition.notify_all()
+
+    async def started(self, key: Any):
+        """Key's audio is being transcribed - it no longer counts as prefetched"""
+        async with self._condition:
+            if key in self._held:
+                self._held[key][2] = False
+                self._condition.notify_all()
+
+    async def release(self, key: Any):
+        """Key's audio is gone; safe to call more than once"""
+        async with self._condition:
+            if self._held.pop(key, None) is not None:
+                self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            'ahead': self.ahead,
+            'held_mb': self.held_mb,
+            'peak_ahead': self.peak_ahead,
+            'wait_seconds': self.wait_seconds,
+        }
+
+
+@dataclass
+class Stage:
+    """One step of the pipeline and the resources it may use"""
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[str]]]
+    workers: int = 1
+    max_workers: Optional[int] = None  # Ceiling for adaptive resizing (default: workers)
+    memory_mb: float = 0  # Reserved from the MemoryBudget per running item
+    timeout: Optional[float] = None
+    retries: int = 0
+    uses_api: bool = False  # Backs off on rate-limit responses
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one stage"""
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    retried: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    busy_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def snapshot(self) -> Dict[str, float]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        done = self.processed + self.failed
+        return {
+            'processed': self.processed,
+            'failed': self.failed,
+            'retried': self.retried,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+            'throughput_per_min': self.processed / elapsed * 60,
+            'avg_seconds': self.busy_seconds / done if done else 0.0,
+            'avg_wait_seconds': self.wait_seconds / done if done else 0.0,
+            'utilization': min(self.busy_seconds / (elapsed * self.workers), 1.0),
+        }
+
+
+class StagePipeline:
+    """Run items through stages with per-stage workers and bounded queues
+
+    Items enter at the first stage. Each queue holds at most queue_size
+    items, so a slow stage pushes back on the ones feeding it rather than
+    letting finished work pile up in memory. An exception that outlasts a
+    stage's retries finishes the item with that error; on_finish is called
+    once per item either way. on_stage, if given, is told how long each
+    attempt at a stage took for that item. on_advance, if given, is awaited
+    after each stage an item completes, with the stage it moves to next (None
+    when finished) - the place to checkpoint it.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 4,
+                 memory_budget: Optional[MemoryBudget] = None,
+                 on_finish: Optional[Callable[[Any, Optional[BaseException]], Awaitable[None]]] = None,
+                 on_stage: Optional[Callable[[Any, str, float], None]] = None,
+                 on_advance: Optional[Callable[[Any, str, Optional[str]], Awaitable[None]]] = None,
+                 controller: Optional[AdaptiveConcurrencyController] = None,
+                 correlation_id: str = ""):
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = {stage.name: stage for stage in stages}
+        self.entry = stages[0].name
+        self.queue_size = queue_size
+        self.memory_budget = memory_budget
+        self.on_finish = on_finish
+        self.on_stage = on_stage
+        self.on_advance = on_advance
+        self.cid = correlation_id
+        self.controller = controller
+        self.metrics = {stage.name: StageMetrics(stage.workers) for stage in stages}
+        self.limits = {
+            stage.name: AdaptiveLimit(stage.workers, maximum=stage.max_workers or stage.workers, name=stage.name)
+            for stage in stages
+        }
+        if controller:
+            for stage in stages:
+                controller.register(stage.name, self.limits[stage.name],
+                                    memory_heavy=stage.memory_mb > 0, uses_api=stage.uses_api)
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._errors: List[Optional[BaseException]] = []
+        self._remaining = 0
+        self._done: Optional[asyncio.Event] = None
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage metrics and current concurrency limit, in stage order"""
+        return {name: {**metrics.snapshot(), 'limit': self.limits[name].limit}
+                for name, metrics in self.metrics.items()}
+
+    async def run(self, items: List[Any]) -> List[Optional[BaseException]]:
+        """Process every item; returns the error each one finished with (None on success)"""
+        self._errors = [None] * len(items)
+        if not items:
+            return self._errors
+
+        self._remaining = len(items)
+        self._done = asyncio.Event()
+        self._queues = {name: asyncio.Queue(maxsize=max(self.queue_size, 1)) for name in self.stages}
+        now = time.monotonic()
+        for metrics in self.metrics.values():
+            metrics.started_at = now
+
+        # One task per possible slot; the stage's limit decides how many run at once
+        tasks = [asyncio.create_task(self._worker(stage))
+                 for stage in self.stages.values() for _ in range(self.limits[stage.name].maximum)]
+        tasks.append(asyncio.create_task(self._feed(items)))
+        try:
+            await self._done.wait()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return self._errors
+
+    async def _feed(self, items: List[Any]):
+        queue = self._queues[self.entry]
+        for index, item in enumerate(items):
+            await queue.put((index, item, time.monotonic()))
+
+    async def _worker(self, stage: Stage):
+        queue = self._queues[stage.name]
+        metrics = self.metrics[stage.name]
+        limit = self.limits[stage.name]
+        while True:
+            index, item, queued_at = await queue.get()
+            async with limit:
+                metrics.wait_seconds += time.monotonic() - queued_at
+                try:
+                    next_stage, error = await self._run_stage(stage, metrics, item), None
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    next_stage, error = None, e
+
+            if error is not None:
+                metrics.failed += 1
+                logger.warning(f"[{self.cid}] Stage {stage.name} failed: {error}")
+                await self._finish(index, item, error)
+                continue
+
+            metrics.processed += 1
+            if self.on_advance:
+                try:
+                    await self.on_advance(item, stage.name, next_stage)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(f"[{self.cid}] Checkpoint after {stage.name} failed: {e}")
+            if next_stage is None:
+                await self._finish(index, item, None)
+            elif next_stage not in self._queues:
+                await self._finish(index, item, ValueError(f"Unknown stage: {next_stage}"))
+            else:
+                await self._queues[next_stage].put((index, item, time.monotonic()))
+
+    async def _run_stage(self, stage: Stage, metrics: StageMetrics, item: Any) -> Optional[str]:
+        for attempt in range(stage.retries + 1):
+            try:
+                return await self._attempt(stage, metrics, item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt >= stage.retries:
+                    raise
+                metrics.retried += 1
+                delay = exponential_backoff_with_jitter(attempt)
+                logger.warning(
+                    f"[{self.cid}] Stage {stage.name} attempt {attempt + 1} failed: {e}. "
+                    f"Retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+
+    async def _attempt(self, stage: Stage, metrics: StageMetrics, item: Any) -> Optional[str]:
+        if stage.memory_mb and self.memory_budget:
+            async with self.memory_budget.reserve(stage.memory_mb):
+                return await self._timed(stage, metrics, item)
+        return await self._timed(stage, metrics, item)
+
+    async def _timed(self, stage: Stage, metrics: StageMetrics, item: Any) -> Optional[str]:
+        metrics.in_flight += 1
+        metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+        start = time.monotonic()
+        try:
+            return await asyncio.wait_for(stage.handler(item), timeout=stage.timeout)
+        finally:
+            elapsed = time.monotonic() - start
+            metrics.busy_seconds += elapsed
+            metrics.in_flight -= 1
+            if self.on_stage:
+                self.on_stage(item, stage.name, elapsed)
+            if self.controller:
+                self.controller.record_latency(stage.name, elapsed)
+
+    async def _finish(self, index: int, item: Any, error: Optional[BaseException]):
+        self._errors[index] = error
+        if self.on_finish:
+            try:
+                await self.on_finish(item, error)
+            except Exception as e:
+                logger.error(f"[{self.cid}] Pipeline finish callback failed: {e}")
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._done.set()
@@ -20,6 +20,10 @@ class CacheValidator:
             "Founder's Fund", "Founders' Fund"
         ]
     
+    def needs_transcript_check(self, summary: str, paragraph_summary: str) -> bool:
+        """Whether the summaries mention a known error, so validating them needs the transcript"""
+        return any(error in summary or error in paragraph_summary for error in self.invalidating_errors)
+    
     def should_regenerate_summaries(self, transcript: str, summary: str, paragraph_summary: str) -> Tuple[bool, str]:
         """
         Check if summaries should be regenerated
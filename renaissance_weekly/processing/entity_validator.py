@@ -7,7 +7,7 @@ from pathlib import Path
 from collections import defaultdict
 
 from ..utils.logging import get_logger
-from ..utils.clients import openai_client
+from ..utils.clients import get_async_openai_client
 
 logger = get_logger(__name__)
 
@@ -130,7 +130,7 @@ Focus on:
 Return as JSON: {{"corrections": [{{"incorrect": "", "correct": "", "confidence": 0.0, "reason": ""}}]}}"""
 
         try:
-            response = await openai_client.chat.completions.create(
+            response = await get_async_openai_client().chat.completions.create(
                 model="gpt-4o-mini",  # Faster, cheaper for validation
                 messages=[
                     {"role": "system", "content": "You are an expert at identifying transcription errors in podcast transcripts, especially for tech and finance personalities."},
@@ -1,18 +1,49 @@
 """Generate executive summaries using ChatGPT - FIXED with external prompts"""
 
 import os
+import asyncio
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple, List
 
 from ..models import Episode, TranscriptSource
-from ..config import SUMMARY_DIR, BASE_DIR, TESTING_MODE
+from ..config import (
+    SUMMARY_DIR, BASE_DIR, TESTING_MODE, OPENAI_CHAT_TIMEOUT,
+    SUMMARY_MAP_REDUCE_CHARS, SUMMARY_SECTION_CHARS, SUMMARY_SECTION_MODEL,
+    SUMMARY_SECTION_MAX_TOKENS, SUMMARY_SECTION_CONCURRENCY
+)
 from ..utils.logging import get_logger
-from ..utils.helpers import slugify, retry_with_backoff, CircuitBreaker
-from ..utils.clients import openai_client, openai_rate_limiter
+from ..utils.helpers import slugify, retry_with_backoff, CircuitBreaker, estimate_tokens
+from ..utils.clients import get_async_openai_client, openai_rate_limiter, chat_rate_limiter
 
 logger = get_logger(__name__)
 
 
+def split_sections(text: str, max_chars: int) -> List[str]:
+    """Split a transcript into sections of at most max_chars
+    
+    Cuts at the last paragraph break in the back half of each window,
+    falling back to a line break, a sentence end, then a space.
+    """
+    sections = []
+    start = 0
+    while len(text) - start > max_chars:
+        window = text[start:start + max_chars]
+        cut = window.rfind('\n\n')
+        if cut < max_chars // 2:
+            cut = window.rfind('\n')
+        if cut < max_chars // 2:
+            cut = max(window.rfind('. '), window.rfind('? '), window.rfind('! ')) + 1
+        if cut < max_chars // 2:
+            cut = window.rfind(' ')
+        if cut <= 0:
+            cut = max_chars
+        sections.append(text[start:start + cut].strip())
+        start += cut
+    sections.append(text[start:].strip())
+    return [section for section in sections if section]
+
+
 class Summarizer:
     """Generate executive summaries for podcast episodes using configurable prompts"""
     
@@ -23,6 +54,7 @@ class Summarizer:
         # Load both prompt templates
         self.paragraph_prompt_template = self._load_prompt("paragraph_prompt.txt")
         self.full_summary_prompt_template = self._load_prompt("full_summary_prompt.txt")
+        self.section_prompt_template = self._load_prompt("section_summary_prompt.txt")
         
         # Configuration from environment
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
@@ -59,6 +91,8 @@ class Summarizer:
                     return self._get_default_paragraph_prompt()
                 elif filename == "full_summary_prompt.txt":
                     return self._get_default_full_summary_prompt()
+                elif filename == "section_summary_prompt.txt":
+                    return self._get_default_section_prompt()
                 else:
                     return ""
         except Exception as e:
@@ -70,6 +104,8 @@ class Summarizer:
                 return self._get_default_paragraph_prompt()
             elif filename == "full_summary_prompt.txt":
                 return self._get_default_full_summary_prompt()
+            elif filename == "section_summary_prompt.txt":
+                return self._get_default_section_prompt()
             else:
                 return ""
     
@@ -79,11 +115,8 @@ class Summarizer:
             # Note: Transcript validation is now done earlier in the pipeline
             # to allow fallback to audio transcription when needed
             
-            # Create safe filename for summary cache - NOW INCLUDES MODE
-            date_str = episode.published.strftime('%Y%m%d')
-            safe_podcast = slugify(episode.podcast)[:30]
-            safe_title = slugify(episode.title)[:50]
-            summary_file = SUMMARY_DIR / f"{date_str}_{safe_podcast}_{safe_title}_{mode}_summary.md"
+            # Summary cache - NOW INCLUDES MODE
+            summary_file = self._cache_file(episode, mode, 'summary')
             
             # Check cache first (unless force_fresh is True)
             if not force_fresh and summary_file.exists():
@@ -94,7 +127,8 @@ class Summarizer:
                 logger.info("🔄 Force fresh enabled - bypassing cached summary")
             
             # Prepare the prompt with episode data
-            prompt = self._prepare_prompt(episode, transcript, source)
+            context = await self._build_context(episode, transcript, source, force_fresh)
+            prompt = self._prepare_prompt(episode, transcript, source, context=context)
             
             # Show actual processing mode, not just TESTING_MODE flag
             if mode == 'test':
@@ -130,14 +164,44 @@ class Summarizer:
             logger.error(traceback.format_exc())
             return None
     
-    async def generate_paragraph_summary(self, episode: Episode, transcript: str, source: TranscriptSource, mode: str = 'test', force_fresh: bool = False) -> Optional[str]:
+    async def generate_summaries(self, episode: Episode, transcript: str, source: TranscriptSource, mode: str = 'test', force_fresh: bool = False) -> Tuple[Optional[str], Optional[str]]:
+        """Generate the paragraph and full summaries concurrently
+        
+        The transcript is condensed (or truncated) and the guest name
+        extracted once for both prompts; the two completions then run side
+        by side, paced by the shared rate limiter, so an episode takes about
+        as long as the slower of the two calls.
+        
+        Returns:
+            Tuple of (paragraph_summary, full_summary), either may be None
+        """
+        # Both cached: skip the context, which may cost a call per section for long transcripts
+        paragraph_file = self._cache_file(episode, mode, 'paragraph')
+        full_summary_file = self._cache_file(episode, mode, 'full_summary')
+        if not force_fresh and paragraph_file.exists() and full_summary_file.exists():
+            logger.info("✅ Found cached paragraph and full summaries")
+            return (paragraph_file.read_text(encoding='utf-8'),
+                    full_summary_file.read_text(encoding='utf-8'))
+        
+        context = await self._build_context(episode, transcript, source, force_fresh)
+        paragraph, full_summary = await asyncio.gather(
+            self.generate_paragraph_summary(episode, transcript, source, mode, force_fresh, context=context),
+            self.generate_full_summary(episode, transcript, source, mode, force_fresh, context=context)
+        )
+        return paragraph, full_summary
+    
+    def _cache_file(self, episode: Episode, mode: str, kind: str) -> Path:
+        """Cache file for one kind of summary ('summary', 'paragraph' or 'full_summary') in a mode"""
+        date_str = episode.published.strftime('%Y%m%d')
+        safe_podcast = slugify(episode.podcast)[:30]
+        safe_title = slugify(episode.title)[:50]
+        return SUMMARY_DIR / f"{date_str}_{safe_podcast}_{safe_title}_{mode}_{kind}.md"
+    
+    async def generate_paragraph_summary(self, episode: Episode, transcript: str, source: TranscriptSource, mode: str = 'test', force_fresh: bool = False,
+                                         context: Optional[Dict[str, str]] = None) -> Optional[str]:
         """Generate 150-word paragraph summary for email scanning"""
         try:
-            # Create safe filename for paragraph cache
-            date_str = episode.published.strftime('%Y%m%d')
-            safe_podcast = slugify(episode.podcast)[:30]
-            safe_title = slugify(episode.title)[:50]
-            paragraph_file = SUMMARY_DIR / f"{date_str}_{safe_podcast}_{safe_title}_{mode}_paragraph.md"
+            paragraph_file = self._cache_file(episode, mode, 'paragraph')
             
             # Check cache first (unless force_fresh is True)
             if not force_fresh and paragraph_file.exists():
@@ -148,7 +212,9 @@ class Summarizer:
                 logger.info("🔄 Force fresh enabled - bypassing cached paragraph")
             
             # Prepare the prompt with episode data
-            prompt = self._prepare_prompt(episode, transcript, source, template_type='paragraph')
+            if context is None:
+                context = await self._build_context(episode, transcript, source, force_fresh)
+            prompt = self._prepare_prompt(episode, transcript, source, template_type='paragraph', context=context)
             
             # Show actual processing mode, not just TESTING_MODE flag
             if mode == 'test':
@@ -157,11 +223,8 @@ class Summarizer:
                 mode_info = " (FULL EPISODE)"
             logger.info(f"🤖 Generating paragraph summary with {self.model}{mode_info}...")
             
-            # Call OpenAI API with reduced token limit for paragraph
-            old_max_tokens = self.max_tokens
-            self.max_tokens = 300  # Enough for 150-word paragraph
-            response = await self._call_openai_api(prompt)
-            self.max_tokens = old_max_tokens  # Restore
+            # Call OpenAI API with reduced token limit for paragraph (enough for 150 words)
+            response = await self._call_openai_api(prompt, max_tokens=300)
             
             if not response:
                 logger.error("❌ Failed to generate paragraph summary")
@@ -185,14 +248,11 @@ class Summarizer:
             logger.error(traceback.format_exc())
             return None
     
-    async def generate_full_summary(self, episode: Episode, transcript: str, source: TranscriptSource, mode: str = 'test', force_fresh: bool = False) -> Optional[str]:
+    async def generate_full_summary(self, episode: Episode, transcript: str, source: TranscriptSource, mode: str = 'test', force_fresh: bool = False,
+                                    context: Optional[Dict[str, str]] = None) -> Optional[str]:
         """Generate comprehensive full summary with natural flow"""
         try:
-            # Create safe filename for full summary cache
-            date_str = episode.published.strftime('%Y%m%d')
-            safe_podcast = slugify(episode.podcast)[:30]
-            safe_title = slugify(episode.title)[:50]
-            full_summary_file = SUMMARY_DIR / f"{date_str}_{safe_podcast}_{safe_title}_{mode}_full_summary.md"
+            full_summary_file = self._cache_file(episode, mode, 'full_summary')
             
             # Check cache first (unless force_fresh is True)
             if not force_fresh and full_summary_file.exists():
@@ -203,7 +263,9 @@ class Summarizer:
                 logger.info("🔄 Force fresh enabled - bypassing cached full summary")
             
             # Prepare the prompt with episode data
-            prompt = self._prepare_prompt(episode, transcript, source, template_type='full')
+            if context is None:
+                context = await self._build_context(episode, transcript, source, force_fresh)
+            prompt = self._prepare_prompt(episode, transcript, source, template_type='full', context=context)
             
             # Show actual processing mode, not just TESTING_MODE flag
             if mode == 'test':
@@ -237,14 +299,91 @@ class Summarizer:
             logger.error(traceback.format_exc())
             return None
     
-    def _prepare_prompt(self, episode: Episode, transcript: str, source: TranscriptSource, template_type: str = 'legacy') -> str:
-        """Prepare the prompt with episode data"""
+    async def _build_context(self, episode: Episode, transcript: str, source: TranscriptSource,
+                             force_fresh: bool = False) -> Dict[str, str]:
+        """Prompt context, with long transcripts replaced by section notes"""
+        if len(transcript) > SUMMARY_MAP_REDUCE_CHARS:
+            notes = await self._summarize_sections(episode, transcript, force_fresh)
+            if notes:
+                transcript = notes
+        return self._prepare_context(episode, transcript, source)
+    
+    async def _summarize_sections(self, episode: Episode, transcript: str, force_fresh: bool = False) -> Optional[str]:
+        """Map step: condense each transcript section with the cheaper model
+        
+        Section notes are cached by a hash of model, section prompt and
+        section text, so a rerun after changing the paragraph or full
+        prompt only repeats the final (reduce) calls. force_fresh ignores
+        the cache (and refreshes it); dry runs neither read nor write it.
+        Returns None if any section fails, leaving the caller to fall back
+        to truncation.
+        """
+        # Dry-run notes are placeholders - never let them into the cache
+        use_cache = os.getenv('DRY_RUN') != 'true'
+        sections = split_sections(transcript, SUMMARY_SECTION_CHARS)
+        cache_dir = SUMMARY_DIR / "sections"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(SUMMARY_SECTION_CONCURRENCY)
+        logger.info(f"🧩 Transcript is {len(transcript):,} chars - summarizing {len(sections)} sections with {SUMMARY_SECTION_MODEL}")
+        
+        async def summarize(number: int, section: str) -> Optional[str]:
+            prompt = self.section_prompt_template
+            for placeholder, value in (("{episode_title}", episode.title), ("{podcast_name}", episode.podcast),
+                                       ("{section_number}", str(number)), ("{section_count}", str(len(sections))),
+                                       ("{section}", section)):
+                prompt = prompt.replace(placeholder, value)
+            key = hashlib.sha256(f"{SUMMARY_SECTION_MODEL}\0{prompt}".encode('utf-8')).hexdigest()
+            cache_file = cache_dir / f"{key}.md"
+            if use_cache and not force_fresh and cache_file.exists():
+                return cache_file.read_text(encoding='utf-8')
+            
+            async with semaphore:
+                try:
+                    notes = await self._call_openai_api(prompt, max_tokens=SUMMARY_SECTION_MAX_TOKENS,
+                                                        model=SUMMARY_SECTION_MODEL,
+                                                        system_prompt="You take precise, complete notes on podcast transcripts.")
+                except Exception as e:
+                    logger.warning(f"Section {number}/{len(sections)} summary failed: {e}")
+                    return None
+            if notes and use_cache:
+                temp_file = cache_file.with_suffix('.tmp')
+                temp_file.write_text(notes, encoding='utf-8')
+                temp_file.replace(cache_file)
+            return notes
+        
+        results = await asyncio.gather(*(summarize(i, section) for i, section in enumerate(sections, 1)))
+        if not all(results):
+            logger.warning("⚠️ Some section summaries failed - falling back to the truncated transcript")
+            return None
+        
+        parts = [f"[SECTION {i} OF {len(results)}]\n{notes.strip()}" for i, notes in enumerate(results, 1)]
+        return ("[The full transcript was too long to include. Below are detailed section-by-section notes "
+                "covering the entire episode in order.]\n\n" + "\n\n".join(parts))
+    
+    def _prepare_context(self, episode: Episode, transcript: str, source: TranscriptSource) -> Dict[str, str]:
+        """Template values shared by every prompt for an episode"""
         # Truncate transcript if too long (leave room for response)
         max_transcript_chars = 100000  # Adjust based on model limits
         truncated_transcript = transcript[:max_transcript_chars]
         if len(transcript) > max_transcript_chars:
             truncated_transcript += "\n\n[TRANSCRIPT TRUNCATED DUE TO LENGTH]"
         
+        return {
+            "{episode_title}": episode.title,
+            "{podcast_name}": episode.podcast,
+            "{source}": source.value,
+            "{transcript}": truncated_transcript,
+            # Extract guest name from title if possible (common patterns)
+            "{guest_name}": self._extract_guest_name(episode.title, episode.description),
+            "{publish_date}": episode.published.strftime('%B %d, %Y'),
+        }
+    
+    def _prepare_prompt(self, episode: Episode, transcript: str, source: TranscriptSource, template_type: str = 'legacy',
+                        context: Optional[Dict[str, str]] = None) -> str:
+        """Prepare the prompt with episode data"""
+        if context is None:
+            context = self._prepare_context(episode, transcript, source)
+        
         # Select appropriate template based on type
         if template_type == 'paragraph':
             prompt = self.paragraph_prompt_template
@@ -253,18 +392,9 @@ class Summarizer:
         else:
             # Default to full summary for legacy calls
             prompt = self.full_summary_prompt_template
-        prompt = prompt.replace("{episode_title}", episode.title)
-        prompt = prompt.replace("{podcast_name}", episode.podcast)
-        prompt = prompt.replace("{source}", source.value)
-        prompt = prompt.replace("{transcript}", truncated_transcript)
         
-        # Extract guest name from title if possible (common patterns)
-        guest_name = self._extract_guest_name(episode.title, episode.description)
-        prompt = prompt.replace("{guest_name}", guest_name)
-        
-        # Format publish date
-        publish_date = episode.published.strftime('%B %d, %Y')
-        prompt = prompt.replace("{publish_date}", publish_date)
+        for placeholder, value in context.items():
+            prompt = prompt.replace(placeholder, value)
         
         return prompt
     
@@ -425,12 +555,14 @@ class Summarizer:
         # Default if no guest found
         return "[Guest Name]"
     
-    async def _call_openai_api(self, prompt: str) -> Optional[str]:
+    async def _call_openai_api(self, prompt: str, max_tokens: Optional[int] = None, model: Optional[str] = None,
+                               system_prompt: Optional[str] = None) -> Optional[str]:
         """Call OpenAI API with enhanced retry logic and rate limiting"""
-        import asyncio
         import uuid
         
         correlation_id = str(uuid.uuid4())[:8]
+        max_tokens = max_tokens or self.max_tokens
+        model = model or self.model
         
         # Check for dry-run mode
         if os.getenv('DRY_RUN') == 'true':
@@ -451,49 +583,36 @@ Actionable takeaways from the episode.
 ---
 *This summary was generated in dry-run mode without making API calls.*"""
         
-        # Wait for rate limiter before making API call
-        wait_time = await openai_rate_limiter.acquire(correlation_id)
-        if wait_time > 0:
-            logger.info(f"[{correlation_id}] Rate limiting: waiting {wait_time:.1f}s before API call")
-            await asyncio.sleep(wait_time)
+        # Quotas are per model - only the main model's calls go through openai_rate_limiter
+        rate_limiter = openai_rate_limiter if model == self.model else chat_rate_limiter(model)
         
         # Log current rate limiter usage
-        usage = openai_rate_limiter.get_current_usage()
+        usage = rate_limiter.get_current_usage()
         logger.info(f"[{correlation_id}] OpenAI rate limit usage: {usage['current_requests']}/{usage['max_requests']} ({usage['utilization']:.1f}%)")
         
         # Create the full user message with transcript
         user_message = prompt
+        system_message = system_prompt or self.system_prompt or "You are a helpful assistant."
+        # Output tokens count against TPM as soon as they're requested
+        tokens = estimate_tokens(system_message) + estimate_tokens(user_message) + max_tokens
         
         # Define the API call function for retry and circuit breaker
         async def api_call():
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            
-            def sync_api_call():
-                try:
-                    return openai_client.chat.completions.create(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": self.system_prompt if self.system_prompt else "You are a helpful assistant."},
-                            {"role": "user", "content": user_message}
-                        ],
-                        max_tokens=self.max_tokens,
-                        temperature=self.temperature
-                    )
-                except Exception as e:
-                    # Wrap the exception to preserve response information
-                    if hasattr(e, 'response'):
-                        raise e
-                    else:
-                        # Create a wrapper exception
-                        class APIError(Exception):
-                            def __init__(self, message):
-                                super().__init__(message)
-                                self.response = None
-                        
-                        raise APIError(str(e))
-            
-            return await loop.run_in_executor(None, sync_api_call)
+            # Each attempt takes its own limiter slot; the response headers correct the limiter's budget
+            async with rate_limiter.slot(tokens, correlation_id):
+                # Native async request - cancelling the task aborts it instead of leaving a thread blocked
+                raw = await get_async_openai_client().chat.completions.with_raw_response.create(
+                    model=model,
+                    messages=[
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": user_message}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    timeout=OPENAI_CHAT_TIMEOUT
+                )
+                rate_limiter.update_from_headers(raw.headers)
+                return raw.parse()
         
         try:
             # Call with circuit breaker and enhanced retry
@@ -588,6 +707,16 @@ CONSTRAINTS
 TRANSCRIPT
 {transcript}"""
 
+    def _get_default_section_prompt(self) -> str:
+        """Default section notes prompt (map step) as fallback"""
+        return """EPISODE {episode_title}   |   PODCAST {podcast_name}
+SECTION {section_number} OF {section_count}
+
+Take dense, complete bullet-point notes on this section of a podcast transcript, in conversation order. Keep every topic, argument, number, forecast, name and notable quote; another analyst will write the final summary from these notes alone.
+
+TRANSCRIPT SECTION
+{section}"""
+    
     def _get_default_full_summary_prompt(self) -> str:
         """Default full summary prompt template as fallback"""
         return """EPISODE {episode_title}   |   PODCAST {podcast_name}
@@ -1,12 +1,12 @@
 """Intelligent transcript post-processing using GPT-4 to fix errors automatically"""
 
 import json
-import asyncio
 from typing import Tuple, Optional
 
+from ..config import OPENAI_CHAT_TIMEOUT
 from ..utils.logging import get_logger
 from ..utils.helpers import retry_with_backoff
-from ..utils.clients import openai_client, openai_rate_limiter
+from ..utils.clients import get_async_openai_client
 
 logger = get_logger(__name__)
 
@@ -73,11 +73,8 @@ class TranscriptPostProcessor:
         prompt = self._build_prompt(transcript_sample, podcast_name, episode_title)
         
         try:
-            # Use sync API with executor
-            loop = asyncio.get_event_loop()
-            
-            def sync_api_call():
-                return openai_client.chat.completions.create(
+            async def api_call():
+                return await get_async_openai_client().chat.completions.create(
                     model=self.model,
                     messages=[
                         {
@@ -88,11 +85,11 @@ class TranscriptPostProcessor:
                     ],
                     temperature=0.1,  # Low temperature for consistency
                     max_tokens=2000,
-                    response_format={"type": "json_object"}
+                    response_format={"type": "json_object"},
+                    timeout=OPENAI_CHAT_TIMEOUT
                 )
             
-            # Run in executor to avoid blocking
-            response = await loop.run_in_executor(None, sync_api_call)
+            response = await retry_with_backoff(api_call, max_attempts=3, handle_rate_limit=True)
             
             result = json.loads(response.choices[0].message.content)
             
@@ -15,6 +15,7 @@ from ..models import Episode
 from ..config import TESTING_MODE, MAX_TRANSCRIPTION_MINUTES
 from ..utils.logging import get_logger
 from ..utils.filename_utils import generate_temp_filename
+from ..utils.audio_probe import probe_audio
 
 # Suppress verbose HTTP client logging from AssemblyAI
 logging.getLogger("httpcore").setLevel(logging.WARNING)
@@ -94,9 +95,10 @@ class AssemblyAITranscriber:
                     
                     # Check if the audio is already short enough (might be pre-trimmed by download manager)
                     try:
-                        from pydub import AudioSegment
-                        temp_audio = AudioSegment.from_file(str(audio_path))
-                        current_duration_seconds = len(temp_audio) / 1000
+                        audio_info = await asyncio.to_thread(probe_audio, audio_path)
+                        if not audio_info:
+                            raise ValueError("unreadable audio headers")
+                        current_duration_seconds = audio_info.duration
                         max_duration_seconds = max_minutes * 60
                         
                         if current_duration_seconds > max_duration_seconds:
@@ -110,11 +112,6 @@ class AssemblyAITranscriber:
                         else:
                             logger.info(f"Test mode: Audio already short enough ({current_duration_seconds:.1f}s), no trimming needed")
                         
-                        # Clean up temp audio
-                        del temp_audio
-                        import gc
-                        gc.collect()
-                        
                     except Exception as e:
                         logger.warning(f"Failed to check audio duration, proceeding with trim: {e}")
                         # Fall back to the original behavior
@@ -202,6 +199,11 @@ class AssemblyAITranscriber:
     async def _trim_audio(self, audio_path: Path, max_minutes: int) -> Optional[Path]:
         """Trim audio file to specified duration"""
         try:
+            # Nothing to trim if the headers already say it's short enough
+            audio_info = await asyncio.to_thread(probe_audio, audio_path)
+            if audio_info and audio_info.duration <= max_minutes * 60:
+                return audio_path
+            
             # Check file size first to avoid OOM
             file_size_mb = audio_path.stat().st_size / (1024 * 1024)
             if file_size_mb > 100:  # 100MB threshold
@@ -12,6 +12,7 @@ import asyncio
 from datetime import datetime, timedelta
 
 from ..utils.logging import get_logger
+from ..utils.download_sink import DownloadSink, verified_sha256
 from ..monitoring import monitor
 
 logger = get_logger(__name__)
@@ -122,6 +123,10 @@ class PlatformAudioDownloader:
         if not file_path.exists():
             return False
         
+        # Already sniffed while streaming in _download_with_progress
+        if verified_sha256(file_path):
+            return True
+        
         # Check file size
         file_size = file_path.stat().st_size
         if file_size < 1000:  # Less than 1KB is suspicious
@@ -662,10 +667,11 @@ class PlatformAudioDownloader:
             chunk_start_time = datetime.now()
             chunk_downloaded = 0
             
-            with open(output_path, 'wb') as f:
+            # Lenient: unknown binary formats still get the ffprobe check in _validate_audio_file
+            with DownloadSink(output_path, total_size, lenient=True, min_size=1000) as sink:
                 for chunk in response.iter_content(chunk_size=32768):  # 32KB chunks
                     if chunk:
-                        f.write(chunk)
+                        sink.write(chunk)
                         downloaded += len(chunk)
                         chunk_downloaded += len(chunk)
                         
@@ -713,21 +719,21 @@ class PlatformAudioDownloader:
                             # Reset chunk tracking
                             chunk_start_time = now
                             chunk_downloaded = 0
-                
-                # Final validation
-                if downloaded < 1000:
-                    logger.warning(f"Downloaded file too small: {downloaded} bytes")
-                    if output_path.exists():
-                        output_path.unlink()
-                    return False
-                
-                # Log final stats
-                total_time = (datetime.now() - start_time).total_seconds()
-                avg_speed_mbps = (downloaded / total_time / (1024 * 1024)) if total_time > 0 else 0
-                logger.info(f"✅ Download complete: {downloaded / 1_000_000:.1f}MB in {int(total_time)}s "
-                          f"(avg {avg_speed_mbps:.2f}MB/s)")
-                
-                return True
+            
+            # Final validation
+            if not sink.validate():
+                if output_path.exists():
+                    output_path.unlink()
+                return False
+            sink.commit()
+            
+            # Log final stats
+            total_time = (datetime.now() - start_time).total_seconds()
+            avg_speed_mbps = (downloaded / total_time / (1024 * 1024)) if total_time > 0 else 0
+            logger.info(f"✅ Download complete: {downloaded / 1_000_000:.1f}MB in {int(total_time)}s "
+                      f"(avg {avg_speed_mbps:.2f}MB/s)")
+            
+            return True
                 
         except Exception as e:
             logger.error(f"Download error: {e}")
@@ -0,0 +1,116 @@
+"""Chunk boundary planning and transcript stitching for long episodes"""
+
+import re
+import difflib
+from typing import List, NamedTuple, Tuple
+
+# Whisper rejects uploads over 25MB; chunks are re-encoded at a fixed bitrate
+# so their size follows directly from their length
+WHISPER_MAX_BYTES = 25 * 1024 * 1024
+CHUNK_BITRATE = 128000
+SIZE_HEADROOM = 0.95  # Container overhead and encoder variance
+
+# ffmpeg silencedetect settings
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_SECONDS = 0.4
+
+# Stitching: how far into each side to look, and the shortest run accepted as overlap
+STITCH_WINDOW_WORDS = 80
+MIN_OVERLAP_WORDS = 3
+
+_SILENCE_START = re.compile(r'silence_start:\s*(-?[\d.]+)')
+_SILENCE_END = re.compile(r'silence_end:\s*(-?[\d.]+)')
+
+
+class ChunkSpan(NamedTuple):
+    """One chunk to extract; overlap is seconds repeated from the previous chunk"""
+    start: float
+    end: float
+    overlap: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def max_chunk_seconds(limit_bytes: int = WHISPER_MAX_BYTES, bitrate: int = CHUNK_BITRATE) -> float:
+    """Longest chunk that stays under the upload limit at the chunk bitrate"""
+    return limit_bytes * SIZE_HEADROOM * 8 / bitrate
+
+
+def parse_silencedetect(output: str) -> List[Tuple[float, float]]:
+    """Parse (start, end) silence intervals from ffmpeg silencedetect stderr"""
+    silences = []
+    start = None
+    for line in output.splitlines():
+        match = _SILENCE_START.search(line)
+        if match:
+            start = max(0.0, float(match.group(1)))
+            continue
+        match = _SILENCE_END.search(line)
+        if match and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(duration: float, silences: List[Tuple[float, float]], max_seconds: float,
+                overlap: float = 2.0, search_seconds: float = 60.0) -> List[ChunkSpan]:
+    """Split [0, duration] into chunks no longer than max_seconds
+
+    Each chunk is filled as close to max_seconds as possible and then cut at
+    the latest silence inside the search window before that point. Where no
+    silence is found the cut is made at the limit and the next chunk starts
+    `overlap` seconds early so the words across the cut appear in both.
+    """
+    midpoints = sorted((s + e) / 2 for s, e in silences)
+    spans = []
+    start = 0.0
+    chunk_overlap = 0.0
+
+    while duration - start > max_seconds:
+        limit = start + max_seconds
+        floor = max(limit - search_seconds, start + max_seconds / 2)
+        candidates = [m for m in midpoints if floor <= m <= limit]
+
+        if candidates:
+            cut, next_overlap = candidates[-1], 0.0
+        else:
+            cut, next_overlap = limit, overlap
+
+        spans.append(ChunkSpan(start, cut, chunk_overlap))
+        start, chunk_overlap = cut - next_overlap, next_overlap
+
+    spans.append(ChunkSpan(start, duration, chunk_overlap))
+    return spans
+
+
+def _normalize_word(word: str) -> str:
+    return re.sub(r'[\W_]+', '', word.casefold())
+
+
+def stitch_transcripts(parts: List[str], overlapped: List[bool]) -> str:
+    """Join chunk transcripts, dropping text repeated across overlapping chunks
+
+    overlapped[i] says whether part i starts with audio already heard at the
+    end of part i-1. For those, the longest run of words shared by the tail
+    of the text so far and the head of the part is kept once; anything after
+    the run on the left (a word garbled by the cut) and before it on the
+    right is dropped.
+    """
+    words: List[str] = []
+    for part, has_overlap in zip(parts, overlapped):
+        part_words = part.split()
+        if has_overlap and words:
+            tail_start = max(0, len(words) - STITCH_WINDOW_WORDS)
+            tail = [_normalize_word(w) for w in words[tail_start:]]
+            head = [_normalize_word(w) for w in part_words[:STITCH_WINDOW_WORDS]]
+
+            match = difflib.SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(
+                0, len(tail), 0, len(head)
+            )
+            if match.size >= MIN_OVERLAP_WORDS:
+                del words[tail_start + match.a + match.size:]
+                part_words = part_words[match.b + match.size:]
+        words.extend(part_words)
+    return " ".join(words)
@@ -3,9 +3,8 @@
 import os
 import asyncio
 import aiohttp
-import aiofiles
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import subprocess
 import time
 import re
@@ -16,16 +15,29 @@ import tempfile
 import gc
 
 from ..models import Episode
-from ..config import AUDIO_DIR, TEMP_DIR, TESTING_MODE, MAX_TRANSCRIPTION_MINUTES
+from ..config import (
+    AUDIO_DIR, TEMP_DIR, TESTING_MODE, MAX_TRANSCRIPTION_MINUTES,
+    TRANSCRIPTION_CHUNK_CONCURRENCY, TRANSCRIPTION_CHUNK_RETRIES,
+    TRANSCRIPTION_CHUNK_OVERLAP_SECONDS, TRANSCRIPTION_SILENCE_SEARCH_SECONDS,
+    PARTIAL_DOWNLOAD_ENABLED, OPENAI_TRANSCRIPTION_TIMEOUT
+)
 from ..utils.logging import get_logger
 from ..fetchers.audio_sources import AudioSourceFinder
+from ..download_strategies.range_strategy import RangeDownloadStrategy
+from ..audio_store import AudioBlobStore
+from .chunking import (
+    ChunkSpan, SILENCE_NOISE_DB, SILENCE_MIN_SECONDS,
+    max_chunk_seconds, parse_silencedetect, plan_chunks, stitch_transcripts
+)
 from ..utils.filename_utils import generate_audio_filename, generate_temp_filename
+from ..utils.audio_probe import probe_audio
+from ..utils.download_sink import DownloadSink, DownloadRejected
 from ..utils.helpers import (
     slugify, validate_audio_file_comprehensive, validate_audio_file_smart, 
     exponential_backoff_with_jitter, retry_with_backoff, ProgressTracker, 
-    calculate_file_hash, CircuitBreaker
+    CircuitBreaker
 )
-from ..utils.clients import openai_client, openai_rate_limiter, whisper_rate_limiter
+from ..utils.clients import get_async_openai_client, openai_rate_limiter, whisper_rate_limiter
 from ..robustness_config import should_use_feature
 
 logger = get_logger(__name__)
@@ -38,11 +50,11 @@ class AudioTranscriber:
         self.max_retries = 5  # Increased from 3
         self.retry_delay = 1.0
         self.chunk_size = 8192
-        self.validation_interval = 1024 * 1024  # Validate every 1MB during download
         self.session = None
         self._session_lock = asyncio.Lock()
         self.temp_files = set()  # Track temp files for cleanup
-        self._current_mode = 'test'  # Default mode, updated per episode
+        self.range_strategy = RangeDownloadStrategy()  # Test-mode partial downloads
+        self.blob_store = AudioBlobStore()  # Full downloads, shared across titles and modes
         
         # Check for ffmpeg availability (critical for memory-efficient trimming)
         import shutil
@@ -166,41 +178,76 @@ class AudioTranscriber:
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
     
+    @staticmethod
+    def _resolve_mode(transcription_mode: Optional[str]) -> str:
+        """'test' or 'full' - the given mode, else the environment setting
+        
+        The mode travels with each call rather than living on the instance,
+        since one transcriber serves test- and full-mode episodes at once.
+        """
+        if not transcription_mode:
+            return 'test' if TESTING_MODE else 'full'
+        return 'test' if transcription_mode == 'test' else 'full'
+    
     async def transcribe_episode(self, episode: Episode, transcription_mode: str = None) -> Optional[str]:
         """Download and transcribe episode audio with robust error handling"""
         correlation_id = str(uuid.uuid4())[:8]
         logger.info(f"[{correlation_id}] Starting transcription for: {episode.title}")
         
-        # Use provided mode or fall back to environment setting
-        self._current_mode = transcription_mode if transcription_mode else ('test' if TESTING_MODE else 'full')
+        audio_file = await self.acquire_audio(episode, transcription_mode, correlation_id)
+        if not audio_file:
+            return None
         
-        audio_file = None
-        temp_files_to_clean = []
+        try:
+            return await self.transcribe_audio(episode, audio_file, transcription_mode, correlation_id)
+        finally:
+            self.release_audio(audio_file, correlation_id)
+    
+    async def acquire_audio(self, episode: Episode, transcription_mode: str = None,
+                            correlation_id: Optional[str] = None) -> Optional[Path]:
+        """Download and validate episode audio; the caller hands it back with release_audio()"""
+        correlation_id = correlation_id or str(uuid.uuid4())[:8]
         
+        mode = self._resolve_mode(transcription_mode)
+        
+        audio_file = None
         try:
             # Download audio file with enhanced error handling
-            audio_file = await self._download_audio_with_fallbacks(episode, correlation_id)
+            audio_file = await self._download_audio_cached(episode, correlation_id, mode)
             if not audio_file:
                 return None
             
-            temp_files_to_clean.append(audio_file)
-            
             # Comprehensive validation with smart mode
             if not validate_audio_file_smart(audio_file, correlation_id, episode.audio_url):
                 logger.error(f"[{correlation_id}] Downloaded file failed comprehensive validation")
+                self.release_audio(audio_file, correlation_id)
                 return None
             
             # Additional validation with ffprobe if available
             if not await self._validate_with_ffprobe(audio_file, correlation_id):
                 logger.warning(f"[{correlation_id}] FFprobe validation failed, but continuing")
             
+            return audio_file
+        
+        except Exception as e:
+            logger.error(f"[{correlation_id}] Audio download error: {e}", exc_info=True)
+            self.release_audio(audio_file, correlation_id)
+            return None
+    
+    async def transcribe_audio(self, episode: Episode, audio_file: Path, transcription_mode: str = None,
+                               correlation_id: Optional[str] = None) -> Optional[str]:
+        """Transcribe audio from acquire_audio(), AssemblyAI first and Whisper as fallback"""
+        correlation_id = correlation_id or str(uuid.uuid4())[:8]
+        mode = self._resolve_mode(transcription_mode)
+        
+        try:
             # Try AssemblyAI first if available
             transcript = None
             if self.assemblyai_transcriber:
                 try:
                     logger.info(f"[{correlation_id}] 🚀 Using AssemblyAI for transcription (32x concurrency)")
                     transcript = await self.assemblyai_transcriber.transcribe_episode(
-                        episode, audio_file, self._current_mode
+                        episode, audio_file, mode
                     )
                     if transcript:
                         logger.info(f"[{correlation_id}] ✅ AssemblyAI transcription successful")
@@ -210,57 +257,62 @@ class AudioTranscriber:
             # Fall back to Whisper if AssemblyAI failed or unavailable
             if not transcript:
                 logger.info(f"[{correlation_id}] Using OpenAI Whisper for transcription")
-                transcript = await self._transcribe_with_whisper(audio_file, correlation_id)
-            
-            # Stream processing: delete audio file immediately after successful transcription
-            if transcript and self._current_mode == 'full':
-                try:
-                    if audio_file.exists():
-                        audio_file.unlink()
-                        self.temp_files.discard(str(audio_file))
-                        temp_files_to_clean.remove(audio_file)
-                        logger.info(f"[{correlation_id}] 🗑️  Deleted audio file immediately to save disk space")
-                except Exception as e:
-                    logger.debug(f"[{correlation_id}] Could not delete audio file immediately: {e}")
+                transcript = await self._transcribe_with_whisper(audio_file, correlation_id, mode)
             
             # Force garbage collection after processing large audio files
             gc.collect()
             
             return transcript
-            
+        
         except Exception as e:
             logger.error(f"[{correlation_id}] Transcription error: {e}", exc_info=True)
             return None
-            
-        finally:
-            # Cleanup in finally block
-            for file_path in temp_files_to_clean:
-                try:
-                    if file_path and file_path.exists():
-                        file_path.unlink()
-                        logger.debug(f"[{correlation_id}] Cleaned up: {file_path.name}")
-                except Exception as e:
-                    logger.debug(f"[{correlation_id}] Cleanup error: {e}")
-            
-            # Remove from tracked temp files
-            for file_path in temp_files_to_clean:
-                self.temp_files.discard(str(file_path))
     
-    async def download_audio_simple(self, episode: Episode, url: str, correlation_id: str) -> Optional[Path]:
+    def release_audio(self, audio_file: Optional[Path], correlation_id: str = ""):
+        """Delete a downloaded audio file once it is no longer needed"""
+        if not audio_file:
+            return
+        try:
+            if audio_file.exists():
+                audio_file.unlink()
+                logger.debug(f"[{correlation_id}] Cleaned up: {audio_file.name}")
+        except Exception as e:
+            logger.debug(f"[{correlation_id}] Cleanup error: {e}")
+        self.temp_files.discard(str(audio_file))
+    
+    def audio_pointer(self, audio_file: Path) -> str:
+        """Where acquired audio can be found again after a restart: its blob, else the file itself"""
+        return str(self.blob_store.blob_for(audio_file) or audio_file)
+    
+    def restore_audio(self, episode: Episode, pointer: Optional[str], transcription_mode: str = None,
+                      correlation_id: str = "") -> Optional[Path]:
+        """Audio acquired by an earlier run, ready for transcribe_audio() (None if it's gone)"""
+        source = Path(pointer) if pointer else None
+        if not source or not source.exists():
+            return None
+        mode = 'test' if transcription_mode == 'test' else 'full'
+        audio_file = AUDIO_DIR / generate_audio_filename(episode, mode)
+        if source != audio_file:
+            self.blob_store.link(source, audio_file)
+        self.temp_files.add(str(audio_file))
+        logger.info(f"[{correlation_id}] 📦 Reusing audio from the interrupted run ({source.name})")
+        return audio_file
+    
+    async def download_audio_simple(self, episode: Episode, url: str, correlation_id: str,
+                                    transcription_mode: str = None) -> Optional[Path]:
         """Simple audio download without retry logic - for use with DownloadManager"""
         logger.info(f"[{correlation_id}] 📥 Downloading audio from: {url[:80]}...")
         
         # Create safe filename
         # Generate standardized filename
-        mode = 'test' if self._current_mode == 'test' else 'full'
+        mode = self._resolve_mode(transcription_mode)
         filename = generate_audio_filename(episode, mode)
         audio_file = AUDIO_DIR / filename
         
         # Check if already exists and is valid
         if audio_file.exists():
             if validate_audio_file_smart(audio_file, correlation_id, url):
-                file_hash = calculate_file_hash(audio_file)
-                logger.info(f"[{correlation_id}] ✅ Using cached audio file (hash: {file_hash[:8]}...)")
+                logger.info(f"[{correlation_id}] ✅ Using cached audio file")
                 return audio_file
             else:
                 logger.warning(f"[{correlation_id}] Cached file invalid, re-downloading")
@@ -326,21 +378,44 @@ class AudioTranscriber:
                     except Exception:
                         pass
     
-    async def _download_audio_with_fallbacks(self, episode: Episode, correlation_id: str) -> Optional[Path]:
+    async def _download_audio_cached(self, episode: Episode, correlation_id: str, mode: str) -> Optional[Path]:
+        """Download audio, reusing and feeding the content-addressed blob store"""
+        audio_file = AUDIO_DIR / generate_audio_filename(episode, mode)
+        
+        fingerprint = None
+        if not audio_file.exists() and episode.audio_url and episode.audio_url.startswith(('http://', 'https://')):
+            fingerprint = await self.blob_store.fingerprint(episode.audio_url)
+            blob = self.blob_store.find(fingerprint)
+            if blob:
+                # Test mode trims its clip from the full audio at transcription time
+                logger.info(f"[{correlation_id}] 📦 Reusing stored audio blob {blob.stem[:12]}")
+                self.blob_store.link(blob, audio_file)
+                self.temp_files.add(str(audio_file))
+                return audio_file
+        
+        audio_file = await self._download_audio_with_fallbacks(episode, correlation_id, mode)
+        
+        # Test-mode downloads may be partial (Range) - only full downloads become blobs
+        if audio_file and fingerprint and mode == 'full':
+            try:
+                await asyncio.to_thread(self.blob_store.ingest, audio_file, fingerprint)
+            except Exception as e:
+                logger.warning(f"[{correlation_id}] Could not store audio blob: {e}")
+        return audio_file
+    
+    async def _download_audio_with_fallbacks(self, episode: Episode, correlation_id: str, mode: str) -> Optional[Path]:
         """Download audio with multiple fallback strategies and exponential backoff"""
         logger.info(f"[{correlation_id}] 📥 Downloading audio file...")
         
         # Create safe filename
         # Generate standardized filename
-        mode = 'test' if self._current_mode == 'test' else 'full'
         filename = generate_audio_filename(episode, mode)
         audio_file = AUDIO_DIR / filename
         
         # Check if already exists and is valid
         if audio_file.exists():
             if validate_audio_file_smart(audio_file, correlation_id, episode.audio_url):
-                file_hash = calculate_file_hash(audio_file)
-                logger.info(f"[{correlation_id}] ✅ Using cached audio file (hash: {file_hash[:8]}...)")
+                logger.info(f"[{correlation_id}] ✅ Using cached audio file")
                 return audio_file
             else:
                 logger.warning(f"[{correlation_id}] Cached file invalid, re-downloading")
@@ -385,6 +460,18 @@ class AudioTranscriber:
             except Exception as e:
                 logger.debug(f"[{correlation_id}] Redirect resolution failed: {e}")
             
+            # Test mode only transcribes the opening minutes - try fetching just that byte range
+            if (mode == 'test' and PARTIAL_DOWNLOAD_ENABLED and
+                    self.range_strategy.can_handle(audio_url, episode.podcast)):
+                success, error = await self.range_strategy.download(
+                    audio_url, audio_file,
+                    {'podcast': episode.podcast, 'title': episode.title, 'max_seconds': MAX_TRANSCRIPTION_MINUTES * 60}
+                )
+                if success and validate_audio_file_smart(audio_file, correlation_id, audio_url):
+                    logger.info(f"[{correlation_id}] ✅ Partial download successful from source {source_idx + 1}")
+                    return audio_file
+                logger.debug(f"[{correlation_id}] Partial download unavailable ({error}), downloading full file")
+            
             # Use PlatformAudioDownloader for initial attempt
             try:
                 from .audio_downloader import PlatformAudioDownloader
@@ -503,55 +590,35 @@ class AudioTranscriber:
                 if total_size > 0:
                     logger.info(f"[{correlation_id}] 📦 Download size: {total_size / 1024 / 1024:.1f} MB")
                 
-                # Download with progress and validation
-                async with aiofiles.open(temp_file, 'wb') as file:
-                    downloaded = 0
+                # Download with progress; the sink sniffs, hashes and sizes each chunk as it's written
+                async with DownloadSink(temp_file, total_size, correlation_id=correlation_id) as sink:
                     last_progress = 0
-                    validation_errors = 0
-                    first_chunk_validated = False
                     
                     async for chunk in response.content.iter_chunked(self.chunk_size):
-                        await file.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        # Validate first chunk
-                        if not first_chunk_validated and downloaded >= 16:
-                            await file.flush()
-                            if not await self._validate_first_chunk(temp_file, correlation_id):
-                                logger.error(f"[{correlation_id}] First chunk validation failed")
-                                return False
-                            first_chunk_validated = True
-                        
-                        # Periodic validation every 1MB
-                        if downloaded % self.validation_interval == 0:
-                            await file.flush()
-                            # Quick size check
-                            if temp_file.stat().st_size != downloaded:
-                                validation_errors += 1
-                                logger.warning(f"[{correlation_id}] Size mismatch at {downloaded} bytes")
-                                if validation_errors > 3:
-                                    logger.error(f"[{correlation_id}] Too many validation errors")
-                                    return False
+                        await sink.awrite(chunk)
                         
                         # Show progress
                         if total_size > 0:
-                            progress = int((downloaded / total_size) * 100)
+                            progress = int((sink.size / total_size) * 100)
                             if progress >= last_progress + 10:
                                 logger.info(f"[{correlation_id}]    Progress: {progress}%")
                                 last_progress = progress
                 
                 # Final validation
-                if not await self._validate_download_complete(temp_file, downloaded, total_size, correlation_id):
+                if not sink.validate():
                     return False
                 
                 # Move to final location
-                shutil.move(str(temp_file), str(output_file))
+                sink.commit(output_file)
                 self.temp_files.discard(str(temp_file))
                 
                 logger.info(f"[{correlation_id}] ✅ Download complete: {output_file.name}")
                 logger.info(f"[{correlation_id}] 📊 Audio file size: {output_file.stat().st_size / 1024 / 1024:.1f} MB")
                 return True
                 
+        except DownloadRejected as e:
+            logger.error(f"[{correlation_id}] {e}")
+            return False
         except asyncio.TimeoutError:
             logger.error(f"[{correlation_id}] Download timeout")
             return False
@@ -608,38 +675,25 @@ class AudioTranscriber:
                 if total_size > 0:
                     logger.info(f"[{correlation_id}] 📦 Download size: {total_size / 1024 / 1024:.1f} MB")
                 
-                with open(temp_file, 'wb') as f:
-                    downloaded = 0
+                with DownloadSink(temp_file, total_size, correlation_id=correlation_id) as sink:
                     last_progress = 0
-                    first_chunk_validated = False
                     
                     for chunk in response.iter_content(chunk_size=self.chunk_size):
                         if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # Validate first chunk
-                            if not first_chunk_validated and downloaded >= 16:
-                                f.flush()
-                                # Run async validation in sync context
-                                if not self._validate_first_chunk_sync(temp_file, correlation_id):
-                                    logger.error(f"[{correlation_id}] First chunk validation failed")
-                                    return False
-                                first_chunk_validated = True
+                            sink.write(chunk)
                             
                             if total_size > 0:
-                                progress = int((downloaded / total_size) * 100)
+                                progress = int((sink.size / total_size) * 100)
                                 if progress >= last_progress + 10:
                                     logger.info(f"[{correlation_id}]    Progress: {progress}%")
                                     last_progress = progress
                 
                 # Final validation
-                if downloaded < 100 * 1024:  # Less than 100KB
-                    logger.error(f"[{correlation_id}] Downloaded file too small: {downloaded} bytes")
+                if not sink.validate():
                     return False
                 
                 # Move to final location
-                shutil.move(str(temp_file), str(output_file))
+                sink.commit(output_file)
                 
                 logger.info(f"[{correlation_id}] ✅ Download complete: {output_file.name}")
                 return True
@@ -649,6 +703,9 @@ class AudioTranscriber:
                 self.temp_files.discard(str(temp_file))
             return result
             
+        except DownloadRejected as e:
+            logger.error(f"[{correlation_id}] {e}")
+            return False
         except Exception as e:
             logger.debug(f"[{correlation_id}] requests download error: {e}")
             return False
@@ -661,85 +718,6 @@ class AudioTranscriber:
                 except:
                     pass
     
-    async def _validate_first_chunk(self, file_path: Path, correlation_id: str) -> bool:
-        """Validate the first chunk of downloaded file"""
-        try:
-            with open(file_path, 'rb') as f:
-                header = f.read(16)
-                
-                # Check for HTML
-                if header.lower().startswith(b'<!doctype') or header.lower().startswith(b'<html'):
-                    logger.error(f"[{correlation_id}] File starts with HTML")
-                    return False
-                
-                # Check for audio signatures
-                audio_signatures = [
-                    b'ID3', b'\xFF\xFB', b'\xFF\xF3', b'\xFF\xF2',
-                    b'OggS', b'RIFF', b'fLaC'
-                ]
-                
-                # Check at offset 4 for MP4
-                if len(header) >= 8 and header[4:8] == b'ftyp':
-                    return True
-                
-                # Check standard signatures
-                for sig in audio_signatures:
-                    if header.startswith(sig):
-                        return True
-                
-                logger.warning(f"[{correlation_id}] No audio signature found in first chunk")
-                return False
-                
-        except Exception as e:
-            logger.error(f"[{correlation_id}] First chunk validation error: {e}")
-            return False
-    
-    def _validate_first_chunk_sync(self, file_path: Path, correlation_id: str) -> bool:
-        """Synchronous version of first chunk validation"""
-        try:
-            with open(file_path, 'rb') as f:
-                header = f.read(16)
-                
-                if header.lower().startswith(b'<!doctype') or header.lower().startswith(b'<html'):
-                    return False
-                
-                audio_signatures = [
-                    b'ID3', b'\xFF\xFB', b'\xFF\xF3', b'\xFF\xF2',
-                    b'OggS', b'RIFF', b'fLaC'
-                ]
-                
-                if len(header) >= 8 and header[4:8] == b'ftyp':
-                    return True
-                
-                for sig in audio_signatures:
-                    if header.startswith(sig):
-                        return True
-                
-                return False
-                
-        except:
-            return False
-    
-    async def _validate_download_complete(self, file_path: Path, downloaded: int, expected_size: int, correlation_id: str) -> bool:
-        """Validate completed download"""
-        actual_size = file_path.stat().st_size
-        
-        # Check size
-        if actual_size != downloaded:
-            logger.error(f"[{correlation_id}] Size mismatch: expected {downloaded}, got {actual_size}")
-            return False
-        
-        if expected_size > 0 and abs(actual_size - expected_size) > 1024:  # Allow 1KB difference
-            logger.warning(f"[{correlation_id}] Size differs from Content-Length: {actual_size} vs {expected_size}")
-            # Don't fail, some servers report wrong Content-Length
-        
-        # Minimum size check
-        if actual_size < 100 * 1024:  # 100KB minimum
-            logger.error(f"[{correlation_id}] File too small: {actual_size} bytes")
-            return False
-        
-        return True
-    
     async def _download_substack_audio(self, url: str, output_file: Path, episode: Episode, correlation_id: str) -> bool:
         """Special handling for Substack audio downloads"""
         logger.info(f"[{correlation_id}] 🔧 Using Substack-specific download method...")
@@ -1047,7 +1025,7 @@ class AudioTranscriber:
             logger.debug(f"[{correlation_id}] ffprobe error: {e}")
             return True  # Don't fail on ffprobe errors
     
-    async def _transcribe_with_whisper(self, audio_file: Path, correlation_id: str) -> Optional[str]:
+    async def _transcribe_with_whisper(self, audio_file: Path, correlation_id: str, mode: str = 'full') -> Optional[str]:
         """Transcribe audio using OpenAI Whisper API with enhanced error handling and rate limiting"""
         logger.info(f"[{correlation_id}] 🎤 Starting transcription with Whisper...")
         
@@ -1057,12 +1035,13 @@ class AudioTranscriber:
         try:
             # Handle test mode truncation (only if audio is not already trimmed)
             # Only trim if explicitly in test mode, regardless of global TESTING_MODE
-            if self._current_mode == 'test':
+            if mode == 'test':
                 # First check if the audio is already short enough (might be pre-trimmed by download manager)
                 try:
-                    from pydub import AudioSegment
-                    temp_audio = AudioSegment.from_file(str(audio_file))
-                    current_duration_seconds = len(temp_audio) / 1000
+                    audio_info = await asyncio.to_thread(probe_audio, audio_file)
+                    if not audio_info:
+                        raise ValueError("unreadable audio headers")
+                    current_duration_seconds = audio_info.duration
                     max_duration_seconds = MAX_TRANSCRIPTION_MINUTES * 60
                     
                     if current_duration_seconds > max_duration_seconds:
@@ -1074,11 +1053,6 @@ class AudioTranscriber:
                     else:
                         logger.info(f"[{correlation_id}] 🧪 TEST MODE: Audio already short enough ({current_duration_seconds:.1f}s), no trimming needed")
                     
-                    # Clean up temp audio
-                    del temp_audio
-                    import gc
-                    gc.collect()
-                    
                 except Exception as e:
                     logger.warning(f"[{correlation_id}] Failed to check audio duration, proceeding with trim: {e}")
                     # Fall back to the original behavior
@@ -1090,7 +1064,7 @@ class AudioTranscriber:
             
             # Check if we need to use chunking for large files
             file_size = audio_file.stat().st_size
-            if file_size > 25 * 1024 * 1024 and self._current_mode == 'full':
+            if file_size > 25 * 1024 * 1024 and mode == 'full':
                 # For full episodes, use chunking instead of compression
                 logger.info(f"[{correlation_id}] 📚 File too large ({file_size / 1024 / 1024:.1f} MB), using chunked transcription...")
                 return await self._transcribe_with_chunks(audio_file, correlation_id)
@@ -1110,44 +1084,13 @@ class AudioTranscriber:
                 logger.info(f"[{correlation_id}] 🧪 DRY RUN: Skipping OpenAI transcription API call")
                 return "This is a dry-run transcript. In normal operation, this would contain the actual transcript from the audio file."
             
-            # Wait for rate limiter before making API call
-            wait_time = await whisper_rate_limiter.acquire(correlation_id)
-            if wait_time > 0:
-                logger.info(f"[{correlation_id}] Whisper rate limiting: waiting {wait_time:.1f}s before API call")
-                await asyncio.sleep(wait_time)
-            
             # Log current rate limiter usage
             usage = whisper_rate_limiter.get_current_usage()
             logger.info(f"[{correlation_id}] Whisper API rate limit usage: {usage['current_requests']}/{usage['max_requests']} ({usage['utilization']:.1f}%)")
             
             # Define the transcription function for retry and circuit breaker
             async def transcribe():
-                with open(audio_file, 'rb') as f:
-                    # Run in executor to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    
-                    def api_call():
-                        try:
-                            return openai_client.audio.transcriptions.create(
-                                model="whisper-1",
-                                file=f,
-                                response_format="text",
-                                language="en"  # Assuming English, adjust if needed
-                            )
-                        except Exception as e:
-                            # Wrap the exception to preserve response information
-                            if hasattr(e, 'response'):
-                                raise e
-                            else:
-                                # Create a wrapper exception that includes the error message
-                                class APIError(Exception):
-                                    def __init__(self, message):
-                                        super().__init__(message)
-                                        self.response = None
-                                
-                                raise APIError(str(e))
-                    
-                    return await loop.run_in_executor(None, api_call)
+                return await self._whisper_request(audio_file, correlation_id)
             
             # Try transcription with circuit breaker and enhanced retry logic
             try:
@@ -1182,7 +1125,7 @@ class AudioTranscriber:
                         files_to_clean.append(converted_file)
                         # Retry with converted file
                         audio_file = converted_file
-                        return await self._transcribe_with_whisper(audio_file, correlation_id)
+                        return await self._transcribe_with_whisper(audio_file, correlation_id, mode)
                 
                 elif "file size" in error_msg.lower():
                     logger.error(f"[{correlation_id}] File size issue after compression")
@@ -1389,108 +1332,233 @@ class AudioTranscriber:
         return None
     
     async def _transcribe_with_chunks(self, audio_file: Path, correlation_id: str) -> Optional[str]:
-        """Transcribe large audio files by splitting into chunks under 25MB"""
+        """Transcribe large audio files by splitting into chunks under 25MB
+        
+        Chunk boundaries are placed at silences near the upload limit (see
+        chunking.plan_chunks), so words aren't cut mid-utterance; where no
+        silence is close enough, neighbouring chunks overlap by a few seconds
+        and the repeated words are removed when stitching. Chunks are handed
+        to a small worker pool as soon as each one is extracted, so extraction
+        and transcription overlap. If any chunk still fails after its retries
+        the whole transcription fails rather than returning a transcript with
+        a hole in it.
+        """
+        producer = None
+        workers = []
         try:
             logger.info(f"[{correlation_id}] 🔪 Starting chunked transcription...")
             
-            # Calculate chunk duration based on file size and bitrate
-            file_size_mb = audio_file.stat().st_size / (1024 * 1024)
-            
             # Get audio duration using ffprobe
             duration_seconds = await self._get_audio_duration(audio_file, correlation_id)
             if not duration_seconds:
                 logger.error(f"[{correlation_id}] Failed to get audio duration")
                 return None
             
-            # Calculate optimal chunk size (aim for ~20MB chunks with some buffer)
-            target_chunk_mb = 20
-            num_chunks = max(2, int(file_size_mb / target_chunk_mb) + 1)
-            chunk_duration = duration_seconds / num_chunks
+            # Chunks are re-encoded at a fixed bitrate, so fill each one up to the size limit
+            silences = await self._detect_silences(audio_file, correlation_id)
+            spans = plan_chunks(
+                duration_seconds, silences, max_chunk_seconds(),
+                overlap=TRANSCRIPTION_CHUNK_OVERLAP_SECONDS,
+                search_seconds=TRANSCRIPTION_SILENCE_SEARCH_SECONDS
+            )
+            num_chunks = len(spans)
+            hard_cuts = sum(1 for span in spans if span.overlap)
             
-            logger.info(f"[{correlation_id}] Splitting {duration_seconds/60:.1f} min audio into {num_chunks} chunks of ~{chunk_duration/60:.1f} min each")
+            logger.info(f"[{correlation_id}] Splitting {duration_seconds/60:.1f} min audio into {num_chunks} chunks of up to "
+                        f"{max(span.duration for span in spans)/60:.1f} min ({num_chunks - 1 - hard_cuts} cut at silence, {hard_cuts} overlapped)")
             
-            # Split audio into chunks
-            chunks = []
-            for i in range(num_chunks):
-                start_time = i * chunk_duration
-                chunk_file = await self._extract_audio_chunk(audio_file, start_time, chunk_duration, i, correlation_id)
-                if chunk_file:
-                    chunks.append(chunk_file)
-                else:
-                    logger.error(f"[{correlation_id}] Failed to create chunk {i+1}/{num_chunks}")
+            queue: asyncio.Queue = asyncio.Queue()
+            results = {}
+            failed = asyncio.Event()
+            
+            producer = asyncio.create_task(
+                self._produce_audio_chunks(audio_file, spans, queue, correlation_id)
+            )
+            workers = [
+                asyncio.create_task(self._chunk_worker(queue, results, failed, correlation_id))
+                for _ in range(min(TRANSCRIPTION_CHUNK_CONCURRENCY, num_chunks))
+            ]
             
-            if not chunks:
-                logger.error(f"[{correlation_id}] No chunks created successfully")
+            produced = await producer
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+            
+            if produced is None:
+                logger.error(f"[{correlation_id}] Chunk extraction failed")
                 return None
             
-            # Transcribe each chunk
-            transcripts = []
-            for i, chunk_file in enumerate(chunks):
-                try:
-                    logger.info(f"[{correlation_id}] 📝 Transcribing chunk {i+1}/{len(chunks)}...")
-                    
-                    # Use the regular transcription method for each chunk
-                    transcript = await self._transcribe_single_file(chunk_file, correlation_id)
-                    
-                    if transcript:
-                        transcripts.append(transcript)
-                        logger.info(f"[{correlation_id}] ✅ Chunk {i+1} transcribed: {len(transcript)} characters")
-                    else:
-                        logger.error(f"[{correlation_id}] ❌ Failed to transcribe chunk {i+1}")
-                    
-                finally:
-                    # Clean up chunk file immediately after transcription
-                    try:
-                        chunk_file.unlink()
-                        self.temp_files.discard(str(chunk_file))
-                    except Exception as e:
-                        logger.debug(f"[{correlation_id}] Error cleaning up chunk: {e}")
-            
-            # Combine all transcripts
-            if transcripts:
-                full_transcript = " ".join(transcripts)
-                logger.info(f"[{correlation_id}] ✅ Combined {len(transcripts)} chunks into {len(full_transcript)} characters")
-                return full_transcript
-            else:
-                logger.error(f"[{correlation_id}] No chunks were successfully transcribed")
+            missing = [i + 1 for i in range(produced) if not results.get(i)]
+            if failed.is_set() or missing:
+                logger.error(f"[{correlation_id}] ❌ Chunks {missing} could not be transcribed - not returning a partial transcript")
                 return None
+            
+            # Combine all transcripts in order, dropping words heard twice across overlaps
+            full_transcript = stitch_transcripts(
+                [results[i] for i in range(produced)],
+                [span.overlap > 0 for span in spans]
+            )
+            logger.info(f"[{correlation_id}] ✅ Combined {produced} chunks into {len(full_transcript)} characters")
+            return full_transcript
                 
         except Exception as e:
             logger.error(f"[{correlation_id}] Chunked transcription error: {e}", exc_info=True)
             return None
+        finally:
+            for task in [producer, *workers]:
+                if task and not task.done():
+                    task.cancel()
     
-    async def _get_audio_duration(self, audio_file: Path, correlation_id: str) -> Optional[float]:
-        """Get audio duration in seconds using ffprobe"""
+    async def _detect_silences(self, audio_file: Path, correlation_id: str) -> List[Tuple[float, float]]:
+        """Find silent stretches with ffmpeg silencedetect (none without ffmpeg)"""
+        if not self.ffmpeg_available:
+            return []
+        
+        cmd = [
+            'ffmpeg', '-hide_banner', '-nostats', '-i', str(audio_file),
+            '-vn', '-af', f'silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}',
+            '-f', 'null', '-'
+        ]
+        
         try:
-            import shutil
-            if not shutil.which('ffprobe'):
-                # Fallback: estimate based on file size (assume 128kbps)
-                file_size_bits = audio_file.stat().st_size * 8
-                estimated_seconds = file_size_bits / (128 * 1000)
-                logger.warning(f"[{correlation_id}] ffprobe not available, estimating duration: {estimated_seconds/60:.1f} min")
-                return estimated_seconds
-            
-            cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', 
-                   '-of', 'default=noprint_wrappers=1:nokey=1', str(audio_file)]
-            
             process = await asyncio.create_subprocess_exec(
                 *cmd,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
                 stderr=asyncio.subprocess.PIPE
             )
+            _, stderr = await process.communicate()
+        except Exception as e:
+            logger.warning(f"[{correlation_id}] Silence detection error: {e}")
+            return []
+        
+        if process.returncode != 0:
+            logger.warning(f"[{correlation_id}] Silence detection failed, using fixed chunk boundaries")
+            return []
+        
+        silences = parse_silencedetect(stderr.decode(errors='replace'))
+        logger.info(f"[{correlation_id}] Found {len(silences)} silences for chunk boundaries")
+        return silences
+    
+    async def _produce_audio_chunks(self, audio_file: Path, spans: List[ChunkSpan],
+                                    queue: asyncio.Queue, correlation_id: str) -> Optional[int]:
+        """Feed (index, chunk_file) items to the queue as chunks are written
+        
+        Returns the number of chunks produced, or None if extraction failed.
+        """
+        if not self.ffmpeg_available or len(spans) == 1 or any(span.overlap for span in spans):
+            # Overlapping chunks (or pydub) need one extraction per chunk
+            for i, span in enumerate(spans):
+                chunk_file = await self._extract_audio_chunk(audio_file, span.start, span.duration, i, correlation_id)
+                if not chunk_file:
+                    logger.error(f"[{correlation_id}] Failed to create chunk {i+1}/{len(spans)}")
+                    return None
+                await queue.put((i, chunk_file))
+            return len(spans)
+        
+        base_name = generate_temp_filename(f"chunks_{audio_file.stem}_{correlation_id}", suffix="")
+        cmd = [
+            'ffmpeg', '-v', 'error', '-i', str(audio_file),
+            '-map', '0:a:0',
+            '-acodec', 'libmp3lame',
+            '-b:a', '128k',  # Consistent bitrate for predictable file sizes
+            '-f', 'segment',
+            '-segment_times', ",".join(f"{span.start:.3f}" for span in spans[1:]),
+            '-reset_timestamps', '1',
+            '-segment_list', 'pipe:1',  # Each finished segment's name is printed as it closes
+            '-segment_list_type', 'flat',
+            '-y',
+            str(TEMP_DIR / f"{base_name}_%03d.mp3")
+        ]
+        
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        
+        produced = 0
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                chunk_file = TEMP_DIR / Path(line.decode().strip()).name
+                self.temp_files.add(str(chunk_file))
+                chunk_size_mb = chunk_file.stat().st_size / (1024 * 1024)
+                logger.info(f"[{correlation_id}] ✅ Created chunk {produced+1}: {chunk_size_mb:.1f} MB")
+                await queue.put((produced, chunk_file))
+                produced += 1
             
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                duration = float(stdout.decode().strip())
-                return duration
-            else:
-                logger.error(f"[{correlation_id}] ffprobe error: {stderr.decode()}")
-                return None
+            stderr = await process.stderr.read()
+            await process.wait()
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        
+        if process.returncode != 0 or not produced:
+            logger.error(f"[{correlation_id}] ffmpeg segmenting failed: {stderr.decode()}")
+            return None
+        return produced
+    
+    async def _chunk_worker(self, queue: asyncio.Queue, results: dict, failed: asyncio.Event, correlation_id: str):
+        """Transcribe chunks from the queue until the None sentinel arrives"""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            
+            index, chunk_file = item
+            try:
+                if failed.is_set():
+                    continue  # Transcript is already incomplete - don't spend API calls
                 
-        except Exception as e:
+                transcript = await self._transcribe_chunk_with_retry(chunk_file, index, correlation_id)
+                if transcript:
+                    results[index] = transcript
+                else:
+                    failed.set()
+            finally:
+                # Clean up chunk file immediately after transcription
+                try:
+                    chunk_file.unlink()
+                    self.temp_files.discard(str(chunk_file))
+                except Exception as e:
+                    logger.debug(f"[{correlation_id}] Error cleaning up chunk: {e}")
+    
+    async def _transcribe_chunk_with_retry(self, chunk_file: Path, index: int, correlation_id: str) -> Optional[str]:
+        """Transcribe one chunk, retrying the whole call if it comes back empty"""
+        for attempt in range(1 + TRANSCRIPTION_CHUNK_RETRIES):
+            logger.info(f"[{correlation_id}] 📝 Transcribing chunk {index+1}"
+                        f"{f' (retry {attempt})' if attempt else ''}...")
+            
+            transcript = await self._transcribe_single_file(chunk_file, correlation_id)
+            if transcript:
+                logger.info(f"[{correlation_id}] ✅ Chunk {index+1} transcribed: {len(transcript)} characters")
+                return transcript
+            
+            if attempt < TRANSCRIPTION_CHUNK_RETRIES:
+                delay = exponential_backoff_with_jitter(attempt, base_delay=5.0, max_delay=60.0)
+                logger.warning(f"[{correlation_id}] ⚠️ Chunk {index+1} failed, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        
+        logger.error(f"[{correlation_id}] ❌ Failed to transcribe chunk {index+1} after {1 + TRANSCRIPTION_CHUNK_RETRIES} attempts")
+        return None
+    
+    async def _get_audio_duration(self, audio_file: Path, correlation_id: str) -> Optional[float]:
+        """Get audio duration in seconds from the file headers"""
+        audio_info = await asyncio.to_thread(probe_audio, audio_file)
+        if audio_info:
+            return audio_info.duration
+        
+        # Fallback: estimate based on file size (assume 128kbps)
+        try:
+            estimated_seconds = audio_file.stat().st_size * 8 / (128 * 1000)
+        except OSError as e:
             logger.error(f"[{correlation_id}] Duration detection error: {e}")
             return None
+        logger.warning(f"[{correlation_id}] Could not read audio headers, estimating duration: {estimated_seconds/60:.1f} min")
+        return estimated_seconds
     
     async def _extract_audio_chunk(self, audio_file: Path, start_time: float, duration: float, chunk_index: int, correlation_id: str) -> Optional[Path]:
         """Extract a chunk of audio using ffmpeg"""
@@ -1544,6 +1612,21 @@ class AudioTranscriber:
             logger.error(f"[{correlation_id}] Chunk extraction error: {e}")
             return None
     
+    async def _whisper_request(self, audio_file: Path, correlation_id: Optional[str] = None) -> str:
+        """One Whisper API request on the shared async client (cancellable, per-call timeout)"""
+        audio_bytes = await asyncio.to_thread(audio_file.read_bytes)
+        # Each attempt (including retries) takes its own rate limiter slot
+        async with whisper_rate_limiter.slot(correlation_id=correlation_id):
+            raw = await get_async_openai_client().audio.transcriptions.with_raw_response.create(
+                model="whisper-1",
+                file=(audio_file.name, audio_bytes),
+                response_format="text",
+                language="en",  # Assuming English, adjust if needed
+                timeout=OPENAI_TRANSCRIPTION_TIMEOUT
+            )
+            whisper_rate_limiter.update_from_headers(raw.headers)
+            return raw.parse()
+    
     async def _transcribe_single_file(self, audio_file: Path, correlation_id: str) -> Optional[str]:
         """Transcribe a single audio file (used for chunks)"""
         try:
@@ -1551,36 +1634,9 @@ class AudioTranscriber:
             if os.getenv('DRY_RUN') == 'true':
                 return "Dry-run chunk transcript"
             
-            # Wait for rate limiter
-            wait_time = await whisper_rate_limiter.acquire(correlation_id)
-            if wait_time > 0:
-                logger.info(f"[{correlation_id}] Whisper rate limiting: waiting {wait_time:.1f}s before API call")
-                await asyncio.sleep(wait_time)
-            
             # Define the transcription function
             async def transcribe():
-                with open(audio_file, 'rb') as f:
-                    loop = asyncio.get_event_loop()
-                    
-                    def api_call():
-                        try:
-                            return openai_client.audio.transcriptions.create(
-                                model="whisper-1",
-                                file=f,
-                                response_format="text",
-                                language="en"
-                            )
-                        except Exception as e:
-                            if hasattr(e, 'response'):
-                                raise e
-                            else:
-                                class APIError(Exception):
-                                    def __init__(self, message):
-                                        super().__init__(message)
-                                        self.response = None
-                                raise APIError(str(e))
-                    
-                    return await loop.run_in_executor(None, api_call)
+                return await self._whisper_request(audio_file, correlation_id)
             
             # Try transcription with retry
             transcript = await retry_with_backoff(
@@ -5962,7 +5962,8 @@ class EpisodeSelector:
                             audio_path = await transcriber.download_audio_simple(
                                 episode,
                                 url,
-                                f"manual-{episode.title[:20]}"
+                                f"manual-{episode.title[:20]}",
+                                transcription_mode='test'
                             )
                         
                         if audio_path and audio_path.exists():
@@ -0,0 +1,239 @@
+"""Adaptive (AIMD) concurrency limits
+
+Concurrency used to be fixed at startup from one free-memory reading and
+a few hard-coded guesses, and a resource monitor logged warnings nobody
+acted on. AdaptiveLimit is a semaphore whose size can change while tasks
+wait on it. AdaptiveConcurrencyController resizes a set of them every few
+seconds the way TCP sizes its window: one more slot while a limit is
+saturated and every signal is healthy, half as many on trouble.
+
+Trouble means low free memory, or too little room for another task at the
+measured RSS per task (memory-heavy limits); p95 latency far above the
+best p95 seen (any limit); or 429 responses reported by retry_with_backoff
+and CircuitBreaker (API limits). Each change is logged with its reason
+and kept in ``decisions`` for tuning.
+"""
+
+import math
+import time
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+from ..config import (
+    ADAPTIVE_INTERVAL_SECONDS, ADAPTIVE_MIN_FREE_MB, ADAPTIVE_LATENCY_FACTOR
+)
+from .helpers import (
+    get_available_memory, get_process_rss, add_rate_limit_listener, remove_rate_limit_listener
+)
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_SAMPLES = 50
+MIN_LATENCY_SAMPLES = 5
+DECREASE_FACTOR = 0.5
+COOLDOWN_STEPS = 3  # Steps after a decrease before the limit may grow again
+
+
+class AdaptiveLimit:
+    """Concurrency limit that can be resized while callers wait on it
+
+    Not tied to an event loop, so module-level limits survive across loops.
+    """
+
+    def __init__(self, limit: int, minimum: int = 1, maximum: Optional[int] = None, name: str = ""):
+        self.minimum = max(1, minimum)
+        self.maximum = max(maximum or limit, self.minimum)
+        self.name = name
+        self.in_use = 0
+        self._limit = self._clamp(limit)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def saturated(self) -> bool:
+        """Every slot is busy and callers are queued for one"""
+        return self.in_use >= self._limit and bool(self._waiters)
+
+    def _clamp(self, limit: int) -> int:
+        return min(max(int(limit), self.minimum), self.maximum)
+
+    def set_limit(self, limit: int) -> int:
+        """Resize (within minimum..maximum); returns the limit actually set
+
+        Shrinking never interrupts running tasks - new ones just wait until
+        enough of them finish.
+        """
+        self._limit = self._clamp(limit)
+        self._wake()
+        return self._limit
+
+    async def acquire(self):
+        while self.in_use >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()  # Pass the wakeup on to the next waiter
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_use += 1
+
+    def release(self):
+        self.in_use -= 1
+        self._wake()
+
+    def _wake(self):
+        free = self._limit - self.in_use
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+        return False
+
+
+@dataclass
+class _Tracked:
+    limit: AdaptiveLimit
+    memory_heavy: bool
+    uses_api: bool
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+    best_p95: Optional[float] = None
+    cooldown: int = 0
+
+
+def p95(samples) -> float:
+    """95th percentile (nearest rank)"""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(len(ordered) * 0.95) - 1, 0)]
+
+
+class AdaptiveConcurrencyController:
+    """Additive-increase / multiplicative-decrease control of AdaptiveLimits
+
+    Use as an async context manager around the work it governs (or call
+    start() and stop()): it subscribes to rate-limit reports and runs
+    step() every interval.
+    """
+
+    def __init__(self, interval: float = ADAPTIVE_INTERVAL_SECONDS, min_free_mb: float = ADAPTIVE_MIN_FREE_MB,
+                 latency_factor: float = ADAPTIVE_LATENCY_FACTOR, correlation_id: str = ""):
+        self.interval = interval
+        self.min_free_mb = min_free_mb
+        self.latency_factor = latency_factor
+        self.cid = correlation_id
+        self.decisions: Deque[Tuple[float, str, int, int, str]] = deque(maxlen=200)
+        self._tracked: Dict[str, _Tracked] = {}
+        self._rate_limits = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, limit: AdaptiveLimit, memory_heavy: bool = False, uses_api: bool = False):
+        """Put a limit under control; memory_heavy limits watch memory, uses_api ones watch 429s"""
+        self._tracked[name] = _Tracked(limit, memory_heavy, uses_api)
+
+    def record_latency(self, name: str, seconds: float):
+        tracked = self._tracked.get(name)
+        if tracked:
+            tracked.latencies.append(seconds)
+
+    def report_rate_limit(self, source: str = ""):
+        self._rate_limits += 1
+
+    def step(self, free_mb: Optional[float] = None, rss_mb: Optional[float] = None) -> List[Tuple[str, int, int, str]]:
+        """One control decision per limit; returns (name, old, new, reason) for each change"""
+        free_mb = get_available_memory() if free_mb is None else free_mb
+        rss_mb = get_process_rss() if rss_mb is None else rss_mb
+        heavy_in_use = sum(t.limit.in_use for t in self._tracked.values() if t.memory_heavy)
+        rss_per_task = rss_mb / heavy_in_use if rss_mb and heavy_in_use else None
+        rate_limited, self._rate_limits = self._rate_limits, 0
+
+        changes = []
+        for name, tracked in self._tracked.items():
+            limit = tracked.limit
+            old = limit.limit
+            latency = p95(tracked.latencies) if len(tracked.latencies) >= MIN_LATENCY_SAMPLES else None
+
+            reason = None
+            if tracked.memory_heavy and free_mb < self.min_free_mb:
+                reason = f"free memory {free_mb:.0f}MB < {self.min_free_mb:.0f}MB"
+            elif tracked.uses_api and rate_limited:
+                reason = f"{rate_limited} rate-limit responses"
+            elif latency and tracked.best_p95 and latency > tracked.best_p95 * self.latency_factor:
+                reason = f"p95 {latency:.1f}s vs best {tracked.best_p95:.1f}s"
+
+            if reason:
+                new = limit.set_limit(math.floor(old * DECREASE_FACTOR))
+                tracked.cooldown = COOLDOWN_STEPS
+                tracked.latencies.clear()  # Judge the new limit on fresh samples
+            else:
+                if latency:
+                    tracked.best_p95 = min(tracked.best_p95 or latency, latency)
+                if tracked.cooldown:
+                    tracked.cooldown -= 1
+                    continue
+                if not limit.saturated:
+                    continue  # No demand for more
+                if tracked.memory_heavy and rss_per_task and free_mb - rss_per_task < self.min_free_mb:
+                    continue  # Another task at the measured RSS wouldn't fit
+                reason = f"saturated, {free_mb:.0f}MB free"
+                if tracked.memory_heavy and rss_per_task:
+                    reason += f", {rss_per_task:.0f}MB RSS per task"
+                new = limit.set_limit(old + 1)
+
+            if new != old:
+                changes.append((name, old, new, reason))
+                self.decisions.append((time.time(), name, old, new, reason))
+                logger.info(f"[{self.cid}] 🎚️  {name} concurrency {old} → {new} ({reason})")
+        return changes
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.step()
+            except Exception as e:
+                logger.debug(f"[{self.cid}] Adaptive concurrency step failed: {e}")
+
+    def start(self):
+        """Subscribe to rate-limit reports and start stepping every interval"""
+        add_rate_limit_listener(self.report_rate_limit)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        remove_rate_limit_listener(self.report_rate_limit)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+        return False
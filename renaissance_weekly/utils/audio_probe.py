@@ -0,0 +1,227 @@
+"""Read audio duration and format from file headers without decoding
+
+Decoding a whole episode with pydub just to call len() on it costs hundreds
+of MB for long episodes. probe_audio answers the same question from the
+container headers: mutagen first, then ffprobe, then a scan of the MP3
+frame headers.
+"""
+
+import json
+import shutil
+import struct
+import subprocess
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class AudioInfo:
+    """Header metadata for an audio file"""
+    duration: float  # seconds
+    bitrate: Optional[int] = None  # bits per second
+    codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    source: str = ""  # which prober answered
+
+
+def probe_audio(path: Union[str, Path]) -> Optional[AudioInfo]:
+    """Return duration, bitrate, codec and sample rate for an audio file
+
+    Results are cached per (path, size, mtime), so repeated checks on the
+    same download are free and a re-downloaded file is probed again.
+    Returns None if no prober could read the file.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return _probe_cached(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _probe_cached(path: str, size: int, mtime_ns: int) -> Optional[AudioInfo]:
+    for prober in (_probe_mutagen, _probe_ffprobe, _probe_mp3_frames):
+        try:
+            info = prober(path)
+        except Exception as e:
+            logger.debug(f"{prober.__name__} failed for {path}: {e}")
+            continue
+        if info and info.duration > 0:
+            return info
+    return None
+
+
+def _probe_mutagen(path: str) -> Optional[AudioInfo]:
+    from mutagen import File
+
+    audio = File(path)
+    if not audio or not audio.info or not getattr(audio.info, 'length', None):
+        return None
+    info = audio.info
+    return AudioInfo(
+        duration=float(info.length),
+        bitrate=getattr(info, 'bitrate', None) or None,
+        codec=getattr(info, 'codec', None) or type(audio).__name__.lower(),
+        sample_rate=getattr(info, 'sample_rate', None) or None,
+        source='mutagen'
+    )
+
+
+def _probe_ffprobe(path: str) -> Optional[AudioInfo]:
+    if not shutil.which('ffprobe'):
+        return None
+
+    cmd = [
+        'ffprobe', '-v', 'error', '-select_streams', 'a:0',
+        '-show_entries', 'format=duration,bit_rate:stream=codec_name,sample_rate,bit_rate',
+        '-of', 'json', path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        return None
+
+    data = json.loads(result.stdout)
+    fmt = data.get('format', {})
+    stream = (data.get('streams') or [{}])[0]
+    if not fmt.get('duration'):
+        return None
+    bitrate = stream.get('bit_rate') or fmt.get('bit_rate')
+    return AudioInfo(
+        duration=float(fmt['duration']),
+        bitrate=int(bitrate) if bitrate else None,
+        codec=stream.get('codec_name'),
+        sample_rate=int(stream['sample_rate']) if stream.get('sample_rate') else None,
+        source='ffprobe'
+    )
+
+
+# MPEG audio Layer III header tables, indexed by the header's bit fields
+_MP3_BITRATES_V1 = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+_MP3_BITRATES_V2 = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+_SCAN_BYTES = 256 * 1024
+
+
+def _parse_mp3_header(header: bytes) -> Optional[dict]:
+    """Decode a 4-byte MPEG Layer III frame header, or None if it isn't one"""
+    b1, b2, b3 = header[1], header[2], header[3]
+    if header[0] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 0x03  # 3 = MPEG1, 2 = MPEG2, 0 = MPEG2.5
+    layer = (b1 >> 1) & 0x03  # 1 = Layer III
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x03
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = (_MP3_BITRATES_V1 if mpeg1 else _MP3_BITRATES_V2)[bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 0x01
+    return {
+        'bitrate': bitrate,
+        'sample_rate': sample_rate,
+        'samples': 1152 if mpeg1 else 576,
+        'length': (144 if mpeg1 else 72) * bitrate // sample_rate + padding,
+        'side_info': (32 if b3 >> 6 != 3 else 17) if mpeg1 else (17 if b3 >> 6 != 3 else 9),
+    }
+
+
+def id3v2_size(head: bytes) -> int:
+    """Bytes taken by a leading ID3v2 tag, or 0 if there isn't one"""
+    if head[:3] != b'ID3' or len(head) < 10:
+        return 0
+    # Size is a 28-bit syncsafe integer, plus a footer if flagged
+    size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+    return 10 + size + (10 if head[5] & 0x10 else 0)
+
+
+def _find_mp3_frame(data: bytes) -> Optional[Tuple[int, dict]]:
+    """Offset and header of the first MP3 frame in data"""
+    offset = 0
+    while offset + 4 <= len(data):
+        offset = data.find(b'\xff', offset)
+        if offset < 0 or offset + 4 > len(data):
+            return None
+        frame = _parse_mp3_header(data[offset:offset + 4])
+        # Require a second frame right after the first so stray 0xFF bytes don't match
+        following = offset + frame['length'] if frame else 0
+        if frame and (following + 4 > len(data) or _parse_mp3_header(data[following:following + 4])):
+            return offset, frame
+        offset += 1
+    return None
+
+
+def _vbr_header(data: bytes, offset: int, frame: dict) -> Tuple[Optional[int], Optional[int]]:
+    """(frames, bytes) from a Xing/Info or VBRI header in the first frame, if present"""
+    xing = offset + 4 + frame['side_info']
+    if data[xing:xing + 4] in (b'Xing', b'Info'):
+        flags = struct.unpack('>I', data[xing + 4:xing + 8])[0]
+        pos = xing + 8
+        frames = size = None
+        if flags & 0x01:
+            frames = struct.unpack('>I', data[pos:pos + 4])[0]
+            pos += 4
+        if flags & 0x02:
+            size = struct.unpack('>I', data[pos:pos + 4])[0]
+        return frames, size
+    if data[offset + 36:offset + 40] == b'VBRI':
+        size, frames = struct.unpack('>II', data[offset + 46:offset + 54])
+        return frames, size
+    return None, None
+
+
+def mp3_bitrate(data: bytes) -> Optional[int]:
+    """Average bitrate (bits/s) of an MP3 stream from its first few KB
+
+    data should start after any ID3v2 tag. Uses the VBR header's frame and
+    byte counts when present, else the first frame's bitrate.
+    """
+    found = _find_mp3_frame(data)
+    if not found:
+        return None
+    offset, frame = found
+    frames, size = _vbr_header(data, offset, frame)
+    if frames and size:
+        return int(size * 8 / (frames * frame['samples'] / frame['sample_rate']))
+    return frame['bitrate']
+
+
+def _probe_mp3_frames(path: str) -> Optional[AudioInfo]:
+    """Duration from the first MP3 frame: Xing/Info/VBRI frame count, else CBR size math"""
+    file_size = Path(path).stat().st_size
+    with open(path, 'rb') as f:
+        start = id3v2_size(f.read(10))
+        f.seek(start)
+        data = f.read(_SCAN_BYTES)
+        f.seek(max(0, file_size - 128))
+        has_id3v1 = file_size >= 128 and f.read(3) == b'TAG'
+
+    found = _find_mp3_frame(data)
+    if not found:
+        return None
+    offset, frame = found
+    frames, _ = _vbr_header(data, offset, frame)
+
+    if frames:
+        duration = frames * frame['samples'] / frame['sample_rate']
+        bitrate = int((file_size - start - offset) * 8 / duration) if duration else frame['bitrate']
+    else:
+        audio_bytes = file_size - start - offset - (128 if has_id3v1 else 0)
+        duration = audio_bytes * 8 / frame['bitrate']
+        bitrate = frame['bitrate']
+
+    return AudioInfo(
+        duration=duration,
+        bitrate=bitrate,
+        codec='mp3',
+        sample_rate=frame['sample_rate'],
+        source='mp3_frames'
+    )
@@ -1,21 +1,73 @@
 """API clients initialization"""
 
 import os
-from openai import OpenAI
+import asyncio
+import weakref
+from typing import Dict
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
 from sendgrid import SendGridAPIClient
 from dotenv import load_dotenv
-from .helpers import RateLimiter
+from .helpers import AsyncRateLimiter
+from .adaptive import AdaptiveLimit
 from .logging import get_logger
+from ..config import (
+    OPENAI_HTTP2, OPENAI_TRANSCRIPTION_TIMEOUT,
+    OPENAI_CHAT_RPM, OPENAI_CHAT_TPM, OPENAI_WHISPER_RPM,
+    OPENAI_MAX_IN_FLIGHT, ADAPTIVE_MAX_SCALE
+)
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
 
 load_dotenv()
 logger = get_logger(__name__)
 
+# Chat completions in flight; resized at runtime by the adaptive concurrency controller
+openai_call_limit = AdaptiveLimit(
+    OPENAI_MAX_IN_FLIGHT,
+    maximum=int(OPENAI_MAX_IN_FLIGHT * ADAPTIVE_MAX_SCALE),
+    name="openai_calls"
+)
+
 # Global rate limiters for OpenAI APIs
-# Chat API: 50 requests per minute with 10% buffer = 45 effective
-openai_rate_limiter = RateLimiter(max_requests_per_minute=50, buffer_percentage=0.1)
+# Chat API: requests and tokens per minute with a 10% buffer
+openai_rate_limiter = AsyncRateLimiter(
+    max_requests_per_minute=OPENAI_CHAT_RPM,
+    max_tokens_per_minute=OPENAI_CHAT_TPM,
+    buffer_percentage=0.1,
+    name="OpenAI chat",
+    concurrency=openai_call_limit
+)
+
+# OpenAI quotas are per model, so other chat models (e.g. the section-notes model)
+# get limiters of their own; their limits are learned from their own response headers
+_model_rate_limiters: Dict[str, AsyncRateLimiter] = {}
+
+
+def chat_rate_limiter(model: str) -> AsyncRateLimiter:
+    """Rate limiter for a chat model other than the main one (openai_rate_limiter)"""
+    limiter = _model_rate_limiters.get(model)
+    if limiter is None:
+        limiter = AsyncRateLimiter(
+            max_requests_per_minute=OPENAI_CHAT_RPM,
+            max_tokens_per_minute=OPENAI_CHAT_TPM,
+            buffer_percentage=0.1,
+            name=f"OpenAI chat ({model})",
+            concurrency=openai_call_limit
+        )
+        _model_rate_limiters[model] = limiter
+    return limiter
 
-# Whisper API: 3 requests per minute (no buffer needed due to low limit)
-whisper_rate_limiter = RateLimiter(max_requests_per_minute=3, buffer_percentage=0.0)
+
+# Whisper API: requests only (no buffer needed due to low limit)
+whisper_rate_limiter = AsyncRateLimiter(
+    max_requests_per_minute=OPENAI_WHISPER_RPM,
+    buffer_percentage=0.0,
+    name="Whisper"
+)
 
 # Initialize clients with improved settings
 openai_client = OpenAI(
@@ -25,7 +77,40 @@ openai_client = OpenAI(
 )
 
 # Log rate limiter initialization
-logger.info("OpenAI client initialized with global rate limiter (45 req/min effective)")
+logger.info(f"OpenAI client initialized with global rate limiter ({openai_rate_limiter.max_rpm} req/min effective)")
+
+# Async clients for the pipeline, one per event loop - an httpx connection pool
+# can't be shared across loops. The synchronous client above stays for the CLI.
+_async_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """AsyncOpenAI client with a pooled keep-alive transport for the running loop
+    
+    Requests run on the event loop instead of executor threads, so cancelling
+    the awaiting task aborts the HTTP request. Pass timeout= per call to
+    override the default.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is None or client.is_closed():
+        http2 = OPENAI_HTTP2 and H2_AVAILABLE
+        client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            timeout=OPENAI_TRANSCRIPTION_TIMEOUT,
+            max_retries=0,  # retry_with_backoff and CircuitBreaker handle retries
+            http_client=DefaultAsyncHttpxClient(http2=http2, timeout=OPENAI_TRANSCRIPTION_TIMEOUT)
+        )
+        _async_openai_clients[loop] = client
+        logger.debug(f"Async OpenAI client created ({'HTTP/2' if http2 else 'HTTP/1.1'} keep-alive pool)")
+    return client
+
+
+async def close_async_openai_client():
+    """Close the running loop's async client and its connections"""
+    client = _async_openai_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
 
 sendgrid_api_key = os.getenv("SENDGRID_API_KEY")
 if not sendgrid_api_key:
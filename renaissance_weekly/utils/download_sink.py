@@ -0,0 +1,219 @@
+"""Streaming download writer that validates and hashes as bytes arrive
+
+Downloads used to be written to disk, then read back for the magic bytes,
+sampled again by validate_audio_file_comprehensive, and read a third time
+to hash them for the blob store. DownloadSink does all of that on the
+chunks in flight: the header is sniffed from the first in-memory buffer,
+SHA-256 is updated incrementally, and the size and trailing bytes are
+tracked as they are written. A file committed through the sink is
+remembered (by path, size and mtime) so later validation and hashing can
+skip re-reading it.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import aiofiles
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+HEADER_BYTES = 16
+TAIL_BYTES = 1024
+MIN_AUDIO_BYTES = 100 * 1024
+MAX_AUDIO_BYTES = 500 * 1024 * 1024
+MAX_VERIFIED = 512
+
+# (signature, offset, format) - same set validate_audio_file_comprehensive accepts
+AUDIO_SIGNATURES = [
+    (b'ID3', 0, 'mp3'),
+    (b'\xFF\xFB', 0, 'mp3'),
+    (b'\xFF\xF3', 0, 'mp3'),
+    (b'\xFF\xF2', 0, 'mp3'),
+    (b'\xFF\xFA', 0, 'mp3'),
+    (b'\xFF\xE3', 0, 'mp3'),
+    (b'ftyp', 4, 'mp4'),
+    (b'OggS', 0, 'ogg'),
+    (b'RIFF', 0, 'wav'),
+    (b'fLaC', 0, 'flac'),
+    (b'MAC ', 0, 'ape'),
+    (b'wvpk', 0, 'wavpack'),
+]
+
+
+class DownloadRejected(Exception):
+    """Raised mid-stream once the bytes are clearly not audio"""
+    pass
+
+
+def looks_like_html(data: bytes) -> bool:
+    """True for error pages served in place of audio"""
+    start = data.lstrip()[:9].lower()
+    return start.startswith((b'<!doctype', b'<html', b'<?xml'))
+
+
+def sniff_audio(header: bytes) -> Optional[str]:
+    """Audio format named by the leading magic bytes, or None"""
+    for sig, offset, fmt in AUDIO_SIGNATURES:
+        if header[offset:offset + len(sig)] == sig:
+            return fmt
+    return None
+
+
+_verified: "OrderedDict[str, tuple]" = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _file_key(path: Path):
+    stat = path.stat()
+    return str(path.resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def record_verified(path: Union[str, Path], sha256: str):
+    """Remember that this exact file was validated and hashed while streaming"""
+    name, size, mtime_ns = _file_key(Path(path))
+    with _verified_lock:
+        _verified[name] = (size, mtime_ns, sha256)
+        _verified.move_to_end(name)
+        while len(_verified) > MAX_VERIFIED:
+            _verified.popitem(last=False)
+
+
+def verified_sha256(path: Union[str, Path]) -> Optional[str]:
+    """SHA-256 recorded by a DownloadSink, if the file hasn't changed since"""
+    try:
+        name, size, mtime_ns = _file_key(Path(path))
+    except OSError:
+        return None
+    with _verified_lock:
+        entry = _verified.get(name)
+    if entry and entry[:2] == (size, mtime_ns):
+        return entry[2]
+    return None
+
+
+class DownloadSink:
+    """Write a download to disk while sniffing, hashing and sizing it
+
+    Use as a context manager - ``with`` for blocking writers (requests),
+    ``async with`` for aiohttp - and call write()/awrite() per chunk.
+    A chunk that shows the stream is HTML, or (unless lenient) carries no
+    audio signature, raises DownloadRejected before more is downloaded.
+    """
+
+    def __init__(self, path: Union[str, Path], expected_size: int = 0, lenient: bool = False,
+                 min_size: int = MIN_AUDIO_BYTES, correlation_id: str = ""):
+        self.path = Path(path)
+        self.expected_size = expected_size
+        self.lenient = lenient
+        self.min_size = min_size
+        self.cid = correlation_id
+        self.size = 0
+        self.format: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._head = b''
+        self._sniffed = False
+        self._tail = bytearray()
+        self._file = None
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    @property
+    def tail(self) -> bytes:
+        return bytes(self._tail)
+
+    def __enter__(self):
+        self._file = open(self.path, 'wb')
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+        return False
+
+    async def __aenter__(self):
+        self._file = await aiofiles.open(self.path, 'wb')
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._file.close()
+        return False
+
+    def write(self, chunk: bytes):
+        self._observe(chunk)
+        self._file.write(chunk)
+
+    async def awrite(self, chunk: bytes):
+        self._observe(chunk)
+        await self._file.write(chunk)
+
+    def _observe(self, chunk: bytes):
+        """Update hash, size and tail; sniff the header once enough has arrived"""
+        if not self._sniffed:
+            self._head += chunk[:HEADER_BYTES - len(self._head)]
+            if len(self._head) >= HEADER_BYTES:
+                self._sniff()
+
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        self._tail += chunk[-TAIL_BYTES:]
+        del self._tail[:-TAIL_BYTES]
+
+    def _sniff(self):
+        self._sniffed = True
+        if looks_like_html(self._head):
+            raise DownloadRejected("Stream starts with HTML, not audio")
+        self.format = sniff_audio(self._head)
+        if self.format:
+            return
+        if not self.lenient:
+            raise DownloadRejected("No audio signature in first chunk")
+        try:
+            self._head.decode('ascii')
+            raise DownloadRejected("Stream is text, not binary audio")
+        except UnicodeDecodeError:
+            pass  # Binary without a known signature - let the caller's checks decide
+
+    def validate(self) -> bool:
+        """Final checks on what was written, without reading the file back"""
+        cid = self.cid
+        if not self._sniffed and self._head:
+            try:
+                self._sniff()
+            except DownloadRejected as e:
+                logger.error(f"[{cid}] {e}")
+                return False
+
+        if self.size < self.min_size:
+            logger.error(f"[{cid}] Downloaded file too small: {self.size} bytes")
+            return False
+
+        if self.expected_size > 0 and abs(self.size - self.expected_size) > 1024:  # Allow 1KB difference
+            logger.warning(f"[{cid}] Size differs from Content-Length: {self.size} vs {self.expected_size}")
+            # Don't fail, some servers report wrong Content-Length
+
+        tail = self.tail.lower()
+        if b'<html' in tail or b'<!doctype' in tail:
+            logger.error(f"[{cid}] Found HTML content at end of download")
+            return False
+
+        return True
+
+    def commit(self, dest: Optional[Union[str, Path]] = None) -> Path:
+        """Move the finished file to dest (if given) and record its digest
+
+        Only files that pass strict validation are recorded, so lenient
+        downloads still get the full on-disk checks later.
+        """
+        final = Path(dest) if dest else self.path
+        if final != self.path:
+            os.replace(self.path, final)
+        if self.format and MIN_AUDIO_BYTES <= self.size <= MAX_AUDIO_BYTES:
+            record_verified(final, self.sha256)
+        return final
@@ -2,6 +2,7 @@
 
 import hashlib
 import re
+import unicodedata
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -19,24 +20,55 @@ def sanitize_podcast_name(name: str, max_length: int = 20) -> str:
     return sanitized[:max_length]
 
 
+# Patterns like #123, Episode 123, Ep 123, etc. (most specific first)
+EPISODE_NUMBER_PATTERNS = [
+    re.compile(r'#(\d+)'),
+    re.compile(r'episode\s+(\d+)', re.IGNORECASE),
+    re.compile(r'ep\.?\s*(\d+)', re.IGNORECASE),
+    re.compile(r'\b(\d+)\b')  # Any standalone number (last resort)
+]
+
+
+def _match_episode_number(title: str) -> Optional[re.Match]:
+    for pattern in EPISODE_NUMBER_PATTERNS:
+        match = pattern.search(title)
+        if match:
+            return match
+    return None
+
+
 def extract_episode_number(title: str) -> str:
     """Extract episode number from title"""
-    # Look for patterns like #123, Episode 123, Ep 123, etc.
-    patterns = [
-        r'#(\d+)',
-        r'episode\s+(\d+)',
-        r'ep\.?\s*(\d+)',
-        r'\b(\d+)\b'  # Any standalone number (last resort)
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, title, re.IGNORECASE)
-        if match:
-            return f"ep{match.group(1)}"
+    match = _match_episode_number(title)
+    if match:
+        return f"ep{match.group(1)}"
     
     return "ep000"  # Default if no number found
 
 
+def title_fingerprint(title: str) -> str:
+    """Normalized title key for matching the same episode across feeds
+    
+    Casefolds, strips accents and punctuation, and pulls the episode number
+    out into a prefix, so "#818: Tim Ferriss – The Art of Learning" and
+    "Episode 818 | tim ferriss: the art of learning" share a fingerprint.
+    """
+    if not title:
+        return ""
+    
+    text = unicodedata.normalize('NFKD', title)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    
+    number = ""
+    match = _match_episode_number(text)
+    if match:
+        number = str(int(match.group(1)))  # "#007" and "Ep 7" are the same episode
+        text = text[:match.start()] + " " + text[match.end():]
+    
+    words = re.sub(r'[\W_]+', ' ', text.casefold()).split()
+    return f"{number}|{' '.join(words)}"
+
+
 def generate_content_hash(episode: Episode) -> str:
     """Generate consistent hash from episode content"""
     # Use podcast, title, and published date (date only, not time) for consistent hashing
@@ -4,6 +4,7 @@ import os
 import re
 import time
 import random
+import shutil
 import hashlib
 import asyncio
 from typing import List, Optional, Callable, Any, Dict
@@ -11,8 +12,9 @@ from pathlib import Path
 from datetime import datetime
 import uuid
 from collections import deque
-import threading
+from contextlib import asynccontextmanager
 from .logging import get_logger
+from .download_sink import verified_sha256
 
 logger = get_logger(__name__)
 
@@ -108,6 +110,32 @@ def seconds_to_duration(seconds: int) -> str:
         return f"{minutes}m"
 
 
+def duration_to_minutes(duration_str: str) -> Optional[float]:
+    """Minutes in an episode duration ("1:02:03", "45:10", "1h 2m", "1 hour 2 minutes", or seconds)"""
+    text = str(duration_str or '').strip().lower()
+    if not text or text == 'unknown':
+        return None
+    
+    if ':' in text:
+        try:
+            parts = [float(part) for part in text.split(':')]
+        except ValueError:
+            return None
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + part
+        return seconds / 60
+    
+    if text.replace('.', '', 1).isdigit():
+        return float(text) / 60  # Bare numbers are seconds, as in format_duration
+    
+    hours = re.search(r'(\d+)\s*h', text)
+    minutes = re.search(r'(\d+)\s*m', text)
+    if not hours and not minutes:
+        return None
+    return (int(hours.group(1)) if hours else 0) * 60 + (int(minutes.group(1)) if minutes else 0)
+
+
 # New utility functions for robustness improvements
 
 def exponential_backoff_with_jitter(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
@@ -132,68 +160,238 @@ def exponential_backoff_with_jitter(attempt: int, base_delay: float = 1.0, max_d
     return max(0, delay_with_jitter)
 
 
-class RateLimiter:
-    """Rate limiter with sliding window for API calls"""
+def estimate_tokens(text: str) -> int:
+    """Rough token count for rate limiting (~4 characters per token for English)"""
+    return len(text or "") // 4 + 1
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds from an x-ratelimit-reset-* header such as '20ms', '1s' or '6m0s'"""
+    if not value:
+        return None
+    parts = re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value)
+    if not parts:
+        return None
+    scale = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class AsyncRateLimiter:
+    """Sliding-window limiter over requests and tokens per minute for async callers
+    
+    Callers queue on an asyncio lock (FIFO) and the head of the queue reserves
+    its slot before releasing it, so tasks that waited out a full window can't
+    all fire at once. Limits and remaining budget are corrected from the
+    x-ratelimit-* headers OpenAI returns with each response.
+    """
     
-    def __init__(self, max_requests_per_minute: int = 50, buffer_percentage: float = 0.1):
+    def __init__(self, max_requests_per_minute: int = 50, max_tokens_per_minute: Optional[int] = None,
+                 buffer_percentage: float = 0.1, name: str = "OpenAI", concurrency=None):
         """
         Initialize rate limiter.
         
         Args:
-            max_requests_per_minute: Maximum requests allowed per minute
+            max_requests_per_minute: Requests allowed per minute
+            max_tokens_per_minute: Tokens allowed per minute (None for no token budget)
             buffer_percentage: Reserve buffer (0.1 = 10% buffer)
+            name: Label for log messages
+            concurrency: Optional limit on requests in flight (acquire()/release(), e.g. an AdaptiveLimit)
         """
-        self.max_rpm = int(max_requests_per_minute * (1 - buffer_percentage))
+        self.buffer_percentage = buffer_percentage
+        self.max_rpm = max(1, int(max_requests_per_minute * (1 - buffer_percentage)))
+        self.max_tpm = int(max_tokens_per_minute * (1 - buffer_percentage)) if max_tokens_per_minute else None
+        self.name = name
+        self.concurrency = concurrency
         self.window_size = 60  # seconds
-        self.requests = deque()
-        self._lock = threading.Lock()
+        self.requests = deque()  # (timestamp, tokens)
+        self.tokens_in_window = 0
+        self._server_requests = None  # [remaining, reset_at] from response headers
+        self._server_tokens = None
+        self._paused_until = 0.0
+        self._lock = None
+        self._lock_loop = None
         
-        logger.info(f"Rate limiter initialized: {self.max_rpm} requests/minute (with {buffer_percentage*100}% buffer)")
+        tpm = f", {self.max_tpm} tokens/minute" if self.max_tpm else ""
+        logger.info(f"{name} rate limiter initialized: {self.max_rpm} requests/minute{tpm} (with {buffer_percentage*100}% buffer)")
+    
+    def _get_lock(self) -> asyncio.Lock:
+        # asyncio.Lock belongs to one event loop; module-level limiters may outlive a loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
     
-    def _cleanup_old_requests(self):
+    def _cleanup_old_requests(self, now: float):
         """Remove requests older than the window size"""
-        current_time = time.time()
-        cutoff_time = current_time - self.window_size
+        cutoff_time = now - self.window_size
+        while self.requests and self.requests[0][0] < cutoff_time:
+            _, tokens = self.requests.popleft()
+            self.tokens_in_window -= tokens
+    
+    def _wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a request of this size fits every budget"""
+        waits = [self._paused_until - now]
+        
+        if len(self.requests) >= self.max_rpm:
+            waits.append(self.requests[0][0] + self.window_size - now)
+        
+        if self.max_tpm:
+            # An oversized request waits for an empty window rather than forever
+            excess = self.tokens_in_window + min(tokens, self.max_tpm) - self.max_tpm
+            freed = 0
+            for timestamp, used in self.requests:
+                if excess <= 0:
+                    break
+                freed += used
+                if freed >= excess:
+                    waits.append(timestamp + self.window_size - now)
+                    break
         
-        while self.requests and self.requests[0] < cutoff_time:
-            self.requests.popleft()
+        if self._server_requests:
+            remaining, reset_at = self._server_requests
+            if remaining <= 0 and reset_at > now:
+                waits.append(reset_at - now)
+        
+        if self._server_tokens and tokens:
+            remaining, reset_at = self._server_tokens
+            if tokens > remaining and reset_at > now:
+                waits.append(reset_at - now)
+        
+        return max(waits)
     
-    async def acquire(self, correlation_id: Optional[str] = None) -> float:
+    async def acquire(self, tokens: int = 0, correlation_id: Optional[str] = None) -> float:
         """
-        Acquire permission to make a request.
+        Wait for a slot and reserve it.
+        
+        Args:
+            tokens: Estimated tokens the request will use (prompt + max output)
+            correlation_id: Optional correlation ID for logging
         
         Returns:
-            Wait time in seconds (0 if request can proceed immediately)
+            Seconds spent waiting (0 if the request could proceed immediately)
         """
         cid = correlation_id or str(uuid.uuid4())[:8]
+        start = time.monotonic()
         
-        with self._lock:
-            self._cleanup_old_requests()
-            current_time = time.time()
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                self._cleanup_old_requests(now)
+                wait_time = self._wait_time(tokens, now)
+                if wait_time <= 0:
+                    break
+                logger.info(f"[{cid}] {self.name} rate limit reached. Waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time + 0.05)
             
-            if len(self.requests) >= self.max_rpm:
-                # Calculate wait time until oldest request expires
-                oldest_request = self.requests[0]
-                wait_time = (oldest_request + self.window_size) - current_time + 0.1
-                logger.info(f"[{cid}] Rate limit reached. Waiting {wait_time:.1f}s")
-                return wait_time
-            else:
-                # Add current request
-                self.requests.append(current_time)
-                remaining = self.max_rpm - len(self.requests)
-                logger.debug(f"[{cid}] Rate limit: {len(self.requests)}/{self.max_rpm} used, {remaining} remaining")
-                return 0
+            self.requests.append((now, tokens))
+            self.tokens_in_window += tokens
+            if self._server_requests:
+                self._server_requests[0] -= 1
+            if self._server_tokens:
+                self._server_tokens[0] -= tokens
+        
+        logger.debug(f"[{cid}] {self.name} rate limit: {len(self.requests)}/{self.max_rpm} requests, "
+                     f"{self.tokens_in_window} tokens in window")
+        return time.monotonic() - start
+    
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0, correlation_id: Optional[str] = None):
+        """Hold a reserved slot for one request; a 429 inside it pauses the limiter
+        
+        The concurrency slot is taken only once the rate limit allows the
+        request, so callers waiting on the quota don't count as demand for
+        more concurrency.
+        """
+        await self.acquire(tokens, correlation_id)
+        if self.concurrency is not None:
+            await self.concurrency.acquire()
+        try:
+            try:
+                yield self
+            except Exception as e:
+                response = getattr(e, 'response', None)
+                if getattr(e, 'status_code', None) == 429 or "429" in str(e):
+                    headers = getattr(response, 'headers', None) or {}
+                    retry_after = headers.get('retry-after')
+                    try:
+                        delay = float(retry_after) if retry_after else 5.0
+                    except ValueError:
+                        delay = 5.0
+                    self.pause(delay)
+                raise
+        finally:
+            if self.concurrency is not None:
+                self.concurrency.release()
+    
+    def pause(self, seconds: float):
+        """Hold every caller back for the given number of seconds"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"{self.name} rate limiter paused for {seconds:.1f}s")
+    
+    def update_from_headers(self, headers):
+        """Adopt the limits and remaining budget reported in x-ratelimit-* headers"""
+        if not headers:
+            return
+        now = time.monotonic()
+        
+        limit_requests = _header_int(headers, 'x-ratelimit-limit-requests')
+        if limit_requests:
+            self.max_rpm = max(1, int(limit_requests * (1 - self.buffer_percentage)))
+        limit_tokens = _header_int(headers, 'x-ratelimit-limit-tokens')
+        if limit_tokens and self.max_tpm:
+            self.max_tpm = int(limit_tokens * (1 - self.buffer_percentage))
+        
+        remaining = _header_int(headers, 'x-ratelimit-remaining-requests')
+        reset = _parse_reset(headers.get('x-ratelimit-reset-requests'))
+        if remaining is not None and reset is not None:
+            self._server_requests = [remaining, now + reset]
+        remaining = _header_int(headers, 'x-ratelimit-remaining-tokens')
+        reset = _parse_reset(headers.get('x-ratelimit-reset-tokens'))
+        if remaining is not None and reset is not None:
+            self._server_tokens = [remaining, now + reset]
     
     def get_current_usage(self) -> Dict[str, Any]:
         """Get current rate limiter usage statistics"""
-        with self._lock:
-            self._cleanup_old_requests()
-            return {
-                'current_requests': len(self.requests),
-                'max_requests': self.max_rpm,
-                'utilization': len(self.requests) / self.max_rpm * 100,
-                'remaining': max(0, self.max_rpm - len(self.requests))
-            }
+        self._cleanup_old_requests(time.monotonic())
+        return {
+            'current_requests': len(self.requests),
+            'max_requests': self.max_rpm,
+            'utilization': len(self.requests) / self.max_rpm * 100,
+            'remaining': max(0, self.max_rpm - len(self.requests)),
+            'current_tokens': self.tokens_in_window,
+            'max_tokens': self.max_tpm
+        }
+
+
+# Listeners told about every HTTP 429 seen by retry_with_backoff or a CircuitBreaker
+_rate_limit_listeners: List[Callable[[str], None]] = []
+
+
+def add_rate_limit_listener(listener: Callable[[str], None]):
+    """Call listener(source) whenever a rate-limit response is seen"""
+    _rate_limit_listeners.append(listener)
+
+
+def remove_rate_limit_listener(listener: Callable[[str], None]):
+    if listener in _rate_limit_listeners:
+        _rate_limit_listeners.remove(listener)
+
+
+def report_rate_limit(source: str):
+    """Tell listeners (e.g. the adaptive concurrency controller) about a 429"""
+    for listener in list(_rate_limit_listeners):
+        try:
+            listener(source)
+        except Exception as e:
+            logger.debug(f"Rate limit listener failed: {e}")
 
 
 async def retry_with_backoff(
@@ -243,6 +441,9 @@ async def retry_with_backoff(
             last_exception = e
             error_msg = str(e)
             
+            if "429" in error_msg:
+                report_rate_limit(getattr(func, '__name__', 'retry_with_backoff'))
+            
             # Special handling for rate limit errors
             if handle_rate_limit and "429" in error_msg:
                 # Extract retry-after header if available
@@ -431,6 +632,11 @@ def validate_audio_file_smart(file_path: Path, correlation_id: Optional[str] = N
     """
     cid = correlation_id or str(uuid.uuid4())[:8]
     
+    # Checked while it was streamed to disk and unchanged since - no need to read it again
+    if verified_sha256(file_path):
+        logger.debug(f"[{cid}] File validated during download: {file_path.name}")
+        return True
+    
     # First try strict validation
     if validate_audio_file_comprehensive(file_path, cid, lenient=False):
         return True
@@ -503,34 +709,44 @@ class ProgressTracker:
             self.item_start_time = time.time()
             logger.info(f"[{self.correlation_id}] Starting: {item_name} ({self.completed_items + 1}/{self.total_items})")
     
-    async def complete_item(self, success: bool = True):
-        """Mark the completion of an item"""
+    async def complete_item(self, success: bool = True, item_name: Optional[str] = None,
+                            started_at: Optional[float] = None):
+        """
+        Mark the completion of an item.
+
+        Concurrent callers pass item_name and started_at so completions are
+        logged against the right item instead of the shared current_item.
+        """
         async with self._lock:
             if success:
                 self.completed_items += 1
             else:
                 self.failed_items += 1
-            
-            if self.item_start_time:
-                item_duration = time.time() - self.item_start_time
+
+            name = item_name if item_name is not None else self.current_item
+            item_start = started_at if started_at is not None else self.item_start_time
+
+            if item_start:
+                item_duration = time.time() - item_start
                 total_duration = time.time() - self.start_time
-                
+
                 # Calculate ETA
                 items_processed = self.completed_items + self.failed_items
                 if items_processed > 0:
                     avg_time_per_item = total_duration / items_processed
                     remaining_items = self.total_items - items_processed
                     eta_seconds = remaining_items * avg_time_per_item
-                    
+
                     logger.info(
-                        f"[{self.correlation_id}] {'✓' if success else '✗'} {self.current_item} "
+                        f"[{self.correlation_id}] {'✓' if success else '✗'} {name} "
                         f"({item_duration:.1f}s) | Progress: {items_processed}/{self.total_items} "
                         f"| Success rate: {self.completed_items/items_processed*100:.1f}% "
                         f"| ETA: {eta_seconds/60:.1f}m"
                     )
-            
-            self.current_item = None
-            self.item_start_time = None
+
+            if item_name is None:
+                self.current_item = None
+                self.item_start_time = None
     
     def get_summary(self) -> dict:
         """Get progress summary"""
@@ -606,6 +822,7 @@ class CircuitBreaker:
                 # Track rate limit errors separately
                 if "429" in str(e):
                     self.rate_limit_count += 1
+                    report_rate_limit(f"circuit breaker {self.correlation_id}")
                     logger.warning(f"[{self.correlation_id}] Rate limit error {self.rate_limit_count}/{self.rate_limit_threshold}")
                     
                     if self.rate_limit_count >= self.rate_limit_threshold:
@@ -639,6 +856,20 @@ def get_available_memory() -> float:
         return 1024.0  # 1GB
 
 
+def get_free_disk_space(path: Path) -> float:
+    """Free disk space in MB on the filesystem holding path"""
+    return shutil.disk_usage(path).free / 1024 / 1024
+
+
+def get_process_rss() -> Optional[float]:
+    """Resident memory of this process in MB (None if psutil is not available)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+    except ImportError:
+        return None
+
+
 def get_cpu_count() -> int:
     """Get number of CPU cores"""
     try:
@@ -147,10 +147,13 @@ class TestDataCache:
                 if table['sql']:
                     dst_conn.execute(table['sql'])
             
-            # Copy limited episodes (most recent)
+            # Copy limited episodes (most recent) that have a transcript
             episodes = src_conn.execute("""
-                SELECT * FROM episodes 
-                WHERE transcript IS NOT NULL 
+                SELECT * FROM episodes e
+                WHERE EXISTS (
+                    SELECT 1 FROM episode_content c
+                    WHERE c.episode_id = e.id AND c.kind = 'transcript'
+                )
                 ORDER BY published DESC 
                 LIMIT ?
             """, (limit,)).fetchall()
@@ -162,6 +165,17 @@ class TestDataCache:
                 for episode in episodes:
                     values = [episode[col] for col in columns]
                     dst_conn.execute(f"INSERT INTO episodes ({','.join(columns)}) VALUES ({placeholders})", values)
+                    
+                    # Bring the episode's transcripts and summaries along
+                    for content in src_conn.execute(
+                        "SELECT * FROM episode_content WHERE episode_id = ?", (episode['id'],)
+                    ).fetchall():
+                        content_columns = list(content.keys())
+                        dst_conn.execute(
+                            f"INSERT INTO episode_content ({','.join(content_columns)}) "
+                            f"VALUES ({','.join('?' for _ in content_columns)})",
+                            [content[col] for col in content_columns]
+                        )
             
             dst_conn.commit()
             logger.info(f"  Copied {len(episodes)} episodes to test database")
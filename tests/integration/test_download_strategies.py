@@ -19,7 +19,7 @@ class TestSmartDownloadRouter:
     @pytest.fixture
     def router(self, temp_dir):
         """Create router instance"""
-        with patch('renaissance_weekly.config.TEMP_DIR', temp_dir):
+        with patch('renaissance_weekly.download_strategies.smart_router.TEMP_DIR', temp_dir):
             return SmartDownloadRouter()
     
     @pytest.fixture
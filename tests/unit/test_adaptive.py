@@ -0,0 +1,168 @@
+"""Unit tests for adaptive (AIMD) concurrency limits"""
+
+import asyncio
+import pytest
+
+from renaissance_weekly.utils.adaptive import AdaptiveLimit, AdaptiveConcurrencyController
+from renaissance_weekly.utils.helpers import AsyncRateLimiter, retry_with_backoff
+
+
+async def hold(limit, release, running):
+    async with limit:
+        running.append(1)
+        await release.wait()
+
+
+async def saturate(limit, n):
+    """Start n holders and let them settle; returns the event that lets them finish"""
+    release, running = asyncio.Event(), []
+    tasks = [asyncio.create_task(hold(limit, release, running)) for _ in range(n)]
+    await asyncio.sleep(0.01)
+    return release, running, tasks
+
+
+class TestAdaptiveLimit:
+    """Test resizing a limit while callers wait on it"""
+
+    @pytest.mark.unit
+    async def test_grow_wakes_waiters_and_shrink_waits(self):
+        """Growing admits queued callers at once; shrinking lets running ones finish"""
+        limit = AdaptiveLimit(1, maximum=4)
+        release, running, tasks = await saturate(limit, 3)
+        assert len(running) == 1 and limit.saturated
+
+        limit.set_limit(3)
+        await asyncio.sleep(0.01)
+        assert len(running) == 3 and limit.in_use == 3
+
+        assert limit.set_limit(10) == 4
+        assert limit.set_limit(0) == 1
+        assert limit.in_use == 3  # Nothing is interrupted
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert limit.in_use == 0
+
+    @pytest.mark.unit
+    async def test_cancelled_waiter_passes_wakeup_on(self):
+        """A waiter cancelled after being woken doesn't swallow the slot"""
+        limit = AdaptiveLimit(1)
+        release, running, tasks = await saturate(limit, 3)
+
+        limit.release()  # Pretend the holder finished: wakes the first waiter...
+        limit.in_use += 1
+        tasks[1].cancel()  # ...which is cancelled before it runs
+        limit.in_use -= 1
+        await asyncio.sleep(0.01)
+
+        assert len(running) == 2
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TestAdaptiveConcurrencyController:
+    """Test the AIMD decisions"""
+
+    @pytest.mark.unit
+    async def test_additive_increase_when_saturated(self):
+        """A saturated limit grows by one per step; an idle one stays put"""
+        busy, idle = AdaptiveLimit(2, maximum=8), AdaptiveLimit(2, maximum=8)
+        controller = AdaptiveConcurrencyController()
+        controller.register("transcribe", busy, memory_heavy=True)
+        controller.register("persist", idle)
+        release, _, tasks = await saturate(busy, 6)
+
+        changes = controller.step(free_mb=8000, rss_mb=400)
+        await asyncio.sleep(0.01)
+        controller.step(free_mb=8000, rss_mb=600)
+
+        assert changes == [("transcribe", 2, 3, "saturated, 8000MB free, 200MB RSS per task")]
+        assert busy.limit == 4 and idle.limit == 2
+        assert [d[1:4] for d in controller.decisions] == [("transcribe", 2, 3), ("transcribe", 3, 4)]
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.unit
+    async def test_memory_pressure_halves_heavy_limits(self):
+        """Low free memory halves memory-heavy limits only, and blocks growth that wouldn't fit"""
+        heavy, light = AdaptiveLimit(4, maximum=8), AdaptiveLimit(4, maximum=8)
+        controller = AdaptiveConcurrencyController(min_free_mb=500)
+        controller.register("transcribe", heavy, memory_heavy=True)
+        controller.register("summarize", light)
+
+        controller.step(free_mb=300, rss_mb=2000)
+        assert (heavy.limit, light.limit) == (2, 4)
+
+        # Saturated again, but one more 1000MB task would leave less than 500MB free
+        release, _, tasks = await saturate(heavy, 4)
+        for _ in range(4):
+            controller.step(free_mb=1200, rss_mb=2000)
+        assert heavy.limit == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.unit
+    async def test_rate_limits_and_latency_back_off(self):
+        """429s from retry_with_backoff halve API limits; a p95 spike halves that stage"""
+        api, stage = AdaptiveLimit(20, maximum=40), AdaptiveLimit(6, maximum=12)
+        controller = AdaptiveConcurrencyController(latency_factor=3.0)
+        controller.register("openai_calls", api, uses_api=True)
+        controller.register("summarize", stage)
+
+        async def rate_limited():
+            raise Exception("Error code: 429 - Rate limit reached")
+
+        async with controller:
+            with pytest.raises(Exception):
+                await retry_with_backoff(rate_limited, max_attempts=1)
+        controller.step(free_mb=8000)
+        assert api.limit == 10
+
+        for seconds in [1.0] * 10:
+            controller.record_latency("summarize", seconds)
+        controller.step(free_mb=8000)
+        for seconds in [1.0] * 5 + [5.0] * 5:
+            controller.record_latency("summarize", seconds)
+        controller.step(free_mb=8000)
+        assert stage.limit == 3
+        assert "p95 5.0s vs best 1.0s" in controller.decisions[-1][4]
+
+
+class TestRateLimiterConcurrency:
+    """Test the in-flight limit on the chat rate limiter"""
+
+    @pytest.mark.unit
+    async def test_slot_respects_in_flight_limit(self):
+        """Requests beyond the in-flight limit wait for a running one to finish"""
+        limit = AdaptiveLimit(2, maximum=4)
+        limiter = AsyncRateLimiter(max_requests_per_minute=1000, buffer_percentage=0, concurrency=limit)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limit.in_use)
+                await asyncio.sleep(0.02)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2 and limit.in_use == 0
+
+    @pytest.mark.unit
+    async def test_quota_waiters_do_not_saturate(self):
+        """Callers held back by the rate limit don't count as in-flight demand"""
+        limit = AdaptiveLimit(1, maximum=4)
+        limiter = AsyncRateLimiter(max_requests_per_minute=1000, buffer_percentage=0, concurrency=limit)
+        limiter.pause(0.2)
+
+        async def request():
+            async with limiter.slot():
+                pass
+
+        tasks = [asyncio.create_task(request()) for _ in range(3)]
+        await asyncio.sleep(0.05)
+
+        assert limit.in_use == 0 and not limit.saturated
+
+        await asyncio.gather(*tasks)
+        assert limit.in_use == 0
@@ -0,0 +1,88 @@
+"""Unit tests for header-only audio probing"""
+
+import os
+import struct
+import pytest
+
+from renaissance_weekly.utils import audio_probe
+from renaissance_weekly.utils.audio_probe import probe_audio, AudioInfo
+
+# MPEG1 Layer III, 128kbps, 44.1kHz, stereo: 417-byte frames of 1152 samples
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_BYTES = 417
+FRAME_SECONDS = 1152 / 44100
+
+
+def write_mp3(path, frames, id3=True, xing_frames=None):
+    """Write a minimal MP3: optional ID3v2 tag, then empty frames"""
+    first = bytearray(FRAME_HEADER + b"\0" * (FRAME_BYTES - 4))
+    if xing_frames is not None:
+        first[36:48] = b"Xing" + struct.pack(">II", 0x01, xing_frames)
+    body = bytes(first) + (FRAME_HEADER + b"\0" * (FRAME_BYTES - 4)) * (frames - 1)
+    tag = b"ID3\x04\x00\x00\x00\x00\x00\x14" + b"\0" * 20 if id3 else b""
+    path.write_bytes(tag + body)
+    return path
+
+
+class TestMp3FrameScan:
+    """Test the last-resort frame header scan"""
+
+    @pytest.mark.unit
+    def test_cbr_duration(self, temp_dir):
+        """CBR duration is derived from the audio byte count and first-frame bitrate"""
+        path = write_mp3(temp_dir / "cbr.mp3", frames=200)
+        info = audio_probe._probe_mp3_frames(str(path))
+
+        assert info.duration == pytest.approx(200 * FRAME_SECONDS, rel=0.01)
+        assert (info.bitrate, info.sample_rate, info.codec) == (128000, 44100, "mp3")
+
+    @pytest.mark.unit
+    def test_xing_frame_count(self, temp_dir):
+        """A Xing header's frame count wins over the file size"""
+        path = write_mp3(temp_dir / "vbr.mp3", frames=10, xing_frames=5000)
+        info = audio_probe._probe_mp3_frames(str(path))
+
+        assert info.duration == pytest.approx(5000 * FRAME_SECONDS)
+
+    @pytest.mark.unit
+    def test_not_audio(self, temp_dir):
+        """Files without frame headers are rejected"""
+        path = temp_dir / "page.mp3"
+        path.write_bytes(b"<html>" + os.urandom(10000).replace(b"\xff", b"\0"))
+
+        assert audio_probe._probe_mp3_frames(str(path)) is None
+        assert probe_audio(path) is None
+
+
+class TestProbeAudio:
+    """Test prober fallback order and caching"""
+
+    @pytest.mark.unit
+    def test_reads_headers(self, temp_dir):
+        """Duration comes back without decoding the file"""
+        info = probe_audio(write_mp3(temp_dir / "episode.mp3", frames=300))
+
+        assert isinstance(info, AudioInfo)
+        assert info.duration == pytest.approx(300 * FRAME_SECONDS, rel=0.02)
+        assert probe_audio(temp_dir / "missing.mp3") is None
+
+    @pytest.mark.unit
+    def test_cached_per_file_version(self, temp_dir, monkeypatch):
+        """Repeat probes hit the cache; a rewritten file is probed again"""
+        calls = []
+
+        def fake_mutagen(path):
+            calls.append(path)
+            return AudioInfo(duration=60.0 * len(calls), source="mutagen")
+
+        monkeypatch.setattr(audio_probe, "_probe_mutagen", fake_mutagen)
+        audio_probe._probe_cached.cache_clear()
+        path = write_mp3(temp_dir / "episode.mp3", frames=10)
+
+        assert probe_audio(path).duration == 60.0
+        assert probe_audio(path).duration == 60.0
+        assert len(calls) == 1
+
+        write_mp3(path, frames=20)
+        assert probe_audio(path).duration == 120.0
+        audio_probe._probe_cached.cache_clear()
@@ -0,0 +1,117 @@
+"""Unit tests for the content-addressed audio blob store"""
+
+import asyncio
+import time
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from renaissance_weekly.audio_store import AudioBlobStore, AudioFingerprint, hash_file
+
+AUDIO = b"ID3" + b"\x55" * 200000
+
+
+@pytest.fixture
+def store(temp_dir):
+    return AudioBlobStore(root=temp_dir / "blobs", max_bytes=10 * 1024 * 1024)
+
+
+def download(path, body=AUDIO):
+    path.write_bytes(body)
+    return path
+
+
+class TestAudioBlobStore:
+    """Test ingest, lookup and eviction"""
+
+    @pytest.mark.unit
+    def test_ingest_and_find(self, store, temp_dir):
+        """A stored download is found again by URL, ETag and length, from any title or mode"""
+        fingerprint = AudioFingerprint("https://dts.podtrac.com/ep.mp3", "https://cdn.example.com/ep.mp3",
+                                       '"abc"', len(AUDIO))
+        episode_file = download(temp_dir / "20250601_Show_ep1_aaaaaa_full.mp3")
+
+        blob = store.ingest(episode_file, fingerprint)
+
+        assert blob.name == f"{hash_file(blob)}.mp3"
+        assert episode_file.read_bytes() == AUDIO
+        assert episode_file.stat().st_ino == blob.stat().st_ino
+
+        # Tracking redirect with a fresh token still resolves to the same CDN file
+        retitled = AudioFingerprint("https://dts.podtrac.com/ep.mp3?token=2", "https://cdn.example.com/ep.mp3",
+                                    '"abc"', len(AUDIO))
+        assert store.find(retitled) == blob
+
+        # Deleting the episode file after transcription leaves the blob in place
+        episode_file.unlink()
+        assert store.find(fingerprint) == blob
+
+    @pytest.mark.unit
+    def test_changed_audio_misses(self, store, temp_dir):
+        """A new ETag or length at the same URL is treated as different audio"""
+        fingerprint = AudioFingerprint("https://cdn.example.com/ep.mp3", None, '"v1"', len(AUDIO))
+        store.ingest(download(temp_dir / "ep.mp3"), fingerprint)
+
+        assert store.find(fingerprint._replace(etag='"v2"')) is None
+        assert store.find(fingerprint._replace(content_length=1)) is None
+
+    @pytest.mark.unit
+    def test_duplicate_content_stored_once(self, store, temp_dir):
+        """The same bytes from two URLs share one blob"""
+        first = store.ingest(download(temp_dir / "a.mp3"), AudioFingerprint("https://a.example.com/ep.mp3"))
+        second = store.ingest(download(temp_dir / "b.mp3"), AudioFingerprint("https://b.example.com/ep.mp3"))
+
+        assert first == second
+        assert len(list(store.root.glob("*.mp3"))) == 1
+
+    @pytest.mark.unit
+    def test_prune_evicts_least_recently_used(self, temp_dir):
+        """Past max_bytes the least recently used blob goes first"""
+        store = AudioBlobStore(root=temp_dir / "blobs", max_bytes=(len(AUDIO) + 1) * 2)
+        fingerprints = [AudioFingerprint(f"https://example.com/{i}.mp3") for i in range(3)]
+
+        store.ingest(download(temp_dir / "0.mp3", AUDIO + b"0"), fingerprints[0])
+        store.ingest(download(temp_dir / "1.mp3", AUDIO + b"1"), fingerprints[1])
+        store.find(fingerprints[0])
+        store.ingest(download(temp_dir / "2.mp3", AUDIO + b"2"), fingerprints[2])
+
+        assert store.find(fingerprints[0]) is not None
+        assert store.find(fingerprints[1]) is None
+        assert store.find(fingerprints[2]) is not None
+
+    @pytest.mark.unit
+    async def test_fingerprint(self, store):
+        """HEAD supplies the resolved URL, ETag and length; failures fall back to the URL"""
+        async def redirect(request):
+            raise web.HTTPFound("/cdn/ep.mp3")
+
+        async def audio(request):
+            return web.Response(body=AUDIO, headers={"ETag": '"abc"'})
+
+        async def slow(request):
+            await asyncio.sleep(5)
+            return web.Response(body=AUDIO)
+
+        app = web.Application()
+        app.router.add_get("/ep.mp3", redirect)
+        app.router.add_get("/cdn/ep.mp3", audio)
+        app.router.add_get("/slow.mp3", slow)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            url = str(server.make_url("/ep.mp3"))
+            cdn_url = str(server.make_url("/cdn/ep.mp3"))
+            fingerprint = await store.fingerprint(url)
+            missing = await store.fingerprint(str(server.make_url("/missing.mp3")))
+            start = time.monotonic()
+            slow_url = str(server.make_url("/slow.mp3"))
+            slow = await store.fingerprint(slow_url, timeout=0.2)
+            slow_seconds = time.monotonic() - start
+        finally:
+            await server.close()
+
+        assert fingerprint == AudioFingerprint(url, cdn_url, '"abc"', len(AUDIO))
+        assert missing.etag is None and missing.resolved_url is None
+        # A host slow to answer HEAD only costs the (short) timeout
+        assert slow == AudioFingerprint(slow_url) and slow_seconds < 2
@@ -0,0 +1,206 @@
+"""Unit tests for parallel chunked transcription"""
+
+import asyncio
+import shutil
+import subprocess
+import pytest
+
+from renaissance_weekly.transcripts import transcriber as transcriber_module
+from renaissance_weekly.transcripts.chunking import (
+    ChunkSpan, max_chunk_seconds, parse_silencedetect, plan_chunks, stitch_transcripts
+)
+from renaissance_weekly.transcripts.transcriber import AudioTranscriber
+from tests.conftest import create_episode
+
+SILENCEDETECT_OUTPUT = """
+[silencedetect @ 0x5581] silence_start: 1480.2
+[silencedetect @ 0x5581] silence_end: 1481.0 | silence_duration: 0.8
+[silencedetect @ 0x5581] silence_start: 1530.5
+[silencedetect @ 0x5581] silence_end: 1531.5 | silence_duration: 1.0
+size=N/A time=01:00:00.00 bitrate=N/A speed= 412x
+"""
+
+
+@pytest.fixture
+def transcriber(temp_dir, monkeypatch):
+    """Transcriber with a fixed duration and fake chunk extraction"""
+    monkeypatch.setattr(transcriber_module, "TRANSCRIPTION_CHUNK_CONCURRENCY", 3)
+    monkeypatch.setattr(transcriber_module, "TRANSCRIPTION_CHUNK_RETRIES", 1)
+    monkeypatch.setattr(transcriber_module, "exponential_backoff_with_jitter", lambda *a, **k: 0)
+
+    t = AudioTranscriber()
+    t.ffmpeg_available = False
+
+    async def fake_duration(audio_file, correlation_id):
+        return 3600.0
+
+    async def fake_extract(audio_file, start_time, duration, chunk_index, correlation_id):
+        chunk_file = temp_dir / f"chunk_{chunk_index}.mp3"
+        chunk_file.write_bytes(b"audio")
+        return chunk_file
+
+    t._get_audio_duration = fake_duration
+    t._extract_audio_chunk = fake_extract
+    return t
+
+
+@pytest.fixture
+def audio_file(temp_dir):
+    """Sparse stand-in for a one-hour episode"""
+    path = temp_dir / "episode.mp3"
+    with open(path, "wb") as f:
+        f.truncate(50 * 1024 * 1024)
+    return path
+
+
+class TestChunkedTranscription:
+    """Test chunk fan-out, ordering and failure handling"""
+
+    @pytest.mark.unit
+    async def test_chunks_joined_in_order(self, transcriber, audio_file):
+        """Chunks finishing out of order are still joined by chunk index"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_transcribe(chunk_file, correlation_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            index = int(chunk_file.stem.split("_")[1])
+            await asyncio.sleep(0.03 * (3 - index))  # Last chunk finishes first
+            in_flight -= 1
+            return f"part{index}"
+
+        transcriber._transcribe_single_file = fake_transcribe
+        result = await transcriber._transcribe_with_chunks(audio_file, "test")
+
+        assert result == "part0 part1 part2"
+        assert peak == 3
+        assert not list(audio_file.parent.glob("chunk_*.mp3"))
+
+    @pytest.mark.unit
+    async def test_failed_chunk_is_retried(self, transcriber, audio_file):
+        """A chunk that fails once is retried instead of being dropped"""
+        calls = []
+
+        async def flaky_transcribe(chunk_file, correlation_id):
+            calls.append(chunk_file.stem)
+            if chunk_file.stem == "chunk_1" and calls.count("chunk_1") == 1:
+                return None
+            return chunk_file.stem
+
+        transcriber._transcribe_single_file = flaky_transcribe
+        result = await transcriber._transcribe_with_chunks(audio_file, "test")
+
+        assert result == "chunk_0 chunk_1 chunk_2"
+        assert calls.count("chunk_1") == 2
+
+    @pytest.mark.unit
+    async def test_missing_chunk_fails_transcription(self, transcriber, audio_file):
+        """A chunk that never transcribes fails the whole episode instead of leaving a gap"""
+        async def broken_transcribe(chunk_file, correlation_id):
+            return None if chunk_file.stem == "chunk_1" else chunk_file.stem
+
+        transcriber._transcribe_single_file = broken_transcribe
+        assert await transcriber._transcribe_with_chunks(audio_file, "test") is None
+        assert not list(audio_file.parent.glob("chunk_*.mp3"))
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+    async def test_ffmpeg_segments_streamed(self, temp_dir, monkeypatch):
+        """The single-pass ffmpeg segmenter emits every chunk in order"""
+        monkeypatch.setattr(transcriber_module, "TEMP_DIR", temp_dir)
+        source = temp_dir / "tone.mp3"
+        subprocess.run(["ffmpeg", "-v", "error", "-f", "lavfi", "-i", "sine=duration=6",
+                        "-acodec", "libmp3lame", str(source)], check=True)
+
+        t = AudioTranscriber()
+        queue = asyncio.Queue()
+        spans = [ChunkSpan(0.0, 2.0), ChunkSpan(2.0, 4.0), ChunkSpan(4.0, 6.0)]
+        produced = await t._produce_audio_chunks(source, spans, queue, "test")
+
+        assert produced == 3
+        items = [queue.get_nowait() for _ in range(produced)]
+        assert [index for index, _ in items] == [0, 1, 2]
+        assert all(path.exists() for _, path in items)
+
+
+class TestTranscriptionMode:
+    """Test that each episode keeps its own transcription mode"""
+
+    @pytest.mark.unit
+    async def test_concurrent_modes_stay_separate(self, temp_dir):
+        """A full-mode episode never picks up the mode of a test-mode one running alongside it"""
+        t = AudioTranscriber()
+        t.assemblyai_transcriber = None
+        seen = []
+
+        async def fake_download(episode, correlation_id, mode):
+            await asyncio.sleep(0.01)
+            seen.append((episode.title, mode))
+            return temp_dir / f"{episode.title}.mp3"
+
+        async def fake_whisper(audio_file, correlation_id, mode='full'):
+            await asyncio.sleep(0.01)
+            seen.append((audio_file.stem, mode))
+            return None
+
+        t._download_audio_with_fallbacks = fake_download
+        t._transcribe_with_whisper = fake_whisper
+        episodes = {mode: create_episode(title=mode) for mode in ("test", "full")}
+        for episode in episodes.values():
+            episode.audio_url = ""
+
+        await asyncio.gather(*(t._download_audio_cached(episode, "cid", mode) for mode, episode in episodes.items()))
+        await asyncio.gather(*(t.transcribe_audio(episode, temp_dir / f"{mode}.mp3", mode)
+                               for mode, episode in episodes.items()))
+
+        assert sorted(seen) == [("full", "full"), ("full", "full"), ("test", "test"), ("test", "test")]
+
+
+class TestChunkBoundaries:
+    """Test silence-aware chunk planning"""
+
+    @pytest.mark.unit
+    def test_parse_silencedetect(self):
+        """Silence intervals are read from ffmpeg's stderr"""
+        assert parse_silencedetect(SILENCEDETECT_OUTPUT) == [(1480.2, 1481.0), (1530.5, 1531.5)]
+
+    @pytest.mark.unit
+    def test_cut_at_latest_silence_under_limit(self):
+        """Chunks are cut at the last silence that keeps them under the size limit"""
+        spans = plan_chunks(3000.0, parse_silencedetect(SILENCEDETECT_OUTPUT), max_seconds=1550.0)
+
+        assert spans == [ChunkSpan(0.0, 1531.0), ChunkSpan(1531.0, 3000.0)]
+
+    @pytest.mark.unit
+    def test_overlap_without_silence(self):
+        """With no silence nearby the cut is made at the limit and the next chunk overlaps it"""
+        spans = plan_chunks(3000.0, [], max_seconds=1550.0, overlap=2.0)
+
+        assert spans == [ChunkSpan(0.0, 1550.0), ChunkSpan(1548.0, 3000.0, 2.0)]
+        assert all(span.duration <= 1550.0 for span in spans)
+
+    @pytest.mark.unit
+    def test_chunks_fill_upload_limit(self):
+        """A 25MB chunk at 128kbps holds over 25 minutes, so an hour needs three chunks"""
+        assert 25 * 60 < max_chunk_seconds() < 1640
+        assert len(plan_chunks(3600.0, [], max_chunk_seconds())) == 3
+
+
+class TestStitching:
+    """Test de-duplication of overlapped chunk text"""
+
+    @pytest.mark.unit
+    def test_overlap_removed(self):
+        """Words heard in both chunks appear once, including a word garbled by the cut"""
+        parts = ["and that is why the yield curve inverted in twen", "curve inverted in 2022. Next question."]
+
+        assert stitch_transcripts(parts, [False, True]) == "and that is why the yield curve inverted in 2022. Next question."
+
+    @pytest.mark.unit
+    def test_clean_cuts_joined(self):
+        """Chunks cut at silence are simply joined, even if they share phrases"""
+        parts = ["we talked about the yield curve", "the yield curve again"]
+
+        assert stitch_transcripts(parts, [False, False]) == "we talked about the yield curve the yield curve again"
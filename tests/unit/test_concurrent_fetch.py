@@ -0,0 +1,120 @@
+"""Unit tests for concurrent per-podcast episode fetching"""
+
+import asyncio
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from renaissance_weekly import app as app_module
+from renaissance_weekly.app import RenaissanceWeekly, ExceptionAggregator
+from renaissance_weekly.models import Episode
+
+
+def make_app(fetch_episodes):
+    """Build a RenaissanceWeekly without running its __init__ (needs API keys)"""
+    app = RenaissanceWeekly.__new__(RenaissanceWeekly)
+    app.correlation_id = "test"
+    app.current_transcription_mode = 'test'
+    app.db = MagicMock()
+    app.db.get_last_episode_dates.return_value = {}
+    app.selector = None
+    app.exception_aggregator = ExceptionAggregator("test")
+    app.episode_fetcher = MagicMock()
+    app.episode_fetcher.fetch_episodes = fetch_episodes
+    return app
+
+
+class TestConcurrentFetch:
+    """Test _fetch_selected_episodes concurrency and ordering"""
+
+    @pytest.fixture
+    def configs(self, monkeypatch):
+        configs = [
+            {"name": "Alpha", "rss_feeds": ["https://feeds.example.com/a"]},
+            {"name": "Bravo", "rss_feeds": ["https://other.example.net/b"]},
+            {"name": "Charlie", "rss_feeds": ["https://third.example.org/c"]},
+        ]
+        monkeypatch.setattr(app_module, 'PODCAST_CONFIGS', configs)
+        return configs
+
+    @pytest.mark.unit
+    async def test_progress_in_completion_order_output_in_name_order(self, configs):
+        """Slow feeds finish last but results stay alphabetical"""
+        delays = {"Alpha": 0.15, "Bravo": 0.01, "Charlie": 0.05}
+
+        async def fetch_episodes(config, days_back):
+            await asyncio.sleep(delays[config["name"]])
+            return [Episode(podcast=config["name"], title="Ep", published=datetime(2025, 1, 1))]
+
+        app = make_app(fetch_episodes)
+        calls = []
+
+        def progress(name, done, total):
+            calls.append((name, done, total))
+            return True
+
+        start = asyncio.get_running_loop().time()
+        episodes = await app._fetch_selected_episodes(["Charlie", "Alpha", "Bravo"], 7, progress)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [ep.podcast for ep in episodes] == ["Alpha", "Bravo", "Charlie"]
+        assert calls == [("Bravo", 1, 3), ("Charlie", 2, 3), ("Alpha", 3, 3)]
+        # Wall time follows the slowest feed, not the sum of all feeds
+        assert elapsed < sum(delays.values())
+
+    @pytest.mark.unit
+    async def test_per_host_limit(self, configs, monkeypatch):
+        """Feeds on the same host never exceed FEED_FETCH_PER_HOST"""
+        for config in configs:
+            config["rss_feeds"] = ["https://shared.example.com/" + config["name"]]
+        monkeypatch.setattr(app_module, 'FEED_FETCH_PER_HOST', 1)
+
+        in_flight = 0
+        peak = 0
+
+        async def fetch_episodes(config, days_back):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        app = make_app(fetch_episodes)
+        await app._fetch_selected_episodes(["Alpha", "Bravo", "Charlie"], 7, lambda *a: True)
+
+        assert peak == 1
+
+    @pytest.mark.unit
+    async def test_busy_host_does_not_starve_others(self, configs, monkeypatch):
+        """Podcasts waiting on a busy host leave global slots to other hosts"""
+        configs[1]["rss_feeds"] = ["https://feeds.example.com/b", "https://other.example.net/b"]
+        monkeypatch.setattr(app_module, 'FEED_FETCH_CONCURRENCY', 2)
+        monkeypatch.setattr(app_module, 'FEED_FETCH_PER_HOST', 1)
+        started = []
+
+        async def fetch_episodes(config, days_back):
+            started.append(config["name"])
+            await asyncio.sleep(0.05)
+            return []
+
+        app = make_app(fetch_episodes)
+        await app._fetch_selected_episodes(["Alpha", "Bravo", "Charlie"], 7, lambda *a: True)
+
+        # Bravo's first feed shares Alpha's host, so Charlie goes second
+        assert RenaissanceWeekly._feed_host(configs[1]) == "feeds.example.com"
+        assert started == ["Alpha", "Charlie", "Bravo"]
+
+    @pytest.mark.unit
+    async def test_failed_podcast_does_not_stop_others(self, configs):
+        """One failing feed is recorded and the rest still return"""
+        async def fetch_episodes(config, days_back):
+            if config["name"] == "Bravo":
+                raise RuntimeError("feed down")
+            return [Episode(podcast=config["name"], title="Ep", published=datetime(2025, 1, 1))]
+
+        app = make_app(fetch_episodes)
+        episodes = await app._fetch_selected_episodes(["Alpha", "Bravo", "Charlie"], 7, lambda *a: True)
+
+        assert [ep.podcast for ep in episodes] == ["Alpha", "Charlie"]
+        assert app.exception_aggregator.get_summary()['total_errors'] == 1
@@ -0,0 +1,86 @@
+"""Unit tests for compressed transcript/summary storage"""
+
+import pytest
+from datetime import datetime
+
+from renaissance_weekly.content_codec import (
+    encode_content, decode_content, CODEC_RAW, CODEC_ZLIB
+)
+from renaissance_weekly.models import Episode, TranscriptSource
+
+TRANSCRIPT = "Speaker 1: Interest rates and the shape of the yield curve. " * 400
+
+
+class TestContentCodec:
+    """Test the header-byte codec"""
+
+    @pytest.mark.unit
+    def test_zlib_round_trip(self):
+        """Large text is compressed behind a codec header and decodes back"""
+        encoded = encode_content(TRANSCRIPT, codec=CODEC_ZLIB)
+
+        assert isinstance(encoded, bytes)
+        assert encoded[0] == CODEC_ZLIB
+        assert len(encoded) < len(TRANSCRIPT) // 10
+        assert decode_content(encoded) == TRANSCRIPT
+
+    @pytest.mark.unit
+    def test_small_and_disabled_stay_text(self):
+        """Short bodies and the 'none' codec are stored as plain text"""
+        assert encode_content("short summary", codec=CODEC_ZLIB) == "short summary"
+        assert encode_content(TRANSCRIPT, codec=CODEC_RAW) == TRANSCRIPT
+        assert encode_content(None) is None
+
+    @pytest.mark.unit
+    def test_decode_passthrough(self):
+        """Legacy text values and NULLs decode unchanged"""
+        assert decode_content("plain text") == "plain text"
+        assert decode_content(None) is None
+        assert decode_content(bytes([CODEC_RAW]) + "raw".encode()) == "raw"
+
+    @pytest.mark.unit
+    def test_unknown_header(self):
+        """Unknown codec headers fail loudly instead of returning garbage"""
+        with pytest.raises(ValueError):
+            decode_content(b"\x7fpayload")
+
+
+class TestCompressedStorage:
+    """Test transparent compression in PodcastDatabase"""
+
+    @pytest.fixture
+    def episode(self):
+        return Episode(podcast="Macro Podcast", title="Rates", published=datetime(2025, 6, 1), guid="rates-1")
+
+    @pytest.mark.unit
+    def test_transcript_stored_compressed(self, test_db, episode):
+        """Transcripts are written compressed and read back as text"""
+        test_db.save_episode(episode, transcript=TRANSCRIPT, summary="summary",
+                             transcript_source=TranscriptSource.AUDIO_TRANSCRIPTION,
+                             transcription_mode='full')
+
+        with test_db.connection() as conn:
+            rows = dict(conn.execute("SELECT kind, typeof(body) FROM episode_content").fetchall())
+        assert rows == {'transcript': 'blob', 'summary': 'text'}
+
+        transcript, source = test_db.get_transcript(episode, 'full')
+        assert transcript == TRANSCRIPT
+        assert source == TranscriptSource.AUDIO_TRANSCRIPTION
+
+    @pytest.mark.unit
+    def test_compress_existing_content(self, test_db, episode):
+        """The background pass compresses plain-text rows once and leaves them readable"""
+        test_db.save_episode(episode)
+        record = test_db.get_episode(episode.podcast, episode.title, episode.published)
+        with test_db.connection() as conn:
+            conn.execute("""
+                INSERT INTO episode_content (episode_id, mode, kind, body)
+                VALUES (?, 'full', 'transcript', ?)
+            """, (record['id'], TRANSCRIPT))
+
+        assert test_db.compress_existing_content(batch_size=1) == 1
+        assert test_db.compress_existing_content() == 0
+
+        with test_db.connection() as conn:
+            assert conn.execute("SELECT typeof(body) FROM episode_content").fetchone()[0] == 'blob'
+        assert test_db.get_content(record['id'], 'transcript', 'full') == TRANSCRIPT
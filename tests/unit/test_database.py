@@ -282,4 +282,346 @@ class TestPodcastDatabase:
         
         # Verify episodes saved (may have duplicates due to unique constraint)
         all_episodes = test_db.get_episodes_needing_processing(days=30)
-        assert len(all_episodes) > 0
\ No newline at end of file
+        assert len(all_episodes) > 0
+
+class TestEpisodeContent:
+    """Test transcript/summary storage in the episode_content table"""
+    
+    @pytest.mark.unit
+    def test_save_and_get_transcript_by_mode(self, test_db):
+        """Test and full transcripts are stored separately"""
+        episode = create_episode()
+        test_db.save_episode(episode, transcript="test transcript", transcription_mode='test',
+                             transcript_source=TranscriptSource.AUDIO_TRANSCRIPTION)
+        test_db.save_episode(episode, transcript="full transcript", transcription_mode='full',
+                             transcript_source=TranscriptSource.AUDIO_TRANSCRIPTION)
+        
+        assert test_db.get_transcript(episode, 'test')[0] == "test transcript"
+        assert test_db.get_transcript(episode, 'full')[0] == "full transcript"
+        # Without a mode the full transcript wins
+        assert test_db.get_transcript(episode)[0] == "full transcript"
+    
+    @pytest.mark.unit
+    def test_metadata_save_keeps_content(self, test_db):
+        """Re-saving episode metadata doesn't clear stored text"""
+        episode = create_episode()
+        test_db.save_episode(episode, transcript="transcript", summary="summary", transcription_mode='full')
+        test_db.save_episode(episode)
+        
+        data = test_db.get_episode(episode.podcast, episode.title, episode.published)
+        assert data['transcript'] == "transcript"
+        assert data['summary'] == "summary"
+    
+    @pytest.mark.unit
+    def test_listings_skip_transcript_bodies(self, test_db):
+        """Listings report has_* flags and load transcripts only on demand"""
+        episode = create_episode(published=datetime.now(timezone.utc))
+        test_db.save_episode(episode, transcript="x" * 5000, summary="summary",
+                             paragraph_summary="paragraph", transcription_mode='full')
+        
+        recent = test_db.get_recent_episodes(days_back=7)
+        assert len(recent) == 1
+        assert recent[0]['has_transcript'] and not recent[0]['has_transcript_test']
+        assert 'transcript' not in recent[0]
+        
+        light = test_db.get_episode(episode.podcast, episode.title, episode.published,
+                                    include_transcripts=False)
+        assert light['summary'] == "summary"
+        assert 'transcript' not in light
+        assert test_db.get_content(light['id'], 'transcript', 'full') == "x" * 5000
+        
+        summaries = test_db.get_episodes_with_summaries(days_back=7, transcription_mode='full')
+        assert [s['summary'] for s in summaries] == ["summary"]
+    
+    @pytest.mark.unit
+    def test_migrates_inline_columns(self, temp_dir):
+        """Legacy databases have their text columns moved into episode_content"""
+        db_path = temp_dir / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE episodes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, podcast TEXT NOT NULL,
+                    title TEXT NOT NULL, published DATETIME NOT NULL, audio_url TEXT,
+                    transcript_url TEXT, description TEXT, link TEXT, duration TEXT, guid TEXT,
+                    transcript TEXT, transcript_source TEXT, summary TEXT,
+                    transcript_test TEXT, summary_test TEXT, transcription_mode TEXT DEFAULT 'test',
+                    paragraph_summary TEXT, paragraph_summary_test TEXT,
+                    processing_status TEXT DEFAULT 'pending', failure_reason TEXT,
+                    retry_count INTEGER DEFAULT 0, retry_strategy TEXT,
+                    processing_started_at DATETIME, processing_completed_at DATETIME,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(podcast, title, published)
+                )
+            """)
+            conn.execute("""
+                INSERT INTO episodes (podcast, title, published, guid, transcript, summary_test)
+                VALUES ('Legacy', 'Old Episode', '2025-01-01T00:00:00', 'legacy-guid', 'old transcript', 'old summary')
+            """)
+        conn.close()
+        
+        db = PodcastDatabase(db_path)
+        
+        with db.connection() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(episodes)")}
+        assert not columns & {'transcript', 'summary', 'transcript_test', 'summary_test'}
+        
+        episode = Episode(podcast="Legacy", title="Old Episode",
+                          published=datetime(2025, 1, 1), guid="legacy-guid")
+        assert db.get_transcript(episode, 'full')[0] == "old transcript"
+        assert db.get_episode_summary("Legacy", "Old Episode", datetime(2025, 1, 1), 'test') == "old summary"
+
+
+class TestRecreate:
+    """Test the fallback that replaces an unreadable database"""
+    
+    @pytest.mark.unit
+    def test_recreated_database_has_every_table(self, temp_dir):
+        """A database rebuilt after an init error queues jobs and stores feed validators"""
+        db_path = temp_dir / "corrupt.db"
+        db_path.write_bytes(b"not a database" * 100)
+        
+        db = PodcastDatabase(db_path)
+        db.save_feed_cache("https://example.com/feed", "Test Podcast", [], 7, etag='"v1"')
+        [job] = db.claim_jobs([create_episode()], 'full', 'run-1', 300)
+        db.checkpoint_job(job['id'], 'acquire_audio', 'transcribe')
+        
+        assert db_path.with_suffix('.backup').exists()
+        assert db.get_feed_cache("https://example.com/feed")["etag"] == '"v1"'
+        assert db.get_job_counts() == {'running': 1}
+
+
+class TestPublishedDateLookup:
+    """Test the normalized published_date column used for episode lookups"""
+    
+    @pytest.mark.unit
+    def test_lookup_uses_index(self, test_db):
+        """Podcast/title/date lookups are index seeks, not per-row date() scans"""
+        from renaissance_weekly.database import EPISODE_DATE_MATCH_SQL
+        
+        with test_db.connection() as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT e.id FROM episodes e WHERE {EPISODE_DATE_MATCH_SQL}",
+                ("Podcast", "Title", "2025-01-01T10:00:00")
+            ).fetchall()
+        
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_episodes_podcast_title_date (podcast=? AND title=? AND published_date=?)" in details
+    
+    @pytest.mark.unit
+    def test_lookup_ignores_time_of_day(self, test_db):
+        """Episodes match on calendar date whatever time the lookup carries"""
+        episode = create_episode(published=datetime(2025, 3, 4, 6, 30))
+        test_db.save_episode(episode, transcript="transcript", transcription_mode='full')
+        
+        later = datetime(2025, 3, 4, 22, 0)
+        assert test_db.get_episode(episode.podcast, episode.title, later) is not None
+        assert test_db.get_episode(episode.podcast, episode.title, datetime(2025, 3, 5)) is None
+    
+    @pytest.mark.unit
+    def test_backfills_existing_rows(self, test_db):
+        """Rows written without published_date are backfilled on open"""
+        episode = create_episode(published=datetime(2025, 3, 4, 6, 30))
+        test_db.save_episode(episode)
+        with test_db.connection() as conn:
+            conn.execute("UPDATE episodes SET published_date = NULL")
+        
+        reopened = PodcastDatabase(test_db.db_path)
+        
+        with reopened.connection() as conn:
+            assert conn.execute("SELECT published_date FROM episodes").fetchone()[0] == "2025-03-04"
+
+
+class TestTitleLookup:
+    """Test title-fingerprint episode lookups used by the direct cache check"""
+    
+    @pytest.mark.unit
+    def test_fingerprint_normalizes_titles(self):
+        """Case, punctuation, accents and episode-number styles don't matter"""
+        from renaissance_weekly.utils.filename_utils import title_fingerprint
+        
+        assert title_fingerprint("#818: Tim Ferriss – The Art of Learning") == \
+            title_fingerprint("Episode 818 | tim ferriss: the art of learning")
+        assert title_fingerprint("Café Économie, Ep. 07") == title_fingerprint("cafe economie #7")
+        assert title_fingerprint("#818: Interview") != title_fingerprint("#819: Interview")
+    
+    @pytest.mark.unit
+    def test_find_by_fingerprint(self, test_db):
+        """Feed title variants resolve to the stored episode"""
+        test_db.save_episode(create_episode(podcast="Tim Ferriss", title="#818: The Art of Learning"))
+        
+        found = test_db.find_episode_by_title("Tim Ferriss", "Episode 818 - The Art of Learning!")
+        assert found is not None
+        assert found['title'] == "#818: The Art of Learning"
+    
+    @pytest.mark.unit
+    def test_fuzzy_fallback_respects_episode_number(self, test_db):
+        """Near-identical titles only match when the episode numbers agree"""
+        published = datetime(2025, 6, 1, 9, 0)
+        test_db.save_episode(create_episode(podcast="Show", title="#12: Markets, Rates and the Fed in 2025",
+                                            published=published))
+        
+        found = test_db.find_episode_by_title("Show", "#12: Markets, Rates and the Fed in 2025 (Rebroadcast)",
+                                              published)
+        assert found and found['fuzzy']
+        assert test_db.find_episode_by_title("Show", "#13: Markets, Rates and the Fed in 2025", published) is None
+        assert test_db.find_episode_by_title("Show", "#12: Something else entirely", published) is None
+    
+    @pytest.mark.unit
+    def test_fuzzy_fallback_needs_confirmation(self, test_db):
+        """Fuzzy matches need a nearby published date and never swap words"""
+        published = datetime(2025, 6, 1, 9, 0)
+        for title in ("Interview with John Smith about Energy Policy", "Q2 Recap: Apple, Nvidia and Tesla Earnings"):
+            test_db.save_episode(create_episode(podcast="Show", title=title, published=published))
+        
+        # Different episodes with similar titles
+        assert test_db.find_episode_by_title("Show", "Interview with Jane Smith about Energy Policy", published) is None
+        assert test_db.find_episode_by_title("Show", "Q2 Recap: Apple, Nvidia and Meta Earnings", published) is None
+        
+        # A variant title only matches with a date to confirm it
+        variant = "Interview with John Smith about Energy Policy [Replay]"
+        assert test_db.find_episode_by_title("Show", variant) is None
+        assert test_db.find_episode_by_title("Show", variant, published + timedelta(days=5)) is None
+        assert test_db.find_episode_by_title("Show", variant, published + timedelta(hours=20))['fuzzy']
+    
+    @pytest.mark.unit
+    def test_guid_lookup(self, test_db):
+        """A retitled episode is found by its GUID, as an exact match"""
+        episode = create_episode(podcast="Show", title="Old title", guid="guid-123")
+        test_db.save_episode(episode)
+        
+        found = test_db.find_episode_by_title("Show", "Completely new title", guid="guid-123")
+        assert found['title'] == "Old title" and not found['fuzzy']
+    
+    @pytest.mark.unit
+    def test_fingerprint_lookup_uses_index(self, test_db):
+        """The fingerprint step is an index seek, not a scan"""
+        with test_db.connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM episodes WHERE podcast = ? AND title_fingerprint = ?",
+                ("Show", "12|markets")
+            ).fetchall()
+        
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_episodes_podcast_fingerprint (podcast=? AND title_fingerprint=?)" in details
+
+
+class TestCacheStatusBulk:
+    """Test bulk cache-status and content lookups"""
+    
+    @pytest.mark.unit
+    def test_status_per_episode_and_mode(self, test_db):
+        """Statuses line up with the input and reflect only the requested mode"""
+        summarized, transcribed, missing = create_sample_episodes(3)
+        test_db.save_episode(summarized, transcript="t", summary="s", paragraph_summary="p",
+                             transcription_mode='full')
+        test_db.save_episode(transcribed, transcript="t", transcription_mode='test')
+        
+        full = test_db.get_cache_status_bulk([summarized, transcribed, missing], 'full')
+        assert full[0]['has_transcript'] and full[0]['has_summary'] and full[0]['has_paragraph_summary']
+        assert not full[1]['has_transcript'] and not full[1]['has_summary']
+        assert full[2] is None
+        
+        test = test_db.get_cache_status_bulk([summarized, transcribed], 'test')
+        assert not test[0]['has_summary']
+        assert test[1]['has_transcript'] and not test[1]['has_summary']
+    
+    @pytest.mark.unit
+    def test_content_hash_tracks_rewrites(self, test_db):
+        """The content hash changes when stored text is rewritten"""
+        episode = create_episode()
+        test_db.save_episode(episode, transcript="t", summary="short", transcription_mode='full')
+        before = test_db.get_cache_status_bulk([episode], 'full')[0]['content_hash']
+        assert test_db.get_cache_status_bulk([episode], 'full')[0]['content_hash'] == before
+        
+        test_db.save_episode(episode, transcript="t", summary="a longer summary", transcription_mode='full')
+        assert test_db.get_cache_status_bulk([episode], 'full')[0]['content_hash'] != before
+    
+    @pytest.mark.unit
+    def test_large_selection(self, test_db):
+        """Selections bigger than one query chunk are handled"""
+        from renaissance_weekly.database import BULK_LOOKUP_CHUNK
+        
+        episodes = [
+            Episode(podcast="Bulk", title=f"Episode {i}", published=datetime(2025, 1, 1) + timedelta(hours=i))
+            for i in range(BULK_LOOKUP_CHUNK + 5)
+        ]
+        for episode in episodes:
+            test_db.save_episode(episode, summary=f"summary {episode.title}", transcription_mode='full')
+        
+        statuses = test_db.get_cache_status_bulk(episodes, 'full')
+        assert all(status and status['has_summary'] for status in statuses)
+        
+        content = test_db.get_content_bulk([s['id'] for s in statuses], ('summary',), 'full')
+        assert content[statuses[-1]['id']]['summary'] == f"summary {episodes[-1].title}"
+
+
+class TestJobQueue:
+    """Test the durable per-episode job queue"""
+    
+    @pytest.mark.unit
+    def test_claim_checkpoint_and_release(self, test_db):
+        """A released job keeps its checkpoint; a live lease keeps other runs out"""
+        episode = create_episode()
+        [job] = test_db.claim_jobs([episode], 'full', 'run-1', 300)
+        assert job['stage'] == 'fetch_transcript' and job['status'] == 'running'
+        assert job['episode'].title == episode.title
+        
+        test_db.checkpoint_job(job['id'], 'post_process', 'summarize', 12.5,
+                               transcript_id=7, transcript_source='generated')
+        assert test_db.claim_jobs([episode], 'full', 'run-2', 300) == [None]
+        
+        assert test_db.release_job_leases('run-1') == 1
+        [resumed] = test_db.claim_jobs([episode], 'full', 'run-2', 300)
+        assert resumed['id'] == job['id'] and resumed['stage'] == 'summarize'
+        assert resumed['transcript_id'] == 7 and resumed['attempts'] == 2
+        
+        with sqlite3.connect(test_db.db_path) as conn:
+            assert conn.execute("SELECT stage, seconds FROM job_stages WHERE job_id = ?",
+                                (job['id'],)).fetchall() == [('post_process', 12.5)]
+    
+    @pytest.mark.unit
+    def test_completed_jobs_start_over(self, test_db):
+        """Selecting a finished episode again runs it from the first stage"""
+        episode = create_episode()
+        [job] = test_db.claim_jobs([episode], 'test', 'run-1', 300)
+        test_db.checkpoint_job(job['id'], 'persist', None, summary_id=3)
+        test_db.finish_job(job['id'], 'completed')
+        
+        [again] = test_db.claim_jobs([episode], 'test', 'run-2', 300)
+        assert again['stage'] == 'fetch_transcript' and again['summary_id'] is None
+        assert test_db.claim_jobs([episode], 'full', 'run-2', 300)[0]['id'] != job['id']
+    
+    @pytest.mark.unit
+    def test_claim_resumable_jobs(self, test_db):
+        """Resume picks up queued, failed and abandoned jobs until they run out of attempts"""
+        queued, failed, abandoned, exhausted, live = create_sample_episodes(5)
+        jobs = test_db.claim_jobs([queued, failed, abandoned, exhausted], 'full', 'dead-run', -1)
+        test_db.claim_jobs([live], 'full', 'live-run', 300)
+        test_db.finish_job(jobs[0]['id'], 'pending')
+        test_db.finish_job(jobs[1]['id'], 'failed', 'transcribe', 'Whisper timed out')
+        with sqlite3.connect(test_db.db_path) as conn:
+            conn.execute("UPDATE jobs SET attempts = 3 WHERE id = ?", (jobs[3]['id'],))
+        
+        resumed = test_db.claim_resumable_jobs('resume-run', 300, max_attempts=3)
+        assert [job['id'] for job in resumed] == [job['id'] for job in jobs[:3]]
+        assert test_db.get_job_counts() == {'running': 5}
+        
+        with sqlite3.connect(test_db.db_path) as conn:
+            assert conn.execute("SELECT status, error FROM job_stages WHERE job_id = ?",
+                                (jobs[1]['id'],)).fetchone() == ('failed', 'Whisper timed out')
+    
+    @pytest.mark.unit
+    def test_update_episode_status_by_id_or_guid(self, test_db):
+        """Status updates address an episode by database id or by GUID"""
+        episode = create_episode()
+        episode_id = test_db.save_episode(episode)
+        
+        assert test_db.update_episode_status(episode_id, 'transcribing')
+        assert test_db.update_episode_status(episode.guid, 'failed', failure_reason='No audio')
+        assert not test_db.update_episode_status('missing-guid', 'completed')
+        
+        assert test_db.get_episode_failure_info(episode.guid) == {
+            'processing_status': 'failed', 'failure_reason': 'No audio',
+            'retry_count': 1, 'retry_strategy': None
+        }
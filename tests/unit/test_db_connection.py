@@ -0,0 +1,103 @@
+"""Unit tests for the shared SQLite connection pool"""
+
+import sqlite3
+import threading
+import pytest
+from datetime import datetime
+
+from renaissance_weekly.database import PodcastDatabase
+from renaissance_weekly.db_connection import SQLiteConnectionPool, get_connection_pool, close_connection_pool
+from renaissance_weekly.models import Episode
+
+
+class TestSQLiteConnectionPool:
+    """Test connection reuse, tuning and transaction handling"""
+
+    @pytest.fixture
+    def pool(self, temp_dir):
+        pool = SQLiteConnectionPool(temp_dir / "pool.db")
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        yield pool
+        pool.close()
+
+    @pytest.mark.unit
+    def test_pragmas_applied(self, pool):
+        """Connections come up in WAL mode with NORMAL sync and a busy timeout"""
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+
+    @pytest.mark.unit
+    def test_connection_reused(self, pool):
+        """Sequential checkouts on a thread get the same connection back"""
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        assert first is second
+
+    @pytest.mark.unit
+    def test_nested_use_shares_connection(self, pool):
+        """A nested block joins the outer block's transaction"""
+        with pool.connection() as outer:
+            outer.execute("INSERT INTO items (name) VALUES ('a')")
+            with pool.connection() as inner:
+                assert inner is outer
+                assert inner.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+    @pytest.mark.unit
+    def test_rollback_on_error(self, pool):
+        """Exceptions roll the transaction back like sqlite3's own context manager"""
+        with pytest.raises(RuntimeError):
+            with pool.connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('lost')")
+                raise RuntimeError("boom")
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+
+    @pytest.mark.unit
+    def test_row_factory_reset(self, pool):
+        """Per-call row_factory changes don't leak to the next user"""
+        with pool.connection() as conn:
+            conn.row_factory = sqlite3.Row
+        with pool.connection() as conn:
+            assert conn.row_factory is None
+
+    @pytest.mark.unit
+    def test_concurrent_writers(self, pool):
+        """Writers on several threads wait for each other instead of failing"""
+        errors = []
+
+        def writer(n):
+            try:
+                for i in range(50):
+                    with pool.connection() as conn:
+                        conn.execute("INSERT INTO items (name) VALUES (?)", (f"{n}-{i}",))
+            except sqlite3.Error as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 300
+
+    @pytest.mark.unit
+    def test_shared_pool_per_path(self, temp_dir):
+        """Database objects on the same file share one pool"""
+        db_path = temp_dir / "shared.db"
+        first = PodcastDatabase(db_path)
+        second = PodcastDatabase(db_path)
+
+        assert first._pool is second._pool is get_connection_pool(db_path)
+
+        first.save_episode(Episode(podcast="P", title="T", published=datetime(2025, 1, 1)))
+        assert second.get_episode("P", "T", datetime(2025, 1, 1)) is not None
+        close_connection_pool(db_path)
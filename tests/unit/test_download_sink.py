@@ -0,0 +1,125 @@
+"""Unit tests for the validating, hashing download sink"""
+
+import hashlib
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from renaissance_weekly.audio_store import AudioBlobStore, AudioFingerprint
+from renaissance_weekly.transcripts.transcriber import AudioTranscriber
+from renaissance_weekly.utils import helpers
+from renaissance_weekly.utils.download_sink import DownloadSink, DownloadRejected, verified_sha256
+
+AUDIO = b"ID3" + b"\x55" * 300000
+HTML = b"<!DOCTYPE html><html><body>Access denied</body></html>" * 5000
+
+
+def chunks(data, size=4096):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestDownloadSink:
+    """Test validation and hashing on the chunks in flight"""
+
+    @pytest.mark.unit
+    def test_hash_size_and_tail(self, temp_dir):
+        """Digest, size and tail match the bytes written, split however they arrive"""
+        path = temp_dir / "ep.mp3.tmp"
+        with DownloadSink(path, len(AUDIO)) as sink:
+            for chunk in [AUDIO[:2], AUDIO[2:9]] + chunks(AUDIO[9:]):
+                sink.write(chunk)
+
+        assert sink.validate()
+        assert sink.format == "mp3"
+        assert sink.size == len(AUDIO)
+        assert sink.sha256 == hashlib.sha256(AUDIO).hexdigest()
+        assert sink.tail == AUDIO[-1024:]
+        assert path.read_bytes() == AUDIO
+
+    @pytest.mark.unit
+    def test_rejects_html_on_first_chunk(self, temp_dir):
+        """An error page aborts after the first buffer, not at the end"""
+        written = []
+        with pytest.raises(DownloadRejected):
+            with DownloadSink(temp_dir / "ep.mp3") as sink:
+                for chunk in chunks(HTML):
+                    sink.write(chunk)
+                    written.append(chunk)
+
+        assert written == []
+
+    @pytest.mark.unit
+    def test_final_checks(self, temp_dir):
+        """Short downloads and HTML tails fail; lenient sinks accept unknown binary"""
+        with DownloadSink(temp_dir / "short.mp3") as sink:
+            sink.write(AUDIO[:5000])
+        assert not sink.validate()
+
+        with DownloadSink(temp_dir / "tail.mp3") as sink:
+            sink.write(AUDIO + b"<html>upstream timeout</html>")
+        assert not sink.validate()
+
+        with DownloadSink(temp_dir / "odd.bin", lenient=True) as sink:
+            sink.write(b"\x00\x01\x02\xf0" * 50000)
+        assert sink.validate() and sink.format is None
+
+    @pytest.mark.unit
+    async def test_commit_skips_reread(self, temp_dir, monkeypatch):
+        """A committed file needs no second read to validate or to store"""
+        path = temp_dir / "ep.mp3.tmp"
+        async with DownloadSink(path) as sink:
+            for chunk in chunks(AUDIO):
+                await sink.awrite(chunk)
+        assert sink.validate()
+        final = sink.commit(temp_dir / "ep.mp3")
+
+        assert not path.exists()
+        assert verified_sha256(final) == sink.sha256
+
+        def no_reread(*args, **kwargs):
+            raise AssertionError("file was read back")
+
+        monkeypatch.setattr(helpers, "validate_audio_file_comprehensive", no_reread)
+        monkeypatch.setattr("renaissance_weekly.audio_store.hash_file", no_reread)
+        assert helpers.validate_audio_file_smart(final, "test")
+        blob = AudioBlobStore(root=temp_dir / "blobs").ingest(final, AudioFingerprint("https://example.com/ep.mp3"))
+        assert blob.name == f"{sink.sha256}.mp3"
+
+        # Any change to the file drops the record
+        final.unlink()
+        final.write_bytes(AUDIO + b"x")
+        assert verified_sha256(final) is None
+
+
+class TestTranscriberDownload:
+    """Test the aiohttp download path end to end"""
+
+    @pytest.mark.unit
+    async def test_aiohttp_download(self, temp_dir):
+        """Audio is downloaded and recorded; an HTML body leaves nothing behind"""
+        async def audio(request):
+            return web.Response(body=AUDIO, content_type="audio/mpeg")
+
+        async def blocked(request):
+            return web.Response(body=HTML, content_type="application/octet-stream")
+
+        app = web.Application()
+        app.router.add_get("/ep.mp3", audio)
+        app.router.add_get("/blocked.mp3", blocked)
+        server = TestServer(app)
+        await server.start_server()
+        transcriber = AudioTranscriber()
+        try:
+            ok = await transcriber._download_with_aiohttp_validated(
+                str(server.make_url("/ep.mp3")), temp_dir / "ep.mp3", {}, "test")
+            blocked_ok = await transcriber._download_with_aiohttp_validated(
+                str(server.make_url("/blocked.mp3")), temp_dir / "blocked.mp3", {}, "test")
+        finally:
+            await transcriber.cleanup()
+            await server.close()
+
+        assert ok
+        assert verified_sha256(temp_dir / "ep.mp3") == hashlib.sha256(AUDIO).hexdigest()
+        assert not blocked_ok
+        assert list(temp_dir.glob("blocked*")) == []
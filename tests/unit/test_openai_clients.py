@@ -0,0 +1,80 @@
+"""Unit tests for the async OpenAI client layer"""
+
+import asyncio
+import time
+import pytest
+import openai
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from renaissance_weekly.transcripts import transcriber as transcriber_module
+from renaissance_weekly.transcripts.transcriber import AudioTranscriber
+from renaissance_weekly.utils.clients import get_async_openai_client, close_async_openai_client
+from renaissance_weekly.utils.helpers import AsyncRateLimiter
+
+
+@pytest.fixture
+async def whisper_server(monkeypatch):
+    """Local stand-in for the transcription endpoint; /slow never answers in time"""
+    uploads = []
+
+    async def transcriptions(request):
+        form = await request.post()
+        uploads.append((form["model"], form["file"].filename, len(form["file"].file.read())))
+        if request.query.get("slow"):
+            await asyncio.sleep(5)
+        return web.Response(text="hello from whisper", content_type="text/plain")
+
+    app = web.Application()
+    app.router.add_post("/v1/audio/transcriptions", transcriptions)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setenv("OPENAI_BASE_URL", str(server.make_url("/v1")))
+    monkeypatch.setattr(transcriber_module, "whisper_rate_limiter", AsyncRateLimiter(max_requests_per_minute=100))
+    await close_async_openai_client()
+    yield server, uploads
+    await close_async_openai_client()
+    await server.close()
+
+
+class TestAsyncOpenAIClient:
+    """Test client reuse and request handling"""
+
+    @pytest.mark.unit
+    async def test_one_client_per_loop(self):
+        """The pooled client is reused within a loop and rebuilt after closing"""
+        client = get_async_openai_client()
+        assert get_async_openai_client() is client
+
+        await close_async_openai_client()
+        assert client.is_closed()
+        assert get_async_openai_client() is not client
+        await close_async_openai_client()
+
+    @pytest.mark.unit
+    async def test_whisper_request(self, whisper_server, temp_dir):
+        """Whisper uploads go out on the event loop, not an executor thread"""
+        _, uploads = whisper_server
+        audio_file = temp_dir / "chunk.mp3"
+        audio_file.write_bytes(b"ID3" + b"\0" * 5000)
+
+        transcript = await AudioTranscriber()._whisper_request(audio_file)
+
+        assert transcript.strip() == "hello from whisper"
+        assert uploads == [("whisper-1", "chunk.mp3", 5003)]
+
+    @pytest.mark.unit
+    async def test_per_call_timeout(self, whisper_server, temp_dir, monkeypatch):
+        """A request past its timeout is abandoned instead of holding a worker thread"""
+        monkeypatch.setattr(transcriber_module, "OPENAI_TRANSCRIPTION_TIMEOUT", 0.3)
+        client = get_async_openai_client()
+        monkeypatch.setattr(transcriber_module, "get_async_openai_client",
+                            lambda: client.with_options(default_query={"slow": "1"}))
+        audio_file = temp_dir / "chunk.mp3"
+        audio_file.write_bytes(b"ID3" + b"\0" * 5000)
+
+        start = time.monotonic()
+        with pytest.raises(openai.APITimeoutError):
+            await AudioTranscriber()._whisper_request(audio_file)
+        assert time.monotonic() - start < 3
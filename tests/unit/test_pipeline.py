@@ -0,0 +1,360 @@
+"""Unit tests for the staged episode pipeline"""
+
+import asyncio
+import threading
+import pytest
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from renaissance_weekly import app as app_module
+from renaissance_weekly.app import RenaissanceWeekly
+from renaissance_weekly.models import Episode, EpisodeJob, TranscriptSource
+from renaissance_weekly import pipeline as pipeline_module
+from renaissance_weekly.pipeline import MemoryBudget, PrefetchWindow, Stage, StagePipeline
+
+
+def recorder(log, name, delay=0.0, next_stage=None):
+    async def handler(item):
+        log.append((name, item["n"]))
+        await asyncio.sleep(delay)
+        return next_stage
+    return handler
+
+
+class TestStagePipeline:
+    """Test per-stage concurrency, routing and failure handling"""
+
+    @pytest.mark.unit
+    async def test_stages_have_independent_concurrency(self):
+        """A narrow audio stage doesn't hold back a wide summary stage"""
+        log = []
+        items = [{"n": i} for i in range(8)]
+
+        async def route(item):
+            return "transcribe" if item["n"] < 2 else "summarize"
+
+        pipeline = StagePipeline([
+            Stage("fetch", route, workers=4),
+            Stage("transcribe", recorder(log, "transcribe", 0.3, "summarize"), workers=1),
+            Stage("summarize", recorder(log, "summarize", 0.1), workers=6),
+        ], queue_size=8)
+
+        errors = await pipeline.run(items)
+
+        assert errors == [None] * 8
+        metrics = pipeline.snapshot()
+        assert metrics["transcribe"]["processed"] == 2
+        assert metrics["transcribe"]["peak_in_flight"] == 1
+        assert metrics["summarize"]["processed"] == 8
+        assert metrics["summarize"]["peak_in_flight"] >= 5
+        # Summaries of transcript-only episodes finish while audio is still transcribing
+        assert log.index(("summarize", 7)) < log.index(("transcribe", 1))
+
+    @pytest.mark.unit
+    async def test_retries_and_failures(self):
+        """Errors are retried per stage; a persistent one finishes the item with it"""
+        attempts = {}
+        finished = []
+
+        async def flaky(item):
+            attempts[item["n"]] = attempts.get(item["n"], 0) + 1
+            if item["n"] == 0 and attempts[0] == 1:
+                raise ConnectionError("reset")
+            if item["n"] == 1:
+                raise ValueError("bad transcript")
+            return None
+
+        async def on_finish(item, error):
+            finished.append((item["n"], type(error).__name__ if error else None))
+
+        pipeline = StagePipeline([Stage("summarize", flaky, workers=2, retries=1)], on_finish=on_finish)
+        pipeline_errors = await pipeline.run([{"n": 0}, {"n": 1}, {"n": 2}])
+
+        assert pipeline_errors[0] is None and pipeline_errors[2] is None
+        assert isinstance(pipeline_errors[1], ValueError)
+        assert attempts == {0: 2, 1: 2, 2: 1}
+        assert sorted(finished) == [(0, None), (1, "ValueError"), (2, None)]
+        stats = pipeline.snapshot()["summarize"]
+        assert (stats["processed"], stats["failed"], stats["retried"]) == (2, 1, 2)
+
+    @pytest.mark.unit
+    async def test_unknown_stage_and_timeout(self):
+        """Routing to a missing stage or running past the timeout fails only that item"""
+        async def handler(item):
+            if item["n"] == 0:
+                return "nowhere"
+            if item["n"] == 1:
+                await asyncio.sleep(5)
+            return None
+
+        pipeline = StagePipeline([Stage("only", handler, workers=3, timeout=0.2)])
+        errors = await asyncio.wait_for(pipeline.run([{"n": 0}, {"n": 1}, {"n": 2}]), timeout=3)
+
+        assert isinstance(errors[0], ValueError)
+        assert isinstance(errors[1], asyncio.TimeoutError)
+        assert errors[2] is None
+
+    @pytest.mark.unit
+    async def test_cancel_stops_workers(self):
+        """Cancelling a run tears down every worker"""
+        started = asyncio.Event()
+
+        async def slow(item):
+            started.set()
+            await asyncio.sleep(10)
+
+        pipeline = StagePipeline([Stage("transcribe", slow, workers=2)])
+        task = asyncio.create_task(pipeline.run([{"n": 0}, {"n": 1}]))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pipeline.snapshot()["transcribe"]["in_flight"] == 0
+
+
+class TestMemoryBudget:
+    """Test the shared memory reservation"""
+
+    @pytest.mark.unit
+    async def test_reservations_fit_the_budget(self):
+        """Work that would overrun the budget waits; oversized work runs alone"""
+        budget = MemoryBudget(1000)
+        peak = 0
+
+        async def task(mb):
+            nonlocal peak
+            async with budget.reserve(mb):
+                peak = max(peak, budget.used_mb)
+                await asyncio.sleep(0.05)
+
+        await asyncio.gather(*(task(600) for _ in range(3)), task(5000))
+
+        assert peak <= 1000
+        assert budget.used_mb == 0
+
+
+class TestPrefetchWindow:
+    """Test the bounds on audio downloaded ahead of transcription"""
+
+    @pytest.mark.unit
+    async def test_count_and_size_bounds(self):
+        """Episodes wait for a count slot or for bytes; settled sizes free the difference"""
+        window = PrefetchWindow(max_items=2, max_mb=100)
+        await window.admit("a", 40)
+        await window.admit("b", 40)
+
+        third = asyncio.create_task(window.admit("c", 10))
+        await asyncio.sleep(0.01)
+        assert not third.done()  # Two episodes ahead already
+
+        await window.started("a")  # Transcription began: a's bytes stay held, its slot frees
+        await asyncio.wait_for(third, 1)
+        assert window.ahead == 2 and window.held_mb == 90
+
+        fourth = asyncio.create_task(window.admit("d", 30))
+        await window.started("b")
+        await asyncio.sleep(0.01)
+        assert not fourth.done()  # Slot free, but 120MB > 100MB
+
+        await window.settle("b", 10)  # Downloaded smaller than estimated
+        await asyncio.wait_for(fourth, 1)
+        for key in "abcd":
+            await window.release(key)
+        await window.release("a")
+        assert window.held_mb == 0 and window.peak_ahead == 2
+
+        await window.admit("huge", 5000)  # An empty window always admits
+        assert window.ahead == 1
+
+    @pytest.mark.unit
+    async def test_free_disk_floor(self, monkeypatch, temp_dir):
+        """Downloads in progress count against free disk until their size is known"""
+        monkeypatch.setattr(pipeline_module, "get_free_disk_space", lambda path: 1000)
+        window = PrefetchWindow(max_items=4, max_mb=10000, min_free_mb=900, path=temp_dir)
+        await window.admit("a", 60)
+
+        second = asyncio.create_task(window.admit("b", 60))
+        await asyncio.sleep(0.01)
+        assert not second.done()  # 1000 - 60 pending - 60 < 900
+
+        await window.settle("a", 60)  # Now on disk, so already counted in the free space
+        await asyncio.wait_for(second, 1)
+
+
+@pytest.fixture
+def stub_app(monkeypatch):
+    """RenaissanceWeekly with its services replaced; summaries echo the transcript"""
+    app = RenaissanceWeekly.__new__(RenaissanceWeekly)
+    app.correlation_id = "test"
+    app.current_transcription_mode = "test"
+    app._processing_cancelled = False
+    app._processing_status = None
+    app._status_lock = threading.Lock()
+    app._pipeline = None
+    app._prefetch_window = None
+    app.concurrency_manager = app_module.ResourceAwareConcurrencyManager("test")
+    app.exception_aggregator = MagicMock(add_exception=AsyncMock())
+
+    app.db = MagicMock()
+    app.db.get_episode_summary.return_value = None
+    app.db.find_episode_by_title.side_effect = lambda podcast, title, published, guid: {
+        "id": title, "guid": title, "title": title, "fuzzy": False}
+    app.db.save_episode.return_value = 1
+
+    app.db.get_content.side_effect = lambda db_id, kind, mode: (
+        f"transcript of {db_id} " * 50 if kind == "transcript" else None)
+
+    async def summarize(episode, transcript, source, mode, force_fresh):
+        await asyncio.sleep(0.01)
+        return transcript[:40], transcript
+    app.summarizer = MagicMock(generate_summaries=AsyncMock(side_effect=summarize))
+    monkeypatch.setattr(app_module.transcript_postprocessor, "needs_processing", lambda text: False)
+    monkeypatch.setattr(app_module, "monitor", MagicMock())
+    return app
+
+
+class TestEpisodeJob:
+    """Test the per-episode processing context"""
+
+    @pytest.mark.unit
+    def test_slots(self):
+        """Jobs have a fixed set of fields and start empty"""
+        job = EpisodeJob(Episode("Show", "Ep", datetime(2025, 6, 1)), mode="full")
+
+        assert not hasattr(job, "__dict__")
+        with pytest.raises(AttributeError):
+            job.cached_transcrpt = "typo"
+        assert job.key == "Show:Ep" and job.mode == "full"
+        assert job.summaries() is None and job.elapsed == 0.0
+
+    @pytest.mark.unit
+    async def test_concurrent_episodes_keep_their_own_state(self, stub_app):
+        """Each episode is summarized from its own cached transcript, with timings per stage"""
+        episodes = [Episode("Show", f"Episode {i}", datetime(2025, 6, 1)) for i in range(6)]
+        jobs = [EpisodeJob(episode, "test") for episode in episodes]
+
+        pipeline = stub_app._build_episode_pipeline(MemoryBudget(1000))
+        errors = await pipeline.run(jobs)
+
+        assert errors == [None] * 6
+        for i, job in enumerate(jobs):
+            assert job.source is TranscriptSource.CACHED
+            assert job.full_summary.startswith(f"transcript of Episode {i} ")
+            assert job.outcome == "completed"
+            assert list(job.timings) == ["fetch_transcript", "summarize", "persist"]
+        saved = {call.args[0].title: call.args[1] for call in stub_app.db.save_episode.call_args_list}
+        assert all(saved[f"Episode {i}"].startswith(f"transcript of Episode {i} ") for i in range(6))
+
+    @pytest.mark.unit
+    async def test_audio_is_prefetched_during_transcription(self, stub_app, monkeypatch, temp_dir):
+        """Later episodes download while earlier ones transcribe, never more than the window ahead"""
+        monkeypatch.setattr(app_module, "PREFETCH_EPISODES", 2)
+        monkeypatch.setattr(app_module, "AUDIO_DIR", temp_dir)
+        monkeypatch.setattr(app_module, "PIPELINE_TRANSCRIBE_WORKERS", 1)
+        monkeypatch.setattr(app_module, "PIPELINE_AUDIO_WORKERS", 4)
+        stub_app.db.find_episode_by_title.side_effect = None
+        stub_app.db.find_episode_by_title.return_value = None
+        stub_app.transcript_finder = MagicMock(find_transcript=AsyncMock(return_value=(None, None)))
+        monkeypatch.setattr(app_module.transcript_postprocessor, "process_transcript",
+                            AsyncMock(side_effect=lambda text, *args, **kwargs: (text, 0)))
+        events, ahead = [], []
+
+        async def acquire_audio(episode, mode, job_id):
+            events.append(("downloaded", episode.title))
+            ahead.append(stub_app._prefetch_window.ahead)
+            audio_file = temp_dir / f"{job_id}.mp3"
+            audio_file.write_bytes(b"\0" * 1024)
+            return audio_file
+
+        async def transcribe_audio(episode, audio_file, mode, job_id):
+            events.append(("transcribing", episode.title))
+            await asyncio.sleep(0.05)
+            return f"transcript of {episode.title} " * 50
+
+        stub_app.transcriber = MagicMock(acquire_audio=acquire_audio, transcribe_audio=transcribe_audio,
+                                         release_audio=lambda audio_file, job_id: audio_file.unlink())
+        episodes = [Episode("Show", f"Episode {i}", datetime(2025, 6, 1), audio_url=f"https://example.com/{i}.mp3")
+                    for i in range(5)]
+        jobs = [EpisodeJob(episode, "test") for episode in episodes]
+
+        errors = await stub_app._build_episode_pipeline(MemoryBudget(10000)).run(jobs)
+
+        assert errors == [None] * 5
+        assert all(job.source is TranscriptSource.GENERATED for job in jobs)
+        # Episodes 1 and 2 were downloaded while episode 0 was still being transcribed...
+        assert events.index(("downloaded", "Episode 2")) < events.index(("transcribing", "Episode 1"))
+        # ...but no more than two episodes were ever waiting for the transcriber
+        assert max(ahead) <= 2
+        assert stub_app._prefetch_window.held_mb == 0
+        assert list(temp_dir.glob("*.mp3")) == []
+
+    @pytest.mark.unit
+    async def test_failed_transcription_is_retried(self, stub_app, monkeypatch, temp_dir):
+        """A transcriber that gives up raises in the stage, so the stage's retries apply"""
+        monkeypatch.setattr(pipeline_module, "exponential_backoff_with_jitter", lambda attempt: 0)
+        stub_app.db.find_episode_by_title.side_effect = None
+        stub_app.db.find_episode_by_title.return_value = None
+        stub_app.transcript_finder = MagicMock(find_transcript=AsyncMock(return_value=(None, None)))
+        monkeypatch.setattr(app_module.transcript_postprocessor, "process_transcript",
+                            AsyncMock(side_effect=lambda text, *args, **kwargs: (text, 0)))
+        audio_file = temp_dir / "ep.mp3"
+        audio_file.write_bytes(b"\0" * 1024)
+        stub_app.transcriber = MagicMock(
+            acquire_audio=AsyncMock(side_effect=[None, audio_file]),
+            transcribe_audio=AsyncMock(side_effect=[None, None, "transcript " * 100]),
+            release_audio=lambda audio_file, job_id: None)
+        job = EpisodeJob(Episode("Show", "Flaky", datetime(2025, 6, 1), audio_url="https://example.com/1.mp3"))
+
+        errors = await stub_app._build_episode_pipeline(MemoryBudget(10000)).run([job])
+
+        assert errors == [None] and job.outcome == "completed"
+        assert stub_app.transcriber.acquire_audio.await_count == 2
+        assert stub_app.transcriber.transcribe_audio.await_count == 3
+
+    @pytest.mark.unit
+    async def test_interrupted_job_resumes_at_its_checkpoint(self, stub_app, test_db):
+        """An episode interrupted after transcription is summarized without transcribing again"""
+        stub_app.db = test_db
+        stub_app.transcript_finder = MagicMock(find_transcript=AsyncMock(side_effect=AssertionError("fetched")))
+        stub_app.transcriber = MagicMock(acquire_audio=AsyncMock(side_effect=AssertionError("downloaded")))
+        episode = Episode("Show", "Interrupted", datetime(2025, 6, 1), audio_url="https://example.com/1.mp3")
+        transcript = "transcript from the earlier run " * 50
+
+        # An earlier run transcribed and corrected the episode, then died
+        [row] = test_db.claim_jobs([episode], "test", "dead-run", 300)
+        transcript_id = test_db.save_episode(episode, transcript, TranscriptSource.GENERATED,
+                                             transcription_mode="test")
+        test_db.checkpoint_job(row["id"], "post_process", "summarize",
+                               transcript_id=transcript_id, transcript_source="generated")
+        test_db.release_job_leases("dead-run")
+
+        [job] = stub_app._queue_episode_jobs([episode])
+        errors = await stub_app._build_episode_pipeline(MemoryBudget(1000)).run([job])
+
+        assert errors == [None]
+        assert job.outcome == "completed" and job.source is TranscriptSource.GENERATED
+        assert job.full_summary == transcript
+        assert list(job.timings) == ["fetch_transcript", "summarize", "persist"]
+        assert test_db.get_job_counts() == {"completed": 1}
+        assert test_db.claim_resumable_jobs("resume-run", 300, 3) == []
+
+
+class TestCacheFilter:
+    """Test deciding which selected episodes need processing"""
+
+    @pytest.mark.unit
+    def test_transcripts_loaded_only_to_validate_suspect_summaries(self, stub_app, test_db, monkeypatch):
+        """Clean cached summaries are trusted without reading their transcripts"""
+        stub_app.db = test_db
+        clean, suspect, stale, new = [Episode("Show", f"Episode {i}", datetime(2025, 6, i + 1)) for i in range(4)]
+        test_db.save_episode(clean, "transcript", TranscriptSource.CACHED, "summary", "paragraph", "test")
+        test_db.save_episode(suspect, "Open AI said", TranscriptSource.CACHED, "Open AI summary", "paragraph", "test")
+        test_db.save_episode(stale, "OpenAI said", TranscriptSource.CACHED, "Open AI summary", "paragraph", "test")
+        loaded = []
+        get_content = test_db.get_content
+        monkeypatch.setattr(test_db, "get_content",
+                            lambda db_id, kind, mode: loaded.append(kind) or get_content(db_id, kind, mode))
+
+        assert stub_app.filter_episodes_needing_processing([clean, suspect, stale, new]) == [stale, new]
+        assert loaded == ["transcript", "transcript"]
@@ -0,0 +1,103 @@
+"""Unit tests for test-mode partial (HTTP Range) downloads"""
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from renaissance_weekly.download_strategies.range_strategy import RangeDownloadStrategy, MIN_MARGIN_BYTES
+from renaissance_weekly.config import PARTIAL_DOWNLOAD_MARGIN
+
+# MPEG1 Layer III, 128kbps, 44.1kHz: 417-byte frames, ~78s for 3000 frames
+FRAME = b"\xff\xfb\x90\x00" + b"\x55" * 413
+EPISODE = b"ID3\x04\x00\x00\x00\x00\x00\x14" + b"\0" * 20 + FRAME * 3000
+
+
+async def serve(body: bytes, honour_range: bool, tmp_path):
+    """Serve body at /ep.mp3, with or without Range support"""
+    path = tmp_path / "served.mp3"
+    path.write_bytes(body)
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("Range"))
+        if honour_range:
+            return web.FileResponse(path)
+        return web.Response(body=body, content_type="audio/mpeg")
+
+    app = web.Application()
+    app.router.add_get("/ep.mp3", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server, requests
+
+
+class TestRangeDownload:
+    """Test fetching just the opening window of an episode"""
+
+    @pytest.mark.unit
+    async def test_fetches_only_window(self, temp_dir):
+        """Only bitrate * window (+ margin) bytes are downloaded"""
+        server, requests = await serve(EPISODE, True, temp_dir)
+        output = temp_dir / "episode.mp3"
+        try:
+            success, error = await RangeDownloadStrategy().download(
+                str(server.make_url("/ep.mp3")), output, {"max_seconds": 10}
+            )
+        finally:
+            await server.close()
+
+        expected = 30 + int(16000 * 10 * (1 + PARTIAL_DOWNLOAD_MARGIN)) + MIN_MARGIN_BYTES
+        assert success, error
+        assert output.read_bytes() == EPISODE[:expected]
+        assert expected < len(EPISODE)
+        assert all(r and r.startswith("bytes=") for r in requests)
+
+    @pytest.mark.unit
+    async def test_range_ignored(self, temp_dir):
+        """A server answering 200 to a Range request falls back to the full download"""
+        server, _ = await serve(EPISODE, False, temp_dir)
+        output = temp_dir / "episode.mp3"
+        try:
+            success, error = await RangeDownloadStrategy().download(
+                str(server.make_url("/ep.mp3")), output, {"max_seconds": 10}
+            )
+        finally:
+            await server.close()
+
+        assert not success
+        assert "Range" in error
+        assert not output.exists()
+        assert not list(temp_dir.glob("*.part"))
+
+    @pytest.mark.unit
+    async def test_short_or_unknown_streams(self, temp_dir):
+        """Episodes shorter than the window and non-MP3 streams are left to the full download"""
+        server, _ = await serve(EPISODE, True, temp_dir)
+        try:
+            success, _ = await RangeDownloadStrategy().download(
+                str(server.make_url("/ep.mp3")), temp_dir / "a.mp3", {"max_seconds": 600}
+            )
+        finally:
+            await server.close()
+        assert not success
+
+        server, _ = await serve(b"\0" * 200000, True, temp_dir)
+        try:
+            success, error = await RangeDownloadStrategy().download(
+                str(server.make_url("/ep.mp3")), temp_dir / "b.mp3", {"max_seconds": 10}
+            )
+        finally:
+            await server.close()
+        assert not success
+        assert "bitrate" in error
+
+    @pytest.mark.unit
+    def test_can_handle(self):
+        """YouTube, Substack and Cloudflare-protected podcasts are skipped"""
+        strategy = RangeDownloadStrategy()
+
+        assert strategy.can_handle("https://traffic.libsyn.com/ep.mp3", "The Drive")
+        assert not strategy.can_handle("https://www.youtube.com/watch?v=x", "The Drive")
+        assert not strategy.can_handle("https://api.substack.com/ep.mp3", "Dwarkesh Podcast")
+        assert not strategy.can_handle("ytsearch1:episode", "All-In")
@@ -0,0 +1,89 @@
+"""Unit tests for the async request/token rate limiter"""
+
+import asyncio
+import time
+import pytest
+
+from renaissance_weekly.utils.helpers import AsyncRateLimiter, estimate_tokens, _parse_reset
+
+
+def limiter(rpm=100, tpm=None, window=0.3):
+    limiter = AsyncRateLimiter(max_requests_per_minute=rpm, max_tokens_per_minute=tpm, buffer_percentage=0.0)
+    limiter.window_size = window
+    return limiter
+
+
+class TestAsyncRateLimiter:
+    """Test request and token budgets, fairness and header adaptation"""
+
+    @pytest.mark.unit
+    async def test_fifo_without_stampede(self):
+        """Queued callers go in arrival order, never more than the budget per window"""
+        rate = limiter(rpm=2)
+        started = []
+
+        async def call(i):
+            async with rate.slot(correlation_id=str(i)):
+                started.append((i, time.monotonic()))
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(call(i)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert [i for i, _ in started] == [0, 1, 2, 3, 4]
+        times = [t for _, t in started]
+        for i in range(2, 5):
+            assert times[i] - times[i - 2] >= rate.window_size
+
+    @pytest.mark.unit
+    async def test_token_budget(self):
+        """A request waits until enough tokens leave the window; oversized ones still run"""
+        rate = limiter(tpm=1000)
+
+        assert await rate.acquire(tokens=800) < 0.05
+        waited = await rate.acquire(tokens=400)
+        assert waited >= rate.window_size * 0.8
+
+        assert await rate.acquire(tokens=5000) >= rate.window_size * 0.8
+        assert rate.get_current_usage()['current_tokens'] == 5000
+
+    @pytest.mark.unit
+    async def test_adapts_to_headers(self):
+        """Server-reported limits replace the configured ones; an exhausted budget waits for reset"""
+        rate = limiter(rpm=3, tpm=1000, window=60)
+        rate.update_from_headers({
+            'x-ratelimit-limit-requests': '500',
+            'x-ratelimit-limit-tokens': '200000',
+            'x-ratelimit-remaining-requests': '0',
+            'x-ratelimit-reset-requests': '250ms',
+        })
+
+        assert (rate.max_rpm, rate.max_tpm) == (500, 200000)
+        assert await rate.acquire() >= 0.2
+        assert await rate.acquire() < 0.05  # Reset has passed
+
+    @pytest.mark.unit
+    async def test_429_pauses_everyone(self):
+        """A rate limit error inside a slot holds back the next caller"""
+        class RateLimited(Exception):
+            status_code = 429
+
+        rate = limiter()
+        with pytest.raises(RateLimited):
+            async with rate.slot():
+                raise RateLimited("Error code: 429")
+        assert rate._paused_until > time.monotonic() + 4
+        rate._paused_until = time.monotonic() + 0.2  # Shorten the default 5s pause
+
+        assert await rate.acquire() >= 0.15
+
+    @pytest.mark.unit
+    def test_helpers(self):
+        """Reset durations and token estimates"""
+        assert _parse_reset("6m0s") == 360
+        assert _parse_reset("1.5s") == 1.5
+        assert _parse_reset("20ms") == pytest.approx(0.02)
+        assert _parse_reset(None) is None
+        assert estimate_tokens("x" * 400) == 101
@@ -0,0 +1,292 @@
+"""Unit tests for the streaming RSS fetch path of ReliableEpisodeFetcher"""
+
+import pytest
+import feedparser
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from renaissance_weekly.fetchers.rss_stream import StreamingFeedParser
+
+from renaissance_weekly.fetchers.episode_fetcher import ReliableEpisodeFetcher
+
+
+def build_feed(ages_in_days, padding: int = 0) -> str:
+    """Build an RSS feed with one item per age (newest first)"""
+    items = []
+    for i, age in enumerate(ages_in_days):
+        published = format_datetime(datetime.utcnow() - timedelta(days=age))
+        items.append(f"""
+    <item>
+      <title>Episode {i}</title>
+      <description>Description {i} {'x' * padding}</description>
+      <pubDate>{published}</pubDate>
+      <enclosure url="https://example.com/ep{i}.mp3" length="1000" type="audio/mpeg"/>
+      <guid isPermaLink="false">guid-{i}</guid>
+      <link>https://example.com/{i}</link>
+      <itunes:duration>3600</itunes:duration>
+    </item>""")
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd" version="2.0">
+  <channel>
+    <title>Test Podcast</title>{''.join(items)}
+  </channel>
+</rss>"""
+
+
+SAMPLE_FEED = Path(__file__).parent.parent / "fixtures" / "test_data" / "sample_rss.xml"
+
+
+class ChunkedResponse:
+    """Stand-in for aiohttp's response that records how much was read"""
+
+    def __init__(self, body: bytes, chunk_size: int):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.bytes_read = 0
+        self.content = self
+
+    async def iter_chunked(self, size):
+        while self.bytes_read < len(self.body):
+            chunk = self.body[self.bytes_read:self.bytes_read + self.chunk_size]
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+async def serve(responses):
+    """Start a local server replying with (status, body) pairs in order"""
+    queue = list(responses)
+    user_agents = []
+
+    async def handler(request):
+        user_agents.append(request.headers.get("User-Agent"))
+        status, body = queue.pop(0) if len(queue) > 1 else queue[0]
+        return web.Response(status=status, text=body, content_type="application/rss+xml")
+
+    app = web.Application()
+    app.router.add_get("/podcast.xml", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server, user_agents
+
+
+class TestRssFetch:
+    """Test _try_rss_with_fallbacks over aiohttp"""
+
+    @pytest.fixture
+    async def fetcher(self, test_db):
+        fetcher = ReliableEpisodeFetcher(test_db)
+        yield fetcher
+        await fetcher.cleanup()
+
+    @pytest.mark.unit
+    async def test_fetches_recent_episodes(self, fetcher):
+        """Recent items are returned, old ones skipped"""
+        server, _ = await serve([(200, build_feed([1, 3, 30]))])
+        try:
+            url = str(server.make_url("/podcast.xml"))
+            episodes = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        finally:
+            await server.close()
+
+        assert [ep.title for ep in episodes] == ["Episode 0", "Episode 1"]
+        assert episodes[0].audio_url == "https://example.com/ep0.mp3"
+        assert episodes[0].guid == "guid-0"
+
+    @pytest.mark.unit
+    async def test_retries_next_user_agent_on_403(self, fetcher):
+        """A 403 moves on to the next user agent"""
+        server, user_agents = await serve([(403, ""), (200, build_feed([1]))])
+        try:
+            url = str(server.make_url("/podcast.xml"))
+            episodes = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        finally:
+            await server.close()
+
+        assert len(episodes) == 1
+        assert len(user_agents) == 2
+        assert user_agents[0] != user_agents[1]
+
+    @pytest.mark.unit
+    async def test_http_error_stops(self, fetcher):
+        """Non-403 errors stop trying further user agents"""
+        server, user_agents = await serve([(500, "")])
+        try:
+            url = str(server.make_url("/podcast.xml"))
+            episodes = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        finally:
+            await server.close()
+
+        assert episodes == []
+        assert len(user_agents) == 1
+
+    @pytest.mark.unit
+    async def test_stops_reading_past_cutoff(self, fetcher):
+        """Reading stops a few items past the cutoff instead of pulling the whole feed"""
+        body = build_feed([1, 2] + [30] * 200, padding=2000).encode()
+        response = ChunkedResponse(body, 8192)
+
+        episodes = [ep async for ep in fetcher._stream_rss_episodes(response, "Test Podcast", 7, "test")]
+
+        assert [ep.title for ep in episodes] == ["Episode 0", "Episode 1"]
+        assert response.bytes_read < len(body) / 10
+
+    @pytest.mark.unit
+    async def test_tolerates_out_of_order_items(self, fetcher):
+        """A single old item between recent ones doesn't end the scan"""
+        body = build_feed([1, 30, 2, 40, 41, 42, 3]).encode()
+        response = ChunkedResponse(body, 8192)
+
+        episodes = [ep async for ep in fetcher._stream_rss_episodes(response, "Test Podcast", 7, "test")]
+
+        assert [ep.title for ep in episodes] == ["Episode 0", "Episode 2"]
+
+    @pytest.mark.unit
+    async def test_falls_back_to_feedparser_on_bad_xml(self, fetcher):
+        """Feeds with undeclared HTML entities still parse through feedparser"""
+        feed = build_feed([1, 2]).replace("Description 1", "Description&nbsp;1")
+        response = ChunkedResponse(feed.encode(), 64)
+
+        episodes = [ep async for ep in fetcher._stream_rss_episodes(response, "Test Podcast", 7, "test")]
+
+        assert sorted(ep.title for ep in episodes) == ["Episode 0", "Episode 1"]
+
+
+class TestConditionalFetch:
+    """Test the persistent ETag / Last-Modified feed cache"""
+
+    @pytest.fixture
+    async def conditional_server(self):
+        """Server that honours If-None-Match and counts full responses"""
+        state = {"body": build_feed([1, 2]), "etag": '"v1"', "full": 0, "not_modified": 0}
+
+        async def handler(request):
+            if request.headers.get("If-None-Match") == state["etag"]:
+                state["not_modified"] += 1
+                return web.Response(status=304)
+            state["full"] += 1
+            return web.Response(
+                text=state["body"], content_type="application/rss+xml",
+                headers={"ETag": state["etag"], "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+            )
+
+        app = web.Application()
+        app.router.add_get("/podcast.xml", handler)
+        server = TestServer(app)
+        await server.start_server()
+        yield str(server.make_url("/podcast.xml")), state
+        await server.close()
+
+    @pytest.mark.unit
+    async def test_not_modified_returns_cached_episodes(self, test_db, conditional_server):
+        """A second run, even from a new fetcher, gets a 304 and the stored episodes"""
+        url, state = conditional_server
+
+        fetcher = ReliableEpisodeFetcher(test_db)
+        first = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        await fetcher.cleanup()
+
+        fetcher = ReliableEpisodeFetcher(test_db)
+        second = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        await fetcher.cleanup()
+
+        assert state["full"] == 1
+        assert state["not_modified"] == 1
+        assert [ep.title for ep in second] == [ep.title for ep in first] == ["Episode 0", "Episode 1"]
+        assert second[0].published == first[0].published
+        assert test_db.get_cached_feed_urls("Test Podcast") == [url]
+
+    @pytest.mark.unit
+    async def test_changed_feed_is_refetched(self, test_db, conditional_server):
+        """A new ETag means a full download and a refreshed cache"""
+        url, state = conditional_server
+        fetcher = ReliableEpisodeFetcher(test_db)
+        await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+
+        state["body"] = build_feed([0, 1, 2])
+        state["etag"] = '"v2"'
+        episodes = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        await fetcher.cleanup()
+
+        assert state["full"] == 2
+        assert len(episodes) == 3
+        assert test_db.get_feed_cache(url)["etag"] == '"v2"'
+
+    @pytest.mark.unit
+    async def test_quiet_feed_is_cached(self, test_db, conditional_server):
+        """A feed with no recent episodes is revalidated on the next run, not downloaded again"""
+        url, state = conditional_server
+        state["body"] = build_feed([30, 40])
+
+        fetcher = ReliableEpisodeFetcher(test_db)
+        first = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        second = await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        await fetcher.cleanup()
+
+        assert first == second == []
+        assert state["full"] == 1
+        assert test_db.get_feed_cache(url)["etag"] == '"v1"'
+        # Only feeds that have produced episodes are offered as fallbacks
+        assert test_db.get_cached_feed_urls("Test Podcast") == []
+
+    @pytest.mark.unit
+    async def test_wider_window_skips_cache(self, test_db, conditional_server):
+        """A cache filled for 7 days can't answer a 30 day request"""
+        url, state = conditional_server
+        fetcher = ReliableEpisodeFetcher(test_db)
+        await fetcher._try_rss_with_fallbacks("Test Podcast", url, 7, "test")
+        await fetcher._try_rss_with_fallbacks("Test Podcast", url, 30, "test")
+        await fetcher.cleanup()
+
+        assert state["full"] == 2
+        assert state["not_modified"] == 0
+
+
+class TestStreamingFeedParser:
+    """Test the incremental feed parser on its own"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100, 100000])
+    def test_items_straddling_chunks(self, chunk_size):
+        """Entries come out whole regardless of where chunks split"""
+        body = build_feed([1, 2, 3]).encode()
+        parser = StreamingFeedParser()
+        entries = []
+        for i in range(0, len(body), chunk_size):
+            entries.extend(parser.feed(body[i:i + chunk_size]))
+        entries.extend(parser.close())
+
+        assert [entry.title for entry in entries] == ["Episode 0", "Episode 1", "Episode 2"]
+        assert entries[1].enclosures[0].href == "https://example.com/ep1.mp3"
+        assert entries[1].itunes_duration == "3600"
+        assert entries[1].guid == "guid-1"
+        assert entries[1].published_parsed is not None
+
+    @pytest.mark.unit
+    def test_truncated_stream(self):
+        """Closing mid-item returns only the completed items"""
+        body = build_feed([1, 2, 3]).encode()
+        cut = body.index(b"<title>Episode 2")
+        parser = StreamingFeedParser()
+
+        entries = parser.feed(body[:cut]) + parser.close()
+
+        assert [entry.title for entry in entries] == ["Episode 0", "Episode 1"]
+
+    @pytest.mark.unit
+    def test_sample_feed(self):
+        """The fixture feed parses the same way feedparser sees it"""
+        parser = StreamingFeedParser()
+        entries = parser.feed(SAMPLE_FEED.read_bytes()) + parser.close()
+        expected = feedparser.parse(SAMPLE_FEED.read_bytes()).entries
+
+        assert len(entries) == len(expected)
+        for entry, reference in zip(entries, expected):
+            assert entry.title == reference.title
+            assert entry.published_parsed[:6] == reference.published_parsed[:6]
+            assert entry.enclosures[0].href == reference.enclosures[0].href
+            assert entry.itunes_duration == reference.itunes_duration
+            assert entry.guid == reference.guid
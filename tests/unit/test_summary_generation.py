@@ -0,0 +1,213 @@
+"""Unit tests for concurrent paragraph and full summary generation"""
+
+import asyncio
+import time
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from renaissance_weekly.models import Episode, TranscriptSource
+from renaissance_weekly.processing import summarizer as summarizer_module
+from renaissance_weekly.processing.summarizer import Summarizer
+from renaissance_weekly.utils.helpers import AsyncRateLimiter
+
+
+@pytest.fixture
+def summarizer(temp_dir, monkeypatch):
+    """Summarizer caching to a temp dir, with a fake 0.2s completion call"""
+    monkeypatch.setattr(summarizer_module, "SUMMARY_DIR", temp_dir)
+    s = Summarizer()
+    s.calls = []
+    s.section_calls = []
+
+    async def fake_call(prompt, max_tokens=None, model=None, system_prompt=None):
+        s.calls.append((prompt, max_tokens))
+        if model:
+            s.section_calls.append(prompt)
+            return f"notes on section {prompt.split('SECTION ')[1][:6]}"
+        await asyncio.sleep(0.2)
+        return f"summary with {max_tokens or s.max_tokens} tokens"
+
+    s._call_openai_api = fake_call
+    return s
+
+
+@pytest.fixture
+def episode():
+    return Episode(
+        podcast="Test Podcast",
+        title="Markets and Machines with Jane Doe | Ep 12",
+        published=datetime(2025, 6, 1),
+        audio_url="https://example.com/test.mp3",
+        description="A conversation about AI"
+    )
+
+
+class TestGenerateSummaries:
+    """Test shared preprocessing and concurrency"""
+
+    @pytest.mark.unit
+    async def test_runs_concurrently(self, summarizer, episode):
+        """Both completions overlap, each with its own token limit"""
+        start = time.monotonic()
+        paragraph, full_summary = await summarizer.generate_summaries(
+            episode, "transcript " * 1000, TranscriptSource.AUDIO_TRANSCRIPTION, mode='test'
+        )
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.35
+        assert paragraph == "summary with 300 tokens"
+        assert full_summary == f"summary with {summarizer.max_tokens} tokens"
+        assert {tokens for _, tokens in summarizer.calls} == {300, None}
+
+    @pytest.mark.unit
+    async def test_context_prepared_once(self, summarizer, episode, monkeypatch):
+        """Guest extraction and truncation run once for both prompts"""
+        monkeypatch.setattr(summarizer_module, "SUMMARY_MAP_REDUCE_CHARS", 10 ** 9)
+        guest_calls = []
+        original = summarizer._extract_guest_name
+        monkeypatch.setattr(summarizer, "_extract_guest_name",
+                            lambda *args: guest_calls.append(args) or original(*args))
+
+        await summarizer.generate_summaries(
+            episode, "x" * 150000, TranscriptSource.AUDIO_TRANSCRIPTION, mode='test'
+        )
+
+        assert len(guest_calls) == 1
+        for prompt, _ in summarizer.calls:
+            assert "[TRANSCRIPT TRUNCATED DUE TO LENGTH]" in prompt
+            assert "x" * 100001 not in prompt
+
+    @pytest.mark.unit
+    async def test_cached_summaries_skip_api(self, summarizer, episode):
+        """A second run reads both summaries from the cache"""
+        first = await summarizer.generate_summaries(
+            episode, "transcript " * 1000, TranscriptSource.AUDIO_TRANSCRIPTION, mode='test'
+        )
+        summarizer.calls.clear()
+        second = await summarizer.generate_summaries(
+            episode, "transcript " * 1000, TranscriptSource.AUDIO_TRANSCRIPTION, mode='test'
+        )
+
+        assert second == first
+        assert summarizer.calls == []
+
+
+    @pytest.mark.unit
+    async def test_cached_summaries_skip_section_notes(self, summarizer, episode, temp_dir):
+        """With both summaries cached, a long transcript isn't condensed again"""
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+        for notes in (temp_dir / "sections").iterdir():
+            notes.unlink()
+        summarizer.calls.clear()
+
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+
+        assert summarizer.calls == []
+
+
+LONG_TRANSCRIPT = "\n\n".join(f"Speaker {i % 2}: point number {i} about rates and growth. " * 40 for i in range(120))
+
+
+class TestMapReduce:
+    """Test section summaries for transcripts past the cutoff"""
+
+    @pytest.mark.unit
+    async def test_sections_cover_whole_transcript(self, summarizer, episode):
+        """Every section is condensed and the final prompts see all the notes, not raw text"""
+        sections = summarizer_module.split_sections(LONG_TRANSCRIPT, summarizer_module.SUMMARY_SECTION_CHARS)
+        assert len(LONG_TRANSCRIPT) > summarizer_module.SUMMARY_MAP_REDUCE_CHARS
+        covered = " ".join(sections).split() == LONG_TRANSCRIPT.split()
+        assert covered
+
+        paragraph, full_summary = await summarizer.generate_summaries(
+            episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full'
+        )
+
+        assert paragraph and full_summary
+        assert len(summarizer.section_calls) == len(sections)
+        reduce_prompts = [p for p, _ in summarizer.calls if p not in summarizer.section_calls]
+        assert len(reduce_prompts) == 2
+        for prompt in reduce_prompts:
+            assert f"[SECTION {len(sections)} OF {len(sections)}]" in prompt
+            assert "point number 119" not in prompt
+            assert len(prompt) < 20000
+
+    @pytest.mark.unit
+    async def test_rerun_only_repeats_reduce(self, summarizer, episode, temp_dir):
+        """Cached section notes are reused when the final summaries are regenerated"""
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+        first_sections = len(summarizer.section_calls)
+        summarizer.calls.clear()
+        summarizer.section_calls.clear()
+        summarizer.full_summary_prompt_template += "\nNEW INSTRUCTION"
+        for summary_file in temp_dir.glob("*.md"):
+            summary_file.unlink()
+
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+
+        assert first_sections > 1
+        assert summarizer.section_calls == []
+        assert len(summarizer.calls) == 2
+
+    @pytest.mark.unit
+    async def test_force_fresh_and_dry_run_skip_section_cache(self, summarizer, episode, temp_dir, monkeypatch):
+        """force_fresh condenses the sections again; dry-run placeholder notes are never cached"""
+        monkeypatch.setenv("DRY_RUN", "true")
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+        assert list((temp_dir / "sections").iterdir()) == []
+
+        sections = len(summarizer.section_calls)
+        monkeypatch.delenv("DRY_RUN")
+        for _ in range(2):
+            summarizer.section_calls.clear()
+            await summarizer.generate_summaries(
+                episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full', force_fresh=True
+            )
+            assert len(summarizer.section_calls) == sections
+        assert len(list((temp_dir / "sections").iterdir())) == sections
+
+    @pytest.mark.unit
+    async def test_failed_section_falls_back(self, summarizer, episode):
+        """If a section can't be summarized the final prompts use the truncated transcript"""
+        async def failing_call(prompt, max_tokens=None, model=None, system_prompt=None):
+            if model:
+                raise RuntimeError("boom")
+            summarizer.calls.append((prompt, max_tokens))
+            return "summary"
+
+        summarizer._call_openai_api = failing_call
+        await summarizer.generate_summaries(episode, LONG_TRANSCRIPT, TranscriptSource.AUDIO_TRANSCRIPTION, mode='full')
+
+        for prompt, _ in summarizer.calls:
+            assert "[TRANSCRIPT TRUNCATED DUE TO LENGTH]" in prompt
+
+
+class TestModelRateLimits:
+    """Test that each chat model is paced by its own quota"""
+
+    @pytest.mark.unit
+    async def test_section_model_headers_stay_with_its_limiter(self, temp_dir, monkeypatch):
+        """A cheaper model's larger quota never loosens the main model's limiter"""
+        main = AsyncRateLimiter(max_requests_per_minute=100, max_tokens_per_minute=30000, buffer_percentage=0.0)
+        section = AsyncRateLimiter(max_requests_per_minute=100, max_tokens_per_minute=30000, buffer_percentage=0.0)
+        monkeypatch.setattr(summarizer_module, "openai_rate_limiter", main)
+        monkeypatch.setattr(summarizer_module, "chat_rate_limiter", lambda model: section)
+
+        async def create(model, **kwargs):
+            tpm = "30000" if model == "gpt-4o" else "2000000"
+            parsed = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="notes"))])
+            return SimpleNamespace(headers={"x-ratelimit-limit-tokens": tpm}, parse=lambda: parsed)
+
+        client = MagicMock()
+        client.chat.completions.with_raw_response.create = create
+        monkeypatch.setattr(summarizer_module, "get_async_openai_client", lambda: client)
+        s = Summarizer()
+        s.model = "gpt-4o"
+
+        assert await s._call_openai_api("prompt", model="gpt-4o-mini") == "notes"
+        assert await s._call_openai_api("prompt") == "notes"
+
+        assert section.max_tpm == 2000000
+        assert main.max_tpm == 30000